@@ -0,0 +1,121 @@
+"""
+Append-only agent history files: one JSON line per step instead of rewriting the whole history document.
+
+`AgentHistoryList.save_to_file()` serializes every step into a single JSON document, so saving after each step of a
+long run costs O(n²) and loading parses everything at once. `HistoryStreamWriter` appends each finished step as one
+(sensitive-data filtered) line, `iter_history_file()` reads the steps back one at a time, and `compact_history_file()`
+converts a stream into the JSON format written by `save_to_file()`.
+
+Stream a run to disk with `Agent(..., history_writer=HistoryStreamWriter('history.jsonl'))`.
+"""
+
+import json
+import logging
+import os
+import textwrap
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Literal
+
+from browser_use.agent.views import AgentHistory, AgentOutput
+
+logger = logging.getLogger(__name__)
+
+FsyncPolicy = Literal['never', 'step', 'close']
+
+
+class HistoryStreamWriter:
+	"""
+	Appends one JSON line per AgentHistory item to a file.
+
+	Every line is flushed to the OS as soon as it is written, so a crashed process loses at most the step being written.
+	`fsync` controls when the file is also forced to disk (surviving an OS crash or power loss):
+	'never' leaves it to the OS, 'step' syncs after every step, 'close' syncs once when the writer is closed.
+	`append()` and `close()` block on disk I/O (an fsync can take milliseconds); the Agent calls them in a worker thread.
+	"""
+
+	def __init__(self, path: str | Path, fsync: FsyncPolicy = 'close'):
+		if fsync not in ('never', 'step', 'close'):
+			raise ValueError(f"Invalid fsync policy {fsync!r}, expected 'never', 'step' or 'close'")
+		self.path = Path(path)
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		self.fsync = fsync
+		self.steps_written = 0
+		self._lock = threading.Lock()
+		self._file = self.path.open('a', encoding='utf-8')
+
+	def append(self, history_item: AgentHistory, sensitive_data: dict[str, str | dict[str, str]] | None = None) -> None:
+		"""Serialize one history item (filtering sensitive data like save_to_file) and append it as a line"""
+		line = json.dumps(history_item.model_dump(sensitive_data=sensitive_data))
+		with self._lock:
+			if self._file.closed:
+				raise ValueError(f'History stream {self.path} is closed')
+			self._file.write(line + '\n')
+			self._file.flush()
+			if self.fsync == 'step':
+				os.fsync(self._file.fileno())
+			self.steps_written += 1
+
+	def close(self) -> None:
+		"""Flush and close the file, syncing it to disk unless the policy is 'never'. Safe to call more than once."""
+		with self._lock:
+			if self._file.closed:
+				return
+			self._file.flush()
+			if self.fsync != 'never':
+				os.fsync(self._file.fileno())
+			self._file.close()
+
+	def __enter__(self) -> 'HistoryStreamWriter':
+		return self
+
+	def __exit__(self, *exc_info: Any) -> None:
+		self.close()
+
+
+def _iter_records(path: str | Path) -> Iterator[dict[str, Any]]:
+	"""Yield the JSON records of a history stream, skipping a final line cut off by a crash mid-write"""
+	with open(path, encoding='utf-8') as f:
+		for line_number, line in enumerate(f, 1):
+			if not line.strip():
+				continue
+			try:
+				yield json.loads(line)
+			except json.JSONDecodeError:
+				if line.endswith('\n'):
+					raise ValueError(f'Invalid history record on line {line_number} of {path}')
+				logger.warning(f'⚠️ Ignoring incomplete last history record on line {line_number} of {path}')
+
+
+def iter_history_file(path: str | Path, output_model: type[AgentOutput]) -> Iterator[AgentHistory]:
+	"""Lazily load the steps of a history stream one at a time, validating actions with output_model"""
+	for record in _iter_records(path):
+		yield AgentHistory.load_from_dict(record, output_model)
+
+
+def compact_history_file(stream_path: str | Path, output_path: str | Path) -> int:
+	"""
+	Convert a history stream into the JSON document written by AgentHistoryList.save_to_file().
+
+	Records are copied one at a time without validation, so this needs neither the output model nor the whole
+	history in memory. The output is written to a temporary file and moved into place. Returns the number of steps.
+	"""
+	output_path = Path(output_path)
+	output_path.parent.mkdir(parents=True, exist_ok=True)
+	tmp_path = output_path.with_name(f'.{output_path.name}.tmp')
+	steps = 0
+	try:
+		with open(tmp_path, 'w', encoding='utf-8') as f:
+			f.write('{\n  "history": [')
+			for record in _iter_records(stream_path):
+				f.write(',\n' if steps else '\n')
+				# Same layout as json.dump(..., indent=2) of the whole {'history': [...]} document
+				f.write(textwrap.indent(json.dumps(record, indent=2), '    '))
+				steps += 1
+			f.write('\n  ]\n}' if steps else ']\n}')
+		os.replace(tmp_path, output_path)
+	except BaseException:
+		tmp_path.unlink(missing_ok=True)
+		raise
+	return steps
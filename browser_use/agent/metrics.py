@@ -0,0 +1,163 @@
+"""
+Sinks for per-step latency metrics (StepMetrics), so DOM capture, serialization, screenshot, LLM and action
+time can be charted across many agents.
+
+Pass them to the agent with `Agent(..., metrics_sinks=[JSONLMetricsSink('steps.jsonl')])`. Every finished step
+is also available as `AgentHistory.metadata.metrics`.
+"""
+
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, TextIO
+
+from browser_use.agent.views import StepMetrics
+
+try:
+	from opentelemetry import metrics as otel_metrics
+
+	OPENTELEMETRY_AVAILABLE = True
+except ImportError:
+	OPENTELEMETRY_AVAILABLE = False
+
+# Prometheus histogram buckets in seconds, from fast DOM phases up to slow LLM calls
+DEFAULT_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class StepMetricsSink(ABC):
+	"""
+	Receives the StepMetrics of every finished agent step.
+
+	Sinks that block on disk I/O set `blocking = True`; the agent then calls `record_step()` and `close()` in a
+	worker thread instead of on the event loop.
+	"""
+
+	blocking: bool = False
+
+	@abstractmethod
+	def record_step(self, task_id: str, metrics: StepMetrics) -> None:
+		"""Record one step. Non-blocking sinks are called on the agent loop, so they must not block on I/O."""
+
+	def close(self) -> None:
+		"""Flush and release resources, called when the agent is closed."""
+
+
+class JSONLMetricsSink(StepMetricsSink):
+	"""Appends one JSON object per step to a file, for offline analysis (pandas, DuckDB, jq...)."""
+
+	blocking = True
+
+	def __init__(self, path: str | Path):
+		self.path = Path(path)
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		self._lock = threading.Lock()
+		self._file: TextIO | None = None
+
+	def record_step(self, task_id: str, metrics: StepMetrics) -> None:
+		line = json.dumps({'task_id': task_id, **metrics.model_dump()})
+		with self._lock:
+			# Opened once and kept open; reopened if a step is recorded after close()
+			if self._file is None:
+				self._file = self.path.open('a', encoding='utf-8')
+			self._file.write(line + '\n')
+			self._file.flush()
+
+	def close(self) -> None:
+		with self._lock:
+			if self._file is not None:
+				self._file.close()
+				self._file = None
+
+
+class PrometheusTextFileSink(StepMetricsSink):
+	"""
+	Keeps cumulative histograms per phase and rewrites a Prometheus text exposition file after every step.
+
+	Point node_exporter's textfile collector (or any scraper reading the format) at the file; the file is
+	replaced atomically so a scrape never sees a partial write.
+	"""
+
+	blocking = True
+
+	def __init__(
+		self,
+		path: str | Path,
+		metric_name: str = 'browser_use_step_phase_duration_seconds',
+		buckets: tuple[float, ...] = DEFAULT_BUCKETS_SECONDS,
+		labels: dict[str, str] | None = None,
+	):
+		self.path = Path(path)
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		self.metric_name = metric_name
+		self.buckets = tuple(sorted(buckets))
+		self.labels = labels or {}
+		self._lock = threading.Lock()
+		# phase -> non-cumulative count per bucket (last slot is the +Inf overflow), sum in seconds, count
+		self._bucket_counts: dict[str, list[int]] = {}
+		self._sums: dict[str, float] = {}
+		self._counts: dict[str, int] = {}
+
+	def record_step(self, task_id: str, metrics: StepMetrics) -> None:
+		with self._lock:
+			for phase, duration_ms in metrics.phase_durations_ms().items():
+				seconds = duration_ms / 1000
+				counts = self._bucket_counts.setdefault(phase, [0] * (len(self.buckets) + 1))
+				counts[bisect_left(self.buckets, seconds)] += 1
+				self._sums[phase] = self._sums.get(phase, 0.0) + seconds
+				self._counts[phase] = self._counts.get(phase, 0) + 1
+			text = self.render()
+			tmp_path = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+			tmp_path.write_text(text, encoding='utf-8')
+			os.replace(tmp_path, self.path)
+
+	def render(self) -> str:
+		"""Current histograms in the Prometheus text exposition format."""
+		lines = [
+			f'# HELP {self.metric_name} Duration of browser-use agent step phases.',
+			f'# TYPE {self.metric_name} histogram',
+		]
+		for phase in sorted(self._bucket_counts):
+			labels = {**self.labels, 'phase': phase}
+			cumulative = 0
+			for upper_bound, count in zip((*self.buckets, float('inf')), self._bucket_counts[phase]):
+				cumulative += count
+				le = '+Inf' if upper_bound == float('inf') else repr(upper_bound)
+				lines.append(f'{self.metric_name}_bucket{_format_labels({**labels, "le": le})} {cumulative}')
+			lines.append(f'{self.metric_name}_sum{_format_labels(labels)} {self._sums[phase]!r}')
+			lines.append(f'{self.metric_name}_count{_format_labels(labels)} {self._counts[phase]}')
+		return '\n'.join(lines) + '\n'
+
+
+class OpenTelemetryMetricsSink(StepMetricsSink):
+	"""Records phase durations on an OpenTelemetry histogram; export is handled by the configured MeterProvider."""
+
+	def __init__(
+		self,
+		meter: Any | None = None,
+		histogram_name: str = 'browser_use.step.phase.duration',
+		attributes: dict[str, str] | None = None,
+	):
+		if meter is None:
+			if not OPENTELEMETRY_AVAILABLE:
+				raise ImportError('OpenTelemetryMetricsSink requires opentelemetry-api: pip install opentelemetry-api')
+			meter = otel_metrics.get_meter('browser_use')
+		self.attributes = attributes or {}
+		self._histogram = meter.create_histogram(
+			histogram_name, unit='ms', description='Duration of browser-use agent step phases'
+		)
+
+	def record_step(self, task_id: str, metrics: StepMetrics) -> None:
+		for phase, duration_ms in metrics.phase_durations_ms().items():
+			self._histogram.record(duration_ms, attributes={**self.attributes, 'phase': phase})
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+	"""Render a Prometheus label set, escaping backslashes, quotes and newlines in values."""
+	parts = []
+	for key, value in labels.items():
+		value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+		parts.append(f'{key}="{value}"')
+	return '{' + ','.join(parts) + '}'
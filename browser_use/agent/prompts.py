@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Literal, Optional
 from browser_use.dom.views import NodeType, SimplifiedNode
 from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, SystemMessage, UserMessage
 from browser_use.observability import observe_debug
-from browser_use.utils import is_new_tab_page, sanitize_surrogates
+from browser_use.utils import get_image_media_type, is_new_tab_page, sanitize_surrogates
 
 if TYPE_CHECKING:
 	from browser_use.agent.views import AgentStepInfo
@@ -68,6 +68,37 @@ class SystemPrompt:
 		return self.system_message
 
 
+def resize_screenshot(screenshot_b64: str, size: tuple[int, int]) -> str:
+	"""Resize a base64 screenshot to `size`, keeping its image format.
+
+	Screenshots already at that size (e.g. captured at that size by the browser) are returned as-is: PIL only
+	parses the image header to read the size, the pixels are decoded only when a resize is actually needed.
+	CPU-bound, so the agent runs it on the image executor before building the state message.
+	"""
+	try:
+		import base64
+		import logging
+		from io import BytesIO
+
+		from PIL import Image
+
+		img = Image.open(BytesIO(base64.b64decode(screenshot_b64)))
+		if img.size == size:
+			return screenshot_b64
+
+		logging.getLogger(__name__).info(
+			f'🔄 Resizing screenshot from {img.size[0]}x{img.size[1]} to {size[0]}x{size[1]} for LLM'
+		)
+
+		img_resized = img.resize(size, Image.Resampling.LANCZOS)
+		buffer = BytesIO()
+		img_resized.save(buffer, format=img.format or 'PNG')
+		return base64.b64encode(buffer.getvalue()).decode('utf-8')
+	except Exception as e:
+		logging.getLogger(__name__).warning(f'Failed to resize screenshot: {e}, using original')
+		return screenshot_b64
+
+
 class AgentMessagePrompt:
 	vision_detail_level: Literal['auto', 'low', 'high']
 
@@ -328,29 +359,7 @@ Available tabs:
 		"""Resize screenshot to llm_screenshot_size if configured."""
 		if not self.llm_screenshot_size:
 			return screenshot_b64
-
-		try:
-			import base64
-			import logging
-			from io import BytesIO
-
-			from PIL import Image
-
-			img = Image.open(BytesIO(base64.b64decode(screenshot_b64)))
-			if img.size == self.llm_screenshot_size:
-				return screenshot_b64
-
-			logging.getLogger(__name__).info(
-				f'🔄 Resizing screenshot from {img.size[0]}x{img.size[1]} to {self.llm_screenshot_size[0]}x{self.llm_screenshot_size[1]} for LLM'
-			)
-
-			img_resized = img.resize(self.llm_screenshot_size, Image.Resampling.LANCZOS)
-			buffer = BytesIO()
-			img_resized.save(buffer, format='PNG')
-			return base64.b64encode(buffer.getvalue()).decode('utf-8')
-		except Exception as e:
-			logging.getLogger(__name__).warning(f'Failed to resize screenshot: {e}, using original')
-			return screenshot_b64
+		return resize_screenshot(screenshot_b64, self.llm_screenshot_size)
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_user_message')
 	def get_user_message(self, use_vision: bool = True) -> UserMessage:
@@ -410,11 +419,12 @@ Available tabs:
 				processed_screenshot = self._resize_screenshot(screenshot)
 
 				# Add the screenshot
+				media_type = get_image_media_type(processed_screenshot)
 				content_parts.append(
 					ContentPartImageParam(
 						image_url=ImageURL(
-							url=f'data:image/png;base64,{processed_screenshot}',
-							media_type='image/png',
+							url=f'data:{media_type};base64,{processed_screenshot}',
+							media_type=media_type,
 							detail=self.vision_detail_level,
 						),
 					)
@@ -1,4 +1,5 @@
 import asyncio
+import dataclasses
 import gc
 import inspect
 import json
@@ -22,6 +23,7 @@ from browser_use.agent.cloud_events import (
 )
 from browser_use.agent.message_manager.utils import save_conversation
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.client_pool import llm_client_pool
 from browser_use.llm.messages import BaseMessage, ContentPartImageParam, ContentPartTextParam, UserMessage
 from browser_use.tokens.service import TokenCost
 
@@ -32,6 +34,7 @@ from pydantic import BaseModel, ValidationError
 from uuid_extensions import uuid7str
 
 from browser_use import Browser, BrowserProfile, BrowserSession
+from browser_use.agent.history_stream import HistoryStreamWriter
 from browser_use.agent.judge import construct_judge_messages
 
 # Lazy import for gif to avoid heavy agent.views import at startup
@@ -39,7 +42,8 @@ from browser_use.agent.judge import construct_judge_messages
 from browser_use.agent.message_manager.service import (
 	MessageManager,
 )
-from browser_use.agent.prompts import SystemPrompt
+from browser_use.agent.metrics import StepMetricsSink
+from browser_use.agent.prompts import SystemPrompt, resize_screenshot
 from browser_use.agent.views import (
 	ActionResult,
 	AgentError,
@@ -53,12 +57,14 @@ from browser_use.agent.views import (
 	BrowserStateHistory,
 	JudgementResult,
 	StepMetadata,
+	StepMetrics,
 )
 from browser_use.browser.session import DEFAULT_BROWSER_PROFILE
 from browser_use.browser.views import BrowserStateSummary
 from browser_use.config import CONFIG
 from browser_use.dom.views import DOMInteractedElement
 from browser_use.filesystem.file_system import FileSystem
+from browser_use.image_executor import image_executor
 from browser_use.observability import observe, observe_debug
 from browser_use.telemetry.service import ProductTelemetry
 from browser_use.telemetry.views import AgentTelemetryEvent
@@ -183,6 +189,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		sample_images: list[ContentPartTextParam | ContentPartImageParam] | None = None,
 		final_response_after_failure: bool = True,
 		llm_screenshot_size: tuple[int, int] | None = None,
+		metrics_sinks: list[StepMetricsSink] | None = None,
+		history_writer: HistoryStreamWriter | None = None,
 		_url_shortening_limit: int = 25,
 		**kwargs,
 	):
@@ -280,6 +288,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self.task = self._enhance_task_with_schema(task, output_model_schema)
 		self.llm = llm
 		self.judge_llm = judge_llm
+		# Hold a lease on the shared LLM HTTP client pool until close() so connections stay warm between steps
+		self._holds_llm_client_lease = False
+		self._acquire_llm_client_lease()
 		self.directly_open_url = directly_open_url
 		self.include_recent_events = include_recent_events
 		self._url_shortening_limit = _url_shortening_limit
@@ -331,6 +342,15 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self.token_cost_service.register_llm(page_extraction_llm)
 		self.token_cost_service.register_llm(judge_llm)
 
+		# Per-step latency metrics (also stored on each AgentHistory's StepMetadata)
+		self.metrics_sinks: list[StepMetricsSink] = metrics_sinks or []
+		self._step_timing: dict[str, float] = {}
+		# Per-step timings of the last rerun_history() call
+		self.replay_metrics: list[StepMetrics] = []
+
+		# Appends every history item to a JSONL file as it is added
+		self.history_writer = history_writer
+
 		# Initialize state
 		self.state = injected_agent_state or AgentState()
 
@@ -713,6 +733,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# Initialize timing first, before any exceptions can occur
 
 		self.step_start_time = time.time()
+		self._step_timing = {}
 
 		browser_state_summary = None
 
@@ -743,15 +764,30 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self.logger.debug(f'🌐 Step {self.state.n_steps}: Getting browser state...')
 		# Always take screenshots for all steps
 		self.logger.debug('📸 Requesting browser state with include_screenshot=True')
+		browser_state_start = time.time()
+		llm_screenshot_size = self.browser_session.llm_screenshot_size if self.settings.use_vision is not False else None
+		# Opt-in: a second screenshot that the browser renders at the LLM's size, the shared one stays full resolution
+		downscale_in_browser = self.browser_session.browser_profile.downscale_llm_screenshot_in_browser
 		browser_state_summary = await self.browser_session.get_browser_state_summary(
 			include_screenshot=True,  # always capture even if use_vision=False so that cloud sync is useful (it's fast now anyway)
 			include_recent_events=self.include_recent_events,
+			llm_screenshot_size=llm_screenshot_size if downscale_in_browser else None,
 		)
+		self._step_timing['browser_state_ms'] = (time.time() - browser_state_start) * 1000
 		if browser_state_summary.screenshot:
 			self.logger.debug(f'📸 Got browser state WITH screenshot, length: {len(browser_state_summary.screenshot)}')
 		else:
 			self.logger.debug('📸 Got browser state WITHOUT screenshot')
 
+		# Resize for the LLM off the event loop; the state message then finds the screenshot already at that size.
+		# Only the LLM's copy is resized: the summary is cached by the session and its screenshot goes into history.
+		# A screenshot the browser already rendered at that size is passed through without decoding its pixels.
+		llm_browser_state_summary = browser_state_summary
+		source_screenshot = browser_state_summary.llm_screenshot or browser_state_summary.screenshot
+		if llm_screenshot_size and source_screenshot:
+			llm_screenshot = await image_executor.run(resize_screenshot, source_screenshot, llm_screenshot_size)
+			llm_browser_state_summary = dataclasses.replace(browser_state_summary, screenshot=llm_screenshot)
+
 		# Check for new downloads after getting browser state (catches PDF auto-downloads and previous step downloads)
 		await self._check_and_update_downloads(f'Step {self.state.n_steps}: after getting browser state')
 
@@ -769,7 +805,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self.logger.debug(f'💬 Step {self.state.n_steps}: Creating state messages for context...')
 
 		self._message_manager.create_state_messages(
-			browser_state_summary=browser_state_summary,
+			browser_state_summary=llm_browser_state_summary,
 			model_output=self.state.last_model_output,
 			result=self.state.last_result,
 			step_info=step_info,
@@ -791,6 +827,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			f'🤖 Step {self.state.n_steps}: Calling LLM with {len(input_messages)} messages (model: {self.llm.model})...'
 		)
 
+		llm_start = time.time()
 		try:
 			model_output = await asyncio.wait_for(
 				self._get_model_output_with_retry(input_messages), timeout=self.settings.llm_timeout
@@ -807,6 +844,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			raise TimeoutError(
 				f'LLM call timed out after {self.settings.llm_timeout} seconds. Keep your thinking and output short.'
 			)
+		finally:
+			self._step_timing['llm_ms'] = (time.time() - llm_start) * 1000
 
 		self.state.last_model_output = model_output
 
@@ -824,7 +863,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		if self.state.last_model_output is None:
 			raise ValueError('No model output to execute actions from')
 
-		result = await self.multi_act(self.state.last_model_output.action)
+		actions_start = time.time()
+		try:
+			result = await self.multi_act(self.state.last_model_output.action)
+		finally:
+			self._step_timing['actions_ms'] = (time.time() - actions_start) * 1000
 		self.state.last_result = result
 
 	async def _post_process(self) -> None:
@@ -858,6 +901,18 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				for i, file_path in enumerate(self.state.last_result[-1].attachments):
 					self.logger.info(f'👉 Attachment {i + 1 if total_attachments > 1 else ""}: {file_path}')
 
+	async def _record_step_metrics(self, metrics: StepMetrics) -> None:
+		"""Send the step metrics to the configured sinks; a failing sink never fails the step"""
+		for sink in self.metrics_sinks:
+			try:
+				if sink.blocking:
+					# File-backed sinks write on every step, so they run in a worker thread
+					await asyncio.to_thread(sink.record_step, self.task_id, metrics)
+				else:
+					sink.record_step(self.task_id, metrics)
+			except Exception as e:
+				self.logger.warning(f'Failed to record step metrics with {type(sink).__name__}: {type(e).__name__}: {e}')
+
 	async def _handle_step_error(self, error: Exception) -> None:
 		"""Handle all types of errors that can occur during a step"""
 
@@ -897,10 +952,18 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			return
 
 		if browser_state_summary:
+			metrics = StepMetrics.from_timings(
+				step_number=self.state.n_steps,
+				step_ms=(step_end_time - self.step_start_time) * 1000,
+				step_timing=self._step_timing,
+				browser_timing=browser_state_summary.timing,
+			)
+			await self._record_step_metrics(metrics)
 			metadata = StepMetadata(
 				step_number=self.state.n_steps,
 				step_start_time=self.step_start_time,
 				step_end_time=step_end_time,
+				metrics=metrics,
 			)
 
 			# Use _make_history_item like main branch
@@ -1145,7 +1208,19 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			state_message=state_message,
 		)
 
+		await self._add_history_item(history_item)
+
+	async def _add_history_item(self, history_item: AgentHistory) -> None:
+		"""Add an item to the history and append it to the history stream; a failing stream never fails the step"""
 		self.history.add_item(history_item)
+		if self.history_writer is not None:
+			try:
+				# Serializing, writing and (with fsync='step') syncing the step blocks, so it runs in a worker thread
+				await asyncio.to_thread(self.history_writer.append, history_item, sensitive_data=self.sensitive_data)
+			except Exception as e:
+				self.logger.warning(
+					f'Failed to append step to history stream {self.history_writer.path}: {type(e).__name__}: {e}'
+				)
 
 	def _remove_think_tags(self, text: str) -> str:
 		THINK_TAGS = re.compile(r'<think>.*?</think>', re.DOTALL)
@@ -1826,6 +1901,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		)
 		signal_handler.register()
 
+		# Re-acquire the LLM client pool lease if a previous run() already closed this agent (follow-up tasks)
+		self._acquire_llm_client_lease()
+
 		try:
 			await self._log_agent_run()
 
@@ -1905,7 +1983,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			else:
 				agent_run_error = 'Failed to complete task in maximum steps'
 
-				self.history.add_item(
+				await self._add_history_item(
 					AgentHistory(
 						model_output=None,
 						result=[ActionResult(error=agent_run_error, include_in_memory=True)],
@@ -1980,7 +2058,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				# Lazy import gif module to avoid heavy startup cost
 				from browser_use.agent.gif import create_history_gif
 
-				create_history_gif(task=self.task, history=self.history, output_path=output_path)
+				await image_executor.run(create_history_gif, task=self.task, history=self.history, output_path=output_path)
 
 				# Only emit output file event if GIF was actually created
 				if Path(output_path).exists():
@@ -2151,15 +2229,20 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		max_retries: int = 3,
 		skip_failures: bool = True,
 		delay_between_actions: float = 2.0,
+		fast: bool = False,
 	) -> list[ActionResult]:
 		"""
 		Rerun a saved history of actions with error handling and retry logic.
 
+		The timings of every replayed step are logged, sent to the metrics sinks and kept in `self.replay_metrics`.
+
 		Args:
 		                history: The history to replay
 		                max_retries: Maximum number of retries per action
 		                skip_failures: Whether to skip failed actions or stop execution
-		                delay_between_actions: Delay between actions in seconds
+		                delay_between_actions: Delay between actions in seconds (the longest wait for the page to settle if fast)
+		                fast: Don't highlight elements, and after each step wait until the page settles (loaded, no DOM
+		                        changes or finished requests for a moment) instead of sleeping delay_between_actions
 
 		Returns:
 		                List of action results
@@ -2171,6 +2254,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		await self.browser_session.start()
 
 		results = []
+		self.replay_metrics = []
 
 		for i, history_item in enumerate(history.history):
 			goal = history_item.model_output.current_state.next_goal if history_item.model_output else ''
@@ -2190,7 +2274,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			retry_count = 0
 			while retry_count < max_retries:
 				try:
-					result = await self._execute_history_step(history_item, delay_between_actions)
+					result = await self._execute_history_step(history_item, delay_between_actions, fast=fast)
 					results.extend(result)
 					break
 
@@ -2204,7 +2288,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 							raise RuntimeError(error_msg)
 					else:
 						self.logger.warning(f'{step_name} failed (attempt {retry_count}/{max_retries}), retrying...')
-						await asyncio.sleep(delay_between_actions)
+						if fast:
+							await self.browser_session.wait_for_page_settle(timeout=delay_between_actions)
+						else:
+							await asyncio.sleep(delay_between_actions)
 
 		await self.close()
 		return results
@@ -2258,58 +2345,91 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				metadata=metadata,
 			)
 
-			self.history.add_item(history_item)
+			await self._add_history_item(history_item)
 			self.logger.debug('📝 Saved initial actions to history as step 0')
 			self.logger.debug('Initial actions completed')
 
-	async def _execute_history_step(self, history_item: AgentHistory, delay: float) -> list[ActionResult]:
+	async def _execute_history_step(self, history_item: AgentHistory, delay: float, fast: bool = False) -> list[ActionResult]:
 		"""Execute a single step from history with element validation"""
 		assert self.browser_session is not None, 'BrowserSession is not set up'
-		state = await self.browser_session.get_browser_state_summary(include_screenshot=False)
+		step_start = time.time()
+		step_timing: dict[str, float] = {}
+		state = await self.browser_session.get_browser_state_summary(include_screenshot=False, include_highlights=not fast)
+		step_timing['browser_state_ms'] = (time.time() - step_start) * 1000
 		if not state or not history_item.model_output:
 			raise ValueError('Invalid state or model output')
+
+		element_hash_index = self._build_element_hash_index(state)
 		updated_actions = []
 		for i, action in enumerate(history_item.model_output.action):
 			updated_action = await self._update_action_indices(
 				history_item.state.interacted_element[i],
 				action,
 				state,
+				element_hash_index,
 			)
 			updated_actions.append(updated_action)
 
 			if updated_action is None:
 				raise ValueError(f'Could not find matching element {i} in current page')
 
+		actions_start = time.time()
 		result = await self.multi_act(updated_actions)
+		step_timing['actions_ms'] = (time.time() - actions_start) * 1000
 
-		await asyncio.sleep(delay)
+		settle_start = time.time()
+		if fast:
+			settled = await self.browser_session.wait_for_page_settle(timeout=delay)
+			if not settled:
+				self.logger.debug(f'Page did not settle within {delay}s, continuing')
+		else:
+			await asyncio.sleep(delay)
+		step_timing['settle_ms'] = (time.time() - settle_start) * 1000
+
+		metrics = StepMetrics.from_timings(
+			step_number=history_item.metadata.step_number if history_item.metadata else len(self.replay_metrics),
+			step_ms=(time.time() - step_start) * 1000,
+			step_timing=step_timing,
+			browser_timing=state.timing,
+		)
+		self.replay_metrics.append(metrics)
+		await self._record_step_metrics(metrics)
+		self.logger.info(
+			f'⏱️ Replayed step {metrics.step_number} in {metrics.step_ms / 1000:.2f}s '
+			f'(state {step_timing["browser_state_ms"]:.0f}ms, actions {step_timing["actions_ms"]:.0f}ms, '
+			f'{"settle" if fast else "delay"} {step_timing["settle_ms"]:.0f}ms)'
+		)
 		return result
 
+	@staticmethod
+	def _build_element_hash_index(browser_state_summary: BrowserStateSummary) -> dict[int, int]:
+		"""Map element hashes to the highlight index of the first element with that hash"""
+		element_hash_index: dict[int, int] = {}
+		for highlight_index, element in browser_state_summary.dom_state.selector_map.items():
+			element_hash_index.setdefault(element.element_hash, highlight_index)
+		return element_hash_index
+
 	async def _update_action_indices(
 		self,
 		historical_element: DOMInteractedElement | None,
 		action: ActionModel,  # Type this properly based on your action model
 		browser_state_summary: BrowserStateSummary,
+		element_hash_index: dict[int, int] | None = None,
 	) -> ActionModel | None:
 		"""
 		Update action indices based on current page state.
 		Returns updated action or None if element cannot be found.
+
+		Pass element_hash_index (see _build_element_hash_index) when updating several actions against the same state.
 		"""
 		if not historical_element or not browser_state_summary.dom_state.selector_map:
 			return action
 
-		# selector_hash_map = {hash(e): e for e in browser_state_summary.dom_state.selector_map.values()}
+		if element_hash_index is None:
+			element_hash_index = self._build_element_hash_index(browser_state_summary)
 
-		highlight_index, current_element = next(
-			(
-				(highlight_index, element)
-				for highlight_index, element in browser_state_summary.dom_state.selector_map.items()
-				if element.element_hash == historical_element.element_hash
-			),
-			(None, None),
-		)
-
-		if not current_element or highlight_index is None:
+		highlight_index = element_hash_index.get(historical_element.element_hash)
+		if highlight_index is None:
 			return None
 
 		old_index = action.get_index()
@@ -2409,6 +2529,24 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 					# stops the EventBus with clear=True, and recreates a fresh EventBus
 					await self.browser_session.kill()
 
+			# Release pooled LLM HTTP clients (closed once no other agent is using them)
+			await self._release_llm_client_lease()
+
+			for sink in self.metrics_sinks:
+				try:
+					if sink.blocking:
+						await asyncio.to_thread(sink.close)
+					else:
+						sink.close()
+				except Exception as e:
+					self.logger.debug(f'Failed to close metrics sink {type(sink).__name__}: {e}')
+
+			if self.history_writer is not None:
+				try:
+					await asyncio.to_thread(self.history_writer.close)
+				except Exception as e:
+					self.logger.debug(f'Failed to close history stream {self.history_writer.path}: {e}')
+
 			# Force garbage collection
 			gc.collect()
 
@@ -2430,6 +2568,16 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		except Exception as e:
 			self.logger.error(f'Error during cleanup: {e}')
 
+	def _acquire_llm_client_lease(self) -> None:
+		if not self._holds_llm_client_lease:
+			llm_client_pool.acquire()
+			self._holds_llm_client_lease = True
+
+	async def _release_llm_client_lease(self) -> None:
+		if self._holds_llm_client_lease:
+			self._holds_llm_client_lease = False
+			await llm_client_pool.release()
+
 	async def _update_action_models_for_page(self, page_url: str) -> None:
 		"""Update action models with page-specific actions"""
 		# Create new action model with current page's filtered actions
@@ -4,6 +4,7 @@ import json
 import logging
 import traceback
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Generic, Literal
 
@@ -153,12 +154,62 @@ class ActionResult(BaseModel):
 		return self
 
 
+class StepMetrics(BaseModel):
+	"""Latency breakdown of a single step in milliseconds, None for phases that did not run"""
+
+	step_number: int
+	step_ms: float
+	browser_state_ms: float | None = None
+	dom_capture_ms: float | None = None
+	dom_serialization_ms: float | None = None
+	screenshot_ms: float | None = None
+	llm_ms: float | None = None
+	actions_ms: float | None = None
+	settle_ms: float | None = None  # waiting for the page to settle after the actions (history replay)
+	# Detailed DomService / DOMTreeSerializer timings (e.g. cdp_parallel_calls_ms, build_snapshot_lookup_ms)
+	dom_timing: dict[str, float] = Field(default_factory=dict)
+
+	@classmethod
+	def from_timings(
+		cls, step_number: int, step_ms: float, step_timing: dict[str, float], browser_timing: dict[str, float] | None = None
+	) -> StepMetrics:
+		"""Combine the agent's phase timings with the timing breakdown attached to the BrowserStateSummary"""
+		browser_timing = browser_timing or {}
+		return cls(
+			step_number=step_number,
+			step_ms=step_ms,
+			browser_state_ms=step_timing.get('browser_state_ms'),
+			dom_capture_ms=browser_timing.get('get_dom_tree_total_ms'),
+			dom_serialization_ms=browser_timing.get('serialize_accessible_elements_total_ms'),
+			screenshot_ms=browser_timing.get('screenshot_ms'),
+			llm_ms=step_timing.get('llm_ms'),
+			actions_ms=step_timing.get('actions_ms'),
+			settle_ms=step_timing.get('settle_ms'),
+			dom_timing={key: value for key, value in browser_timing.items() if key != 'screenshot_ms'},
+		)
+
+	def phase_durations_ms(self) -> dict[str, float]:
+		"""Durations of the phases that ran, keyed by phase name (step, browser_state, dom_capture, ...)"""
+		phases = {
+			'step': self.step_ms,
+			'browser_state': self.browser_state_ms,
+			'dom_capture': self.dom_capture_ms,
+			'dom_serialization': self.dom_serialization_ms,
+			'screenshot': self.screenshot_ms,
+			'llm': self.llm_ms,
+			'actions': self.actions_ms,
+			'settle': self.settle_ms,
+		}
+		return {phase: duration for phase, duration in phases.items() if duration is not None}
+
+
 class StepMetadata(BaseModel):
 	"""Metadata for a single step including timing and token information"""
 
 	step_start_time: float
 	step_end_time: float
 	step_number: int
+	metrics: StepMetrics | None = None
 
 	@property
 	def duration_seconds(self) -> float:
@@ -202,8 +253,9 @@ class AgentOutput(BaseModel):
 		)
 
 	@staticmethod
+	@lru_cache(maxsize=128)
 	def type_with_custom_actions(custom_actions: type[ActionModel]) -> type[AgentOutput]:
-		"""Extend actions with custom actions"""
+		"""Extend actions with custom actions (cached per ActionModel class so schema caches stay warm)"""
 
 		model_ = create_model(
 			'AgentOutput',
@@ -217,6 +269,7 @@ class AgentOutput(BaseModel):
 		return model_
 
 	@staticmethod
+	@lru_cache(maxsize=128)
 	def type_with_custom_actions_no_thinking(custom_actions: type[ActionModel]) -> type[AgentOutput]:
 		"""Extend actions with custom actions and exclude thinking field"""
 
@@ -241,6 +294,7 @@ class AgentOutput(BaseModel):
 		return model
 
 	@staticmethod
+	@lru_cache(maxsize=128)
 	def type_with_custom_actions_flash_mode(custom_actions: type[ActionModel]) -> type[AgentOutput]:
 		"""Extend actions with custom actions for flash mode - memory and action fields only"""
 
@@ -384,6 +438,18 @@ class AgentHistory(BaseModel):
 			'state_message': self.state_message,
 		}
 
+	@classmethod
+	def load_from_dict(cls, data: dict[str, Any], output_model: type[AgentOutput]) -> AgentHistory:
+		"""Load one history item, validating model_output actions with output_model to enrich with custom actions"""
+		if data['model_output']:
+			if isinstance(data['model_output'], dict):
+				data['model_output'] = output_model.model_validate(data['model_output'])
+			else:
+				data['model_output'] = None
+		if 'interacted_element' not in data['state']:
+			data['state']['interacted_element'] = None
+		return cls.model_validate(data)
+
 
 AgentStructuredOutput = TypeVar('AgentStructuredOutput', bound=BaseModel)
 
@@ -471,21 +537,19 @@ class AgentHistoryList(BaseModel, Generic[AgentStructuredOutput]):
 	@classmethod
 	def load_from_dict(cls, data: dict[str, Any], output_model: type[AgentOutput]) -> AgentHistoryList:
 		# loop through history and validate output_model actions to enrich with custom actions
-		for h in data['history']:
-			if h['model_output']:
-				if isinstance(h['model_output'], dict):
-					h['model_output'] = output_model.model_validate(h['model_output'])
-				else:
-					h['model_output'] = None
-			if 'interacted_element' not in h['state']:
-				h['state']['interacted_element'] = None
+		data['history'] = [AgentHistory.load_from_dict(h, output_model) for h in data['history']]
 
 		history = cls.model_validate(data)
 		return history
 
 	@classmethod
 	def load_from_file(cls, filepath: str | Path, output_model: type[AgentOutput]) -> AgentHistoryList:
-		"""Load history from JSON file"""
+		"""Load history from a JSON file, or from a JSONL file written by HistoryStreamWriter"""
+		if Path(filepath).suffix == '.jsonl':
+			from browser_use.agent.history_stream import iter_history_file
+
+			return cls(history=list(iter_history_file(filepath, output_model)))
+
 		with open(filepath, encoding='utf-8') as f:
 			data = json.load(f)
 		return cls.load_from_dict(data, output_model)
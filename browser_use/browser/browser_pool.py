@@ -0,0 +1,350 @@
+"""
+Warm pool of pre-launched local browsers for fast BrowserSession startup.
+
+Launching Chromium and waiting for its CDP endpoint takes seconds, which every job pays on `BrowserSession.start()`.
+The pool keeps `size` headless browsers running with throwaway profiles. LocalBrowserWatchdog takes one from the pool
+instead of launching its own when the session's profile is compatible (same executable and launch args, and a temporary
+user_data_dir rather than a persistent user profile). While a session uses the browser, the pool records the origin of
+every page, frame and worker it runs. When the session stops, the browser is reset (tabs closed, cookies, cache and the
+storage of every recorded origin cleared) and goes back to the pool. Browsers that fail to reset or reach `max_uses` are
+killed and replaced, and the pool is refilled in the background.
+
+The pool is opt-in: set BROWSER_USE_BROWSER_POOL_SIZE=N, or configure `browser_pool` in code, and optionally
+`await browser_pool.start()` to pre-launch before the first session. Pool hits and cold starts are tracked in
+`browser_pool.stats`.
+"""
+
+import asyncio
+import atexit
+import logging
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+import psutil
+
+from browser_use.config import CONFIG
+
+if TYPE_CHECKING:
+	from cdp_use import CDPClient
+
+	from browser_use.browser.profile import BrowserProfile
+
+logger = logging.getLogger(__name__)
+
+# A pooled browser is killed and replaced after serving this many sessions, bounding whatever state a reset misses
+BROWSER_POOL_MAX_USES = 20
+
+# Prefix of the user_data_dir BrowserProfile creates when none is given, i.e. a profile that is safe to swap out
+THROWAWAY_USER_DATA_DIR_PREFIX = 'browser-use-user-data-dir-'
+
+
+def _http_origin(url: str) -> str | None:
+	parsed = urlparse(url)
+	if parsed.scheme in ('http', 'https') and parsed.netloc:
+		return f'{parsed.scheme}://{parsed.netloc}'
+	return None
+
+
+@dataclass
+class PooledBrowser:
+	"""A pre-launched browser process owned by the pool while idle and by one session while in use."""
+
+	process: psutil.Process
+	cdp_url: str
+	user_data_dir: Path
+	uses: int = 0
+	recorded_origins: set[str] = field(default_factory=set)  # origins loaded during the current session
+	recorder: asyncio.Task | None = None
+
+
+@dataclass
+class BrowserPoolStats:
+	hits: int = 0  # sessions started on a pre-launched browser
+	cold_starts: int = 0  # sessions that launched their own browser (pool empty or profile not compatible)
+	launched: int = 0
+	launch_failures: int = 0
+	recycled: int = 0  # browsers reset and returned to the pool after a session
+	retired: int = 0  # browsers killed after a failed reset or max_uses
+	total_launch_ms: float = 0.0
+
+	@property
+	def hit_rate(self) -> float:
+		total = self.hits + self.cold_starts
+		return self.hits / total if total else 0.0
+
+	@property
+	def avg_launch_ms(self) -> float:
+		return self.total_launch_ms / self.launched if self.launched else 0.0
+
+
+@dataclass
+class BrowserPool:
+	"""Process-wide pool of warm headless browsers handed out to BrowserSession.start()."""
+
+	size: int | None = None  # defaults to BROWSER_USE_BROWSER_POOL_SIZE, 0 disables the pool
+	browser_profile: 'BrowserProfile | None' = None  # launch template, defaults to BrowserProfile(headless=True)
+	max_uses: int = BROWSER_POOL_MAX_USES
+
+	stats: BrowserPoolStats = field(default_factory=BrowserPoolStats)
+	_idle: list[PooledBrowser] = field(default_factory=list)
+	_launch_tasks: set[asyncio.Task] = field(default_factory=set)
+	_background_tasks: set[asyncio.Task] = field(default_factory=set)
+	_launch_key: tuple | None = None
+	_atexit_registered: bool = False
+
+	@property
+	def target_size(self) -> int:
+		return CONFIG.BROWSER_USE_BROWSER_POOL_SIZE if self.size is None else self.size
+
+	@property
+	def idle_count(self) -> int:
+		return len(self._idle)
+
+	def _get_profile(self) -> 'BrowserProfile':
+		if self.browser_profile is None:
+			from browser_use.browser.profile import BrowserProfile
+
+			self.browser_profile = BrowserProfile(headless=True)
+		return self.browser_profile
+
+	@staticmethod
+	def _profile_launch_key(profile: 'BrowserProfile') -> tuple:
+		"""Everything about a profile that shapes the launched browser, except its user_data_dir."""
+		args = tuple(arg for arg in profile.model_copy(update={'user_data_dir': '-'}).get_args() if arg != '--user-data-dir=-')
+		return (str(profile.executable_path or ''), args)
+
+	def is_compatible(self, profile: 'BrowserProfile') -> bool:
+		"""Whether a session with this profile can run on a pooled browser."""
+		if profile.user_data_dir is not None and THROWAWAY_USER_DATA_DIR_PREFIX not in str(profile.user_data_dir):
+			return False  # persistent user profiles are launched as-is
+		if self._launch_key is None:
+			self._launch_key = self._profile_launch_key(self._get_profile())
+		return self._profile_launch_key(profile) == self._launch_key
+
+	async def start(self) -> None:
+		"""Pre-launch browsers until the pool is full and wait for them to be ready."""
+		self._replenish()
+		if self._launch_tasks:
+			await asyncio.gather(*self._launch_tasks, return_exceptions=True)
+
+	async def acquire(self, profile: 'BrowserProfile') -> PooledBrowser | None:
+		"""Take a warm browser for a session with this profile, or None if the session must launch its own."""
+		if self.target_size <= 0:
+			return None
+		if not self.is_compatible(profile):
+			self.stats.cold_starts += 1
+			return None
+
+		while self._idle:
+			browser = self._idle.pop()
+			if browser.process.is_running():
+				browser.uses += 1
+				self.stats.hits += 1
+				browser.recorded_origins = set()
+				browser.recorder = self._spawn(self._record_origins(browser))
+				self._replenish()
+				logger.debug(f'🏊 Using pooled browser pid={browser.process.pid} ({self.idle_count} idle left)')
+				return browser
+			await self._retire(browser)
+
+		self.stats.cold_starts += 1
+		self._replenish()  # first use warms the pool up for the next sessions
+		logger.debug('🏊 Browser pool is empty, launching a browser for this session')
+		return None
+
+	def release(self, browser: PooledBrowser, visited_origins: set[str] | None = None) -> None:
+		"""Hand a browser back after its session stopped; it is reset and returned to the pool in the background."""
+		self._spawn(self._recycle(browser, set(visited_origins or ())))
+
+	async def close(self) -> None:
+		"""Kill all idle browsers and stop refilling the pool."""
+		self.size = 0
+		for task in [*self._launch_tasks, *self._background_tasks]:
+			task.cancel()
+		await asyncio.gather(*self._launch_tasks, *self._background_tasks, return_exceptions=True)
+		idle, self._idle = self._idle, []
+		for browser in idle:
+			await self._retire(browser, count=False)
+
+	# --- Internals -----------------------------------------------------------------------------
+
+	def _spawn(self, coro) -> asyncio.Task:
+		task = asyncio.create_task(coro)
+		self._background_tasks.add(task)
+		task.add_done_callback(self._background_tasks.discard)
+		return task
+
+	def _replenish(self) -> None:
+		missing = self.target_size - len(self._idle) - len(self._launch_tasks)
+		for _ in range(max(missing, 0)):
+			task = asyncio.create_task(self._launch())
+			self._launch_tasks.add(task)
+			task.add_done_callback(self._launch_tasks.discard)
+
+	async def _launch(self) -> None:
+		from browser_use.browser.watchdogs.local_browser_watchdog import LocalBrowserWatchdog
+
+		profile = self._get_profile()
+		browser_path = profile.executable_path or LocalBrowserWatchdog._find_installed_browser_path()
+		if not browser_path:
+			self.stats.launch_failures += 1
+			logger.warning('🏊 No local Chrome/Chromium install found, cannot pre-launch pooled browsers')
+			return
+
+		user_data_dir = Path(tempfile.mkdtemp(prefix='browser-use-pool-'))
+		debug_port = LocalBrowserWatchdog._find_free_port()
+		launch_args = profile.model_copy(update={'user_data_dir': user_data_dir}).get_args()
+		launch_args.append(f'--remote-debugging-port={debug_port}')
+
+		start = time.perf_counter()
+		process = None
+		try:
+			subprocess = await asyncio.create_subprocess_exec(
+				str(browser_path),
+				*launch_args,
+				stdout=asyncio.subprocess.DEVNULL,
+				stderr=asyncio.subprocess.PIPE,
+			)
+			process = psutil.Process(subprocess.pid)
+			cdp_url = await LocalBrowserWatchdog._wait_for_cdp_url(debug_port, stderr=subprocess.stderr)
+		except BaseException as e:
+			self.stats.launch_failures += 1
+			if process is not None:
+				await LocalBrowserWatchdog._cleanup_process(process)
+			shutil.rmtree(user_data_dir, ignore_errors=True)
+			if isinstance(e, asyncio.CancelledError):
+				raise
+			logger.warning(f'🏊 Failed to pre-launch pooled browser: {type(e).__name__}: {e}')
+			return
+
+		self.stats.launched += 1
+		self.stats.total_launch_ms += (time.perf_counter() - start) * 1000
+		if not self._atexit_registered:
+			atexit.register(self._kill_idle_sync)
+			self._atexit_registered = True
+		self._idle.append(PooledBrowser(process=process, cdp_url=cdp_url, user_data_dir=user_data_dir))
+		logger.debug(f'🏊 Pre-launched pooled browser pid={process.pid} on {cdp_url} ({self.idle_count} idle)')
+
+	async def _recycle(self, browser: PooledBrowser, visited_origins: set[str]) -> None:
+		if browser.recorder is not None:
+			browser.recorder.cancel()
+			await asyncio.gather(browser.recorder, return_exceptions=True)
+			browser.recorder = None
+		if browser.uses >= self.max_uses or not browser.process.is_running():
+			await self._retire(browser)
+			self._replenish()
+			return
+		try:
+			await asyncio.wait_for(self._reset(browser, visited_origins), timeout=10)
+		except Exception as e:
+			logger.debug(f'🏊 Failed to reset pooled browser pid={browser.process.pid}, replacing it: {type(e).__name__}: {e}')
+			await self._retire(browser)
+			self._replenish()
+			return
+		self.stats.recycled += 1
+		self._idle.append(browser)
+		self._trim()
+
+	def _trim(self) -> None:
+		"""Drop browsers beyond the target size, cancelling pending launches before killing warm browsers."""
+		excess = len(self._idle) + len(self._launch_tasks) - self.target_size
+		for task in list(self._launch_tasks)[: max(excess, 0)]:
+			task.cancel()
+			self._launch_tasks.discard(task)
+			excess -= 1
+		if excess > 0:
+			self._idle.sort(key=lambda browser: browser.uses)
+			self._idle, extra = self._idle[:-excess], self._idle[-excess:]
+			for browser in extra:
+				self._spawn(self._retire(browser))
+
+	@staticmethod
+	async def _connect(browser: PooledBrowser) -> 'CDPClient':
+		import httpx
+		from cdp_use import CDPClient
+
+		async with httpx.AsyncClient() as client:
+			version_info = await client.get(browser.cdp_url.rstrip('/') + '/json/version')
+			ws_url = version_info.json()['webSocketDebuggerUrl']
+
+		cdp_client = CDPClient(ws_url)
+		await cdp_client.start()
+		return cdp_client
+
+	@staticmethod
+	async def _record_origins(browser: PooledBrowser) -> None:
+		"""Record the origin of every page, iframe and worker target until cancelled when the browser is released.
+
+		Navigations of the session only cover its top-level pages, but third-party frames and workers keep storage too.
+		"""
+
+		def on_target(event, session_id=None) -> None:
+			if origin := _http_origin(event['targetInfo']['url']):
+				browser.recorded_origins.add(origin)
+
+		try:
+			cdp_client = await BrowserPool._connect(browser)
+		except Exception as e:
+			logger.debug(f'🏊 Cannot record the origins of pooled browser pid={browser.process.pid}: {type(e).__name__}: {e}')
+			return
+		try:
+			cdp_client.register.Target.targetCreated(on_target)
+			cdp_client.register.Target.targetInfoChanged(on_target)
+			# Reports the targets that already exist too; without a filter iframes and (service) workers are included
+			await cdp_client.send.Target.setDiscoverTargets(params={'discover': True})
+			await asyncio.Event().wait()
+		finally:
+			await cdp_client.stop()
+
+	@staticmethod
+	async def _reset(browser: PooledBrowser, visited_origins: set[str]) -> None:
+		"""Close every tab but a fresh about:blank and clear cookies, cache and the storage of every recorded origin."""
+		cdp_client = await BrowserPool._connect(browser)
+		try:
+			targets = (await cdp_client.send.Target.getTargets())['targetInfos']
+			pages = [target for target in targets if target['type'] == 'page']
+			origins = set(visited_origins) | browser.recorded_origins
+			for target in targets:
+				if origin := _http_origin(target['url']):
+					origins.add(origin)
+
+			blank = await cdp_client.send.Target.createTarget(params={'url': 'about:blank'})
+			for target in pages:
+				await cdp_client.send.Target.closeTarget(params={'targetId': target['targetId']})
+
+			session = await cdp_client.send.Target.attachToTarget(params={'targetId': blank['targetId'], 'flatten': True})
+			await cdp_client.send.Network.clearBrowserCache(session_id=session['sessionId'])
+			await cdp_client.send.Target.detachFromTarget(params={'sessionId': session['sessionId']})
+
+			await cdp_client.send.Storage.clearCookies()
+			for origin in origins:
+				await cdp_client.send.Storage.clearDataForOrigin(params={'origin': origin, 'storageTypes': 'all'})
+		finally:
+			await cdp_client.stop()
+
+	async def _retire(self, browser: PooledBrowser, count: bool = True) -> None:
+		from browser_use.browser.watchdogs.local_browser_watchdog import LocalBrowserWatchdog
+
+		if count:
+			self.stats.retired += 1
+		await LocalBrowserWatchdog._cleanup_process(browser.process)
+		shutil.rmtree(browser.user_data_dir, ignore_errors=True)
+
+	def _kill_idle_sync(self) -> None:
+		"""Don't leave idle browsers running when the interpreter exits without close()."""
+		for browser in self._idle:
+			try:
+				browser.process.kill()
+			except psutil.Error:
+				pass
+			shutil.rmtree(browser.user_data_dir, ignore_errors=True)
+		self._idle.clear()
+
+
+# Shared process-wide pool used by LocalBrowserWatchdog
+browser_pool = BrowserPool()
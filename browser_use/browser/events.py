@@ -176,6 +176,9 @@ class ScreenshotEvent(BaseEvent[str]):
 
 	full_page: bool = False
 	clip: dict[str, float] | None = None  # {x, y, width, height}
+	format: Literal['png', 'jpeg', 'webp'] = 'png'
+	quality: int | None = None  # 0-100, only used for jpeg and webp
+	size: tuple[int, int] | None = None  # (width, height) to downscale the viewport to inside the browser
 
 	event_timeout: float | None = _get_timeout('TIMEOUT_ScreenshotEvent', 45.0)  # seconds
 
@@ -186,6 +189,8 @@ class BrowserStateRequestEvent(BaseEvent[BrowserStateSummary]):
 	include_dom: bool = True
 	include_screenshot: bool = True
 	include_recent_events: bool = False
+	include_highlights: bool = True  # draw the element highlights in the page (if dom_highlight_elements is enabled)
+	llm_screenshot_size: tuple[int, int] | None = None  # also capture a screenshot downscaled by the browser, for the LLM only
 
 	event_timeout: float | None = _get_timeout('TIMEOUT_BrowserStateRequestEvent', 60.0)  # seconds
 
@@ -526,6 +531,17 @@ class FileDownloadedEvent(BaseEvent):
 	event_timeout: float | None = _get_timeout('TIMEOUT_FileDownloadedEvent', 30.0)  # seconds
 
 
+class FileDownloadProgressEvent(BaseEvent):
+	"""A chunk of a streamed download has been written to disk."""
+
+	url: str
+	path: str
+	bytes_written: int
+	total_bytes: int | None = None  # None when the size is not known in advance
+
+	event_timeout: float | None = _get_timeout('TIMEOUT_FileDownloadProgressEvent', 5.0)  # seconds
+
+
 class AboutBlankDVDScreensaverShownEvent(BaseEvent):
 	"""AboutBlankWatchdog has shown DVD screensaver animation on an about:blank tab."""
 
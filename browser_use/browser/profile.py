@@ -569,11 +569,11 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 	deterministic_rendering: bool = Field(default=False, description='Enable deterministic rendering flags.')
 	allowed_domains: list[str] | set[str] | None = Field(
 		default=None,
-		description='List of allowed domains for navigation e.g. ["*.google.com", "https://example.com", "chrome-extension://*"]. Lists with 100+ items are auto-optimized to sets (no pattern matching).',
+		description='List of allowed domains for navigation e.g. ["*.google.com", "https://example.com", "chrome-extension://*"]. Lists with 100+ items are converted to sets (plain domains also match their www. variant).',
 	)
 	prohibited_domains: list[str] | set[str] | None = Field(
 		default=None,
-		description='List of prohibited domains for navigation e.g. ["*.google.com", "https://example.com", "chrome-extension://*"]. Allowed domains take precedence over prohibited domains. Lists with 100+ items are auto-optimized to sets (no pattern matching).',
+		description='List of prohibited domains for navigation e.g. ["*.google.com", "https://example.com", "chrome-extension://*"]. Allowed domains take precedence over prohibited domains. Lists with 100+ items are converted to sets (plain domains also match their www. variant).',
 	)
 	block_ip_addresses: bool = Field(
 		default=False,
@@ -640,14 +640,39 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		default=True, description='Only show element IDs in highlights if llm_representation is less than 10 characters.'
 	)
 	paint_order_filtering: bool = Field(default=True, description='Enable paint order filtering. Slightly experimental.')
+	paint_order_union: Literal['pure', 'indexed'] = Field(
+		default='indexed',
+		description="Rectangle union used for paint order filtering: 'indexed' (grid spatial index) or 'pure' (flat list).",
+	)
+	incremental_dom: bool = Field(
+		default=False,
+		description='Keep the DOM tree live between steps from CDP mutation events instead of re-fetching it every step. Experimental.',
+	)
 	interaction_highlight_color: str = Field(
 		default='rgb(255, 127, 39)',
 		description='Color to use for highlighting elements during interactions (CSS color string).',
 	)
 	interaction_highlight_duration: float = Field(default=1.0, description='Duration in seconds to show interaction highlights.')
+	screenshot_format: Literal['png', 'jpeg', 'webp'] = Field(
+		default='png',
+		description="Image format of the browser state screenshots sent to the LLM. 'jpeg' and 'webp' are much smaller to transfer.",
+	)
+	screenshot_quality: int = Field(
+		default=80, ge=0, le=100, description="Compression quality (0-100) of 'jpeg' and 'webp' screenshots."
+	)
+	downscale_llm_screenshot_in_browser: bool = Field(
+		default=False,
+		description='With llm_screenshot_size and vision on, take a second screenshot that the browser renders at that size for '
+		'the LLM, instead of resizing the full resolution screenshot in Python.',
+	)
 
 	# --- Downloads ---
 	auto_download_pdfs: bool = Field(default=True, description='Automatically download PDFs when navigating to PDF viewer pages.')
+	download_chunk_size: int = Field(
+		default=1024 * 1024,
+		gt=0,
+		description='Chunk size in bytes when streaming in-page downloads to disk through CDP IO.read.',
+	)
 
 	profile_directory: str = 'Default'  # e.g. 'Profile 1', 'Profile 2', 'Custom Profile', etc.
 
@@ -694,8 +719,7 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		if len(v) >= DOMAIN_OPTIMIZATION_THRESHOLD:
 			logger.warning(
 				f'🔧 Optimizing domain list with {len(v)} items to set for O(1) lookup. '
-				f'Note: Pattern matching (*.domain.com, etc.) is not supported for lists >= {DOMAIN_OPTIMIZATION_THRESHOLD} items. '
-				f'Use exact domains only or keep list size < {DOMAIN_OPTIMIZATION_THRESHOLD} for pattern support.'
+				f'Note: plain domains in sets match with and without www., not only root domains like in lists < {DOMAIN_OPTIMIZATION_THRESHOLD} items.'
 			)
 			return set(v)
 
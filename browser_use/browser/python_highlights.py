@@ -9,17 +9,21 @@ import base64
 import io
 import logging
 import os
+import threading
+from typing import NamedTuple
 
 from PIL import Image, ImageDraw, ImageFont
 
 from browser_use.dom.views import DOMSelectorMap, EnhancedDOMTreeNode
+from browser_use.image_executor import image_executor
 from browser_use.observability import observe_debug
 from browser_use.utils import time_execution_async
 
 logger = logging.getLogger(__name__)
 
 # Font cache to prevent repeated font loading and reduce memory usage
-_FONT_CACHE: dict[tuple[str, int], ImageFont.FreeTypeFont | None] = {}
+# FreeType faces must not be used from several threads at once, so each image worker thread gets its own fonts
+_FONT_CACHE: dict[tuple[str, int, int], ImageFont.FreeTypeFont | None] = {}
 
 # Cross-platform font paths
 _FONT_PATHS = [
@@ -42,8 +46,8 @@ def get_cross_platform_font(font_size: int) -> ImageFont.FreeTypeFont | None:
 	Returns:
 	    ImageFont object or None if no system fonts are available
 	"""
-	# Use cache key based on font size
-	cache_key = ('system_font', font_size)
+	# Use cache key based on font size and thread
+	cache_key = ('system_font', font_size, threading.get_ident())
 
 	# Return cached font if available
 	if cache_key in _FONT_CACHE:
@@ -337,6 +341,84 @@ def draw_bounding_box_with_text(
 			logger.debug(f'Failed to draw text overlay: {e}')
 
 
+class ElementHighlight(NamedTuple):
+	"""What is drawn for one element: plain data, so drawing can run on a (thread or process) worker."""
+
+	x: float  # CSS pixels
+	y: float
+	width: float
+	height: float
+	tag_name: str
+	element_type: str | None
+	index_text: str | None
+
+
+def get_element_highlight(element: EnhancedDOMTreeNode, filter_highlight_ids: bool) -> ElementHighlight | None:
+	"""Extract the highlight of an element from the DOM tree, None if it has no position."""
+	# Use absolute_position coordinates directly
+	if not element.absolute_position:
+		return None
+
+	bounds = element.absolute_position
+
+	# Get element color based on type
+	tag_name = element.tag_name if hasattr(element, 'tag_name') else 'div'
+	element_type = None
+	if hasattr(element, 'attributes') and element.attributes:
+		element_type = element.attributes.get('type')
+
+	# Get element index for overlay and apply filtering
+	backend_node_id = getattr(element, 'backend_node_id', None)
+	index_text = None
+
+	if backend_node_id is not None:
+		if filter_highlight_ids:
+			# Use the meaningful text that matches what the LLM sees
+			meaningful_text = element.get_meaningful_text_for_llm()
+			# Show ID only if meaningful text is less than 5 characters
+			if len(meaningful_text) < 3:
+				index_text = str(backend_node_id)
+		else:
+			# Always show ID when filter is disabled
+			index_text = str(backend_node_id)
+
+	return ElementHighlight(bounds.x, bounds.y, bounds.width, bounds.height, tag_name, element_type, index_text)
+
+
+def draw_element_highlight(
+	highlight: ElementHighlight,
+	draw,
+	device_pixel_ratio: float,
+	font,
+	image_size: tuple[int, int],
+) -> None:
+	"""Draw the bounding box and index of one element."""
+	# Scale coordinates from CSS pixels to device pixels for screenshot
+	# The screenshot is captured at device pixel resolution, but coordinates are in CSS pixels
+	x1 = int(highlight.x * device_pixel_ratio)
+	y1 = int(highlight.y * device_pixel_ratio)
+	x2 = int((highlight.x + highlight.width) * device_pixel_ratio)
+	y2 = int((highlight.y + highlight.height) * device_pixel_ratio)
+
+	# Ensure coordinates are within image bounds
+	img_width, img_height = image_size
+	x1 = max(0, min(x1, img_width))
+	y1 = max(0, min(y1, img_height))
+	x2 = max(x1, min(x2, img_width))
+	y2 = max(y1, min(y2, img_height))
+
+	# Skip if bounding box is too small or invalid
+	if x2 - x1 < 2 or y2 - y1 < 2:
+		return
+
+	color = get_element_color(highlight.tag_name, highlight.element_type)
+
+	# Draw enhanced bounding box with bigger index
+	draw_enhanced_bounding_box_with_text(
+		draw, (x1, y1, x2, y2), color, highlight.index_text, font, highlight.tag_name, image_size, device_pixel_ratio
+	)
+
+
 def process_element_highlight(
 	element_id: int,
 	element: EnhancedDOMTreeNode,
@@ -348,62 +430,43 @@ def process_element_highlight(
 ) -> None:
 	"""Process a single element for highlighting."""
 	try:
-		# Use absolute_position coordinates directly
-		if not element.absolute_position:
-			return
-
-		bounds = element.absolute_position
-
-		# Scale coordinates from CSS pixels to device pixels for screenshot
-		# The screenshot is captured at device pixel resolution, but coordinates are in CSS pixels
-		x1 = int(bounds.x * device_pixel_ratio)
-		y1 = int(bounds.y * device_pixel_ratio)
-		x2 = int((bounds.x + bounds.width) * device_pixel_ratio)
-		y2 = int((bounds.y + bounds.height) * device_pixel_ratio)
-
-		# Ensure coordinates are within image bounds
-		img_width, img_height = image_size
-		x1 = max(0, min(x1, img_width))
-		y1 = max(0, min(y1, img_height))
-		x2 = max(x1, min(x2, img_width))
-		y2 = max(y1, min(y2, img_height))
-
-		# Skip if bounding box is too small or invalid
-		if x2 - x1 < 2 or y2 - y1 < 2:
-			return
-
-		# Get element color based on type
-		tag_name = element.tag_name if hasattr(element, 'tag_name') else 'div'
-		element_type = None
-		if hasattr(element, 'attributes') and element.attributes:
-			element_type = element.attributes.get('type')
-
-		color = get_element_color(tag_name, element_type)
-
-		# Get element index for overlay and apply filtering
-		backend_node_id = getattr(element, 'backend_node_id', None)
-		index_text = None
-
-		if backend_node_id is not None:
-			if filter_highlight_ids:
-				# Use the meaningful text that matches what the LLM sees
-				meaningful_text = element.get_meaningful_text_for_llm()
-				# Show ID only if meaningful text is less than 5 characters
-				if len(meaningful_text) < 3:
-					index_text = str(backend_node_id)
-			else:
-				# Always show ID when filter is disabled
-				index_text = str(backend_node_id)
-
-		# Draw enhanced bounding box with bigger index
-		draw_enhanced_bounding_box_with_text(
-			draw, (x1, y1, x2, y2), color, index_text, font, tag_name, image_size, device_pixel_ratio
-		)
-
+		highlight = get_element_highlight(element, filter_highlight_ids)
+		if highlight:
+			draw_element_highlight(highlight, draw, device_pixel_ratio, font, image_size)
 	except Exception as e:
 		logger.debug(f'Failed to draw highlight for element {element_id}: {e}')
 
 
+def _draw_highlights(screenshot_b64: str, highlights: list[ElementHighlight], device_pixel_ratio: float) -> str:
+	"""Decode the screenshot, draw every highlight and re-encode it. CPU-bound, runs on the image executor."""
+	# Decode screenshot
+	screenshot_data = base64.b64decode(screenshot_b64)
+	image = Image.open(io.BytesIO(screenshot_data)).convert('RGBA')
+	output_buffer = io.BytesIO()
+	try:
+		# Create drawing context
+		draw = ImageDraw.Draw(image)
+
+		# Load font using shared function with caching
+		font = get_cross_platform_font(12)
+		# If no system fonts found, font remains None and will use default font
+
+		# PIL ImageDraw is not thread-safe, so elements are drawn one by one on this worker
+		for highlight in highlights:
+			try:
+				draw_element_highlight(highlight, draw, device_pixel_ratio, font, image.size)
+			except Exception as e:
+				logger.debug(f'Failed to draw highlight for {highlight.tag_name} element: {e}')
+
+		# Convert back to base64
+		image.save(output_buffer, format='PNG')
+		return base64.b64encode(output_buffer.getvalue()).decode('utf-8')
+	finally:
+		# Explicit cleanup to prevent memory leaks
+		output_buffer.close()
+		image.close()
+
+
 @observe_debug(ignore_input=True, ignore_output=True, name='create_highlighted_screenshot')
 @time_execution_async('create_highlighted_screenshot')
 async def create_highlighted_screenshot(
@@ -416,6 +479,8 @@ async def create_highlighted_screenshot(
 ) -> str:
 	"""Create a highlighted screenshot with bounding boxes around interactive elements.
 
+	The image decoding, drawing and encoding run on the shared image executor, off the event loop.
+
 	Args:
 	    screenshot_b64: Base64 encoded screenshot
 	    selector_map: Map of interactive elements with their positions
@@ -427,42 +492,23 @@ async def create_highlighted_screenshot(
 	    Base64 encoded highlighted screenshot
 	"""
 	try:
-		# Decode screenshot
-		screenshot_data = base64.b64decode(screenshot_b64)
-		image = Image.open(io.BytesIO(screenshot_data)).convert('RGBA')
-
-		# Create drawing context
-		draw = ImageDraw.Draw(image)
-
-		# Load font using shared function with caching
-		font = get_cross_platform_font(12)
-		# If no system fonts found, font remains None and will use default font
-
-		# Process elements sequentially to avoid ImageDraw thread safety issues
-		# PIL ImageDraw is not thread-safe, so we process elements one by one
+		# Read the DOM tree here: only plain highlight data is handed to the worker
+		highlights = []
 		for element_id, element in selector_map.items():
-			process_element_highlight(element_id, element, draw, device_pixel_ratio, font, filter_highlight_ids, image.size)
+			try:
+				highlight = get_element_highlight(element, filter_highlight_ids)
+			except Exception as e:
+				logger.debug(f'Failed to get highlight for element {element_id}: {e}')
+				continue
+			if highlight:
+				highlights.append(highlight)
 
-		# Convert back to base64
-		output_buffer = io.BytesIO()
-		try:
-			image.save(output_buffer, format='PNG')
-			output_buffer.seek(0)
-			highlighted_b64 = base64.b64encode(output_buffer.getvalue()).decode('utf-8')
-
-			logger.debug(f'Successfully created highlighted screenshot with {len(selector_map)} elements')
-			return highlighted_b64
-		finally:
-			# Explicit cleanup to prevent memory leaks
-			output_buffer.close()
-			if 'image' in locals():
-				image.close()
+		highlighted_b64 = await image_executor.run(_draw_highlights, screenshot_b64, highlights, device_pixel_ratio)
+		logger.debug(f'Successfully created highlighted screenshot with {len(selector_map)} elements')
+		return highlighted_b64
 
 	except Exception as e:
 		logger.error(f'Failed to create highlighted screenshot: {e}')
-		# Clean up on error as well
-		if 'image' in locals():
-			image.close()
 		# Return original screenshot on error
 		return screenshot_b64
 
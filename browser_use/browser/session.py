@@ -53,6 +53,33 @@ if TYPE_CHECKING:
 DEFAULT_BROWSER_PROFILE = BrowserProfile()
 
 _LOGGED_UNIQUE_SESSION_IDS = set()  # track unique session IDs that have been logged to make sure we always assign a unique enough id to new sessions and avoid ambiguity in logs
+
+# Resolves to true once the document is loaded and no DOM mutation or new resource timing entry (= finished request)
+# was seen for quietMs, or to false after timeoutMs
+_PAGE_SETTLE_SCRIPT = """(quietMs, timeoutMs) => new Promise(resolve => {
+	const start = performance.now();
+	let lastActivity = start;
+	let resourceCount = performance.getEntriesByType('resource').length;
+	const observer = new MutationObserver(() => { lastActivity = performance.now(); });
+	observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+	const check = () => {
+		const now = performance.now();
+		const count = performance.getEntriesByType('resource').length;
+		if (count !== resourceCount || document.readyState !== 'complete') {
+			resourceCount = count;
+			lastActivity = now;
+		}
+		const settled = now - lastActivity >= quietMs;
+		if (settled || now - start >= timeoutMs) {
+			observer.disconnect();
+			resolve(settled);
+		} else {
+			setTimeout(check, Math.min(50, quietMs));
+		}
+	};
+	setTimeout(check, Math.min(50, quietMs));
+})"""
+
 red = '\033[91m'
 reset = '\033[0m'
 
@@ -144,11 +171,17 @@ class BrowserSession(BaseModel):
 		wait_for_network_idle_page_load_time: float | None = None,
 		wait_between_actions: float | None = None,
 		auto_download_pdfs: bool | None = None,
+		download_chunk_size: int | None = None,
+		screenshot_format: Literal['png', 'jpeg', 'webp'] | None = None,
+		screenshot_quality: int | None = None,
+		downscale_llm_screenshot_in_browser: bool | None = None,
 		cookie_whitelist_domains: list[str] | None = None,
 		cross_origin_iframes: bool | None = None,
 		highlight_elements: bool | None = None,
 		dom_highlight_elements: bool | None = None,
 		paint_order_filtering: bool | None = None,
+		paint_order_union: Literal['pure', 'indexed'] | None = None,
+		incremental_dom: bool | None = None,
 		max_iframes: int | None = None,
 		max_iframe_depth: int | None = None,
 	) -> None: ...
@@ -176,11 +209,17 @@ class BrowserSession(BaseModel):
 		wait_for_network_idle_page_load_time: float | None = None,
 		wait_between_actions: float | None = None,
 		auto_download_pdfs: bool | None = None,
+		download_chunk_size: int | None = None,
+		screenshot_format: Literal['png', 'jpeg', 'webp'] | None = None,
+		screenshot_quality: int | None = None,
+		downscale_llm_screenshot_in_browser: bool | None = None,
 		cookie_whitelist_domains: list[str] | None = None,
 		cross_origin_iframes: bool | None = None,
 		highlight_elements: bool | None = None,
 		dom_highlight_elements: bool | None = None,
 		paint_order_filtering: bool | None = None,
+		paint_order_union: Literal['pure', 'indexed'] | None = None,
+		incremental_dom: bool | None = None,
 		max_iframes: int | None = None,
 		max_iframe_depth: int | None = None,
 		# All other local params
@@ -280,6 +319,10 @@ class BrowserSession(BaseModel):
 		wait_between_actions: float | None = None,
 		filter_highlight_ids: bool | None = None,
 		auto_download_pdfs: bool | None = None,
+		download_chunk_size: int | None = None,
+		screenshot_format: Literal['png', 'jpeg', 'webp'] | None = None,
+		screenshot_quality: int | None = None,
+		downscale_llm_screenshot_in_browser: bool | None = None,
 		profile_directory: str | None = None,
 		cookie_whitelist_domains: list[str] | None = None,
 		# DOM extraction layer configuration
@@ -287,6 +330,8 @@ class BrowserSession(BaseModel):
 		highlight_elements: bool | None = None,
 		dom_highlight_elements: bool | None = None,
 		paint_order_filtering: bool | None = None,
+		paint_order_union: Literal['pure', 'indexed'] | None = None,
+		incremental_dom: bool | None = None,
 		# Iframe processing limits
 		max_iframes: int | None = None,
 		max_iframe_depth: int | None = None,
@@ -374,6 +419,8 @@ class BrowserSession(BaseModel):
 
 	# Cache of original viewport size for coordinate conversion (set when browser state is captured)
 	_original_viewport_size: tuple[int, int] | None = PrivateAttr(default=None)
+	# Size in CSS pixels of the part of the viewport the browser-downscaled LLM screenshot shows, when that was clipped
+	_llm_screenshot_area: tuple[float, float] | None = PrivateAttr(default=None)
 
 	# Convenience properties for common browser settings
 	@property
@@ -1223,17 +1270,15 @@ class BrowserSession(BaseModel):
 			# Session not in pool yet - wait for attach event
 			self.logger.debug(f'[SessionManager] Waiting for target {target_id[:8]}... to attach...')
 
-			# Wait up to 2 seconds for the attach event
-			for attempt in range(20):
-				await asyncio.sleep(0.1)
-				session = self.session_manager._get_session_for_target(target_id)
-				if session:
-					self.logger.debug(f'[SessionManager] Target appeared after {attempt * 100}ms')
-					break
-
+			# Wait up to 2 seconds for the attach event, resolved by SessionManager the moment it arrives
+			wait_start = asyncio.get_event_loop().time()
+			session = await self.session_manager.wait_for_session(target_id, timeout=2.0)
 			if not session:
 				# Timeout - target doesn't exist
 				raise ValueError(f'Target {target_id} not found - may have detached or never existed')
+			self.logger.debug(
+				f'[SessionManager] Target appeared after {(asyncio.get_event_loop().time() - wait_start) * 1000:.0f}ms'
+			)
 
 		# Validate session is still active
 		is_valid = await self.session_manager.validate_session(target_id)
@@ -1279,6 +1324,8 @@ class BrowserSession(BaseModel):
 		include_screenshot: bool = True,
 		cached: bool = False,
 		include_recent_events: bool = False,
+		include_highlights: bool = True,
+		llm_screenshot_size: tuple[int, int] | None = None,
 	) -> BrowserStateSummary:
 		if cached and self._cached_browser_state_summary is not None and self._cached_browser_state_summary.dom_state:
 			# Don't use cached state if it has 0 interactive elements
@@ -1303,6 +1350,8 @@ class BrowserSession(BaseModel):
 					include_dom=True,
 					include_screenshot=include_screenshot,
 					include_recent_events=include_recent_events,
+					include_highlights=include_highlights,
+					llm_screenshot_size=llm_screenshot_size,
 				)
 			),
 		)
@@ -1312,6 +1361,43 @@ class BrowserSession(BaseModel):
 		assert result is not None and result.dom_state is not None
 		return result
 
+	async def wait_for_page_settle(self, quiet_period: float = 0.3, timeout: float = 5.0) -> bool:
+		"""Wait until the focused page has loaded and neither its DOM nor its network activity changed for quiet_period.
+
+		DOM mutations are watched with a MutationObserver and network activity through new resource timing entries.
+		If the page navigates while waiting, waiting continues on the new document.
+
+		Returns:
+			True if the page settled, False if the timeout was reached first.
+		"""
+		loop = asyncio.get_running_loop()
+		deadline = loop.time() + timeout
+		while True:
+			remaining = deadline - loop.time()
+			if remaining <= 0:
+				return False
+			try:
+				cdp_session = await self.get_or_create_cdp_session(focus=True)
+				result = await asyncio.wait_for(
+					cdp_session.cdp_client.send.Runtime.evaluate(
+						params={
+							'expression': f'({_PAGE_SETTLE_SCRIPT})({quiet_period * 1000}, {remaining * 1000})',
+							'awaitPromise': True,
+							'returnByValue': True,
+						},
+						session_id=cdp_session.session_id,
+					),
+					timeout=remaining + 1,
+				)
+				if 'exceptionDetails' not in result:
+					return bool(result.get('result', {}).get('value'))
+			except TimeoutError:
+				return False
+			except Exception as e:
+				# The document was replaced by a navigation while waiting, wait on the new one
+				self.logger.debug(f'Page settle check interrupted: {type(e).__name__}: {e}')
+			await asyncio.sleep(0.05)
+
 	async def get_state_as_text(self) -> str:
 		"""Get the browser state as text."""
 		state = await self.get_browser_state_summary()
@@ -53,6 +53,11 @@ class SessionManager:
 		self._recovery_complete_event: asyncio.Event | None = None
 		self._recovery_task: asyncio.Task | None = None
 
+		# Futures waiting for a target's session, resolved by _handle_target_attached as soon as the session is added
+		# (attach waiters) or once page monitoring is enabled on it (ready waiters)
+		self._attach_waiters: dict[TargetID, list[asyncio.Future['CDPSession | None']]] = {}
+		self._ready_waiters: dict[TargetID, list[asyncio.Future['CDPSession | None']]] = {}
+
 	async def start_monitoring(self) -> None:
 		"""Start monitoring Target attach/detach events.
 
@@ -147,6 +152,50 @@ class SessionManager:
 			return None
 		return self._sessions.get(next(iter(session_ids)))
 
+	async def wait_for_session(self, target_id: TargetID, timeout: float = 2.0, ready: bool = False) -> 'CDPSession | None':
+		"""Wait for a target's session to attach, resolving the instant Target.attachedToTarget is handled.
+
+		Args:
+			target_id: Target ID to wait for
+			timeout: Maximum time to wait in seconds
+			ready: Also wait until lifecycle/network monitoring is enabled on page targets
+
+		Returns:
+			CDPSession once attached (and ready), None on timeout
+		"""
+		session = self._get_session_for_target(target_id)
+		if session and (not ready or self._is_session_ready(target_id, session)):
+			return session
+
+		waiters = self._ready_waiters if ready else self._attach_waiters
+		future: asyncio.Future[CDPSession | None] = asyncio.get_running_loop().create_future()
+		waiters.setdefault(target_id, []).append(future)
+		try:
+			return await asyncio.wait_for(future, timeout=timeout)
+		except TimeoutError:
+			return None
+		finally:
+			target_waiters = waiters.get(target_id)
+			if target_waiters is not None and future in target_waiters:
+				target_waiters.remove(future)
+				if not target_waiters:
+					del waiters[target_id]
+
+	def _is_session_ready(self, target_id: TargetID, session: 'CDPSession') -> bool:
+		"""Whether monitoring is set up on a session (only page targets need it)."""
+		target = self._targets.get(target_id)
+		if target is None or target.target_type not in ('page', 'tab'):
+			return True
+		return session._lifecycle_events is not None
+
+	@staticmethod
+	def _resolve_waiters(
+		waiters: dict[TargetID, list[asyncio.Future['CDPSession | None']]], target_id: TargetID, session: 'CDPSession'
+	) -> None:
+		for future in waiters.pop(target_id, []):
+			if not future.done():
+				future.set_result(session)
+
 	def get_all_page_targets(self) -> list:
 		"""Get all page/tab targets using owned data.
 
@@ -181,6 +230,14 @@ class SessionManager:
 			self._target_sessions.clear()
 			self._session_to_target.clear()
 
+		# Nothing will attach anymore, release anyone still waiting
+		for waiters in (self._attach_waiters, self._ready_waiters):
+			for futures in waiters.values():
+				for future in futures:
+					if not future.done():
+						future.set_result(None)
+			waiters.clear()
+
 		self.logger.info('[SessionManager] Cleared all owned data (targets, sessions, mappings)')
 
 	async def is_target_valid(self, target_id: TargetID) -> bool:
@@ -445,10 +502,12 @@ class SessionManager:
 			f'[SessionManager] Created session {session_id[:8]}... for target {target_id[:8]}... '
 			f'(total sessions: {len(self._sessions)})'
 		)
+		self._resolve_waiters(self._attach_waiters, target_id, cdp_session)
 
 		# Enable lifecycle events and network monitoring for page targets
 		if target_type in ('page', 'tab'):
 			await self._enable_page_monitoring(cdp_session)
+		self._resolve_waiters(self._ready_waiters, target_id, cdp_session)
 
 		# Resume execution if waiting for debugger
 		if waiting_for_debugger:
@@ -658,14 +717,8 @@ class SessionManager:
 				self.browser_session.event_bus.dispatch(TabCreatedEvent(url='about:blank', target_id=new_target_id))
 
 			# Wait for CDP attach event to create session
-			# Note: This polling is necessary - waiting for external Chrome CDP event
 			# _handle_target_attached will add session to pool when Chrome fires attachedToTarget
-			new_session = None
-			for attempt in range(20):  # Wait up to 2 seconds
-				await asyncio.sleep(0.1)
-				new_session = self._get_session_for_target(new_target_id)
-				if new_session:
-					break
+			new_session = await self.wait_for_session(new_target_id, timeout=2.0)
 
 			if new_session:
 				self.browser_session.agent_focus_target_id = new_target_id
@@ -699,21 +752,16 @@ class SessionManager:
 			self.logger.warning(f'[SessionManager] Created emergency fallback tab {fallback_target_id[:8]}...')
 
 			# Try one more time with fallback
-			# Note: This polling is necessary - waiting for external Chrome CDP event
-			for _ in range(20):
-				await asyncio.sleep(0.1)
-				fallback_session = self._get_session_for_target(fallback_target_id)
-				if fallback_session:
-					self.browser_session.agent_focus_target_id = fallback_target_id
-					self.logger.warning(f'[SessionManager] ⚠️ Agent focus set to emergency fallback: {fallback_target_id[:8]}...')
-
-					from browser_use.browser.events import AgentFocusChangedEvent, TabCreatedEvent
-
-					self.browser_session.event_bus.dispatch(TabCreatedEvent(url='about:blank', target_id=fallback_target_id))
-					self.browser_session.event_bus.dispatch(
-						AgentFocusChangedEvent(target_id=fallback_target_id, url='about:blank')
-					)
-					return
+			fallback_session = await self.wait_for_session(fallback_target_id, timeout=2.0)
+			if fallback_session:
+				self.browser_session.agent_focus_target_id = fallback_target_id
+				self.logger.warning(f'[SessionManager] ⚠️ Agent focus set to emergency fallback: {fallback_target_id[:8]}...')
+
+				from browser_use.browser.events import AgentFocusChangedEvent, TabCreatedEvent
+
+				self.browser_session.event_bus.dispatch(TabCreatedEvent(url='about:blank', target_id=fallback_target_id))
+				self.browser_session.event_bus.dispatch(AgentFocusChangedEvent(target_id=fallback_target_id, url='about:blank'))
+				return
 
 			# Complete failure - this should never happen
 			self.logger.critical(
@@ -767,65 +815,14 @@ class SessionManager:
 					f'[SessionManager] Failed to attach to existing target {target_id[:8]}... (type={target_type}): {e}'
 				)
 
-		# Wait for event handlers to complete their work (they run via create_task)
-		# Use event-driven approach instead of polling for better performance
-		ready_event = asyncio.Event()
-
-		async def check_all_ready():
-			"""Check if all sessions are ready and signal completion."""
-			while True:
-				ready_count = 0
-				for tid in target_ids_to_wait_for:
-					session = self._get_session_for_target(tid)
-					if session:
-						target = self._targets.get(tid)
-						target_type = target.target_type if target else 'unknown'
-						# For pages, verify monitoring is enabled
-						if target_type in ('page', 'tab'):
-							if hasattr(session, '_lifecycle_events') and session._lifecycle_events is not None:
-								ready_count += 1
-						else:
-							# Non-page targets don't need monitoring
-							ready_count += 1
-
-				if ready_count == len(target_ids_to_wait_for):
-					ready_event.set()
-					return
-
-				await asyncio.sleep(0.05)
-
-		# Start checking in background
-		check_task = create_task_with_error_handling(
-			check_all_ready(), name='check_all_targets_ready', logger_instance=self.logger
-		)
-
-		try:
-			# Wait for completion with timeout
-			await asyncio.wait_for(ready_event.wait(), timeout=2.0)
-		except TimeoutError:
-			# Timeout - count what's ready
-			ready_count = 0
-			for tid in target_ids_to_wait_for:
-				session = self._get_session_for_target(tid)
-				if session:
-					target = self._targets.get(tid)
-					target_type = target.target_type if target else 'unknown'
-					# For pages, verify monitoring is enabled
-					if target_type in ('page', 'tab'):
-						if hasattr(session, '_lifecycle_events') and session._lifecycle_events is not None:
-							ready_count += 1
-					else:
-						# Non-page targets don't need monitoring
-						ready_count += 1
+		# Wait for event handlers to complete their work (they run via create_task), each wait resolves as soon as
+		# _handle_target_attached has added the session and enabled monitoring on it
+		sessions = await asyncio.gather(*(self.wait_for_session(tid, timeout=2.0, ready=True) for tid in target_ids_to_wait_for))
+		ready_count = sum(session is not None for session in sessions)
+		if ready_count < len(target_ids_to_wait_for):
 			self.logger.warning(
 				f'[SessionManager] Initialization timeout after 2.0s: {ready_count}/{len(target_ids_to_wait_for)} sessions ready'
 			)
-		finally:
-			check_task.cancel()
-			try:
-				await check_task
-			except asyncio.CancelledError:
-				pass
 
 	async def _enable_page_monitoring(self, cdp_session: 'CDPSession') -> None:
 		"""Enable lifecycle events and network monitoring for a page target.
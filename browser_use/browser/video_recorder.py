@@ -1,19 +1,17 @@
 """Video Recording Service for Browser Use Sessions."""
 
+import asyncio
 import base64
+import binascii
+import contextlib
 import logging
 import math
-import subprocess
 from pathlib import Path
-from typing import Optional
 
 from browser_use.browser.profile import ViewportSize
 
 try:
-	import imageio.v2 as iio  # type: ignore[import-not-found]
 	import imageio_ffmpeg  # type: ignore[import-not-found]
-	import numpy as np  # type: ignore[import-not-found]
-	from imageio.core.format import Format  # type: ignore[import-not-found]
 
 	IMAGEIO_AVAILABLE = True
 except ImportError:
@@ -21,6 +19,18 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Frames waiting for the encoder; when it falls further behind the oldest queued frames are dropped
+VIDEO_FRAME_QUEUE_SIZE = 60
+
+# Max time to wait on stop for the queued frames to be written and ffmpeg to finish the video file
+VIDEO_FINALIZE_TIMEOUT = 30.0
+
+# Bytes of ffmpeg's error output kept for the error message when encoding fails
+VIDEO_STDERR_TAIL_BYTES = 4096
+
+# libx264 constant rate factor, what imageio used for quality=8 (lower is better, 0-51)
+VIDEO_CRF = 10
+
 
 def _get_padded_size(size: ViewportSize, macro_block_size: int = 16) -> ViewportSize:
 	"""Calculates the dimensions padded to the nearest multiple of macro_block_size."""
@@ -31,14 +41,14 @@ def _get_padded_size(size: ViewportSize, macro_block_size: int = 16) -> Viewport
 
 class VideoRecorderService:
 	"""
-	Handles the video encoding process for a browser session using imageio.
+	Handles the video encoding process for a browser session using one long-lived ffmpeg process.
 
-	This service captures individual frames from the CDP screencast, decodes them,
-	and appends them to a video file using a pip-installable ffmpeg backend.
-	It automatically resizes frames to match the target video dimensions.
+	Compressed CDP screencast frames are piped as they are into ffmpeg (image2pipe), which scales, pads and encodes
+	them straight into the video file. Frames are handed over through a bounded queue, so adding a frame never blocks
+	the event loop; if the encoder can't keep up, the oldest queued frames are dropped.
 	"""
 
-	def __init__(self, output_path: Path, size: ViewportSize, framerate: int):
+	def __init__(self, output_path: Path, size: ViewportSize, framerate: int, max_queued_frames: int = VIDEO_FRAME_QUEUE_SIZE):
 		"""
 		Initializes the video recorder.
 
@@ -46,17 +56,56 @@ class VideoRecorderService:
 		    output_path: The full path where the video will be saved.
 		    size: A ViewportSize object specifying the width and height of the video.
 		    framerate: The desired framerate for the output video.
+		    max_queued_frames: How many frames may wait for the encoder before frames are dropped.
 		"""
 		self.output_path = output_path
 		self.size = size
 		self.framerate = framerate
-		self._writer: Optional['Format.Writer'] = None
-		self._is_active = False
+		self.max_queued_frames = max_queued_frames
 		self.padded_size = _get_padded_size(self.size)
-
-	def start(self) -> None:
+		self.frames_written = 0
+		self.frames_dropped = 0
+		self._is_active = False
+		self._process: asyncio.subprocess.Process | None = None
+		self._queue: asyncio.Queue[str | None] | None = None
+		self._writer_task: asyncio.Task | None = None
+		self._stderr_task: asyncio.Task | None = None
+		self._stderr_tail = b''
+
+	def _get_ffmpeg_command(self) -> list[str]:
+		# Build a filter chain for ffmpeg:
+		# 1. scale: Resizes the frame to the user-specified dimensions.
+		# 2. pad: Adds black bars to meet codec's macro-block requirements,
+		#    centering the original content.
+		vf_chain = (
+			f'scale={self.size["width"]}:{self.size["height"]},'
+			f'pad={self.padded_size["width"]}:{self.padded_size["height"]}:(ow-iw)/2:(oh-ih)/2:color=black'
+		)
+		return [
+			imageio_ffmpeg.get_ffmpeg_exe(),
+			'-y',
+			'-loglevel',
+			'error',
+			'-f',
+			'image2pipe',  # Input is a stream of compressed images (PNG/JPEG, detected per frame)
+			'-framerate',
+			str(self.framerate),
+			'-i',
+			'-',  # Input from stdin
+			'-vf',
+			vf_chain,  # Video filter for resizing and padding
+			'-c:v',
+			'libx264',
+			'-crf',
+			str(VIDEO_CRF),
+			'-pix_fmt',
+			'yuv420p',  # Ensures compatibility with most players
+			str(self.output_path),
+		]
+
+	async def start(self) -> None:
 		"""
-		Prepares and starts the video writer.
+		Starts the ffmpeg encoder process and the task feeding it frames.
 
 		If the required optional dependencies are not installed, this method will
 		log an error and do nothing.
@@ -69,94 +118,111 @@ class VideoRecorderService:
 
 		try:
 			self.output_path.parent.mkdir(parents=True, exist_ok=True)
-			# The macro_block_size is set to None because we handle padding ourselves
-			self._writer = iio.get_writer(
-				str(self.output_path),
-				fps=self.framerate,
-				codec='libx264',
-				quality=8,  # A good balance of quality and file size (1-10 scale)
-				pixelformat='yuv420p',  # Ensures compatibility with most players
-				macro_block_size=None,
+			self._process = await asyncio.create_subprocess_exec(
+				*self._get_ffmpeg_command(),
+				stdin=asyncio.subprocess.PIPE,
+				stdout=asyncio.subprocess.DEVNULL,
+				stderr=asyncio.subprocess.PIPE,
 			)
-			self._is_active = True
-			logger.debug(f'Video recorder started. Output will be saved to {self.output_path}')
 		except Exception as e:
 			logger.error(f'Failed to initialize video writer: {e}')
 			self._is_active = False
+			return
+
+		assert self._process.stdin is not None and self._process.stderr is not None
+		# ffmpeg blocks (and with it stdin.drain()) once the stderr pipe is full, so it is read all along
+		self._stderr_tail = b''
+		self._stderr_task = asyncio.create_task(self._read_stderr(self._process.stderr), name='video_recorder_read_stderr')
+		# Bounded by add_frame() rather than maxsize, so the end-of-stream marker can always be queued
+		self._queue = asyncio.Queue()
+		self._writer_task = asyncio.create_task(
+			self._write_frames(self._queue, self._process.stdin), name='video_recorder_write_frames'
+		)
+		self._is_active = True
+		logger.debug(f'Video recorder started. Output will be saved to {self.output_path}')
 
 	def add_frame(self, frame_data_b64: str) -> None:
 		"""
-		Decodes a base64-encoded PNG frame, resizes it, pads it to be codec-compatible,
-		and appends it to the video.
+		Queues a base64-encoded PNG or JPEG frame for encoding without blocking.
+
+		When the queue is full the oldest queued frame is dropped to make room.
 
 		Args:
-		    frame_data_b64: A base64-encoded string of the PNG frame data.
+		    frame_data_b64: A base64-encoded string of the frame data.
 		"""
-		if not self._is_active or not self._writer:
+		if not self._is_active or self._queue is None:
 			return
 
-		try:
-			frame_bytes = base64.b64decode(frame_data_b64)
-
-			# Build a filter chain for ffmpeg:
-			# 1. scale: Resizes the frame to the user-specified dimensions.
-			# 2. pad: Adds black bars to meet codec's macro-block requirements,
-			#    centering the original content.
-			vf_chain = (
-				f'scale={self.size["width"]}:{self.size["height"]},'
-				f'pad={self.padded_size["width"]}:{self.padded_size["height"]}:(ow-iw)/2:(oh-ih)/2:color=black'
-			)
-
-			output_pix_fmt = 'rgb24'
-			command = [
-				imageio_ffmpeg.get_ffmpeg_exe(),
-				'-f',
-				'image2pipe',  # Input format from a pipe
-				'-c:v',
-				'png',  # Specify input codec is PNG
-				'-i',
-				'-',  # Input from stdin
-				'-vf',
-				vf_chain,  # Video filter for resizing and padding
-				'-f',
-				'rawvideo',  # Output format is raw video
-				'-pix_fmt',
-				output_pix_fmt,  # Output pixel format
-				'-',  # Output to stdout
-			]
-
-			# Execute ffmpeg as a subprocess
-			proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-			out, err = proc.communicate(input=frame_bytes)
-
-			if proc.returncode != 0:
-				err_msg = err.decode(errors='ignore').strip()
-				if 'deprecated pixel format used' not in err_msg.lower():
-					raise OSError(f'ffmpeg error during resizing/padding: {err_msg}')
-				else:
-					logger.debug(f'ffmpeg warning during resizing/padding: {err_msg}')
-
-			# Convert the raw output bytes to a numpy array with the padded dimensions
-			img_array = np.frombuffer(out, dtype=np.uint8).reshape((self.padded_size['height'], self.padded_size['width'], 3))
-
-			self._writer.append_data(img_array)
-		except Exception as e:
-			logger.warning(f'Could not process and add video frame: {e}')
-
-	def stop_and_save(self) -> None:
+		if self._queue.qsize() >= self.max_queued_frames:
+			self._queue.get_nowait()
+			self.frames_dropped += 1
+		self._queue.put_nowait(frame_data_b64)
+
+	async def _write_frames(self, queue: asyncio.Queue[str | None], stdin: asyncio.StreamWriter) -> None:
+		"""Feeds queued frames to ffmpeg's stdin until the end-of-stream marker is queued."""
+		while True:
+			frame_data_b64 = await queue.get()
+			if frame_data_b64 is None:
+				return
+
+			try:
+				stdin.write(base64.b64decode(frame_data_b64))
+				await stdin.drain()
+				self.frames_written += 1
+			except binascii.Error as e:
+				logger.warning(f'Could not process and add video frame: {e}')
+			except (BrokenPipeError, ConnectionResetError) as e:
+				logger.error(f'Video encoder exited unexpectedly, recording stopped: {type(e).__name__}: {e}')
+				self._is_active = False
+				return
+
+	async def _read_stderr(self, stderr: asyncio.StreamReader) -> None:
+		"""Drains ffmpeg's error output, keeping its end for the error message."""
+		while chunk := await stderr.read(VIDEO_STDERR_TAIL_BYTES):
+			self._stderr_tail = (self._stderr_tail + chunk)[-VIDEO_STDERR_TAIL_BYTES:]
+
+	async def stop_and_save(self) -> None:
 		"""
-		Finalizes the video file by closing the writer.
+		Finalizes the video file: writes the queued frames, closes ffmpeg's input and waits for it to finish the file.
 
 		This method should be called when the recording session is complete.
 		"""
-		if not self._is_active or not self._writer:
+		process, self._process = self._process, None
+		if process is None:
 			return
+		self._is_active = False
 
 		try:
-			self._writer.close()
-			logger.info(f'📹 Video recording saved successfully to: {self.output_path}')
+			async with asyncio.timeout(VIDEO_FINALIZE_TIMEOUT):
+				if self._queue is not None and self._writer_task is not None:
+					self._queue.put_nowait(None)
+					await self._writer_task
+				if not self.frames_written:
+					logger.warning(f'📹 No video frames were recorded, not saving {self.output_path}')
+					process.kill()
+					await process.wait()
+					return
+				if process.stdin is not None:
+					process.stdin.close()
+					with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+						await process.stdin.wait_closed()
+				await process.wait()
+				if self._stderr_task is not None:
+					await self._stderr_task
+			if process.returncode != 0:
+				stderr = self._stderr_tail.decode(errors='ignore').strip()
+				raise OSError(f'ffmpeg exited with code {process.returncode}: {stderr}')
+			dropped = f' ({self.frames_dropped} frames dropped under load)' if self.frames_dropped else ''
+			logger.info(f'📹 Video recording saved successfully to: {self.output_path}{dropped}')
 		except Exception as e:
-			logger.error(f'Failed to finalize and save video: {e}')
+			logger.error(f'Failed to finalize and save video: {type(e).__name__}: {e}')
+			if process.returncode is None:
+				process.kill()
+				await process.wait()
 		finally:
-			self._is_active = False
-			self._writer = None
+			for task in (self._writer_task, self._stderr_task):
+				if task is not None and not task.done():
+					task.cancel()
+			self._queue = None
+			self._writer_task = None
+			self._stderr_task = None
@@ -97,6 +97,7 @@ class BrowserStateSummary:
 	title: str
 	tabs: list[TabInfo]
 	screenshot: str | None = field(default=None, repr=False)
+	llm_screenshot: str | None = field(default=None, repr=False)  # browser-downscaled screenshot, only sent to the LLM
 	page_info: PageInfo | None = None  # Enhanced page information
 
 	# Keep legacy fields for backward compatibility
@@ -108,6 +109,7 @@ class BrowserStateSummary:
 	pending_network_requests: list[NetworkRequest] = field(default_factory=list)  # Currently loading network requests
 	pagination_buttons: list[PaginationButton] = field(default_factory=list)  # Detected pagination buttons
 	closed_popup_messages: list[str] = field(default_factory=list)  # Messages from auto-closed JavaScript dialogs
+	timing: dict[str, float] = field(default_factory=dict, repr=False)  # DOM build / screenshot timings in ms
 
 
 @dataclass
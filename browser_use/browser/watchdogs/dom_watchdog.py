@@ -1,8 +1,9 @@
 """DOM watchdog for browser DOM tree management using CDP."""
 
 import asyncio
+import math
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from browser_use.browser.events import (
 	BrowserErrorEvent,
@@ -20,7 +21,22 @@ from browser_use.observability import observe_debug
 from browser_use.utils import create_task_with_error_handling, time_execution_async
 
 if TYPE_CHECKING:
-	from browser_use.browser.views import BrowserStateSummary, NetworkRequest, PageInfo, PaginationButton
+	from browser_use.browser.views import BrowserStateSummary, NetworkRequest, PageInfo, PaginationButton, TabInfo
+
+# Deadline (seconds) shared by the title and page-info queries of a state request, counted from when they start
+# alongside the DOM build and screenshot; they are never awaited past it if the DOM and screenshot finish first
+PAGE_QUERIES_TIMEOUT = 1.0
+
+# The whole state capture shares one deadline, this many seconds before the request's event_timeout: whatever has
+# not finished by then falls back (minimal DOM state, no screenshot...) instead of the event bus cancelling the request
+STATE_CAPTURE_TIMEOUT_MARGIN = 2.0
+
+
+def _remaining(deadline: float) -> float | None:
+	"""Seconds left until a loop-time deadline, as a timeout for asyncio.wait / wait_for (None when unbounded)."""
+	if deadline == math.inf:
+		return None
+	return max(deadline - asyncio.get_running_loop().time(), 0)
 
 
 class DOMWatchdog(BaseWatchdog):
@@ -38,10 +54,16 @@ class DOMWatchdog(BaseWatchdog):
 	selector_map: dict[int, EnhancedDOMTreeNode] | None = None
 	current_dom_state: SerializedDOMState | None = None
 	enhanced_dom_tree: EnhancedDOMTreeNode | None = None
+	# Incremented on every DOM build, identifies the version of enhanced_dom_tree (e.g. for caches derived from it)
+	dom_version: int = 0
 
 	# Internal DOM service
 	_dom_service: DomService | None = None
 
+	# Timings (ms) of the DOM build and screenshot of the current browser state request
+	_last_dom_timing: dict[str, float] = {}
+	_last_screenshot_ms: float | None = None
+
 	# Network tracking - maps request_id to (url, start_time, method, resource_type)
 	_pending_requests: dict[str, tuple[str, float, str, str | None]] = {}
 
@@ -263,44 +285,54 @@ class DOMWatchdog(BaseWatchdog):
 		# check if we should skip DOM tree build for pointless pages
 		not_a_meaningful_website = page_url.lower().split(':', 1)[0] not in ('http', 'https')
 
-		# Check for pending network requests BEFORE waiting (so we can see what's loading)
-		pending_requests_before_wait = []
-		if not not_a_meaningful_website:
-			try:
-				pending_requests_before_wait = await self._get_pending_network_requests()
-				if pending_requests_before_wait:
-					self.logger.debug(f'🔍 Found {len(pending_requests_before_wait)} pending requests before stability wait')
-			except Exception as e:
-				self.logger.debug(f'Failed to get pending requests before wait: {e}')
-		pending_requests = pending_requests_before_wait
-		# Wait for page stability using browser profile settings (main branch pattern)
-		if not not_a_meaningful_website:
-			self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ⏳ Waiting for page stability...')
-			try:
+		capture_deadline = self._state_capture_deadline(event)
+		tabs_task: asyncio.Task[list[TabInfo]] | None = None
+		dom_task: asyncio.Task[SerializedDOMState | None] | None = None
+		screenshot_task: asyncio.Task[str | None] | None = None
+		llm_screenshot_task: asyncio.Task[str] | None = None
+		title_task: asyncio.Task[str] | None = None
+		page_info_task: asyncio.Task[PageInfo] | None = None
+		try:
+			# The tab list comes from cached target data and does not depend on page stability, so fetch it concurrently
+			tabs_task = asyncio.create_task(self.browser_session.get_tabs(), name='get_tabs')
+
+			# Check for pending network requests BEFORE waiting (so we can see what's loading)
+			pending_requests_before_wait = []
+			if not not_a_meaningful_website:
+				try:
+					pending_requests_before_wait = await asyncio.wait_for(
+						self._get_pending_network_requests(), timeout=_remaining(capture_deadline)
+					)
+					if pending_requests_before_wait:
+						self.logger.debug(f'🔍 Found {len(pending_requests_before_wait)} pending requests before stability wait')
+				except Exception as e:
+					self.logger.debug(f'Failed to get pending requests before wait: {type(e).__name__}: {e}')
+			pending_requests = pending_requests_before_wait
+			# Wait for page stability using browser profile settings (main branch pattern)
+			if not not_a_meaningful_website:
+				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ⏳ Waiting for page stability...')
 				if pending_requests_before_wait:
 					# Reduced from 1s to 0.3s for faster DOM builds while still allowing critical resources to load
-					await asyncio.sleep(0.3)
+					remaining = _remaining(capture_deadline)
+					await asyncio.sleep(0.3 if remaining is None else min(0.3, remaining))
 				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Page stability complete')
-			except Exception as e:
-				self.logger.warning(
-					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Network waiting failed: {e}, continuing anyway...'
-				)
-
-		# Get tabs info once at the beginning for all paths
-		self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting tabs info...')
-		tabs_info = await self.browser_session.get_tabs()
-		self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got {len(tabs_info)} tabs')
-		self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Tabs info: {tabs_info}')
 
-		# Get viewport / scroll position info, remember changing scroll position should invalidate selector_map cache because it only includes visible elements
-		# cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
-		# scroll_info = await cdp_session.cdp_client.send.Runtime.evaluate(
-		# 	params={'expression': 'JSON.stringify({y: document.body.scrollTop, x: document.body.scrollLeft, width: document.documentElement.clientWidth, height: document.documentElement.clientHeight})'},
-		# 	session_id=cdp_session.session_id,
-		# )
-		# self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got scroll info: {scroll_info["result"]}')
+			# Get tabs info once at the beginning for all paths
+			await asyncio.wait((tabs_task,), timeout=_remaining(capture_deadline))
+			tabs_info = self._query_result(tabs_task, 'tabs')
+			if tabs_info is None:
+				tabs_info = []
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got {len(tabs_info)} tabs')
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Tabs info: {tabs_info}')
+
+			# Get viewport / scroll position info, remember changing scroll position should invalidate selector_map cache because it only includes visible elements
+			# cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
+			# scroll_info = await cdp_session.cdp_client.send.Runtime.evaluate(
+			# 	params={'expression': 'JSON.stringify({y: document.body.scrollTop, x: document.body.scrollLeft, width: document.documentElement.clientWidth, height: document.documentElement.clientHeight})'},
+			# 	session_id=cdp_session.session_id,
+			# )
+			# self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got scroll info: {scroll_info["result"]}')
 
-		try:
 			# Fast path for empty pages
 			if not_a_meaningful_website:
 				self.logger.debug(f'⚡ Skipping BuildDOMTree for empty target: {page_url}')
@@ -314,23 +346,10 @@ class DOMWatchdog(BaseWatchdog):
 
 				# Try to get page info from CDP, fall back to defaults if unavailable
 				try:
-					page_info = await self._get_page_info()
+					page_info = await asyncio.wait_for(self._get_page_info(), timeout=_remaining(capture_deadline))
 				except Exception as e:
-					self.logger.debug(f'Failed to get page info from CDP for empty page: {e}, using fallback')
-					# Use default viewport dimensions
-					viewport = self.browser_session.browser_profile.viewport or {'width': 1280, 'height': 720}
-					page_info = PageInfo(
-						viewport_width=viewport['width'],
-						viewport_height=viewport['height'],
-						page_width=viewport['width'],
-						page_height=viewport['height'],
-						scroll_x=0,
-						scroll_y=0,
-						pixels_above=0,
-						pixels_below=0,
-						pixels_left=0,
-						pixels_right=0,
-					)
+					self.logger.debug(f'Failed to get page info from CDP for empty page: {type(e).__name__}: {e}, using fallback')
+					page_info = self._default_page_info()
 
 				return BrowserStateSummary(
 					dom_state=content,
@@ -350,8 +369,8 @@ class DOMWatchdog(BaseWatchdog):
 				)
 
 			# Execute DOM building and screenshot capture in parallel
-			dom_task = None
-			screenshot_task = None
+			self._last_dom_timing = {}
+			self._last_screenshot_ms = None
 
 			# Start DOM building task if requested
 			if event.include_dom:
@@ -379,39 +398,72 @@ class DOMWatchdog(BaseWatchdog):
 					logger_instance=self.logger,
 					suppress_exceptions=True,
 				)
+				# The LLM's browser-downscaled copy is a separate capture, so the shared screenshot keeps full resolution
+				if event.llm_screenshot_size:
+					llm_screenshot_task = asyncio.create_task(
+						self._capture_llm_screenshot(event.llm_screenshot_size), name='capture_llm_screenshot'
+					)
+
+			# Title and page info are independent queries: run them alongside the DOM build and screenshot
+			self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Starting page title and page info queries...')
+			title_task = asyncio.create_task(self.browser_session.get_current_page_title(), name='get_page_title')
+			page_info_task = asyncio.create_task(self._get_page_info(), name='get_page_info')
+			page_queries_deadline = min(asyncio.get_running_loop().time() + PAGE_QUERIES_TIMEOUT, capture_deadline)
 
-			# Wait for both tasks to complete
+			# Wait for both tasks to complete, at most until the capture deadline
 			content = None
 			screenshot_b64 = None
 
 			if dom_task:
 				try:
-					content = await dom_task
+					content = await asyncio.wait_for(dom_task, timeout=_remaining(capture_deadline))
 					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ DOM tree build completed')
 				except Exception as e:
-					self.logger.warning(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: DOM build failed: {e}, using minimal state')
+					self.logger.warning(
+						f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: DOM build failed: {type(e).__name__}: {e}, using minimal state'
+					)
 					content = SerializedDOMState(_root=None, selector_map={})
 			else:
 				content = SerializedDOMState(_root=None, selector_map={})
 
 			if screenshot_task:
 				try:
-					screenshot_b64 = await screenshot_task
+					screenshot_b64 = await asyncio.wait_for(screenshot_task, timeout=_remaining(capture_deadline))
 					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Clean screenshot captured')
 				except Exception as e:
-					self.logger.warning(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Clean screenshot failed: {e}')
+					self.logger.warning(
+						f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Clean screenshot failed: {type(e).__name__}: {e}'
+					)
 					screenshot_b64 = None
 
+			llm_screenshot_b64 = None
+			if llm_screenshot_task:
+				try:
+					llm_screenshot_b64 = await asyncio.wait_for(llm_screenshot_task, timeout=_remaining(capture_deadline))
+				except Exception as e:
+					self.logger.warning(
+						f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: LLM screenshot failed: {type(e).__name__}: {e}'
+					)
+
 			# Add browser-side highlights for user visibility
-			if content and content.selector_map and self.browser_session.browser_profile.dom_highlight_elements:
+			if (
+				content
+				and content.selector_map
+				and event.include_highlights
+				and self.browser_session.browser_profile.dom_highlight_elements
+			):
 				try:
 					self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: 🎨 Adding browser-side highlights...')
-					await self.browser_session.add_highlights(content.selector_map)
+					await asyncio.wait_for(
+						self.browser_session.add_highlights(content.selector_map), timeout=_remaining(capture_deadline)
+					)
 					self.logger.debug(
 						f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ Added browser highlights for {len(content.selector_map)} elements'
 					)
 				except Exception as e:
-					self.logger.warning(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Browser highlighting failed: {e}')
+					self.logger.warning(
+						f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Browser highlighting failed: {type(e).__name__}: {e}'
+					)
 
 			# Ensure we have valid content
 			if not content:
@@ -419,38 +471,17 @@ class DOMWatchdog(BaseWatchdog):
 
 			# Tabs info already fetched at the beginning
 
-			# Get target title safely
-			try:
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page title...')
-				title = await asyncio.wait_for(self.browser_session.get_current_page_title(), timeout=1.0)
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got title: {title}')
-			except Exception as e:
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get title: {e}')
+			# Collect title and page info, waiting at most until their shared deadline
+			await asyncio.wait(
+				(title_task, page_info_task), timeout=max(page_queries_deadline - asyncio.get_running_loop().time(), 0)
+			)
+			title = self._query_result(title_task, 'page title')
+			if title is None:
 				title = 'Page'
-
-			# Get comprehensive page info from CDP with timeout
-			try:
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page info from CDP...')
-				page_info = await asyncio.wait_for(self._get_page_info(), timeout=1.0)
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got page info from CDP: {page_info}')
-			except Exception as e:
-				self.logger.debug(
-					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get page info from CDP: {e}, using fallback'
-				)
-				# Fallback to default viewport dimensions
-				viewport = self.browser_session.browser_profile.viewport or {'width': 1280, 'height': 720}
-				page_info = PageInfo(
-					viewport_width=viewport['width'],
-					viewport_height=viewport['height'],
-					page_width=viewport['width'],
-					page_height=viewport['height'],
-					scroll_x=0,
-					scroll_y=0,
-					pixels_above=0,
-					pixels_below=0,
-					pixels_left=0,
-					pixels_right=0,
-				)
+			page_info = self._query_result(page_info_task, 'page info from CDP')
+			if page_info is None:
+				page_info = self._default_page_info()
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got title: {title}, page info: {page_info}')
 
 			# Check for PDF viewer
 			is_pdf_viewer = page_url.endswith('.pdf') or '/pdf/' in page_url
@@ -476,6 +507,7 @@ class DOMWatchdog(BaseWatchdog):
 				title=title,
 				tabs=tabs_info,
 				screenshot=screenshot_b64,
+				llm_screenshot=llm_screenshot_b64,
 				page_info=page_info,
 				pixels_above=0,
 				pixels_below=0,
@@ -485,6 +517,10 @@ class DOMWatchdog(BaseWatchdog):
 				pending_network_requests=pending_requests,
 				pagination_buttons=pagination_buttons_data,
 				closed_popup_messages=self.browser_session._closed_popup_messages.copy(),
+				timing={
+					**self._last_dom_timing,
+					**({'screenshot_ms': self._last_screenshot_ms} if self._last_screenshot_ms is not None else {}),
+				},
 			)
 
 			# Cache the state
@@ -493,6 +529,8 @@ class DOMWatchdog(BaseWatchdog):
 			# Cache viewport size for coordinate conversion (if llm_screenshot_size is enabled)
 			if self.browser_session.llm_screenshot_size and page_info:
 				self.browser_session._original_viewport_size = (page_info.viewport_width, page_info.viewport_height)
+			if not llm_screenshot_b64:
+				self.browser_session._llm_screenshot_area = None  # the LLM gets the whole viewport, resized
 
 			self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: ✅ COMPLETED - Returning browser state')
 			return browser_state
@@ -530,6 +568,54 @@ class DOMWatchdog(BaseWatchdog):
 				if hasattr(self, 'browser_session') and self.browser_session is not None
 				else [],
 			)
+		finally:
+			# Also runs when the handler itself is cancelled: never leave a query running or its exception unretrieved
+			for task in (tabs_task, dom_task, screenshot_task, llm_screenshot_task, title_task, page_info_task):
+				if task is None:
+					continue
+				if not task.done():
+					task.cancel()
+				elif not task.cancelled():
+					task.exception()
+
+	@staticmethod
+	def _state_capture_deadline(event: BrowserStateRequestEvent) -> float:
+		"""Loop time by which the whole state capture must finish, STATE_CAPTURE_TIMEOUT_MARGIN before the event timeout."""
+		if not event.event_timeout:
+			return math.inf
+		budget = max(event.event_timeout - STATE_CAPTURE_TIMEOUT_MARGIN, event.event_timeout / 2)
+		return asyncio.get_running_loop().time() + budget
+
+	def _query_result(self, task: 'asyncio.Task[Any]', description: str) -> Any | None:
+		"""Result of a finished page query task, or None if it failed or did not finish before the deadline."""
+		if not task.done():
+			task.cancel()
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Timed out getting {description}, using fallback')
+			return None
+		if task.cancelled():
+			return None
+		if exc := task.exception():
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get {description}: {exc}, using fallback')
+			return None
+		return task.result()
+
+	def _default_page_info(self) -> 'PageInfo':
+		"""Page info from the configured viewport, used when CDP layout metrics are unavailable."""
+		from browser_use.browser.views import PageInfo
+
+		viewport = self.browser_session.browser_profile.viewport or {'width': 1280, 'height': 720}
+		return PageInfo(
+			viewport_width=viewport['width'],
+			viewport_height=viewport['height'],
+			page_width=viewport['width'],
+			page_height=viewport['height'],
+			scroll_x=0,
+			scroll_y=0,
+			pixels_above=0,
+			pixels_below=0,
+			pixels_left=0,
+			pixels_right=0,
+		)
 
 	@time_execution_async('build_dom_tree_without_highlights')
 	@observe_debug(ignore_input=True, ignore_output=True, name='build_dom_tree_without_highlights')
@@ -545,8 +631,10 @@ class DOMWatchdog(BaseWatchdog):
 					logger=self.logger,
 					cross_origin_iframes=self.browser_session.browser_profile.cross_origin_iframes,
 					paint_order_filtering=self.browser_session.browser_profile.paint_order_filtering,
+					paint_order_union=self.browser_session.browser_profile.paint_order_union,
 					max_iframes=self.browser_session.browser_profile.max_iframes,
 					max_iframe_depth=self.browser_session.browser_profile.max_iframe_depth,
+					incremental_dom=self.browser_session.browser_profile.incremental_dom,
 				)
 
 			# Get serialized DOM tree using the service
@@ -555,8 +643,10 @@ class DOMWatchdog(BaseWatchdog):
 			self.current_dom_state, self.enhanced_dom_tree, timing_info = await self._dom_service.get_serialized_dom_tree(
 				previous_cached_state=previous_state,
 			)
+			self.dom_version += 1
 			end = time.time()
 			total_time_ms = (end - start) * 1000
+			self._last_dom_timing = timing_info
 			self.logger.debug(
 				'🔍 DOMWatchdog._build_dom_tree_without_highlights: ✅ DomService.get_serialized_dom_tree completed'
 			)
@@ -676,6 +766,7 @@ class DOMWatchdog(BaseWatchdog):
 	@observe_debug(ignore_input=True, ignore_output=True, name='capture_clean_screenshot')
 	async def _capture_clean_screenshot(self) -> str:
 		"""Capture a clean screenshot without JavaScript highlights."""
+		start = time.time()
 		try:
 			self.logger.debug('🔍 DOMWatchdog._capture_clean_screenshot: Capturing clean screenshot...')
 
@@ -686,7 +777,10 @@ class DOMWatchdog(BaseWatchdog):
 			handler_names = [getattr(h, '__name__', str(h)) for h in handlers]
 			self.logger.debug(f'📸 ScreenshotEvent handlers registered: {len(handlers)} - {handler_names}')
 
-			screenshot_event = self.event_bus.dispatch(ScreenshotEvent(full_page=False))
+			profile = self.browser_session.browser_profile
+			screenshot_event = self.event_bus.dispatch(
+				ScreenshotEvent(full_page=False, format=profile.screenshot_format, quality=profile.screenshot_quality)
+			)
 			self.logger.debug('📸 Dispatched ScreenshotEvent, waiting for event to complete...')
 
 			# Wait for the event itself to complete (this waits for all handlers)
@@ -697,6 +791,7 @@ class DOMWatchdog(BaseWatchdog):
 			if screenshot_b64 is None:
 				raise RuntimeError('Screenshot handler returned None')
 			self.logger.debug('🔍 DOMWatchdog._capture_clean_screenshot: ✅ Clean screenshot captured successfully')
+			self._last_screenshot_ms = (time.time() - start) * 1000
 			return str(screenshot_b64)
 
 		except TimeoutError:
@@ -712,6 +807,15 @@ class DOMWatchdog(BaseWatchdog):
 			self.logger.warning(f'📸 Clean screenshot failed: {type(e).__name__}: {e}')
 			raise
 
+	async def _capture_llm_screenshot(self, size: tuple[int, int]) -> str:
+		"""Capture a screenshot that Chrome renders at `size` itself, so it reaches the LLM without being resized in Python."""
+		profile = self.browser_session.browser_profile
+		screenshot_event = self.event_bus.dispatch(
+			ScreenshotEvent(full_page=False, format=profile.screenshot_format, quality=profile.screenshot_quality, size=size)
+		)
+		screenshot_b64 = await screenshot_event.event_result(raise_if_any=True, raise_if_none=True)
+		return str(screenshot_b64)
+
 	def _detect_pagination_buttons(self, selector_map: dict[int, EnhancedDOMTreeNode]) -> list['PaginationButton']:
 		"""Detect pagination buttons from the DOM selector map.
 
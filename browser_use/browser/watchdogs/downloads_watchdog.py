@@ -1,6 +1,7 @@
 """Downloads watchdog for monitoring and handling file downloads."""
 
 import asyncio
+import base64
 import json
 import os
 import tempfile
@@ -14,12 +15,14 @@ from cdp_use.cdp.browser import DownloadProgressEvent, DownloadWillBeginEvent
 from cdp_use.cdp.network import ResponseReceivedEvent
 from cdp_use.cdp.target import SessionID, TargetID
 from pydantic import PrivateAttr
+from uuid_extensions import uuid7str
 
 from browser_use.browser.events import (
 	BrowserLaunchEvent,
 	BrowserStateRequestEvent,
 	BrowserStoppedEvent,
 	FileDownloadedEvent,
+	FileDownloadProgressEvent,
 	NavigationCompleteEvent,
 	TabClosedEvent,
 	TabCreatedEvent,
@@ -28,7 +31,7 @@ from browser_use.browser.watchdog_base import BaseWatchdog
 from browser_use.utils import create_task_with_error_handling
 
 if TYPE_CHECKING:
-	pass
+	from browser_use.browser.session import CDPSession
 
 
 class DownloadsWatchdog(BaseWatchdog):
@@ -47,6 +50,7 @@ class DownloadsWatchdog(BaseWatchdog):
 	# Events this watchdog emits
 	EMITS: ClassVar[list[type[BaseEvent[Any]]]] = [
 		FileDownloadedEvent,
+		FileDownloadProgressEvent,
 	]
 
 	# Private state
@@ -543,82 +547,40 @@ class DownloadsWatchdog(BaseWatchdog):
 
 			self.logger.debug(f'[DownloadsWatchdog] Downloading from: {url[:100]}...')
 
-			# Download using JavaScript fetch to leverage browser cache
-			escaped_url = json.dumps(url)
-
-			result = await asyncio.wait_for(
-				temp_session.cdp_client.send.Runtime.evaluate(
-					params={
-						'expression': f"""
-				(async () => {{
-					try {{
-						const response = await fetch({escaped_url}, {{
-							cache: 'force-cache'
-						}});
-						if (!response.ok) {{
-							throw new Error(`HTTP error! status: ${{response.status}}`);
-						}}
-						const blob = await response.blob();
-						const arrayBuffer = await blob.arrayBuffer();
-						const uint8Array = new Uint8Array(arrayBuffer);
-
-						return {{
-							data: Array.from(uint8Array),
-							responseSize: uint8Array.length
-						}};
-					}} catch (error) {{
-						throw new Error(`Fetch failed: ${{error.message}}`);
-					}}
-				}})()
-				""",
-						'awaitPromise': True,
-						'returnByValue': True,
-					},
-					session_id=temp_session.session_id,
-				),
-				timeout=15.0,  # 15 second timeout
+			# Download using JavaScript fetch to leverage browser cache, streamed to disk
+			download_path = os.path.join(downloads_dir, final_filename)
+			download_result = await self._stream_url_to_file(
+				temp_session, url, Path(download_path), force_cache=True, timeout=15.0
 			)
 
-			download_result = result.get('result', {}).get('value', {})
-
-			if download_result and download_result.get('data') and len(download_result['data']) > 0:
-				download_path = os.path.join(downloads_dir, final_filename)
-
-				# Save the file asynchronously
-				async with await anyio.open_file(download_path, 'wb') as f:
-					await f.write(bytes(download_result['data']))
+			if download_result['size'] > 0:
+				actual_size = download_result['size']
+				self.logger.debug(f'[DownloadsWatchdog] File written: {download_path} ({actual_size} bytes)')
 
-				# Verify file was written successfully
-				if os.path.exists(download_path):
-					actual_size = os.path.getsize(download_path)
-					self.logger.debug(f'[DownloadsWatchdog] File written: {download_path} ({actual_size} bytes)')
+				# Determine file type
+				file_ext = Path(final_filename).suffix.lower().lstrip('.')
+				mime_type = content_type or f'application/{file_ext}'
 
-					# Determine file type
-					file_ext = Path(final_filename).suffix.lower().lstrip('.')
-					mime_type = content_type or f'application/{file_ext}'
+				# Store URL->path mapping for this session
+				self._session_pdf_urls[url] = download_path
 
-					# Store URL->path mapping for this session
-					self._session_pdf_urls[url] = download_path
-
-					# Emit file downloaded event
-					self.logger.debug(f'[DownloadsWatchdog] Dispatching FileDownloadedEvent for {final_filename}')
-					self.event_bus.dispatch(
-						FileDownloadedEvent(
-							url=url,
-							path=download_path,
-							file_name=final_filename,
-							file_size=actual_size,
-							file_type=file_ext if file_ext else None,
-							mime_type=mime_type,
-							auto_download=True,
-						)
+				# Emit file downloaded event
+				self.logger.debug(f'[DownloadsWatchdog] Dispatching FileDownloadedEvent for {final_filename}')
+				self.event_bus.dispatch(
+					FileDownloadedEvent(
+						url=url,
+						path=download_path,
+						file_name=final_filename,
+						file_size=actual_size,
+						file_type=file_ext if file_ext else None,
+						mime_type=mime_type,
+						auto_download=True,
 					)
+				)
 
-					return download_path
-				else:
-					self.logger.error(f'[DownloadsWatchdog] Failed to write file: {download_path}')
-					return None
+				return download_path
 			else:
+				await anyio.Path(download_path).unlink(missing_ok=True)
 				self.logger.warning(f'[DownloadsWatchdog] No data received when downloading from {url}')
 				return None
 
@@ -629,6 +591,123 @@ class DownloadsWatchdog(BaseWatchdog):
 			self.logger.warning(f'[DownloadsWatchdog] Download failed: {type(e).__name__}: {e}')
 			return None
 
+	async def _stream_url_to_file(
+		self,
+		cdp_session: 'CDPSession',
+		url: str,
+		path: Path,
+		force_cache: bool = False,
+		timeout: float | None = None,
+	) -> dict[str, Any]:
+		"""Fetch a URL inside the page and stream the response body to `path`.
+
+		The body stays in the page as a Blob and is read with IO.read in base64 chunks of
+		`browser_profile.download_chunk_size` bytes, each written to disk before the next is requested, so the file
+		never crosses the websocket as one JSON int array and is never fully buffered in Python.
+		A FileDownloadProgressEvent is dispatched after every chunk. `timeout` bounds the whole transfer, fetch and reads
+		(TimeoutError when exceeded). A partially written file is removed on failure.
+
+		Returns:
+			dict with `size` (bytes written), `contentType` and `fromCache`
+		"""
+		cdp_client = cdp_session.cdp_client
+		session_id = cdp_session.session_id
+		object_group = f'browser_use_download_{uuid7str()}'
+		fetch_options = "{ cache: 'force-cache' }" if force_cache else '{}'
+		chunk_size = self.browser_session.browser_profile.download_chunk_size
+
+		try:
+			# One deadline for the whole transfer: the in-page fetch and every IO.read chunk
+			async with asyncio.timeout(timeout):
+				result = await cdp_client.send.Runtime.evaluate(
+					params={
+						'expression': f"""
+					(async () => {{
+						const response = await fetch({json.dumps(url)}, {fetch_options});
+						if (!response.ok) {{
+							throw new Error(`HTTP error! status: ${{response.status}}`);
+						}}
+						const blob = await response.blob();
+						return {{
+							blob: blob,
+							size: blob.size,
+							contentType: response.headers.get('content-type') || 'application/octet-stream',
+							// Check if served from cache
+							fromCache: response.headers.has('age') || !response.headers.has('date'),
+						}};
+					}})()
+					""",
+						'awaitPromise': True,
+						'objectGroup': object_group,
+					},
+					session_id=session_id,
+				)
+				if 'exceptionDetails' in result:
+					details = result['exceptionDetails']
+					raise RuntimeError(f'Fetch failed: {details.get("exception", {}).get("description") or details.get("text")}')
+				response_object_id = result['result']['objectId']
+
+				metadata_result, blob_result = await asyncio.gather(
+					cdp_client.send.Runtime.callFunctionOn(
+						params={
+							'functionDeclaration': 'function() { return {size: this.size, contentType: this.contentType, fromCache: this.fromCache}; }',
+							'objectId': response_object_id,
+							'returnByValue': True,
+						},
+						session_id=session_id,
+					),
+					cdp_client.send.Runtime.callFunctionOn(
+						params={
+							'functionDeclaration': 'function() { return this.blob; }',
+							'objectId': response_object_id,
+							'objectGroup': object_group,
+						},
+						session_id=session_id,
+					),
+				)
+				metadata: dict[str, Any] = metadata_result['result']['value']
+				blob_uuid = (
+					await cdp_client.send.IO.resolveBlob(
+						params={'objectId': blob_result['result']['objectId']}, session_id=session_id
+					)
+				)['uuid']
+				handle = f'blob:{blob_uuid}'
+
+				bytes_written = 0
+				try:
+					async with await anyio.open_file(path, 'wb') as f:
+						while True:
+							chunk = await cdp_client.send.IO.read(
+								params={'handle': handle, 'size': chunk_size}, session_id=session_id
+							)
+							data = base64.b64decode(chunk['data']) if chunk.get('base64Encoded') else chunk['data'].encode()
+							if data:
+								await f.write(data)
+								bytes_written += len(data)
+								self.event_bus.dispatch(
+									FileDownloadProgressEvent(
+										url=url, path=str(path), bytes_written=bytes_written, total_bytes=metadata.get('size')
+									)
+								)
+							if chunk.get('eof'):
+								break
+				finally:
+					try:
+						await cdp_client.send.IO.close(params={'handle': handle}, session_id=session_id)
+					except Exception:
+						pass
+		except BaseException:
+			await anyio.Path(path).unlink(missing_ok=True)
+			raise
+		finally:
+			try:
+				await cdp_client.send.Runtime.releaseObjectGroup(params={'objectGroup': object_group}, session_id=session_id)
+			except Exception:
+				pass
+
+		metadata['size'] = bytes_written
+		return metadata
+
 	def _track_download(self, file_path: str) -> None:
 		"""Track a completed download and dispatch the appropriate event.
 
@@ -702,59 +781,17 @@ class DownloadsWatchdog(BaseWatchdog):
 				file_size = None
 				download_result = None
 				try:
-					# Escape the URL for JavaScript
-					import json
-
-					escaped_url = json.dumps(download_url)
-
 					# Get the proper session for the frame that initiated the download
 					cdp_session = await self.browser_session.cdp_client_for_frame(event.get('frameId'))
 					assert cdp_session
 
-					result = await cdp_session.cdp_client.send.Runtime.evaluate(
-						params={
-							'expression': f"""
-						(async () => {{
-							try {{
-								const response = await fetch({escaped_url});
-								if (!response.ok) {{
-									throw new Error(`HTTP error! status: ${{response.status}}`);
-								}}
-								const blob = await response.blob();
-								const arrayBuffer = await blob.arrayBuffer();
-								const uint8Array = new Uint8Array(arrayBuffer);
-								return {{
-									data: Array.from(uint8Array),
-									size: uint8Array.length,
-									contentType: response.headers.get('content-type') || 'application/octet-stream'
-								}};
-							}} catch (error) {{
-								throw new Error(`Fetch failed: ${{error.message}}`);
-							}}
-						}})()
-						""",
-							'awaitPromise': True,
-							'returnByValue': True,
-						},
-						session_id=cdp_session.session_id,
-					)
-					download_result = result.get('result', {}).get('value')
-
-					if download_result and download_result.get('data'):
-						# Save the file
-						file_data = bytes(download_result['data'])
-						file_size = len(file_data)
-
-						# Ensure unique filename
-						unique_filename = await self._get_unique_filename(str(downloads_dir), suggested_filename)
-						final_path = downloads_dir / unique_filename
-
-						# Write the file
-						import anyio
-
-						async with await anyio.open_file(final_path, 'wb') as f:
-							await f.write(file_data)
+					# Ensure unique filename
+					unique_filename = await self._get_unique_filename(str(downloads_dir), suggested_filename)
+					final_path = downloads_dir / unique_filename
+					download_result = await self._stream_url_to_file(cdp_session, download_url, final_path)
+					file_size = download_result['size']
 
+					if file_size:
 						self.logger.debug(f'[DownloadsWatchdog] ✅ Downloaded and saved file: {final_path} ({file_size} bytes)')
 						expected_path = final_path
 						# Emit download event immediately
@@ -783,6 +820,7 @@ class DownloadsWatchdog(BaseWatchdog):
 						)
 						return
 					else:
+						final_path.unlink(missing_ok=True)
 						self.logger.error('[DownloadsWatchdog] ❌ No data received from fetch')
 
 				except Exception as fetch_error:
@@ -1178,75 +1216,17 @@ class DownloadsWatchdog(BaseWatchdog):
 
 			self.logger.debug(f'[DownloadsWatchdog] Starting PDF download from: {pdf_url[:100]}...')
 
-			# Download using JavaScript fetch to leverage browser cache
+			# Download using JavaScript fetch to leverage browser cache, streamed to disk
 			try:
-				# Properly escape the URL to prevent JavaScript injection
-				escaped_pdf_url = json.dumps(pdf_url)
-
-				result = await asyncio.wait_for(
-					temp_session.cdp_client.send.Runtime.evaluate(
-						params={
-							'expression': f"""
-					(async () => {{
-						try {{
-							// Use fetch with cache: 'force-cache' to prioritize cached version
-							const response = await fetch({escaped_pdf_url}, {{
-								cache: 'force-cache'
-							}});
-							if (!response.ok) {{
-								throw new Error(`HTTP error! status: ${{response.status}}`);
-							}}
-							const blob = await response.blob();
-							const arrayBuffer = await blob.arrayBuffer();
-							const uint8Array = new Uint8Array(arrayBuffer);
-							
-							// Check if served from cache
-							const fromCache = response.headers.has('age') || 
-											 !response.headers.has('date');
-											 
-							return {{ 
-								data: Array.from(uint8Array),
-								fromCache: fromCache,
-								responseSize: uint8Array.length,
-								transferSize: response.headers.get('content-length') || 'unknown'
-							}};
-						}} catch (error) {{
-							throw new Error(`Fetch failed: ${{error.message}}`);
-						}}
-					}})()
-					""",
-							'awaitPromise': True,
-							'returnByValue': True,
-						},
-						session_id=temp_session.session_id,
-					),
-					timeout=10.0,  # 10 second timeout for download operation
+				download_path = os.path.join(downloads_dir, final_filename)
+				download_result = await self._stream_url_to_file(
+					temp_session, pdf_url, Path(download_path), force_cache=True, timeout=10.0
 				)
-				download_result = result.get('result', {}).get('value', {})
-
-				if download_result and download_result.get('data') and len(download_result['data']) > 0:
-					# Ensure downloads directory exists
-					downloads_dir = str(self.browser_session.browser_profile.downloads_path)
-					os.makedirs(downloads_dir, exist_ok=True)
-					download_path = os.path.join(downloads_dir, final_filename)
-
-					# Save the PDF asynchronously
-					async with await anyio.open_file(download_path, 'wb') as f:
-						await f.write(bytes(download_result['data']))
-
-					# Verify file was written successfully
-					if os.path.exists(download_path):
-						actual_size = os.path.getsize(download_path)
-						self.logger.debug(
-							f'[DownloadsWatchdog] PDF file written successfully: {download_path} ({actual_size} bytes)'
-						)
-					else:
-						self.logger.error(f'[DownloadsWatchdog] ❌ Failed to write PDF file to: {download_path}')
-						return None
 
+				if download_result['size'] > 0:
 					# Log cache information
 					cache_status = 'from cache' if download_result.get('fromCache') else 'from network'
-					response_size = download_result.get('responseSize', 0)
+					response_size = download_result['size']
 					self.logger.debug(
 						f'[DownloadsWatchdog] ✅ Auto-downloaded PDF ({cache_status}, {response_size:,} bytes): {download_path}'
 					)
@@ -1272,6 +1252,7 @@ class DownloadsWatchdog(BaseWatchdog):
 					# No need to detach - session is cached
 					return download_path
 				else:
+					await anyio.Path(download_path).unlink(missing_ok=True)
 					self.logger.warning(f'[DownloadsWatchdog] No data received when downloading PDF from {pdf_url}')
 					return None
 
@@ -6,16 +6,19 @@ import shutil
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
+from urllib.parse import urlparse
 
 import psutil
 from bubus import BaseEvent
 from pydantic import PrivateAttr
 
+from browser_use.browser.browser_pool import PooledBrowser, browser_pool
 from browser_use.browser.events import (
 	BrowserKillEvent,
 	BrowserLaunchEvent,
 	BrowserLaunchResult,
 	BrowserStopEvent,
+	NavigationCompleteEvent,
 )
 from browser_use.browser.watchdog_base import BaseWatchdog
 from browser_use.observability import observe_debug
@@ -24,6 +27,38 @@ if TYPE_CHECKING:
 	pass
 
 
+# Chrome prints this to stderr once its remote debugging server accepts connections
+DEVTOOLS_LISTENING_PREFIX = 'DevTools listening on '
+
+# Tasks draining the stderr of launched browsers (a full pipe would block the browser)
+_stderr_drain_tasks: set[asyncio.Task] = set()
+
+
+async def _drain_stream(stream: asyncio.StreamReader) -> None:
+	while await stream.read(64 * 1024):
+		pass
+
+
+async def _read_until_devtools_listening(stderr: asyncio.StreamReader) -> str:
+	"""Read the browser's stderr until it reports the DevTools websocket URL, then keep draining it in the background."""
+	output_tail: list[str] = []
+	while True:
+		try:
+			line_bytes = await stderr.readline()
+		except ValueError:
+			continue  # line longer than the stream buffer, not the one we are looking for
+		if not line_bytes:
+			output = '\n'.join(output_tail).strip()
+			raise RuntimeError(f'Browser exited before DevTools was ready: {output or "(no output)"}')
+		line = line_bytes.decode(errors='replace').strip()
+		if line.startswith(DEVTOOLS_LISTENING_PREFIX):
+			task = asyncio.create_task(_drain_stream(stderr))
+			_stderr_drain_tasks.add(task)
+			task.add_done_callback(_stderr_drain_tasks.discard)
+			return line[len(DEVTOOLS_LISTENING_PREFIX) :]
+		output_tail = (output_tail + [line])[-20:]
+
+
 class LocalBrowserWatchdog(BaseWatchdog):
 	"""Manages local browser subprocess lifecycle."""
 
@@ -32,6 +67,7 @@ class LocalBrowserWatchdog(BaseWatchdog):
 		BrowserLaunchEvent,
 		BrowserKillEvent,
 		BrowserStopEvent,
+		NavigationCompleteEvent,
 	]
 
 	# Events this watchdog emits
@@ -42,6 +78,8 @@ class LocalBrowserWatchdog(BaseWatchdog):
 	_owns_browser_resources: bool = PrivateAttr(default=True)
 	_temp_dirs_to_cleanup: list[Path] = PrivateAttr(default_factory=list)
 	_original_user_data_dir: str | None = PrivateAttr(default=None)
+	_pooled_browser: PooledBrowser | None = PrivateAttr(default=None)
+	_visited_origins: set[str] = PrivateAttr(default_factory=set)
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='browser_launch_event')
 	async def on_BrowserLaunchEvent(self, event: BrowserLaunchEvent) -> BrowserLaunchResult:
@@ -50,6 +88,20 @@ class LocalBrowserWatchdog(BaseWatchdog):
 		try:
 			self.logger.debug('[LocalBrowserWatchdog] Received BrowserLaunchEvent, launching local browser...')
 
+			# Take a pre-launched browser from the warm pool if enabled and compatible with this profile
+			pooled_browser = await browser_pool.acquire(self.browser_session.browser_profile)
+			if pooled_browser is not None:
+				self._pooled_browser = pooled_browser
+				self._subprocess = pooled_browser.process
+				self._visited_origins = set()
+				profile = self.browser_session.browser_profile
+				self._original_user_data_dir = str(profile.user_data_dir) if profile.user_data_dir else None
+				profile.user_data_dir = str(pooled_browser.user_data_dir)
+				self.logger.debug(
+					f'[LocalBrowserWatchdog] 🏊 Using pooled browser browser_pid= {pooled_browser.process.pid} 🔗 {pooled_browser.cdp_url}'
+				)
+				return BrowserLaunchResult(cdp_url=pooled_browser.cdp_url)
+
 			# self.logger.debug('[LocalBrowserWatchdog] Calling _launch_browser...')
 			process, cdp_url = await self._launch_browser()
 			self._subprocess = process
@@ -64,7 +116,16 @@ class LocalBrowserWatchdog(BaseWatchdog):
 		"""Kill the local browser subprocess."""
 		self.logger.debug('[LocalBrowserWatchdog] Killing local browser process')
 
-		if self._subprocess:
+		if self._pooled_browser:
+			# Pooled browsers are reset and handed back to the pool instead of being killed
+			browser_pool.release(self._pooled_browser, self._visited_origins)
+			self._pooled_browser = None
+			self._subprocess = None
+			# The pooled profile directory goes back with the browser, so always restore the session's own
+			# (None validates to a fresh throwaway directory, like it did when the profile was created)
+			self.browser_session.browser_profile.user_data_dir = self._original_user_data_dir
+			self._original_user_data_dir = None
+		elif self._subprocess:
 			await self._cleanup_process(self._subprocess)
 			self._subprocess = None
 
@@ -87,6 +148,13 @@ class LocalBrowserWatchdog(BaseWatchdog):
 			# Dispatch BrowserKillEvent without awaiting so it gets processed after all BrowserStopEvent handlers
 			self.event_bus.dispatch(BrowserKillEvent())
 
+	async def on_NavigationCompleteEvent(self, event: NavigationCompleteEvent) -> None:
+		"""Remember the origins a pooled browser visited so their storage is cleared before it is reused."""
+		if self._pooled_browser:
+			parsed = urlparse(event.url)
+			if parsed.scheme in ('http', 'https') and parsed.netloc:
+				self._visited_origins.add(f'{parsed.scheme}://{parsed.netloc}')
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='launch_browser_process')
 	async def _launch_browser(self, max_retries: int = 3) -> tuple[psutil.Process, str]:
 		"""Launch browser process and return (process, cdp_url).
@@ -155,7 +223,7 @@ class LocalBrowserWatchdog(BaseWatchdog):
 				process = psutil.Process(subprocess.pid)
 
 				# Wait for CDP to be ready and get the URL
-				cdp_url = await self._wait_for_cdp_url(debug_port)
+				cdp_url = await self._wait_for_cdp_url(debug_port, stderr=subprocess.stderr)
 
 				# Success! Clean up any temp dirs we created but didn't use
 				for tmp_dir in self._temp_dirs_to_cleanup:
@@ -360,8 +428,19 @@ class LocalBrowserWatchdog(BaseWatchdog):
 		return port
 
 	@staticmethod
-	async def _wait_for_cdp_url(port: int, timeout: float = 30) -> str:
-		"""Wait for the browser to start and return the CDP URL."""
+	async def _wait_for_cdp_url(port: int, timeout: float = 30, stderr: asyncio.StreamReader | None = None) -> str:
+		"""Wait for the browser to start and return the CDP URL.
+
+		Given the browser's stderr, returns the moment Chrome prints its "DevTools listening on" line (and raises with
+		the browser's output if it exits first). Otherwise polls the /json/version endpoint.
+		"""
+		if stderr is not None:
+			try:
+				await asyncio.wait_for(_read_until_devtools_listening(stderr), timeout=timeout)
+			except TimeoutError:
+				raise TimeoutError(f'Browser did not start within {timeout} seconds')
+			return f'http://localhost:{port}/'
+
 		import aiohttp
 
 		start_time = asyncio.get_event_loop().time()
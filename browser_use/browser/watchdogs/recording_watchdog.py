@@ -1,6 +1,5 @@
 """Recording Watchdog for Browser Use Sessions."""
 
-import asyncio
 from pathlib import Path
 from typing import ClassVar
 
@@ -48,7 +47,7 @@ class RecordingWatchdog(BaseWatchdog):
 
 		self.logger.debug(f'Initializing video recorder for format: {video_format}')
 		self._recorder = VideoRecorderService(output_path=output_path, size=size, framerate=profile.record_video_framerate)
-		self._recorder.start()
+		await self._recorder.start()
 
 		if not self._recorder._is_active:
 			self._recorder = None
@@ -72,8 +71,9 @@ class RecordingWatchdog(BaseWatchdog):
 		except Exception as e:
 			self.logger.error(f'Failed to start screencast via CDP: {e}')
 			if self._recorder:
-				self._recorder.stop_and_save()
+				recorder = self._recorder
 				self._recorder = None
+				await recorder.stop_and_save()
 
 	async def _get_current_viewport_size(self) -> ViewportSize | None:
 		"""Gets the current viewport size directly from the browser via CDP."""
@@ -96,7 +96,7 @@ class RecordingWatchdog(BaseWatchdog):
 
 	def on_screencastFrame(self, event: ScreencastFrameEvent, session_id: str | None) -> None:
 		"""
-		Synchronous handler for incoming screencast frames.
+		Synchronous handler for incoming screencast frames, only queues the frame for the encoder.
 		"""
 
 		if not self._recorder:
@@ -129,5 +129,4 @@ class RecordingWatchdog(BaseWatchdog):
 			self._recorder = None
 
 			self.logger.debug('Stopping video recording and saving file...')
-			loop = asyncio.get_event_loop()
-			await loop.run_in_executor(None, recorder.stop_and_save)
+			await recorder.stop_and_save()
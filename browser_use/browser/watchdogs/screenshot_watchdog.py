@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from bubus import BaseEvent
-from cdp_use.cdp.page import CaptureScreenshotParameters
+from cdp_use.cdp.page import CaptureScreenshotParameters, Viewport
 
 from browser_use.browser.events import ScreenshotEvent
 from browser_use.browser.views import BrowserError
@@ -11,7 +11,10 @@ from browser_use.browser.watchdog_base import BaseWatchdog
 from browser_use.observability import observe_debug
 
 if TYPE_CHECKING:
-	pass
+	from browser_use.browser.session import CDPSession
+
+# Largest fraction of the viewport width or height cropped to match the aspect ratio of a requested screenshot size
+MAX_DOWNSCALE_CROP = 0.01
 
 
 class ScreenshotWatchdog(BaseWatchdog):
@@ -28,7 +31,7 @@ class ScreenshotWatchdog(BaseWatchdog):
 		"""Handle screenshot request using CDP.
 
 		Args:
-			event: ScreenshotEvent with optional full_page and clip parameters
+			event: ScreenshotEvent with optional full_page, clip, format, quality and size parameters
 
 		Returns:
 			Dict with 'screenshot' key containing base64-encoded screenshot or None
@@ -39,7 +42,17 @@ class ScreenshotWatchdog(BaseWatchdog):
 			cdp_session = await self.browser_session.get_or_create_cdp_session()
 
 			# Prepare screenshot parameters
-			params = CaptureScreenshotParameters(format='png', captureBeyondViewport=False)
+			params = CaptureScreenshotParameters(format=event.format, captureBeyondViewport=False)
+			if event.quality is not None and event.format != 'png':
+				params['quality'] = event.quality
+
+			# Let Chrome render the screenshot at the requested size instead of decoding and resizing it in Python.
+			# Sized screenshots are the LLM's: remember which part of the viewport it sees to map its coordinates back.
+			if event.size:
+				clip = await self._get_downscale_clip(cdp_session, event.size)
+				if clip:
+					params['clip'] = clip
+				self.browser_session._llm_screenshot_area = (clip['width'], clip['height']) if clip else None
 
 			# Take screenshot using CDP
 			self.logger.debug(f'[ScreenshotWatchdog] Taking screenshot with params: {params}')
@@ -60,3 +73,39 @@ class ScreenshotWatchdog(BaseWatchdog):
 				await self.browser_session.remove_highlights()
 			except Exception:
 				pass
+
+	async def _get_downscale_clip(self, cdp_session: 'CDPSession', size: tuple[int, int]) -> Viewport | None:
+		"""Clip of the visible viewport with the scale that makes Chrome output a screenshot of exactly `size`.
+
+		The output is clip size * scale * device pixel ratio, and a clip scale is uniform, so up to
+		MAX_DOWNSCALE_CROP of the viewport is cropped to match the aspect ratio of `size`. Returns None
+		when the aspect ratios differ more than that; the screenshot is then captured at full resolution.
+		"""
+		metrics = await cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=cdp_session.session_id)
+		visual_viewport = metrics.get('visualViewport', {})
+		css_visual_viewport = metrics.get('cssVisualViewport', {})
+
+		css_width = css_visual_viewport.get('clientWidth', 0)
+		css_height = css_visual_viewport.get('clientHeight', 0)
+		if css_width <= 0 or css_height <= 0:
+			return None
+		device_pixel_ratio = visual_viewport.get('clientWidth', css_width) / css_width
+
+		width, height = size
+		scale = max(width / css_width, height / css_height) / device_pixel_ratio
+		clip_width = width / (scale * device_pixel_ratio)
+		clip_height = height / (scale * device_pixel_ratio)
+		if clip_width < css_width * (1 - MAX_DOWNSCALE_CROP) or clip_height < css_height * (1 - MAX_DOWNSCALE_CROP):
+			self.logger.debug(
+				f'[ScreenshotWatchdog] Aspect ratio of {width}x{height} does not match viewport {css_width}x{css_height}, '
+				'capturing at full resolution'
+			)
+			return None
+
+		return Viewport(
+			x=css_visual_viewport.get('pageX', 0),
+			y=css_visual_viewport.get('pageY', 0),
+			width=clip_width,
+			height=clip_height,
+			scale=scale,
+		)
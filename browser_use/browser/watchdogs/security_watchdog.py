@@ -11,13 +11,11 @@ from browser_use.browser.events import (
 	TabCreatedEvent,
 )
 from browser_use.browser.watchdog_base import BaseWatchdog
+from browser_use.domain_matcher import get_domain_policy, get_domain_variants, is_ip_address, is_root_domain
 
 if TYPE_CHECKING:
 	pass
 
-# Track if we've shown the glob warning
-_GLOB_WARNING_SHOWN = False
-
 
 class SecurityWatchdog(BaseWatchdog):
 	"""Monitors and enforces security policies for URL access."""
@@ -104,21 +102,7 @@ class SecurityWatchdog(BaseWatchdog):
 		Returns:
 			True if it's a simple root domain, False otherwise
 		"""
-		# Skip if it contains wildcards or protocol
-		if '*' in domain or '://' in domain:
-			return False
-
-		return domain.count('.') == 1
-
-	def _log_glob_warning(self) -> None:
-		"""Log a warning about glob patterns in allowed_domains."""
-		global _GLOB_WARNING_SHOWN
-		if not _GLOB_WARNING_SHOWN:
-			_GLOB_WARNING_SHOWN = True
-			self.logger.warning(
-				'⚠️ Using glob patterns in allowed_domains. '
-				'Note: Patterns like "*.example.com" will match both subdomains AND the main domain.'
-			)
+		return is_root_domain(domain)
 
 	def _get_domain_variants(self, host: str) -> tuple[str, str]:
 		"""Get both variants of a domain (with and without www prefix).
@@ -131,10 +115,7 @@ class SecurityWatchdog(BaseWatchdog):
 			- If host starts with www., variant is without www.
 			- Otherwise, variant is with www. prefix
 		"""
-		if host.startswith('www.'):
-			return (host, host[4:])  # ('www.example.com', 'example.com')
-		else:
-			return (host, f'www.{host}')  # ('example.com', 'www.example.com')
+		return get_domain_variants(host)
 
 	def _is_ip_address(self, host: str) -> bool:
 		"""Check if a hostname is an IP address (IPv4 or IPv6).
@@ -145,19 +126,12 @@ class SecurityWatchdog(BaseWatchdog):
 		Returns:
 			True if the host is an IP address, False otherwise
 		"""
-		import ipaddress
-
-		try:
-			# Try to parse as IP address (handles both IPv4 and IPv6)
-			ipaddress.ip_address(host)
-			return True
-		except ValueError:
-			return False
-		except Exception:
-			return False
+		return is_ip_address(host)
 
 	def _is_url_allowed(self, url: str) -> bool:
-		"""Check if a URL is allowed based on the allowed_domains configuration.
+		"""Check if a URL is allowed based on the allowed_domains / prohibited_domains configuration.
+
+		The domain lists are compiled once per profile (see DomainPolicy) instead of being matched pattern by pattern.
 
 		Args:
 			url: The URL to check
@@ -165,116 +139,6 @@ class SecurityWatchdog(BaseWatchdog):
 		Returns:
 			True if the URL is allowed, False otherwise
 		"""
-
-		# Always allow internal browser targets (before any other checks)
-		if url in ['about:blank', 'chrome://new-tab-page/', 'chrome://new-tab-page', 'chrome://newtab/']:
-			return True
-
-		# Parse the URL to extract components
-		from urllib.parse import urlparse
-
-		try:
-			parsed = urlparse(url)
-		except Exception:
-			# Invalid URL
-			return False
-
-		# Allow data: and blob: URLs (they don't have hostnames)
-		if parsed.scheme in ['data', 'blob']:
-			return True
-
-		# Get the actual host (domain)
-		host = parsed.hostname
-		if not host:
-			return False
-
-		# Check if IP addresses should be blocked (before domain checks)
-		if self.browser_session.browser_profile.block_ip_addresses:
-			if self._is_ip_address(host):
-				return False
-
-		# If no allowed_domains specified, allow all URLs
-		if (
-			not self.browser_session.browser_profile.allowed_domains
-			and not self.browser_session.browser_profile.prohibited_domains
-		):
-			return True
-
-		# Check allowed domains (fast path for sets, slow path for lists with patterns)
-		if self.browser_session.browser_profile.allowed_domains:
-			allowed_domains = self.browser_session.browser_profile.allowed_domains
-
-			if isinstance(allowed_domains, set):
-				# Fast path: O(1) exact hostname match - check both www and non-www variants
-				host_variant, host_alt = self._get_domain_variants(host)
-				return host_variant in allowed_domains or host_alt in allowed_domains
-			else:
-				# Slow path: O(n) pattern matching for lists
-				for pattern in allowed_domains:
-					if self._is_url_match(url, host, parsed.scheme, pattern):
-						return True
-				return False
-
-		# Check prohibited domains (fast path for sets, slow path for lists with patterns)
-		if self.browser_session.browser_profile.prohibited_domains:
-			prohibited_domains = self.browser_session.browser_profile.prohibited_domains
-
-			if isinstance(prohibited_domains, set):
-				# Fast path: O(1) exact hostname match - check both www and non-www variants
-				host_variant, host_alt = self._get_domain_variants(host)
-				return host_variant not in prohibited_domains and host_alt not in prohibited_domains
-			else:
-				# Slow path: O(n) pattern matching for lists
-				for pattern in prohibited_domains:
-					if self._is_url_match(url, host, parsed.scheme, pattern):
-						return False
-				return True
-
-		return True
-
-	def _is_url_match(self, url: str, host: str, scheme: str, pattern: str) -> bool:
-		"""Check if a URL matches a pattern."""
-
-		# Full URL for matching (scheme + host)
-		full_url_pattern = f'{scheme}://{host}'
-
-		# Handle glob patterns
-		if '*' in pattern:
-			self._log_glob_warning()
-			import fnmatch
-
-			# Check if pattern matches the host
-			if pattern.startswith('*.'):
-				# Pattern like *.example.com should match subdomains and main domain
-				domain_part = pattern[2:]  # Remove *.
-				if host == domain_part or host.endswith('.' + domain_part):
-					# Only match http/https URLs for domain-only patterns
-					if scheme in ['http', 'https']:
-						return True
-			elif pattern.endswith('/*'):
-				# Pattern like brave://* should match any brave:// URL
-				prefix = pattern[:-1]  # Remove the * at the end
-				if url.startswith(prefix):
-					return True
-			else:
-				# Use fnmatch for other glob patterns
-				if fnmatch.fnmatch(
-					full_url_pattern if '://' in pattern else host,
-					pattern,
-				):
-					return True
-		else:
-			# Exact match
-			if '://' in pattern:
-				# Full URL pattern
-				if url.startswith(pattern):
-					return True
-			else:
-				# Domain-only pattern (case-insensitive comparison)
-				if host.lower() == pattern.lower():
-					return True
-				# If pattern is a root domain, also check www subdomain
-				if self._is_root_domain(pattern) and host.lower() == f'www.{pattern.lower()}':
-					return True
-
-		return False
+		profile = self.browser_session.browser_profile
+		policy = get_domain_policy(profile.allowed_domains, profile.prohibited_domains, profile.block_ip_addresses)
+		return policy.is_url_allowed(url)
@@ -163,6 +163,43 @@ class OldConfig:
 	def DEFAULT_LLM(self) -> str:
 		return os.getenv('DEFAULT_LLM', '')
 
+	# LLM HTTP client pool (defaults match the connection limits the OpenAI/Anthropic SDKs use for their own clients)
+	@property
+	def BROWSER_USE_LLM_MAX_CONNECTIONS(self) -> int:
+		return int(os.getenv('BROWSER_USE_LLM_MAX_CONNECTIONS', '1000'))
+
+	@property
+	def BROWSER_USE_LLM_MAX_KEEPALIVE_CONNECTIONS(self) -> int:
+		return int(os.getenv('BROWSER_USE_LLM_MAX_KEEPALIVE_CONNECTIONS', '100'))
+
+	@property
+	def BROWSER_USE_LLM_HTTP2(self) -> bool:
+		return os.getenv('BROWSER_USE_LLM_HTTP2', 'true').lower()[:1] in ('t', 'y', '1')
+
+	# Image processing executor
+	@property
+	def BROWSER_USE_IMAGE_EXECUTOR(self) -> str:
+		return os.getenv('BROWSER_USE_IMAGE_EXECUTOR', 'thread').lower()
+
+	@property
+	def BROWSER_USE_IMAGE_EXECUTOR_WORKERS(self) -> int:
+		return int(os.getenv('BROWSER_USE_IMAGE_EXECUTOR_WORKERS', '0'))
+
+	# Warm browser pool
+	@property
+	def BROWSER_USE_BROWSER_POOL_SIZE(self) -> int:
+		return int(os.getenv('BROWSER_USE_BROWSER_POOL_SIZE', '0'))
+
+	# MCP server
+	@property
+	def BROWSER_USE_MCP_MAX_BROWSERS(self) -> int:
+		return int(os.getenv('BROWSER_USE_MCP_MAX_BROWSERS', '4'))
+
+	# DOM
+	@property
+	def BROWSER_USE_DOM_HASH(self) -> str:
+		return os.getenv('BROWSER_USE_DOM_HASH', 'sha256').lower()
+
 	# Runtime hints
 	@property
 	def IN_DOCKER(self) -> bool:
@@ -209,6 +246,14 @@ class FlatEnvConfig(BaseSettings):
 	AZURE_OPENAI_KEY: str = Field(default='')
 	SKIP_LLM_API_KEY_VERIFICATION: bool = Field(default=False)
 	DEFAULT_LLM: str = Field(default='')
+	BROWSER_USE_LLM_MAX_CONNECTIONS: int = Field(default=1000)
+	BROWSER_USE_LLM_MAX_KEEPALIVE_CONNECTIONS: int = Field(default=100)
+	BROWSER_USE_LLM_HTTP2: bool = Field(default=True)
+	BROWSER_USE_IMAGE_EXECUTOR: str = Field(default='thread')
+	BROWSER_USE_IMAGE_EXECUTOR_WORKERS: int = Field(default=0)
+	BROWSER_USE_BROWSER_POOL_SIZE: int = Field(default=0)
+	BROWSER_USE_MCP_MAX_BROWSERS: int = Field(default=4)
+	BROWSER_USE_DOM_HASH: str = Field(default='sha256')
 
 	# Runtime hints
 	IN_DOCKER: bool | None = Field(default=None)
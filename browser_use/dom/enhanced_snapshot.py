@@ -1,15 +1,18 @@
 """
 Enhanced snapshot processing for browser-use DOM tree extraction.
 
-This module provides stateless functions for parsing Chrome DevTools Protocol (CDP) DOMSnapshot data
-to extract visibility, clickability, cursor styles, and other layout information.
+This module parses Chrome DevTools Protocol (CDP) DOMSnapshot data to extract visibility, clickability,
+cursor styles, and other layout information.
 """
 
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, Mapping
+
 from cdp_use.cdp.domsnapshot.commands import CaptureSnapshotReturns
 from cdp_use.cdp.domsnapshot.types import (
 	LayoutTreeSnapshot,
 	NodeTreeSnapshot,
-	RareBooleanData,
 )
 
 from browser_use.dom.views import DOMRect, EnhancedSnapshotNode
@@ -30,11 +33,6 @@ REQUIRED_COMPUTED_STYLES = [
 ]
 
 
-def _parse_rare_boolean_data(rare_data: RareBooleanData, index: int) -> bool | None:
-	"""Parse rare boolean data from snapshot - returns True if index is in the rare data."""
-	return index in rare_data['index']
-
-
 def _parse_computed_styles(strings: list[str], style_indices: list[int]) -> dict[str, str]:
 	"""Parse computed styles from layout tree using string indices."""
 	styles = {}
@@ -44,118 +42,148 @@ def _parse_computed_styles(strings: list[str], style_indices: list[int]) -> dict
 	return styles
 
 
-def build_snapshot_lookup(
-	snapshot: CaptureSnapshotReturns,
-	device_pixel_ratio: float = 1.0,
-) -> dict[int, EnhancedSnapshotNode]:
-	"""Build a lookup table of backend node ID to enhanced snapshot data with everything calculated upfront."""
-	snapshot_lookup: dict[int, EnhancedSnapshotNode] = {}
-
-	if not snapshot['documents']:
-		return snapshot_lookup
+def _rect(data: list[float] | None, scale: float = 1.0) -> DOMRect | None:
+	if not data or len(data) < 4:
+		return None
+	return DOMRect(x=data[0] / scale, y=data[1] / scale, width=data[2] / scale, height=data[3] / scale)
 
-	strings = snapshot['strings']
 
-	for document in snapshot['documents']:
-		nodes: NodeTreeSnapshot = document['nodes']
-		layout: LayoutTreeSnapshot = document['layout']
+class _DocumentColumns:
+	"""Columnar layout data of one snapshot document, referencing the CDP arrays without copying them."""
 
-		# Build backend node id to snapshot index lookup
-		backend_node_to_snapshot_index = {}
-		if 'backendNodeId' in nodes:
-			for i, backend_node_id in enumerate(nodes['backendNodeId']):
-				backend_node_to_snapshot_index[backend_node_id] = i
+	__slots__ = ('layout', 'node_to_layout', 'clickable', 'has_clickable')
 
-		# PERFORMANCE: Pre-build layout index map to eliminate O(n²) double lookups
-		# Preserve original behavior: use FIRST occurrence for duplicates
-		layout_index_map = {}
+	def __init__(self, nodes: NodeTreeSnapshot, layout: LayoutTreeSnapshot | None, node_count: int):
+		self.layout: LayoutTreeSnapshot = layout or {}  # type: ignore[typeddict-item]
+		# snapshot node index -> FIRST layout index for that node, -1 if the node has no layout object
+		self.node_to_layout = array('i', [-1]) * node_count
 		if layout and 'nodeIndex' in layout:
-			for layout_idx, node_index in enumerate(layout['nodeIndex']):
-				if node_index not in layout_index_map:  # Only store first occurrence
-					layout_index_map[node_index] = layout_idx
-
-		# Build snapshot lookup for each backend node id
-		for backend_node_id, snapshot_index in backend_node_to_snapshot_index.items():
-			is_clickable = None
-			if 'isClickable' in nodes:
-				is_clickable = _parse_rare_boolean_data(nodes['isClickable'], snapshot_index)
-
-			# Find corresponding layout node
-			cursor_style = None
-			is_visible = None
-			bounding_box = None
-			computed_styles = {}
-
-			# Look for layout tree node that corresponds to this snapshot node
-			paint_order = None
-			client_rects = None
-			scroll_rects = None
-			stacking_contexts = None
-			if snapshot_index in layout_index_map:
-				layout_idx = layout_index_map[snapshot_index]
-				if layout_idx < len(layout.get('bounds', [])):
-					# Parse bounding box
-					bounds = layout['bounds'][layout_idx]
-					if len(bounds) >= 4:
-						# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels
-						# by dividing by the device pixel ratio
-						raw_x, raw_y, raw_width, raw_height = bounds[0], bounds[1], bounds[2], bounds[3]
-
-						# Apply device pixel ratio scaling to convert device pixels to CSS pixels
-						bounding_box = DOMRect(
-							x=raw_x / device_pixel_ratio,
-							y=raw_y / device_pixel_ratio,
-							width=raw_width / device_pixel_ratio,
-							height=raw_height / device_pixel_ratio,
-						)
-
-					# Parse computed styles for this layout node
-					if layout_idx < len(layout.get('styles', [])):
-						style_indices = layout['styles'][layout_idx]
-						computed_styles = _parse_computed_styles(strings, style_indices)
-						cursor_style = computed_styles.get('cursor')
-
-					# Extract paint order if available
-					if layout_idx < len(layout.get('paintOrders', [])):
-						paint_order = layout.get('paintOrders', [])[layout_idx]
-
-					# Extract client rects if available
-					client_rects_data = layout.get('clientRects', [])
-					if layout_idx < len(client_rects_data):
-						client_rect_data = client_rects_data[layout_idx]
-						if client_rect_data and len(client_rect_data) >= 4:
-							client_rects = DOMRect(
-								x=client_rect_data[0],
-								y=client_rect_data[1],
-								width=client_rect_data[2],
-								height=client_rect_data[3],
-							)
-
-					# Extract scroll rects if available
-					scroll_rects_data = layout.get('scrollRects', [])
-					if layout_idx < len(scroll_rects_data):
-						scroll_rect_data = scroll_rects_data[layout_idx]
-						if scroll_rect_data and len(scroll_rect_data) >= 4:
-							scroll_rects = DOMRect(
-								x=scroll_rect_data[0],
-								y=scroll_rect_data[1],
-								width=scroll_rect_data[2],
-								height=scroll_rect_data[3],
-							)
-
-					# Extract stacking contexts if available
-					if layout_idx < len(layout.get('stackingContexts', [])):
-						stacking_contexts = layout.get('stackingContexts', {}).get('index', [])[layout_idx]
-
-			snapshot_lookup[backend_node_id] = EnhancedSnapshotNode(
-				is_clickable=is_clickable,
-				cursor_style=cursor_style,
-				bounds=bounding_box,
-				clientRects=client_rects,
-				scrollRects=scroll_rects,
-				computed_styles=computed_styles if computed_styles else None,
-				paint_order=paint_order,
-				stacking_contexts=stacking_contexts,
-			)
-
-	return snapshot_lookup
+			for layout_idx, node_index in reversed(list(enumerate(layout['nodeIndex']))):
+				if 0 <= node_index < node_count:
+					self.node_to_layout[node_index] = layout_idx
+		self.has_clickable = 'isClickable' in nodes
+		self.clickable = frozenset(nodes['isClickable']['index']) if self.has_clickable else frozenset()
+
+
+class SnapshotLookup(Mapping[int, EnhancedSnapshotNode]):
+	"""
+	Backend node id -> EnhancedSnapshotNode over a CDP DOMSnapshot, materialized lazily per node.
+
+	Building the lookup only indexes the snapshot arrays (typed arrays for the node -> layout mapping);
+	nodes are turned into EnhancedSnapshotNode objects on first access and cached, so nodes that are never
+	looked up are never built. Computed style dicts are shared between nodes with identical style indices
+	and must be treated as read-only.
+	"""
+
+	def __init__(self, snapshot: CaptureSnapshotReturns, device_pixel_ratio: float = 1.0):
+		self._strings = snapshot['strings']
+		self._device_pixel_ratio = device_pixel_ratio
+		self._documents: list[_DocumentColumns] = []
+		self._offsets: list[int] = []  # start of each document in the global snapshot index space
+		# backend node id -> global snapshot index (later documents / later nodes win for duplicates)
+		self._positions: dict[int, int] = {}
+		self._materialized: dict[int, EnhancedSnapshotNode] = {}
+		self._style_cache: dict[tuple[int, ...], dict[str, str]] = {}
+
+		offset = 0
+		for document in snapshot['documents']:
+			nodes: NodeTreeSnapshot = document['nodes']
+			backend_node_ids = nodes.get('backendNodeId', [])
+			self._documents.append(_DocumentColumns(nodes, document['layout'], len(backend_node_ids)))
+			self._offsets.append(offset)
+			self._positions.update(zip(backend_node_ids, range(offset, offset + len(backend_node_ids))))
+			offset += len(backend_node_ids)
+
+	def __getitem__(self, backend_node_id: int) -> EnhancedSnapshotNode:
+		node = self._materialized.get(backend_node_id)
+		if node is None:
+			position = self._positions[backend_node_id]
+			node = self._materialized[backend_node_id] = self._build_node(position)
+		return node
+
+	def get(self, backend_node_id: int, default: EnhancedSnapshotNode | None = None) -> EnhancedSnapshotNode | None:  # type: ignore[override]
+		if backend_node_id in self._materialized:
+			return self._materialized[backend_node_id]
+		if backend_node_id not in self._positions:
+			return default
+		return self[backend_node_id]
+
+	def __contains__(self, backend_node_id: object) -> bool:
+		return backend_node_id in self._positions
+
+	def __iter__(self) -> Iterator[int]:
+		return iter(self._positions)
+
+	def __len__(self) -> int:
+		return len(self._positions)
+
+	@property
+	def materialized_count(self) -> int:
+		return len(self._materialized)
+
+	def _styles(self, style_indices: list[int]) -> dict[str, str]:
+		key = tuple(style_indices)
+		styles = self._style_cache.get(key)
+		if styles is None:
+			styles = self._style_cache[key] = _parse_computed_styles(self._strings, style_indices)
+		return styles
+
+	def _build_node(self, position: int) -> EnhancedSnapshotNode:
+		doc_idx = bisect_right(self._offsets, position) - 1
+		columns = self._documents[doc_idx]
+		snapshot_index = position - self._offsets[doc_idx]
+
+		is_clickable = (snapshot_index in columns.clickable) if columns.has_clickable else None
+		cursor_style = None
+		bounding_box = None
+		computed_styles: dict[str, str] = {}
+		paint_order = None
+		client_rects = None
+		scroll_rects = None
+		stacking_contexts = None
+
+		layout = columns.layout
+		layout_idx = columns.node_to_layout[snapshot_index]
+		if layout_idx >= 0 and layout_idx < len(layout.get('bounds', [])):
+			# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels by dividing by the device pixel ratio
+			bounding_box = _rect(layout['bounds'][layout_idx], self._device_pixel_ratio)
+
+			styles = layout.get('styles', [])
+			if layout_idx < len(styles):
+				computed_styles = self._styles(styles[layout_idx])
+				cursor_style = computed_styles.get('cursor')
+
+			paint_orders = layout.get('paintOrders', [])
+			if layout_idx < len(paint_orders):
+				paint_order = paint_orders[layout_idx]
+
+			client_rects_data = layout.get('clientRects', [])
+			if layout_idx < len(client_rects_data):
+				client_rects = _rect(client_rects_data[layout_idx])
+
+			scroll_rects_data = layout.get('scrollRects', [])
+			if layout_idx < len(scroll_rects_data):
+				scroll_rects = _rect(scroll_rects_data[layout_idx])
+
+			# stackingContexts is RareBooleanData ({'index': [...]}), so this only ever applies to layout index 0
+			if layout_idx < len(layout.get('stackingContexts', [])):
+				stacking_contexts = layout.get('stackingContexts', {}).get('index', [])[layout_idx]
+
+		return EnhancedSnapshotNode(
+			is_clickable=is_clickable,
+			cursor_style=cursor_style,
+			bounds=bounding_box,
+			clientRects=client_rects,
+			scrollRects=scroll_rects,
+			computed_styles=computed_styles if computed_styles else None,
+			paint_order=paint_order,
+			stacking_contexts=stacking_contexts,
+		)
+
+
+def build_snapshot_lookup(
+	snapshot: CaptureSnapshotReturns,
+	device_pixel_ratio: float = 1.0,
+) -> SnapshotLookup:
+	"""Build a lazy lookup table of backend node ID to enhanced snapshot data."""
+	return SnapshotLookup(snapshot, device_pixel_ratio)
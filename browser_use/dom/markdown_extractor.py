@@ -6,15 +6,83 @@ used by both the tools service and page actor.
 """
 
 import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from browser_use.dom.serializer.html_serializer import HTMLSerializer
+from browser_use.dom.serializer.markdown_serializer import MarkdownSerializer
 from browser_use.dom.service import DomService
 
 if TYPE_CHECKING:
 	from browser_use.browser.session import BrowserSession
 	from browser_use.browser.watchdogs.dom_watchdog import DOMWatchdog
 
+# Max number of (page version, extract_links) markdown conversions kept by the markdown cache
+MARKDOWN_CACHE_MAX_SIZE = 16
+
+
+@dataclass
+class MarkdownCacheInfo:
+	hits: int
+	misses: int
+	size: int
+	max_size: int
+
+	@property
+	def hit_rate(self) -> float:
+		total = self.hits + self.misses
+		return self.hits / total if total else 0.0
+
+
+class MarkdownCache:
+	"""
+	LRU cache of clean markdown per page version.
+
+	The agent often calls extract several times on the same unchanged page (different queries, start_from_char
+	offsets), and serializing + converting a large page takes seconds, so the conversion is done once per version.
+	"""
+
+	def __init__(self, max_size: int = MARKDOWN_CACHE_MAX_SIZE):
+		self.max_size = max_size
+		self._entries: OrderedDict[tuple[Any, ...], tuple[str, dict[str, Any]]] = OrderedDict()
+		self._lock = threading.Lock()
+		self._hits = 0
+		self._misses = 0
+
+	def get(self, key: tuple[Any, ...]) -> tuple[str, dict[str, Any]] | None:
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				self._misses += 1
+				return None
+			self._entries.move_to_end(key)
+			self._hits += 1
+			return entry
+
+	def put(self, key: tuple[Any, ...], content: str, stats: dict[str, Any]) -> None:
+		with self._lock:
+			self._entries[key] = (content, stats)
+			self._entries.move_to_end(key)
+			while len(self._entries) > self.max_size:
+				self._entries.popitem(last=False)
+
+	def info(self) -> MarkdownCacheInfo:
+		"""Hit/miss counters and current size of the cache."""
+		with self._lock:
+			return MarkdownCacheInfo(hits=self._hits, misses=self._misses, size=len(self._entries), max_size=self.max_size)
+
+	def clear(self) -> None:
+		"""Drop all cached markdown and reset the counters."""
+		with self._lock:
+			self._entries.clear()
+			self._hits = 0
+			self._misses = 0
+
+
+# Shared by the tools service and the page actor
+markdown_cache = MarkdownCache()
+
 
 async def extract_clean_markdown(
 	browser_session: 'BrowserSession | None' = None,
@@ -33,8 +101,12 @@ async def extract_clean_markdown(
 	    target_id: Target ID for the page (required when using dom_service)
 	    extract_links: Whether to preserve links in markdown
 
+	On the browser session path the markdown is cached per page version (see MarkdownCache), keyed on the
+	DOMWatchdog DOM version, so an unchanged page is converted once. The DOM service path always rebuilds the
+	tree and is not cached.
+
 	Returns:
-	    tuple: (clean_markdown_content, content_statistics)
+	    tuple: (clean_markdown_content, content_statistics), the statistics include the markdown cache hit rate
 
 	Raises:
 	    ValueError: If neither browser_session nor (dom_service + target_id) are provided
@@ -47,41 +119,33 @@ async def extract_clean_markdown(
 		enhanced_dom_tree = await _get_enhanced_dom_tree_from_browser_session(browser_session)
 		current_url = await browser_session.get_current_page_url()
 		method = 'enhanced_dom_tree'
+		assert browser_session._dom_watchdog is not None
+		cache_key = (
+			browser_session.id,
+			browser_session.agent_focus_target_id,
+			browser_session._dom_watchdog.dom_version,
+			extract_links,
+		)
+		cached = markdown_cache.get(cache_key)
+		if cached is not None:
+			return _cached_markdown_result(cached, hit=True, current_url=current_url)
 	elif dom_service is not None and target_id is not None:
 		# DOM service path (page actor)
 		# Lazy fetch all_frames inside get_dom_tree if needed (for cross-origin iframes)
 		enhanced_dom_tree, _ = await dom_service.get_dom_tree(target_id=target_id, all_frames=None)
 		current_url = None  # Not available via DOM service
 		method = 'dom_service'
+		cache_key = None
 	else:
 		raise ValueError('Must provide either browser_session or both dom_service and target_id')
 
-	# Use the HTML serializer with the enhanced DOM tree
-	html_serializer = HTMLSerializer(extract_links=extract_links)
-	page_html = html_serializer.serialize(enhanced_dom_tree)
-
-	original_html_length = len(page_html)
-
-	# Use markdownify for clean markdown conversion
-	from markdownify import markdownify as md
-
-	content = md(
-		page_html,
-		heading_style='ATX',  # Use # style headings
-		strip=['script', 'style'],  # Remove these tags
-		bullets='-',  # Use - for unordered lists
-		code_language='',  # Don't add language to code blocks
-		escape_asterisks=False,  # Don't escape asterisks (cleaner output)
-		escape_underscores=False,  # Don't escape underscores (cleaner output)
-		escape_misc=False,  # Don't escape other characters (cleaner output)
-		autolinks=False,  # Don't convert URLs to <> format
-		default_title=False,  # Don't add default title attributes
-		keep_inline_images_in=[],  # Don't keep inline images in any tags (we already filter base64 in HTML)
-	)
+	# Convert the enhanced DOM tree straight to markdown (no HTML round-trip)
+	markdown_serializer = MarkdownSerializer(extract_links=extract_links)
+	content = markdown_serializer.serialize(enhanced_dom_tree)
 
 	initial_markdown_length = len(content)
 
-	# Minimal cleanup - markdownify already does most of the work
+	# Minimal cleanup - the converter already does most of the work
 	content = re.sub(r'%[0-9A-Fa-f]{2}', '', content)  # Remove any remaining URL encoding
 
 	# Apply light preprocessing to clean up excessive whitespace
@@ -92,12 +156,23 @@ async def extract_clean_markdown(
 	# Content statistics
 	stats = {
 		'method': method,
-		'original_html_chars': original_html_length,
 		'initial_markdown_chars': initial_markdown_length,
 		'filtered_chars_removed': chars_filtered,
 		'final_filtered_chars': final_filtered_length,
 	}
 
+	if cache_key is not None:
+		markdown_cache.put(cache_key, content, stats)
+	return _cached_markdown_result((content, stats), hit=False, current_url=current_url)
+
+
+def _cached_markdown_result(entry: tuple[str, dict[str, Any]], hit: bool, current_url: str | None) -> tuple[str, dict[str, Any]]:
+	"""Return a cache entry with a fresh copy of its statistics, which callers are free to extend."""
+	content, cached_stats = entry
+	stats = dict(cached_stats)
+	stats['markdown_cache_hit'] = hit
+	stats['markdown_cache_hit_rate'] = markdown_cache.info().hit_rate
+
 	# Add URL to stats if available
 	if current_url:
 		stats['url'] = current_url
@@ -127,6 +202,67 @@ async def _get_enhanced_dom_tree_from_browser_session(browser_session: 'BrowserS
 # Legacy aliases removed - all code now uses the unified extract_clean_markdown function
 
 
+def split_markdown_into_chunks(content: str, max_chunk_chars: int) -> list[str]:
+	"""
+	Split markdown into chunks of at most max_chunk_chars, breaking on structural boundaries.
+
+	Chunks break before headings where possible, then between lines; only a single line longer than
+	max_chunk_chars is cut mid-line. Apart from such cuts, joining the chunks with newlines gives back the content.
+
+	Args:
+	    content: Markdown content to split (as returned by extract_clean_markdown)
+	    max_chunk_chars: Maximum number of characters per chunk
+
+	Returns:
+	    list: Chunks in page order
+	"""
+	if not content:
+		return []
+	if len(content) <= max_chunk_chars:
+		return [content]
+
+	# Group lines into sections that each start at a heading
+	sections: list[str] = []
+	section_lines: list[str] = []
+	for line in content.split('\n'):
+		if line.startswith('#') and section_lines:
+			sections.append('\n'.join(section_lines))
+			section_lines = []
+		section_lines.append(line)
+	sections.append('\n'.join(section_lines))
+
+	chunks: list[str] = []
+	current = ''
+
+	def add(piece: str) -> None:
+		nonlocal current
+		if current and len(current) + 1 + len(piece) > max_chunk_chars:
+			chunks.append(current)
+			current = piece
+		else:
+			current = f'{current}\n{piece}' if current else piece
+
+	# Pack sections greedily into chunks; a section too big for one chunk starts a new chunk and is packed line by line,
+	# lines too big for one chunk are cut into fixed-size slices
+	for section in sections:
+		if len(section) <= max_chunk_chars:
+			add(section)
+			continue
+		if current:
+			chunks.append(current)
+			current = ''
+		for line in section.split('\n'):
+			if len(line) <= max_chunk_chars:
+				add(line)
+			else:
+				for i in range(0, len(line), max_chunk_chars):
+					add(line[i : i + max_chunk_chars])
+	if current:
+		chunks.append(current)
+
+	return chunks
+
+
 def _preprocess_markdown_content(content: str, max_newlines: int = 3) -> tuple[str, int]:
 	"""
 	Light preprocessing of markdown output - minimal cleanup with JSON blob removal.
@@ -0,0 +1,269 @@
+"""
+Keeps a `DOM.getDocument` tree live between steps by applying CDP DOM mutation events to it.
+
+Used by DomService in incremental mode: as long as every mutation since the last full fetch could be applied,
+the patched tree is reused instead of re-fetching `DOM.getDocument(depth=-1, pierce=True)` on the next step.
+Anything the tracker cannot apply exactly (navigation, shadow root changes, unknown node ids, partially pushed
+subtrees, node ids invalidated by another `DOM.getDocument` caller) makes it fall back to a full fetch.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from cdp_use import CDPClient
+from cdp_use.cdp.dom.commands import GetDocumentReturns
+from cdp_use.cdp.dom.events import (
+	AttributeModifiedEvent,
+	AttributeRemovedEvent,
+	CharacterDataModifiedEvent,
+	ChildNodeInsertedEvent,
+	ChildNodeRemovedEvent,
+	SetChildNodesEvent,
+)
+from cdp_use.cdp.dom.types import Node
+from cdp_use.cdp.target import SessionID, TargetID
+
+
+class DOMMutationTracker:
+	"""Live copy of the DOM tree of one CDP session, patched from mutation events."""
+
+	def __init__(self, cdp_client: CDPClient, target_id: TargetID, session_id: SessionID, logger: logging.Logger | None = None):
+		self.cdp_client = cdp_client
+		self.target_id = target_id
+		self.session_id = session_id
+		self.logger = logger or logging.getLogger(__name__)
+
+		self.document: GetDocumentReturns | None = None
+		self.invalidated_reason: str | None = 'not captured yet'
+		self.mutation_count = 0  # mutations applied since the last full fetch
+
+		self._nodes: dict[int, Node] = {}  # nodeId -> raw CDP node (inside self.document)
+		self._missing_children: set[int] = set()  # inserted nodes whose children were not pushed yet
+		self._attached = False
+		self._fetching = False
+		self._events_during_fetch = 0
+
+	# --- lifecycle ---------------------------------------------------------
+
+	def attach(self) -> None:
+		"""Register the DOM event handlers on the CDP client (one handler per method per client)."""
+		if self._attached:
+			return
+		register = self.cdp_client.register.DOM
+		register.childNodeInserted(self._on_child_node_inserted)
+		register.childNodeRemoved(self._on_child_node_removed)
+		register.setChildNodes(self._on_set_child_nodes)
+		register.attributeModified(self._on_attribute_modified)
+		register.attributeRemoved(self._on_attribute_removed)
+		register.characterDataModified(self._on_character_data_modified)
+		register.documentUpdated(lambda event, session_id: self._invalidate_from_event('DOM.documentUpdated', session_id))
+		register.childNodeCountUpdated(
+			lambda event, session_id: self._invalidate_from_event('DOM.childNodeCountUpdated', session_id)
+		)
+		register.shadowRootPushed(lambda event, session_id: self._invalidate_from_event('DOM.shadowRootPushed', session_id))
+		register.shadowRootPopped(lambda event, session_id: self._invalidate_from_event('DOM.shadowRootPopped', session_id))
+		self._attached = True
+
+	def detach(self) -> None:
+		"""Stop applying events and drop the cached tree (handlers become no-ops until replaced)."""
+		self._attached = False
+		self.invalidate('tracker detached')
+
+	def begin_fetch(self) -> None:
+		"""Called right before a full DOM.getDocument: events until reset() cannot be placed relative to it."""
+		self.invalidate('full fetch in progress')
+		self._fetching = True
+		self._events_during_fetch = 0
+
+	def reset(self, document: GetDocumentReturns) -> None:
+		"""Start tracking a freshly fetched DOM.getDocument result."""
+		self._fetching = False
+		if self._events_during_fetch:
+			# Some mutations may be missing from the fetched tree, so only trust it for this step
+			self.invalidate(f'{self._events_during_fetch} mutations during full fetch')
+			return
+		self.document = document
+		self._nodes = {}
+		self._missing_children = set()
+		self._index_subtree(document['root'], check_children=False)
+		self.invalidated_reason = None
+		self.mutation_count = 0
+
+	def invalidate(self, reason: str) -> None:
+		"""Drop the cached tree, the next step does a full DOM.getDocument."""
+		if self.invalidated_reason is None:
+			self.logger.debug(f'🔄 Incremental DOM: full rebuild required ({reason})')
+		self.invalidated_reason = reason
+		self.document = None
+		self._nodes = {}
+		self._missing_children = set()
+
+	@property
+	def is_live(self) -> bool:
+		return self.document is not None and self.invalidated_reason is None and not self._missing_children
+
+	async def get_live_document(self) -> GetDocumentReturns | None:
+		"""
+		Return the patched document if it can be reused, else None.
+
+		Other code paths may call DOM.getDocument on the same session, which rebinds every node id and silently
+		stops mutation events for our ids. A cheap DOM.describeNode on the cached root id detects that.
+		"""
+		if self.document is None or self.invalidated_reason is not None:
+			return None
+		try:
+			await self.cdp_client.send.DOM.describeNode(
+				params={'nodeId': self.document['root']['nodeId'], 'depth': 0}, session_id=self.session_id
+			)
+			# Inserted nodes arrive without their subtree; Chrome answers requestChildNodes with DOM.setChildNodes
+			# events, which are dispatched before the command response resolves
+			if self._missing_children:
+				await asyncio.gather(
+					*(
+						self.cdp_client.send.DOM.requestChildNodes(
+							params={'nodeId': node_id, 'depth': -1, 'pierce': True}, session_id=self.session_id
+						)
+						for node_id in list(self._missing_children)
+					)
+				)
+		except Exception as e:
+			self.invalidate(f'node ids were rebound ({type(e).__name__})')
+			return None
+		if self._missing_children:
+			self.invalidate(f'{len(self._missing_children)} inserted nodes without children')
+		return self.document if self.is_live else None
+
+	# --- tree bookkeeping ----------------------------------------------------
+
+	def _index_subtree(self, node: Node, check_children: bool = True) -> None:
+		"""Index node ids of a subtree; with check_children, remember nodes whose children were not pushed."""
+		stack = [node]
+		while stack:
+			current = stack.pop()
+			self._nodes[current['nodeId']] = current
+			if check_children and current.get('childNodeCount', 0) and 'children' not in current:
+				self._missing_children.add(current['nodeId'])
+			stack.extend(current.get('children', ()))
+			stack.extend(current.get('shadowRoots', ()))
+			if current.get('contentDocument'):
+				stack.append(current['contentDocument'])
+
+	def _unindex_subtree(self, node: Node) -> None:
+		stack = [node]
+		while stack:
+			current = stack.pop()
+			self._nodes.pop(current['nodeId'], None)
+			self._missing_children.discard(current['nodeId'])
+			stack.extend(current.get('children', ()))
+			stack.extend(current.get('shadowRoots', ()))
+			if current.get('contentDocument'):
+				stack.append(current['contentDocument'])
+
+	def _get_node(self, node_id: int, session_id: str | None) -> Node | None:
+		"""Look up a node for an event of our session, invalidating on ids we never saw."""
+		if not self._attached or session_id != self.session_id:
+			return None
+		if self._fetching:
+			self._events_during_fetch += 1
+			return None
+		if self.document is None:
+			return None
+		node = self._nodes.get(node_id)
+		if node is None:
+			self.invalidate(f'mutation on unknown node {node_id}')
+		return node
+
+	def _invalidate_from_event(self, method: str, session_id: str | None) -> None:
+		if self._attached and session_id == self.session_id:
+			if self._fetching:
+				self._events_during_fetch += 1
+			else:
+				self.invalidate(method)
+
+	# --- event handlers ------------------------------------------------------
+
+	def _on_child_node_inserted(self, event: ChildNodeInsertedEvent, session_id: str | None) -> None:
+		parent = self._get_node(event['parentNodeId'], session_id)
+		if parent is None:
+			return
+		children: list[Any] | None = parent.get('children')
+		if children is None:
+			if parent.get('childNodeCount', 0):
+				self.invalidate(f'insert into partially known node {event["parentNodeId"]}')
+				return
+			children = parent['children'] = []
+
+		inserted = event['node']
+		inserted['parentId'] = event['parentNodeId']
+		position = 0
+		if event['previousNodeId']:
+			position = next((i + 1 for i, child in enumerate(children) if child['nodeId'] == event['previousNodeId']), -1)
+			if position < 0:
+				self.invalidate(f'unknown previous sibling {event["previousNodeId"]}')
+				return
+		children.insert(position, inserted)
+		parent['childNodeCount'] = len(children)
+		self._index_subtree(inserted)
+		self.mutation_count += 1
+
+	def _on_child_node_removed(self, event: ChildNodeRemovedEvent, session_id: str | None) -> None:
+		parent = self._get_node(event['parentNodeId'], session_id)
+		if parent is None:
+			return
+		children = parent.get('children') or []
+		for i, child in enumerate(children):
+			if child['nodeId'] == event['nodeId']:
+				del children[i]
+				parent['childNodeCount'] = len(children)
+				self._unindex_subtree(child)
+				self.mutation_count += 1
+				return
+		# e.g. an iframe content document or shadow root, which live outside of `children`
+		self.invalidate(f'removed node {event["nodeId"]} is not a known child')
+
+	def _on_set_child_nodes(self, event: SetChildNodesEvent, session_id: str | None) -> None:
+		parent = self._get_node(event['parentId'], session_id)
+		if parent is None:
+			return
+		for child in parent.get('children', ()):
+			self._unindex_subtree(child)
+		for child in event['nodes']:
+			child['parentId'] = event['parentId']
+		parent['children'] = event['nodes']
+		parent['childNodeCount'] = len(event['nodes'])
+		self._missing_children.discard(event['parentId'])
+		for child in event['nodes']:
+			self._index_subtree(child)
+		self.mutation_count += 1
+
+	def _on_attribute_modified(self, event: AttributeModifiedEvent, session_id: str | None) -> None:
+		node = self._get_node(event['nodeId'], session_id)
+		if node is None:
+			return
+		attributes = node.setdefault('attributes', [])
+		for i in range(0, len(attributes), 2):
+			if attributes[i] == event['name']:
+				attributes[i + 1] = event['value']
+				break
+		else:
+			attributes.extend((event['name'], event['value']))
+		self.mutation_count += 1
+
+	def _on_attribute_removed(self, event: AttributeRemovedEvent, session_id: str | None) -> None:
+		node = self._get_node(event['nodeId'], session_id)
+		if node is None:
+			return
+		attributes = node.get('attributes') or []
+		for i in range(0, len(attributes), 2):
+			if attributes[i] == event['name']:
+				del attributes[i : i + 2]
+				break
+		self.mutation_count += 1
+
+	def _on_character_data_modified(self, event: CharacterDataModifiedEvent, session_id: str | None) -> None:
+		node = self._get_node(event['nodeId'], session_id)
+		if node is None:
+			return
+		node['nodeValue'] = event['characterData']
+		self.mutation_count += 1
@@ -37,7 +37,7 @@ class HTMLSerializer:
 		if node.node_type == NodeType.DOCUMENT_NODE:
 			# Process document root - serialize all children
 			parts = []
-			for child in node.children_and_shadow_roots:
+			for child in node.iter_children_and_shadow_roots():
 				child_html = self.serialize(child, depth)
 				if child_html:
 					parts.append(child_html)
@@ -0,0 +1,529 @@
+# @file purpose: Converts enhanced DOM trees directly to markdown, without an HTML round-trip
+
+import re
+
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
+
+# Elements dropped entirely, same as HTMLSerializer
+_SKIPPED_TAGS = frozenset({'style', 'script', 'head', 'meta', 'link', 'title'})
+
+# Elements HTMLSerializer writes as self-closing, their children are not serialized
+_VOID_TAGS = frozenset(
+	{'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'}
+)
+
+# Elements the HTML parser closes as soon as they are opened: whatever HTMLSerializer wrote inside them
+# ends up as their following siblings
+_PARSER_VOID_TAGS = _VOID_TAGS | {
+	'basefont',
+	'bgsound',
+	'command',
+	'frame',
+	'image',
+	'isindex',
+	'keygen',
+	'menuitem',
+	'nextid',
+	'spacer',
+}
+
+_BLOCK_TAGS = frozenset(
+	{
+		'p',
+		'blockquote',
+		'article',
+		'div',
+		'section',
+		'ol',
+		'ul',
+		'li',
+		'dl',
+		'dt',
+		'dd',
+		'table',
+		'thead',
+		'tbody',
+		'tfoot',
+		'tr',
+		'td',
+		'th',
+	}
+)
+
+_re_heading = re.compile(r'h(\d+)')
+_re_line_with_content = re.compile(r'^(.*)', flags=re.MULTILINE)
+_re_whitespace = re.compile(r'[\t ]+')
+_re_all_whitespace = re.compile(r'[\t \r\n]+')
+_re_newline_whitespace = re.compile(r'[\t \r\n]*[\r\n][\t \r\n]*')
+_re_pre_lstrip = re.compile(r'^[ \n]*\n')
+_re_pre_rstrip = re.compile(r'[ \n]*$')
+_re_extract_newlines = re.compile(r'^(\n*)((?:.*[^\n])?)(\n*)$', flags=re.DOTALL)
+_re_backtick_runs = re.compile(r'`+')
+
+
+class _Element:
+	"""An element as the HTML parser would see it after HTMLSerializer: shadow roots become <template> elements,
+	iframe documents are inlined, skipped elements are gone and adjacent text is merged into one string."""
+
+	__slots__ = ('name', 'node', 'parent', 'index', '_children', '_extract_links')
+
+	def __init__(self, name: str, node: EnhancedDOMTreeNode | None, parent: '_Element | None', extract_links: bool):
+		self.name = name
+		self.node = node
+		self.parent = parent
+		self.index = 0  # position in the parent's children
+		self._children: list['_Element | str'] | None = None
+		self._extract_links = extract_links
+
+	def get(self, key: str) -> str | None:
+		"""Attribute value, None if HTMLSerializer would not have written the attribute."""
+		if self.node is None or self.node.node_type != NodeType.ELEMENT_NODE or not self.node.attributes:
+			return None
+		if key.startswith('data-') or (key == 'href' and not self._extract_links):
+			return None
+		return self.node.attributes.get(key)
+
+	@property
+	def children(self) -> list['_Element | str']:
+		if self._children is None:
+			self._children = self._build_children()
+		return self._children
+
+	def _build_children(self) -> list['_Element | str']:
+		node = self.node
+		if node is None or self.name in _PARSER_VOID_TAGS:
+			return []
+		if node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
+			sources = node.children
+		elif node.node_type == NodeType.DOCUMENT_NODE:
+			sources = node.iter_children_and_shadow_roots()
+		elif self.name in {'iframe', 'frame'} and node.content_document:
+			sources = node.content_document.children
+		else:
+			sources = _shadow_roots_and_children(node)
+
+		children: list[_Element | str] = []
+		for source in sources:
+			self._append(children, source)
+		return children
+
+	def _append(self, children: list['_Element | str'], node: EnhancedDOMTreeNode) -> None:
+		if node.node_type == NodeType.TEXT_NODE:
+			if node.node_value:
+				if children and isinstance(children[-1], str):
+					children[-1] += node.node_value
+				else:
+					children.append(node.node_value)
+		elif node.node_type == NodeType.ELEMENT_NODE:
+			tag_name = node.tag_name
+			if _is_skipped(node, tag_name):
+				return
+			self._append_element(children, _Element(tag_name, node, self, self._extract_links))
+			if tag_name in _PARSER_VOID_TAGS and tag_name not in _VOID_TAGS:
+				# Serialized with children, but the parser closes the element right away
+				for child in self._content_children(node, tag_name):
+					self._append(children, child)
+		elif node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
+			self._append_element(children, _Element('template', node, self, self._extract_links))
+		elif node.node_type == NodeType.DOCUMENT_NODE:
+			for child in node.iter_children_and_shadow_roots():
+				self._append(children, child)
+
+	@staticmethod
+	def _append_element(children: list['_Element | str'], el: '_Element') -> None:
+		el.index = len(children)
+		children.append(el)
+
+	@staticmethod
+	def _content_children(node: EnhancedDOMTreeNode, tag_name: str) -> list[EnhancedDOMTreeNode]:
+		if tag_name in {'iframe', 'frame'} and node.content_document:
+			return node.content_document.children
+		return _shadow_roots_and_children(node)
+
+	def find_all(self, names: set[str]) -> list['_Element']:
+		"""Descendant elements with one of `names`, in document order."""
+		found: list[_Element] = []
+		stack: list[_Element | str] = list(reversed(self.children))
+		while stack:
+			child = stack.pop()
+			if isinstance(child, str):
+				continue
+			if child.name in names:
+				found.append(child)
+			stack.extend(reversed(child.children))
+		return found
+
+	def has_previous_element(self) -> bool:
+		"""Whether a sibling element precedes this one."""
+		if self.parent is None:
+			return False
+		siblings = self.parent.children
+		return any(isinstance(siblings[i], _Element) for i in range(self.index - 1, -1, -1))
+
+
+def _is_skipped(node: EnhancedDOMTreeNode, tag_name: str) -> bool:
+	"""Whether HTMLSerializer drops the element (and everything inside it)."""
+	if tag_name in _SKIPPED_TAGS:
+		return True
+
+	# Hidden code tags often contain JSON state for SPAs
+	if tag_name == 'code' and node.attributes:
+		style = node.attributes.get('style', '')
+		if 'display:none' in style.replace(' ', '') or 'display: none' in style:
+			return True
+		element_id = node.attributes.get('id', '')
+		if 'bpr-guid' in element_id or 'data' in element_id or 'state' in element_id:
+			return True
+
+	# Base64 inline images are usually placeholders or tracking pixels
+	if tag_name == 'img' and node.attributes:
+		if node.attributes.get('src', '').startswith('data:image/'):
+			return True
+
+	return False
+
+
+def _shadow_roots_and_children(node: EnhancedDOMTreeNode) -> list[EnhancedDOMTreeNode]:
+	"""Shadow roots then children, in HTMLSerializer order; the children list itself when there are no shadow roots."""
+	if node.shadow_roots:
+		return node.shadow_roots + node.children
+	return node.children
+
+
+def _remove_whitespace_inside(el: '_Element | str | None') -> bool:
+	"""Whitespace immediately inside a block-level element is dropped."""
+	if not isinstance(el, _Element):
+		return False
+	return el.name in _BLOCK_TAGS or _re_heading.match(el.name) is not None
+
+
+def _remove_whitespace_outside(el: '_Element | str | None') -> bool:
+	"""Whitespace immediately outside a block-level element is dropped."""
+	return _remove_whitespace_inside(el) or (isinstance(el, _Element) and el.name == 'pre')
+
+
+def _chomp(text: str) -> tuple[str, str, str]:
+	"""Move a leading/trailing space of inline content outside of its markup (`<b> foo</b>` => ` **foo**`)."""
+	prefix = ' ' if text and text[0] == ' ' else ''
+	suffix = ' ' if text and text[-1] == ' ' else ''
+	return prefix, suffix, text.strip()
+
+
+def _colspan(cell: _Element) -> int:
+	colspan = cell.get('colspan')
+	if colspan is not None and colspan.isdigit():
+		return max(1, min(1000, int(colspan)))
+	return 1
+
+
+class MarkdownSerializer:
+	"""Serializes enhanced DOM trees to markdown in a single walk.
+
+	Produces the markdown that HTMLSerializer followed by markdownify (ATX headings, '-' bullets, no escaping,
+	no autolinks, inline images reduced to their alt text) produces for the same tree, without building and
+	re-parsing the page HTML. Shadow DOM content and iframe documents are included the same way.
+	"""
+
+	def __init__(self, extract_links: bool = False):
+		"""Initialize the markdown serializer.
+
+		Args:
+			extract_links: If True, links keep their URLs. If False, only the link text is kept.
+		"""
+		self.extract_links = extract_links
+
+	def serialize(self, node: EnhancedDOMTreeNode) -> str:
+		"""Serialize an enhanced DOM tree node and its descendants to markdown.
+
+		Args:
+			node: The enhanced DOM tree node to serialize (usually the document)
+
+		Returns:
+			Markdown string with leading and trailing newlines stripped
+		"""
+		document = _Element('[document]', None, None, self.extract_links)
+		document._children = []
+		document._append(document._children, node)
+		return self._process_element(document, frozenset()).strip('\n')
+
+	def _process_element(self, el: _Element, parent_tags: frozenset[str]) -> str:
+		should_remove_inside = _remove_whitespace_inside(el)
+		siblings = el.children
+
+		tags = {el.name}
+		if el.name in {'td', 'th'} or _re_heading.match(el.name) is not None:
+			tags.add('_inline')
+		if el.name in {'pre', 'code', 'kbd', 'samp'}:
+			tags.add('_noformat')
+		child_tags = parent_tags | tags
+
+		child_strings = []
+		last = len(siblings) - 1
+		for i, child in enumerate(siblings):
+			if isinstance(child, _Element):
+				child_string = self._process_element(child, child_tags)
+			else:
+				previous_sibling = siblings[i - 1] if i > 0 else None
+				next_sibling = siblings[i + 1] if i < last else None
+				if not child.strip():
+					# Whitespace-only text at the inner/outer boundary of a block element is ignored
+					if should_remove_inside and (previous_sibling is None or next_sibling is None):
+						continue
+					if _remove_whitespace_outside(previous_sibling) or _remove_whitespace_outside(next_sibling):
+						continue
+				child_string = self._process_text(child, el, previous_sibling, next_sibling, child_tags)
+			if child_string:
+				child_strings.append(child_string)
+
+		if el.name == 'pre' or 'pre' in parent_tags:
+			# Inside <pre> blocks, do not collapse newlines
+			text = ''.join(child_strings)
+		else:
+			# Collapse newlines at child element boundaries, keeping at most 2
+			parts = ['']
+			for child_string in child_strings:
+				match = _re_extract_newlines.match(child_string)
+				assert match is not None
+				leading_nl, content, trailing_nl = match.groups()
+				if parts[-1] and leading_nl:
+					previous_trailing_nl = parts.pop()
+					leading_nl = '\n' * min(2, max(len(previous_trailing_nl), len(leading_nl)))
+				parts.extend((leading_nl, content, trailing_nl))
+			text = ''.join(parts)
+
+		return self._convert(el, text, parent_tags)
+
+	def _process_text(
+		self,
+		text: str,
+		parent: _Element,
+		previous_sibling: '_Element | str | None',
+		next_sibling: '_Element | str | None',
+		parent_tags: frozenset[str],
+	) -> str:
+		# Normalize whitespace if we're not inside a preformatted element
+		if 'pre' not in parent_tags:
+			text = _re_newline_whitespace.sub('\n', text)
+			text = _re_whitespace.sub(' ', text)
+
+		# Remove leading/trailing whitespace at the start/end of a block or next to a block-level element
+		if _remove_whitespace_outside(previous_sibling) or (previous_sibling is None and _remove_whitespace_inside(parent)):
+			text = text.lstrip(' \t\r\n')
+		if _remove_whitespace_outside(next_sibling) or (next_sibling is None and _remove_whitespace_inside(parent)):
+			text = text.rstrip()
+
+		return text
+
+	def _convert(self, el: _Element, text: str, parent_tags: frozenset[str]) -> str:
+		"""Apply the conversion of the element itself to the markdown of its children."""
+		name = el.name
+		inline = '_inline' in parent_tags
+		noformat = '_noformat' in parent_tags
+
+		if name in {'b', 'strong', 'em', 'i', 'del', 's', 'sub', 'sup'}:
+			if noformat:
+				return text
+			prefix, suffix, text = _chomp(text)
+			if not text:
+				return ''
+			markup = {'b': '**', 'strong': '**', 'em': '*', 'i': '*', 'del': '~~', 's': '~~'}.get(name, '')
+			return f'{prefix}{markup}{text}{markup}{suffix}'
+
+		if name == 'a':
+			if noformat:
+				return text
+			prefix, suffix, text = _chomp(text)
+			if not text:
+				return ''
+			href = el.get('href')
+			title = el.get('title')
+			title_part = ' "%s"' % title.replace('"', r'\"') if title else ''
+			return f'{prefix}[{text}]({href}{title_part}){suffix}' if href else text
+
+		if name in {'div', 'article', 'section', 'dl'}:
+			if inline:
+				return ' ' + text.strip() + ' '
+			text = text.strip()
+			return f'\n\n{text}\n\n' if text else ''
+
+		if name == 'p':
+			if inline:
+				return ' ' + text.strip(' \t\r\n') + ' '
+			text = text.strip(' \t\r\n')
+			return f'\n\n{text}\n\n' if text else ''
+
+		heading = _re_heading.match(name)
+		if heading is not None:
+			if inline:
+				return text
+			hashes = '#' * max(1, min(6, int(heading.group(1))))
+			return f'\n\n{hashes} {_re_all_whitespace.sub(" ", text.strip())}\n\n'
+
+		if name in {'ul', 'ol', 'list'}:
+			before_paragraph = False
+			next_sibling = _next_block_content_sibling(el)
+			if next_sibling is not None and (not isinstance(next_sibling, _Element) or next_sibling.name not in {'ul', 'ol'}):
+				before_paragraph = True
+			if 'li' in parent_tags:
+				# Remove trailing newline if we're in a nested list
+				return '\n' + text.rstrip()
+			return '\n\n' + text + ('\n' if before_paragraph else '')
+
+		if name == 'li':
+			return self._convert_li(el, text)
+
+		if name in {'td', 'th'}:
+			return ' ' + text.strip().replace('\n', ' ') + ' |' * _colspan(el)
+
+		if name == 'tr':
+			return self._convert_tr(el, text)
+
+		if name == 'table':
+			return '\n\n' + text.strip() + '\n\n'
+
+		if name == 'caption':
+			return text.strip() + '\n\n'
+
+		if name == 'figcaption':
+			return '\n\n' + text.strip() + '\n\n'
+
+		if name == 'br':
+			if inline:
+				return text + ' ' if text else ' '
+			return '  \n' + text
+
+		if name == 'hr':
+			return '\n\n---\n\n'
+
+		if name == 'img':
+			alt = el.get('alt') or ''
+			if inline:
+				return alt
+			src = el.get('src') or ''
+			title = el.get('title') or ''
+			title_part = ' "%s"' % title.replace('"', r'\"') if title else ''
+			return f'![{alt}]({src}{title_part})'
+
+		if name in {'code', 'kbd', 'samp'}:
+			if noformat:
+				return text
+			prefix, suffix, text = _chomp(text)
+			if not text:
+				return ''
+			max_backticks = max((len(run) for run in _re_backtick_runs.findall(text)), default=0)
+			delimiter = '`' * (max_backticks + 1)
+			if max_backticks > 0:
+				text = f' {text} '
+			return f'{prefix}{delimiter}{text}{delimiter}{suffix}'
+
+		if name == 'pre':
+			if not text:
+				return ''
+			text = _re_pre_rstrip.sub('', _re_pre_lstrip.sub('', text))
+			return f'\n\n```\n{text}\n```\n\n'
+
+		if name == 'blockquote':
+			text = text.strip(' \t\r\n')
+			if inline:
+				return ' ' + text + ' '
+			if not text:
+				return '\n'
+			text = _re_line_with_content.sub(lambda m: '> ' + m.group(1) if m.group(1) else '>', text)
+			return '\n' + text + '\n\n'
+
+		if name == 'dt':
+			text = _re_all_whitespace.sub(' ', text.strip())
+			if inline:
+				return ' ' + text + ' '
+			if not text:
+				return '\n'
+			return f'\n\n{text}\n'
+
+		if name == 'dd':
+			text = text.strip()
+			if inline:
+				return ' ' + text + ' '
+			if not text:
+				return '\n'
+			text = _re_line_with_content.sub(lambda m: '    ' + m.group(1) if m.group(1) else '', text)
+			return ':' + text[1:] + '\n'
+
+		if name == 'q':
+			return '"' + text + '"'
+
+		if name == 'video':
+			return self._convert_video(el, text, inline)
+
+		return text
+
+	def _convert_li(self, el: _Element, text: str) -> str:
+		text = text.strip()
+		if not text:
+			return '\n'
+
+		parent = el.parent
+		if parent is not None and parent.name == 'ol':
+			start = parent.get('start')
+			first = int(start) if start and start.isnumeric() else 1
+			siblings = parent.children
+			position = sum(1 for sibling in siblings[: el.index] if isinstance(sibling, _Element) and sibling.name == 'li')
+			bullet = f'{first + position}. '
+		else:
+			bullet = '- '
+
+		# Indent content lines by the bullet width, then put the bullet in the first line's indent
+		indent = ' ' * len(bullet)
+		text = _re_line_with_content.sub(lambda m: indent + m.group(1) if m.group(1) else '', text)
+		return bullet + text[len(bullet) :] + '\n'
+
+	def _convert_tr(self, el: _Element, text: str) -> str:
+		parent = el.parent
+		assert parent is not None
+		cells = el.find_all({'td', 'th'})
+		is_first_row = not el.has_previous_element()
+		is_headrow = all(cell.name == 'th' for cell in cells) or (
+			parent.name == 'thead' and len(parent.find_all({'tr'})) == 1  # avoid multiple tr in thead
+		)
+		is_head_row_missing = (is_first_row and parent.name != 'tbody') or (
+			is_first_row and parent.name == 'tbody' and parent.parent is not None and not parent.parent.find_all({'thead'})
+		)
+		full_colspan = sum(_colspan(cell) for cell in cells)
+
+		overline = ''
+		underline = ''
+		if is_headrow and is_first_row:
+			underline = '| ' + ' | '.join(['---'] * full_colspan) + ' |\n'
+		elif is_head_row_missing or (
+			is_first_row and (parent.name == 'table' or (parent.name == 'tbody' and not parent.has_previous_element()))
+		):
+			# No header row: add an empty one so the table stays valid markdown
+			overline = '| ' + ' | '.join([''] * full_colspan) + ' |\n'
+			overline += '| ' + ' | '.join(['---'] * full_colspan) + ' |\n'
+		return overline + '|' + text + '\n' + underline
+
+	def _convert_video(self, el: _Element, text: str, inline: bool) -> str:
+		if inline:
+			return text
+		src = el.get('src') or ''
+		if not src:
+			sources = [source for source in el.find_all({'source'}) if source.get('src') is not None]
+			if sources:
+				src = sources[0].get('src') or ''
+		poster = el.get('poster') or ''
+		if src and poster:
+			return f'[![{text}]({poster})]({src})'
+		if src:
+			return f'[{text}]({src})'
+		if poster:
+			return f'![{text}]({poster})'
+		return text
+
+
+def _next_block_content_sibling(el: _Element) -> '_Element | str | None':
+	"""The next sibling that is an element or non-whitespace text."""
+	if el.parent is None:
+		return None
+	for sibling in el.parent.children[el.index + 1 :]:
+		if isinstance(sibling, _Element) or sibling.strip():
+			return sibling
+	return None
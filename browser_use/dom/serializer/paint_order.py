@@ -1,5 +1,8 @@
+import math
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import Literal
 
 from browser_use.dom.views import SimplifiedNode
 
@@ -127,14 +130,132 @@ class RectUnionPure:
 		self._rects.extend(pending)
 		return True
 
+	def add_many(self, rects: Iterable[Rect]) -> None:
+		"""Insert a batch of rectangles (one paint-order group)."""
+		for r in rects:
+			self.add(r)
+
+
+class RectUnionIndexed(RectUnionPure):
+	"""
+	Same disjoint-rectangle union as RectUnionPure, backed by a uniform grid index.
+
+	`contains`/`add` only split against the stored rectangles whose grid cells overlap the query,
+	visited in insertion order, so the covered area and every `contains` answer match the pure version
+	while pages with thousands of layers (dashboards, maps, card grids) no longer scan every rectangle.
+	"""
+
+	__slots__ = ('_cells', '_oversized')
+
+	CELL_SIZE = 256.0
+	# Rectangles spanning more cells than this are kept in a side list that every query checks
+	MAX_CELLS_PER_RECT = 1024
+
+	def __init__(self):
+		super().__init__()
+		self._cells: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+		self._oversized: list[int] = []
+
+	def _cell_range(self, r: Rect) -> tuple[range, range] | None:
+		"""Grid cells covered by r, or None if r is too large (or not finite) to index."""
+		if not all(math.isfinite(v) for v in (r.x1, r.y1, r.x2, r.y2)):
+			return None
+		size = self.CELL_SIZE
+		xs = range(math.floor(r.x1 / size), math.floor(r.x2 / size) + 1)
+		ys = range(math.floor(r.y1 / size), math.floor(r.y2 / size) + 1)
+		if len(xs) * len(ys) > self.MAX_CELLS_PER_RECT:
+			return None
+		return xs, ys
+
+	def _candidates(self, r: Rect) -> list[Rect]:
+		"""Stored rectangles that may intersect r, in insertion order."""
+		cells = self._cell_range(r)
+		if cells is None:
+			return self._rects
+		indices = set(self._oversized)
+		xs, ys = cells
+		for cx in xs:
+			for cy in ys:
+				bucket = self._cells.get((cx, cy))
+				if bucket:
+					indices.update(bucket)
+		return [self._rects[i] for i in sorted(indices)]
+
+	def _index(self, r: Rect) -> None:
+		i = len(self._rects)
+		self._rects.append(r)
+		cells = self._cell_range(r)
+		if cells is None:
+			self._oversized.append(i)
+			return
+		xs, ys = cells
+		for cx in xs:
+			for cy in ys:
+				self._cells[(cx, cy)].append(i)
+
+	def contains(self, r: Rect) -> bool:
+		stack = [r]
+		for s in self._candidates(r):
+			new_stack = []
+			for piece in stack:
+				if s.contains(piece):
+					continue
+				if piece.intersects(s):
+					new_stack.extend(self._split_diff(piece, s))
+				else:
+					new_stack.append(piece)
+			if not new_stack:
+				return True
+			stack = new_stack
+		return False
+
+	def add(self, r: Rect) -> bool:
+		candidates = self._candidates(r)
+		pending = [r]
+		for s in candidates:
+			new_pending = []
+			for piece in pending:
+				if s.contains(piece):
+					continue
+				if piece.intersects(s):
+					new_pending.extend(self._split_diff(piece, s))
+				else:
+					new_pending.append(piece)
+			pending = new_pending
+			if not pending:  # already covered
+				return False
+
+		for piece in pending:
+			self._index(piece)
+		return True
+
+	def add_many(self, rects: Iterable[Rect]) -> None:
+		"""
+		Insert a paint-order group at once.
+
+		Exact duplicates (nested wrappers with identical bounds) are dropped and larger rectangles go first,
+		so smaller ones in the same group are usually rejected by the early exit in `add`.
+		"""
+		for r in sorted(set(rects), key=lambda r: -r.area()):
+			self.add(r)
+
+
+PaintOrderUnionImpl = Literal['pure', 'indexed']
+
+RECT_UNION_IMPLEMENTATIONS: dict[PaintOrderUnionImpl, type[RectUnionPure]] = {
+	'pure': RectUnionPure,
+	'indexed': RectUnionIndexed,
+}
+
 
 class PaintOrderRemover:
 	"""
 	Calculates which elements should be removed based on the paint order parameter.
 	"""
 
-	def __init__(self, root: SimplifiedNode):
+	def __init__(self, root: SimplifiedNode, union_impl: PaintOrderUnionImpl = 'indexed'):
 		self.root = root
+		self.union_impl = union_impl
 
 	def calculate_paint_order(self) -> None:
 		all_simplified_nodes_with_paint_order: list[SimplifiedNode] = []
@@ -158,7 +279,7 @@ class PaintOrderRemover:
 			if node.original_node.snapshot_node and node.original_node.snapshot_node.paint_order is not None:
 				grouped_by_paint_order[node.original_node.snapshot_node.paint_order].append(node)
 
-		rect_union = RectUnionPure()
+		rect_union = RECT_UNION_IMPLEMENTATIONS[self.union_impl]()
 
 		for paint_order, nodes in sorted(grouped_by_paint_order.items(), key=lambda x: -x[0]):
 			rects_to_add = []
@@ -191,7 +312,6 @@ class PaintOrderRemover:
 
 				rects_to_add.append(rect)
 
-			for rect in rects_to_add:
-				rect_union.add(rect)
+			rect_union.add_many(rects_to_add)
 
 		return None
@@ -3,7 +3,7 @@
 from typing import Any
 
 from browser_use.dom.serializer.clickable_elements import ClickableElementDetector
-from browser_use.dom.serializer.paint_order import PaintOrderRemover
+from browser_use.dom.serializer.paint_order import PaintOrderRemover, PaintOrderUnionImpl
 from browser_use.dom.utils import cap_text_length
 from browser_use.dom.views import (
 	DOMRect,
@@ -63,12 +63,21 @@ class DOMTreeSerializer:
 		enable_bbox_filtering: bool = True,
 		containment_threshold: float | None = None,
 		paint_order_filtering: bool = True,
+		paint_order_union: PaintOrderUnionImpl = 'indexed',
 		session_id: str | None = None,
 	):
 		self.root_node = root_node
 		self._interactive_counter = 1
 		self._selector_map: DOMSelectorMap = {}
 		self._previous_cached_selector_map = previous_cached_state.selector_map if previous_cached_state else None
+		# Backend node IDs of the previous selector map, computed once for O(1) new-node checks
+		self._previous_backend_node_ids: frozenset[int] = (
+			frozenset(node.backend_node_id for node in self._previous_cached_selector_map.values())
+			if self._previous_cached_selector_map
+			else frozenset()
+		)
+		# id(SimplifiedNode) -> whether any descendant is interactive, filled bottom-up once per serialization
+		self._interactive_descendants: dict[int, bool] = {}
 		# Add timing tracking
 		self.timing_info: dict[str, float] = {}
 		# Cache for clickable element detection to avoid redundant calls
@@ -78,6 +87,7 @@ class DOMTreeSerializer:
 		self.containment_threshold = containment_threshold or self.DEFAULT_CONTAINMENT_THRESHOLD
 		# Paint order filtering configuration
 		self.paint_order_filtering = paint_order_filtering
+		self.paint_order_union: PaintOrderUnionImpl = paint_order_union
 		# Session ID for session-specific exclude attribute
 		self.session_id = session_id
 
@@ -107,6 +117,7 @@ class DOMTreeSerializer:
 		self._selector_map = {}
 		self._semantic_groups = []
 		self._clickable_cache = {}  # Clear cache for new serialization
+		self._interactive_descendants = {}
 
 		# Step 1: Create simplified tree (includes clickable element detection)
 		start_step1 = time.time()
@@ -117,7 +128,7 @@ class DOMTreeSerializer:
 		# Step 2: Remove elements based on paint order
 		start_step3 = time.time()
 		if self.paint_order_filtering and simplified_tree:
-			PaintOrderRemover(simplified_tree).calculate_paint_order()
+			PaintOrderRemover(simplified_tree, union_impl=self.paint_order_union).calculate_paint_order()
 		end_step3 = time.time()
 		self.timing_info['calculate_paint_order'] = end_step3 - start_step3
 
@@ -138,6 +149,9 @@ class DOMTreeSerializer:
 
 		# Step 4: Assign interactive indices to clickable elements
 		start_step4 = time.time()
+		if filtered_tree:
+			# Precompute interactive-descendant flags bottom-up so scrollable containers don't rescan their subtrees
+			self._compute_interactive_descendants(filtered_tree)
 		self._assign_interactive_indices_and_mark_new_nodes(filtered_tree)
 		end_step4 = time.time()
 		self.timing_info['assign_interactive_indices'] = end_step4 - start_step4
@@ -172,6 +186,8 @@ class DOMTreeSerializer:
 			return
 
 		# Add compound component information based on element type
+		if node._compound_children is None:
+			node._compound_children = []
 		element_type = node.tag_name
 		input_type = node.attributes.get('type', '') if node.attributes else ''
 
@@ -437,7 +453,7 @@ class DOMTreeSerializer:
 
 		if node.node_type == NodeType.DOCUMENT_NODE:
 			# for all cldren including shadow roots
-			for child in node.children_and_shadow_roots:
+			for child in node.iter_children_and_shadow_roots():
 				simplified_child = self._create_simplified_tree(child, depth + 1)
 				if simplified_child:
 					return simplified_child
@@ -447,7 +463,7 @@ class DOMTreeSerializer:
 		if node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
 			# ENHANCED shadow DOM processing - always include shadow content
 			simplified = SimplifiedNode(original_node=node, children=[])
-			for child in node.children_and_shadow_roots:
+			for child in node.iter_children_and_shadow_roots():
 				simplified_child = self._create_simplified_tree(child, depth + 1)
 				if simplified_child:
 					simplified.children.append(simplified_child)
@@ -491,10 +507,12 @@ class DOMTreeSerializer:
 
 			is_visible = node.is_visible
 			is_scrollable = node.is_actually_scrollable
-			has_shadow_content = bool(node.children_and_shadow_roots)
+			has_shadow_content = bool(node.children_nodes or node.shadow_roots)
 
 			# ENHANCED SHADOW DOM DETECTION: Include shadow hosts even if not visible
-			is_shadow_host = any(child.node_type == NodeType.DOCUMENT_FRAGMENT_NODE for child in node.children_and_shadow_roots)
+			is_shadow_host = any(
+				child.node_type == NodeType.DOCUMENT_FRAGMENT_NODE for child in node.iter_children_and_shadow_roots()
+			)
 
 			# Override visibility for elements with validation attributes
 			if not is_visible and node.attributes:
@@ -515,7 +533,7 @@ class DOMTreeSerializer:
 				simplified = SimplifiedNode(original_node=node, children=[], is_shadow_host=is_shadow_host)
 
 				# Process ALL children including shadow roots with enhanced logging
-				for child in node.children_and_shadow_roots:
+				for child in node.iter_children_and_shadow_roots():
 					simplified_child = self._create_simplified_tree(child, depth + 1)
 					if simplified_child:
 						simplified.children.append(simplified_child)
@@ -587,8 +605,25 @@ class DOMTreeSerializer:
 		for child in node.children:
 			self._collect_interactive_elements(child, elements)
 
+	def _compute_interactive_descendants(self, node: SimplifiedNode) -> bool:
+		"""Fill `_interactive_descendants` for the whole subtree in one post-order pass.
+
+		Returns True if the node itself or any of its descendants is interactive.
+		"""
+		has_interactive_desc = False
+		for child in node.children:
+			if self._compute_interactive_descendants(child):
+				has_interactive_desc = True
+
+		self._interactive_descendants[id(node)] = has_interactive_desc
+		return has_interactive_desc or self._is_interactive_cached(node.original_node)
+
 	def _has_interactive_descendants(self, node: SimplifiedNode) -> bool:
 		"""Check if a node has any interactive descendants (not including the node itself)."""
+		cached = self._interactive_descendants.get(id(node))
+		if cached is not None:
+			return cached
+
 		# Check children for interactivity
 		for child in node.children:
 			# Check if child itself is interactive
@@ -646,10 +681,9 @@ class DOMTreeSerializer:
 				# Mark compound components as new for visibility
 				if node.is_compound_component:
 					node.is_new = True
-				elif self._previous_cached_selector_map:
+				elif self._previous_backend_node_ids:
 					# Check if node is new for regular elements
-					previous_backend_node_ids = {node.backend_node_id for node in self._previous_cached_selector_map.values()}
-					if node.original_node.backend_node_id not in previous_backend_node_ids:
+					if node.original_node.backend_node_id not in self._previous_backend_node_ids:
 						node.is_new = True
 
 		# Process children
@@ -1,10 +1,12 @@
 import asyncio
 import logging
+import sys
 import time
 from typing import TYPE_CHECKING
 
 from cdp_use.cdp.accessibility.commands import GetFullAXTreeReturns
 from cdp_use.cdp.accessibility.types import AXNode
+from cdp_use.cdp.dom.commands import GetDocumentReturns
 from cdp_use.cdp.dom.types import Node
 from cdp_use.cdp.target import TargetID
 
@@ -12,6 +14,8 @@ from browser_use.dom.enhanced_snapshot import (
 	REQUIRED_COMPUTED_STYLES,
 	build_snapshot_lookup,
 )
+from browser_use.dom.mutation_tracker import DOMMutationTracker
+from browser_use.dom.serializer.paint_order import PaintOrderUnionImpl
 from browser_use.dom.serializer.serializer import DOMTreeSerializer
 from browser_use.dom.views import (
 	DOMRect,
@@ -26,7 +30,7 @@ from browser_use.observability import observe_debug
 from browser_use.utils import create_task_with_error_handling
 
 if TYPE_CHECKING:
-	from browser_use.browser.session import BrowserSession
+	from browser_use.browser.session import BrowserSession, CDPSession
 
 # Note: iframe limits are now configurable via BrowserProfile.max_iframes and BrowserProfile.max_iframe_depth
 
@@ -48,21 +52,30 @@ class DomService:
 		logger: logging.Logger | None = None,
 		cross_origin_iframes: bool = False,
 		paint_order_filtering: bool = True,
+		paint_order_union: PaintOrderUnionImpl = 'indexed',
 		max_iframes: int = 100,
 		max_iframe_depth: int = 5,
+		incremental_dom: bool = False,
 	):
 		self.browser_session = browser_session
 		self.logger = logger or browser_session.logger
 		self.cross_origin_iframes = cross_origin_iframes
 		self.paint_order_filtering = paint_order_filtering
+		self.paint_order_union: PaintOrderUnionImpl = paint_order_union
 		self.max_iframes = max_iframes
 		self.max_iframe_depth = max_iframe_depth
+		# Incremental mode: keep the focused target's DOM.getDocument tree live via CDP mutation events
+		self.incremental_dom = incremental_dom
+		self._mutation_tracker: DOMMutationTracker | None = None
 
 	async def __aenter__(self):
 		return self
 
 	async def __aexit__(self, exc_type, exc_value, traceback):
-		pass  # no need to cleanup anything, browser_session auto handles cleaning up session cache
+		# browser_session auto handles cleaning up session cache, only the mutation tracker needs to stop
+		if self._mutation_tracker:
+			self._mutation_tracker.detach()
+			self._mutation_tracker = None
 
 	def _build_enhanced_ax_node(self, ax_node: AXNode) -> EnhancedAXNode:
 		properties: list[EnhancedAXProperty] | None = None
@@ -245,6 +258,38 @@ class DomService:
 
 		return {'nodes': merged_nodes}
 
+	async def _get_dom_document(self, target_id: TargetID, cdp_session: 'CDPSession') -> GetDocumentReturns:
+		"""Full DOM.getDocument, or in incremental mode the tree from the previous step patched with mutation events."""
+		if not self.incremental_dom or target_id != self.browser_session.agent_focus_target_id:
+			return await cdp_session.cdp_client.send.DOM.getDocument(
+				params={'depth': -1, 'pierce': True}, session_id=cdp_session.session_id
+			)
+
+		tracker = self._mutation_tracker
+		if tracker is None or (tracker.target_id, tracker.session_id, tracker.cdp_client) != (
+			target_id,
+			cdp_session.session_id,
+			cdp_session.cdp_client,
+		):
+			if tracker:
+				tracker.detach()
+			tracker = self._mutation_tracker = DOMMutationTracker(
+				cdp_session.cdp_client, target_id, cdp_session.session_id, logger=self.logger
+			)
+			tracker.attach()
+
+		live_document = await tracker.get_live_document()
+		if live_document is not None:
+			self.logger.debug(f'♻️ Incremental DOM: reusing live DOM tree ({tracker.mutation_count} mutations applied)')
+			return live_document
+
+		tracker.begin_fetch()
+		document = await cdp_session.cdp_client.send.DOM.getDocument(
+			params={'depth': -1, 'pierce': True}, session_id=cdp_session.session_id
+		)
+		tracker.reset(document)
+		return document
+
 	async def _get_all_trees(self, target_id: TargetID) -> TargetAllTrees:
 		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
 
@@ -312,9 +357,7 @@ class DomService:
 			)
 
 		def create_dom_tree_request():
-			return cdp_session.cdp_client.send.DOM.getDocument(
-				params={'depth': -1, 'pierce': True}, session_id=cdp_session.session_id
-			)
+			return self._get_dom_document(target_id, cdp_session)
 
 		start_cdp_calls = time.time()
 
@@ -509,12 +552,12 @@ class DomService:
 			else:
 				enhanced_ax_node = None
 
-			# To make attributes more readable
+			# To make attributes more readable; tag names and attribute keys repeat across the page, so intern them
 			attributes: dict[str, str] | None = None
 			if 'attributes' in node and node['attributes']:
 				attributes = {}
 				for i in range(0, len(node['attributes']), 2):
-					attributes[node['attributes'][i]] = node['attributes'][i + 1]
+					attributes[sys.intern(node['attributes'][i])] = node['attributes'][i + 1]
 
 			shadow_root_type = None
 			if 'shadowRootType' in node and node['shadowRootType']:
@@ -545,7 +588,7 @@ class DomService:
 				node_id=node['nodeId'],
 				backend_node_id=node['backendNodeId'],
 				node_type=NodeType(node['nodeType']),
-				node_name=node['nodeName'],
+				node_name=sys.intern(node['nodeName']),
 				node_value=node['nodeValue'],
 				attributes=attributes or {},
 				is_scrollable=node.get('isScrollable', None),
@@ -785,7 +828,11 @@ class DomService:
 		start_serialize = time.time()
 
 		serialized_dom_state, serializer_timing = DOMTreeSerializer(
-			enhanced_dom_tree, previous_cached_state, paint_order_filtering=self.paint_order_filtering, session_id=session_id
+			enhanced_dom_tree,
+			previous_cached_state,
+			paint_order_filtering=self.paint_order_filtering,
+			paint_order_union=self.paint_order_union,
+			session_id=session_id,
 		).serialize_accessible_elements()
 		total_serialization_ms = (time.time() - start_serialize) * 1000
 
@@ -1,6 +1,9 @@
 import hashlib
-from dataclasses import asdict, dataclass, field
+import zlib
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
 from enum import Enum
+from itertools import chain
 from typing import Any
 
 from cdp_use.cdp.accessibility.commands import GetFullAXTreeReturns
@@ -11,6 +14,7 @@ from cdp_use.cdp.domsnapshot.commands import CaptureSnapshotReturns
 from cdp_use.cdp.target.types import SessionID, TargetID, TargetInfo
 from uuid_extensions import uuid7str
 
+from browser_use.config import CONFIG
 from browser_use.dom.utils import cap_text_length
 from browser_use.observability import observe_debug
 
@@ -132,6 +136,29 @@ STATIC_ATTRIBUTES = {
 }
 
 
+def _sha256_hash(data: str) -> int:
+	"""First 64 bits of the SHA-256 digest, the default: element hashes stay comparable with saved histories."""
+	return int.from_bytes(hashlib.sha256(data.encode()).digest()[:8], 'big')
+
+
+def _fast_hash(data: str) -> int:
+	"""CRC-32 and Adler-32 combined into 64 bits: several times cheaper than SHA-256, but not collision resistant."""
+	encoded = data.encode()
+	return (zlib.crc32(encoded) << 32) | zlib.adler32(encoded)
+
+
+# Hash functions for EnhancedDOMTreeNode element and branch hashes, selected with BROWSER_USE_DOM_HASH
+DOM_HASH_FUNCTIONS: dict[str, Callable[[str], int]] = {'sha256': _sha256_hash, 'fast': _fast_hash}
+
+
+def _get_dom_hash_function() -> Callable[[str], int]:
+	algorithm = CONFIG.BROWSER_USE_DOM_HASH
+	try:
+		return DOM_HASH_FUNCTIONS[algorithm]
+	except KeyError:
+		raise ValueError(f'Unknown BROWSER_USE_DOM_HASH {algorithm!r}, expected one of {list(DOM_HASH_FUNCTIONS)}') from None
+
+
 @dataclass
 class CurrentPageTargets:
 	page_session: TargetInfo
@@ -315,7 +342,7 @@ class EnhancedSnapshotNode:
 # 	element_index: int | None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False)
 class EnhancedDOMTreeNode:
 	"""
 	Enhanced DOM tree node that contains information from AX, DOM, and Snapshot trees. It's mostly based on the types on DOM node type with enhanced data from AX and Snapshot trees.
@@ -386,10 +413,23 @@ class EnhancedDOMTreeNode:
 
 	# endregion - Snapshot Node data
 
-	# Compound control child components information
-	_compound_children: list[dict[str, Any]] = field(default_factory=list)
+	# Compound control child components information (created on first use, most nodes have none)
+	_compound_children: list[dict[str, Any]] | None = None
 
-	uuid: str = field(default_factory=uuid7str)
+	_uuid: str | None = None
+
+	# Structural identifiers, memoized on first use: each is derived from the parent's value plus this node's segment
+	_xpath: str | None = None
+	_branch_path: str | None = None
+	_element_hash: int | None = None
+	_parent_branch_hash: int | None = None
+
+	@property
+	def uuid(self) -> str:
+		"""Unique id of this node object, generated on first access (most nodes never need one)."""
+		if self._uuid is None:
+			self._uuid = uuid7str()
+		return self._uuid
 
 	@property
 	def parent(self) -> 'EnhancedDOMTreeNode | None':
@@ -402,7 +442,7 @@ class EnhancedDOMTreeNode:
 	@property
 	def children_and_shadow_roots(self) -> list['EnhancedDOMTreeNode']:
 		"""
-		Returns all children nodes, including shadow roots
+		Returns all children nodes, including shadow roots, as a new list (prefer iter_children_and_shadow_roots() in loops)
 		"""
 		# IMPORTANT: Make a copy to avoid mutating the original children_nodes list!
 		children = list(self.children_nodes) if self.children_nodes else []
@@ -410,6 +450,18 @@ class EnhancedDOMTreeNode:
 			children.extend(self.shadow_roots)
 		return children
 
+	def iter_children_and_shadow_roots(self) -> Iterable['EnhancedDOMTreeNode']:
+		"""
+		Iterates all children nodes, then shadow roots, without copying them.
+
+		Most nodes have no shadow roots, so this is usually the children list itself: only iterate it, never mutate it.
+		"""
+		if not self.shadow_roots:
+			return self.children_nodes or ()
+		if not self.children_nodes:
+			return self.shadow_roots
+		return chain(self.children_nodes, self.shadow_roots)
+
 	@property
 	def tag_name(self) -> str:
 		return self.node_name.lower()
@@ -417,51 +469,61 @@ class EnhancedDOMTreeNode:
 	@property
 	def xpath(self) -> str:
 		"""Generate XPath for this DOM node, stopping at shadow boundaries or iframes."""
-		segments = []
-		current_element = self
-
-		while current_element and (
-			current_element.node_type == NodeType.ELEMENT_NODE or current_element.node_type == NodeType.DOCUMENT_FRAGMENT_NODE
-		):
-			# just pass through shadow roots
-			if current_element.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
-				current_element = current_element.parent_node
-				continue
-
-			# stop ONLY if we hit iframe
-			if current_element.parent_node and current_element.parent_node.node_name.lower() == 'iframe':
-				break
-
-			position = self._get_element_position(current_element)
-			tag_name = current_element.node_name.lower()
-			xpath_index = f'[{position}]' if position > 0 else ''
-			segments.insert(0, f'{tag_name}{xpath_index}')
-
-			current_element = current_element.parent_node
-
-		return '/'.join(segments)
-
-	def _get_element_position(self, element: 'EnhancedDOMTreeNode') -> int:
-		"""Get the position of an element among its siblings with the same tag name.
-		Returns 0 if it's the only element of its type, otherwise returns 1-based index."""
-		if not element.parent_node or not element.parent_node.children_nodes:
-			return 0
-
-		same_tag_siblings = [
-			child
-			for child in element.parent_node.children_nodes
-			if child.node_type == NodeType.ELEMENT_NODE and child.node_name.lower() == element.node_name.lower()
-		]
-
-		if len(same_tag_siblings) <= 1:
-			return 0  # No index needed if it's the only one
-
-		try:
-			# XPath is 1-indexed
-			position = same_tag_siblings.index(element) + 1
-			return position
-		except ValueError:
-			return 0
+		if self._xpath is None:
+			return self._fill_xpaths()
+		return self._xpath
+
+	def _fill_xpaths(self) -> str:
+		"""Memoize the xpaths of this node and of its ancestors that don't have one yet, from the top down."""
+		pending: list[EnhancedDOMTreeNode] = []
+		current: EnhancedDOMTreeNode | None = self
+		while current is not None and current._xpath is None:
+			pending.append(current)
+			current = current.parent_node
+
+		for node in reversed(pending):
+			if node._xpath is not None:
+				continue  # filled in together with a sibling
+			parent = node.parent_node
+			if node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
+				# just pass through shadow roots
+				node._xpath = parent._xpath if parent is not None else ''
+			elif node.node_type != NodeType.ELEMENT_NODE:
+				node._xpath = ''
+			elif parent is None:
+				node._xpath = node.tag_name
+			else:
+				parent._fill_child_xpaths()
+				if node._xpath is None:
+					# Not listed in its parent's children_nodes, so it has no position among them
+					node._xpath = parent._child_xpath(node.tag_name)
+
+		assert self._xpath is not None
+		return self._xpath
+
+	def _child_xpath(self, segment: str) -> str:
+		# stop ONLY if we hit iframe
+		if self.node_name.lower() == 'iframe':
+			return ''
+		return f'{self._xpath}/{segment}' if self._xpath else segment
+
+	def _fill_child_xpaths(self) -> None:
+		"""Memoize the xpaths of all element children, counting positions among same-tag siblings in one pass.
+		The position is omitted if it's the only element of its type, otherwise it's a 1-based index."""
+		elements = [child for child in self.children_nodes or () if child.node_type == NodeType.ELEMENT_NODE]
+		tag_counts: dict[str, int] = {}
+		for child in elements:
+			tag_counts[child.tag_name] = tag_counts.get(child.tag_name, 0) + 1
+
+		tag_positions: dict[str, int] = {}
+		for child in elements:
+			tag_name = child.tag_name
+			if tag_counts[tag_name] > 1:
+				# XPath is 1-indexed
+				position = tag_positions[tag_name] = tag_positions.get(tag_name, 0) + 1
+				child._xpath = self._child_xpath(f'{tag_name}[{position}]')
+			else:
+				child._xpath = self._child_xpath(tag_name)
 
 	def __json__(self) -> dict:
 		"""Serializes the node and its descendants to a dictionary, omitting parent references."""
@@ -762,44 +824,38 @@ class EnhancedDOMTreeNode:
 
 		TODO: migrate this to use only backendNodeId + current SessionId
 		"""
-
-		# Get parent branch path
-		parent_branch_path = self._get_parent_branch_path()
-		parent_branch_path_string = '/'.join(parent_branch_path)
-
-		attributes_string = ''.join(
-			f'{k}={v}' for k, v in sorted((k, v) for k, v in self.attributes.items() if k in STATIC_ATTRIBUTES)
-		)
-
-		# Combine both for final hash
-		combined_string = f'{parent_branch_path_string}|{attributes_string}'
-		element_hash = hashlib.sha256(combined_string.encode()).hexdigest()
-
-		# Convert to int for __hash__ return type - use first 16 chars and convert from hex to int
-		return int(element_hash[:16], 16)
+		if self._element_hash is None:
+			self._element_hash = _get_dom_hash_function()(f'{self._get_branch_path()}|{self._static_attributes_string()}')
+		return self._element_hash
 
 	def parent_branch_hash(self) -> int:
 		"""
 		Hash the element based on its parent branch path and attributes.
 		"""
-		parent_branch_path = self._get_parent_branch_path()
-		parent_branch_path_string = '/'.join(parent_branch_path)
-		element_hash = hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
-
-		return int(element_hash[:16], 16)
+		if self._parent_branch_hash is None:
+			self._parent_branch_hash = _get_dom_hash_function()(self._get_branch_path())
+		return self._parent_branch_hash
 
-	def _get_parent_branch_path(self) -> list[str]:
-		"""Get the parent branch path as a list of tag names from root to current element."""
-		parents: list['EnhancedDOMTreeNode'] = []
-		current_element: 'EnhancedDOMTreeNode | None' = self
+	def _static_attributes_string(self) -> str:
+		return ''.join(f'{k}={v}' for k, v in sorted((k, v) for k, v in self.attributes.items() if k in STATIC_ATTRIBUTES))
 
-		while current_element is not None:
-			if current_element.node_type == NodeType.ELEMENT_NODE:
-				parents.append(current_element)
-			current_element = current_element.parent_node
+	def _get_branch_path(self) -> str:
+		"""Get the parent branch path: the tag names of the elements from root to current node, joined with '/'.
 
-		parents.reverse()
-		return [parent.tag_name for parent in parents]
+		Memoized on this node and on its ancestors that don't have it yet, each extending its parent's path.
+		"""
+		pending: list[EnhancedDOMTreeNode] = []
+		current: EnhancedDOMTreeNode | None = self
+		while current is not None and current._branch_path is None:
+			pending.append(current)
+			current = current.parent_node
+
+		branch_path = current._branch_path if current is not None else ''
+		for node in reversed(pending):
+			if node.node_type == NodeType.ELEMENT_NODE:
+				branch_path = f'{branch_path}/{node.tag_name}' if branch_path else node.tag_name
+			node._branch_path = branch_path
+		return branch_path
 
 
 DOMSelectorMap = dict[int, EnhancedDOMTreeNode]
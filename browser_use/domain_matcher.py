@@ -0,0 +1,421 @@
+"""
+Compiled domain pattern matching for allowed/prohibited domains, sensitive data and action domain filters.
+
+Checking a URL against a list of patterns one by one (parsing each pattern and running fnmatch) costs O(patterns) per
+navigation, which adds up with allowlists of thousands of domains. The patterns are compiled once instead:
+
+- exact hosts go into a hash set,
+- `*.domain` patterns go into a suffix trie keyed on reversed host labels (`com` -> `example` -> ...), so a host is
+  looked up in O(labels),
+- the remaining globs are translated to precompiled regexes.
+
+Recent URL decisions are kept in a small LRU cache, since the same URLs are checked over and over (every navigation
+event of a page, every action of a step).
+
+Two pattern dialects exist and are preserved exactly:
+
+- `DomainPatternMatcher` implements `match_url_with_domain_pattern()` (sensitive data and action `domains` scoping):
+  patterns are case-insensitive and default to the https scheme.
+- `DomainPolicy` implements the allowed_domains / prohibited_domains rules of SecurityWatchdog.
+"""
+
+import fnmatch
+import functools
+import ipaddress
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Collection, Iterable
+from typing import Generic, TypeVar
+from urllib.parse import urlparse
+
+from browser_use.utils import is_new_tab_page
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Max number of recent URL decisions remembered by each compiled matcher / policy
+URL_DECISION_CACHE_SIZE = 1024
+
+# Max number of compiled pattern sets kept by get_domain_pattern_matcher() and get_domain_policy()
+COMPILED_MATCHER_CACHE_SIZE = 64
+
+# URLs that are always allowed by the security policy (internal browser targets)
+ALWAYS_ALLOWED_URLS = frozenset(('about:blank', 'chrome://new-tab-page/', 'chrome://new-tab-page', 'chrome://newtab/'))
+
+_GLOB_CHARS = ('*', '?', '[')
+
+# Track if we've shown the glob warning
+_GLOB_WARNING_SHOWN = False
+
+
+def is_root_domain(domain: str) -> bool:
+	"""Whether a domain is a simple root domain (exactly one dot, no wildcard or scheme), e.g. example.com."""
+	if '*' in domain or '://' in domain:
+		return False
+	return domain.count('.') == 1
+
+
+def get_domain_variants(host: str) -> tuple[str, str]:
+	"""Both variants of a host, with and without the www. prefix: (host, variant)."""
+	if host.startswith('www.'):
+		return (host, host[4:])
+	return (host, f'www.{host}')
+
+
+def is_ip_address(host: str) -> bool:
+	"""Whether a hostname is an IPv4 or IPv6 address."""
+	try:
+		ipaddress.ip_address(host)
+		return True
+	except ValueError:
+		return False
+
+
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+	"""Regex equivalent of fnmatch.fnmatch(name, pattern); match it against os.path.normcase(name)."""
+	return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+class _DecisionCache(Generic[T]):
+	"""Thread-safe LRU cache of url -> decision."""
+
+	def __init__(self, max_size: int = URL_DECISION_CACHE_SIZE):
+		self.max_size = max_size
+		self._entries: OrderedDict[str, T] = OrderedDict()
+		self._lock = threading.Lock()
+
+	def get(self, url: str) -> T | None:
+		with self._lock:
+			decision = self._entries.get(url)
+			if decision is not None:
+				self._entries.move_to_end(url)
+			return decision
+
+	def put(self, url: str, decision: T) -> None:
+		with self._lock:
+			self._entries[url] = decision
+			self._entries.move_to_end(url)
+			while len(self._entries) > self.max_size:
+				self._entries.popitem(last=False)
+
+
+class _SuffixTrie(Generic[T]):
+	"""Trie over reversed host labels: a domain added with a value matches itself and all of its subdomains."""
+
+	__slots__ = ('_root',)
+
+	def __init__(self):
+		# Each node is (children by label, values of the domains ending at this node)
+		self._root: tuple[dict[str, tuple], list[T]] = ({}, [])
+
+	def __bool__(self) -> bool:
+		return bool(self._root[0])
+
+	def add(self, domain: str, value: T) -> None:
+		node = self._root
+		for label in reversed(domain.split('.')):
+			node = node[0].setdefault(label, ({}, []))
+		node[1].append(value)
+
+	def lookup(self, host: str) -> list[T]:
+		"""Values of every added domain that host is equal to or a subdomain of."""
+		found: list[T] = []
+		node = self._root
+		for label in reversed(host.split('.')):
+			child = node[0].get(label)
+			if child is None:
+				break
+			node = child
+			found.extend(node[1])
+		return found
+
+
+class DomainPatternMatcher:
+	"""
+	Compiled form of match_url_with_domain_pattern() for a fixed collection of patterns.
+
+	`matching_patterns(url)` returns the patterns that match_url_with_domain_pattern(url, pattern) would accept, in one
+	lookup instead of one call per pattern. Use get_domain_pattern_matcher() to share compiled matchers.
+	"""
+
+	def __init__(self, patterns: Iterable[str], log_warnings: bool = False):
+		self.patterns = tuple(patterns)
+		# Each compiled entry is (original pattern, scheme it requires or None, scheme glob regex or None)
+		self._any_host: list[tuple[str, str | None, re.Pattern[str] | None]] = []
+		self._exact_hosts: dict[str, list[tuple[str, str | None, re.Pattern[str] | None]]] = {}
+		self._suffixes: _SuffixTrie[tuple[str, str | None, re.Pattern[str] | None]] = _SuffixTrie()
+		self._globs: list[tuple[re.Pattern[str], tuple[str, str | None, re.Pattern[str] | None]]] = []
+		self._decisions: _DecisionCache[frozenset[str]] = _DecisionCache()
+		for pattern in self.patterns:
+			self._compile(pattern, log_warnings)
+
+	def _compile(self, domain_pattern: str, log_warnings: bool) -> None:
+		pattern = domain_pattern.lower()
+		if '://' in pattern:
+			pattern_scheme, pattern_domain = pattern.split('://', 1)
+		else:
+			pattern_scheme, pattern_domain = 'https', pattern  # default to matching only https for security
+
+		# Ports are stripped from patterns since only the hostname of the URL is compared
+		if ':' in pattern_domain and not pattern_domain.startswith(':'):
+			pattern_domain = pattern_domain.split(':', 1)[0]
+
+		if any(char in pattern_scheme for char in _GLOB_CHARS):
+			entry = (domain_pattern, None, _compile_glob(pattern_scheme))
+		else:
+			entry = (domain_pattern, os.path.normcase(pattern_scheme), None)
+
+		if pattern_domain == '*':
+			self._any_host.append(entry)
+			return
+		self._exact_hosts.setdefault(pattern_domain, []).append(entry)
+		if '*' not in pattern_domain:
+			return
+
+		# Unsafe glob patterns only ever match their literal host
+		if pattern_domain.count('*.') > 1 or pattern_domain.count('.*') > 1:
+			if log_warnings:
+				logger.error(f'⛔️ Multiple wildcards in pattern=[{domain_pattern}] are not supported')
+			return
+		if pattern_domain.endswith('.*'):
+			if log_warnings:
+				logger.error(f'⛔️ Wildcard TLDs like in pattern=[{domain_pattern}] are not supported for security')
+			return
+		if '*' in pattern_domain.replace('*.', ''):
+			if log_warnings:
+				logger.error(f'⛔️ Only *.domain style patterns are supported, ignoring pattern=[{domain_pattern}]')
+			return
+
+		if pattern_domain.startswith('*.'):
+			parent_domain = pattern_domain[2:]
+			if not any(char in parent_domain for char in _GLOB_CHARS):
+				# *.example.com matches example.com and (a glob '*' spanning dots) any host ending in .example.com
+				self._suffixes.add(parent_domain, entry)
+				return
+			self._globs.append((_compile_glob(parent_domain), entry))
+		self._globs.append((_compile_glob(pattern_domain), entry))
+
+	def matching_patterns(self, url: str) -> frozenset[str]:
+		"""The patterns that match this URL."""
+		matched = self._decisions.get(url)
+		if matched is None:
+			matched = self._match(url)
+			self._decisions.put(url, matched)
+		return matched
+
+	def matches(self, url: str) -> bool:
+		"""Whether any of the patterns matches this URL."""
+		return bool(self.matching_patterns(url))
+
+	def _match(self, url: str) -> frozenset[str]:
+		if not self.patterns or is_new_tab_page(url):
+			return frozenset()
+		try:
+			parsed_url = urlparse(url)
+			scheme = parsed_url.scheme.lower() if parsed_url.scheme else ''
+			host = parsed_url.hostname.lower() if parsed_url.hostname else ''
+		except Exception as e:
+			logger.error(f'⛔️ Error matching URL {url} with domain patterns: {type(e).__name__}: {e}')
+			return frozenset()
+		if not scheme or not host:
+			return frozenset()
+
+		candidates = [*self._any_host, *self._exact_hosts.get(host, ()), *self._suffixes.lookup(host)]
+		if self._globs:
+			normalized_host = os.path.normcase(host)
+			candidates.extend(entry for regex, entry in self._globs if regex.match(normalized_host))
+		if not candidates:
+			return frozenset()
+
+		normalized_scheme = os.path.normcase(scheme)
+		return frozenset(
+			pattern
+			for pattern, required_scheme, scheme_regex in candidates
+			if (scheme_regex.match(normalized_scheme) if scheme_regex is not None else normalized_scheme == required_scheme)
+		)
+
+
+@functools.lru_cache(maxsize=COMPILED_MATCHER_CACHE_SIZE)
+def _get_domain_pattern_matcher(patterns: tuple[str, ...], log_warnings: bool) -> DomainPatternMatcher:
+	return DomainPatternMatcher(patterns, log_warnings=log_warnings)
+
+
+def get_domain_pattern_matcher(patterns: Iterable[str], log_warnings: bool = False) -> DomainPatternMatcher:
+	"""Shared compiled matcher for these patterns (see match_url_with_domain_pattern() for the pattern syntax)."""
+	return _get_domain_pattern_matcher(tuple(patterns), log_warnings)
+
+
+class _NavigationPatterns:
+	"""One allowed_domains / prohibited_domains collection compiled for SecurityWatchdog's matching rules."""
+
+	def __init__(self, domains: Collection[str]):
+		# Sets (large lists are converted to sets by BrowserProfile) match plain domains with or without www.,
+		# lists add the www. variant of root domains only
+		self.is_set = isinstance(domains, set)
+		self._exact_hosts: set[str] = set()
+		self._suffixes: _SuffixTrie[str] = _SuffixTrie()  # *.domain, http(s) only
+		self._url_prefixes: list[str] = []
+		host_globs: list[str] = []
+		url_globs: list[str] = []
+
+		for pattern in domains:
+			if '*' in pattern:
+				if pattern.startswith('*.'):
+					self._suffixes.add(pattern[2:], pattern)
+				elif pattern.endswith('/*'):
+					self._url_prefixes.append(pattern[:-1])  # e.g. brave://* matches any brave:// URL
+				elif '://' in pattern:
+					url_globs.append(pattern)
+				else:
+					host_globs.append(pattern)
+			elif '://' in pattern:
+				self._url_prefixes.append(pattern)
+			elif self.is_set:
+				self._exact_hosts.add(pattern)
+			else:
+				self._exact_hosts.add(pattern.lower())
+				if is_root_domain(pattern):
+					self._exact_hosts.add(f'www.{pattern.lower()}')
+
+		self.has_globs = any('*' in pattern for pattern in domains)
+		self._url_prefix_tuple = tuple(self._url_prefixes)
+		self._host_glob = self._combine_globs(host_globs)
+		self._url_glob = self._combine_globs(url_globs)
+
+	@staticmethod
+	def _combine_globs(patterns: list[str]) -> re.Pattern[str] | None:
+		if not patterns:
+			return None
+		return re.compile('|'.join(f'(?:{fnmatch.translate(os.path.normcase(pattern))})' for pattern in patterns))
+
+	def matches(self, url: str, host: str, scheme: str) -> bool:
+		if self.is_set:
+			host_variant, host_alt = get_domain_variants(host)
+			if host_variant in self._exact_hosts or host_alt in self._exact_hosts:
+				return True
+		elif host.lower() in self._exact_hosts:
+			return True
+		if self._suffixes and scheme in ('http', 'https') and self._suffixes.lookup(host):
+			return True
+		if self._url_prefix_tuple and url.startswith(self._url_prefix_tuple):
+			return True
+		if self._host_glob is not None and self._host_glob.match(os.path.normcase(host)):
+			return True
+		if self._url_glob is not None and self._url_glob.match(os.path.normcase(f'{scheme}://{host}')):
+			return True
+		return False
+
+
+class DomainPolicy:
+	"""
+	Compiled allowed_domains / prohibited_domains / block_ip_addresses policy of a browser profile.
+
+	When allowed_domains is set, prohibited_domains is ignored. Pattern syntax (matched case-sensitively against the
+	URL, except plain domains): `example.com` (plus www.example.com for root domains), `*.example.com` (example.com
+	and its subdomains, http/https only), `https://example.com` (URL prefix), `brave://*` (URL prefix) and other
+	globs (fnmatch against the host, or against scheme://host when the pattern has a scheme).
+	Use get_domain_policy() to share compiled policies.
+	"""
+
+	def __init__(
+		self,
+		allowed_domains: Collection[str] | None = None,
+		prohibited_domains: Collection[str] | None = None,
+		block_ip_addresses: bool = False,
+	):
+		self.allowed_domains = allowed_domains
+		self.prohibited_domains = prohibited_domains
+		self.block_ip_addresses = block_ip_addresses
+		self._allowed = _NavigationPatterns(allowed_domains) if allowed_domains else None
+		self._prohibited = _NavigationPatterns(prohibited_domains) if prohibited_domains and not allowed_domains else None
+		self._decisions: _DecisionCache[bool] = _DecisionCache()
+
+		active = self._allowed or self._prohibited
+		if active is not None and active.has_globs:
+			_log_glob_warning()
+
+	def is_url_allowed(self, url: str) -> bool:
+		"""Whether the policy allows visiting this URL."""
+		allowed = self._decisions.get(url)
+		if allowed is None:
+			allowed = self._is_url_allowed(url)
+			self._decisions.put(url, allowed)
+		return allowed
+
+	def _is_url_allowed(self, url: str) -> bool:
+		# Always allow internal browser targets (before any other checks)
+		if url in ALWAYS_ALLOWED_URLS:
+			return True
+
+		try:
+			parsed = urlparse(url)
+		except Exception:
+			return False  # invalid URL
+
+		# data: and blob: URLs don't have hostnames
+		if parsed.scheme in ('data', 'blob'):
+			return True
+
+		host = parsed.hostname
+		if not host:
+			return False
+
+		if self.block_ip_addresses and is_ip_address(host):
+			return False
+
+		if self._allowed is not None:
+			return self._allowed.matches(url, host, parsed.scheme)
+		if self._prohibited is not None:
+			return not self._prohibited.matches(url, host, parsed.scheme)
+		return True
+
+
+_domain_policies: OrderedDict[tuple[int, int, bool], DomainPolicy] = OrderedDict()
+_domain_policies_lock = threading.Lock()
+
+
+def get_domain_policy(
+	allowed_domains: Collection[str] | None,
+	prohibited_domains: Collection[str] | None,
+	block_ip_addresses: bool = False,
+) -> DomainPolicy:
+	"""
+	Shared compiled policy for these domain collections.
+
+	Policies are cached per collection object (BrowserProfile copies share their domain lists), so the collections
+	must not be modified in place once in use; assign a new list to change the policy.
+	"""
+	key = (id(allowed_domains), id(prohibited_domains), block_ip_addresses)
+	with _domain_policies_lock:
+		policy = _domain_policies.get(key)
+		if (
+			policy is not None
+			and policy.allowed_domains is allowed_domains
+			and policy.prohibited_domains is prohibited_domains
+			and len(policy.allowed_domains or ()) == len(allowed_domains or ())
+			and len(policy.prohibited_domains or ()) == len(prohibited_domains or ())
+		):
+			_domain_policies.move_to_end(key)
+			return policy
+
+	policy = DomainPolicy(allowed_domains, prohibited_domains, block_ip_addresses)
+	with _domain_policies_lock:
+		_domain_policies[key] = policy
+		_domain_policies.move_to_end(key)
+		while len(_domain_policies) > COMPILED_MATCHER_CACHE_SIZE:
+			_domain_policies.popitem(last=False)
+	return policy
+
+
+def _log_glob_warning() -> None:
+	global _GLOB_WARNING_SHOWN
+	if not _GLOB_WARNING_SHOWN:
+		_GLOB_WARNING_SHOWN = True
+		logger.warning(
+			'⚠️ Using glob patterns in allowed_domains. '
+			'Note: Patterns like "*.example.com" will match both subdomains AND the main domain.'
+		)
@@ -0,0 +1,121 @@
+"""
+Shared executor for CPU-bound image work (screenshot resizing, highlight overlays, GIF frames).
+
+PIL decoding, drawing and encoding hold the event loop for tens to hundreds of milliseconds per image. In a
+process running many agents that stalls every other agent's CDP traffic, so image work is submitted here and
+awaited instead. A thread pool is used by default (PIL releases the GIL for most heavy operations); set
+BROWSER_USE_IMAGE_EXECUTOR=process to use a process pool, in which case submitted functions and their
+arguments must be picklable (module-level functions, plain data).
+
+Queue depth and latency are tracked in `image_executor.stats`.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Literal, TypeVar
+
+from browser_use.config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Jobs waiting longer than this for a worker are logged, a sign that the pool is too small for the load
+SLOW_WAIT_WARNING_MS = 1000.0
+
+
+def _timed_call(fn: Callable[[], T]) -> tuple[float, float, T]:
+	"""Run `fn` in the worker and return (start wall time, run duration in seconds, result)."""
+	started_at = time.time()
+	start = time.perf_counter()
+	result = fn()
+	return started_at, time.perf_counter() - start, result
+
+
+@dataclass
+class ImageExecutorStats:
+	submitted: int = 0
+	completed: int = 0
+	failed: int = 0
+	queue_depth: int = 0  # jobs submitted and not finished yet (waiting for a worker or running)
+	max_queue_depth: int = 0
+	total_wait_ms: float = 0.0  # time from submission until a worker picked the job up
+	max_wait_ms: float = 0.0
+	total_run_ms: float = 0.0
+	max_run_ms: float = 0.0
+
+	@property
+	def avg_wait_ms(self) -> float:
+		return self.total_wait_ms / self.completed if self.completed else 0.0
+
+	@property
+	def avg_run_ms(self) -> float:
+		return self.total_run_ms / self.completed if self.completed else 0.0
+
+
+@dataclass
+class ImageExecutor:
+	"""Process-wide worker pool that image operations are awaited on, keeping the event loop responsive."""
+
+	kind: Literal['thread', 'process'] | None = None
+	max_workers: int | None = None
+
+	stats: ImageExecutorStats = field(default_factory=ImageExecutorStats)
+	_executor: Executor | None = None
+
+	def _get_executor(self) -> Executor:
+		if self._executor is None:
+			kind = self.kind or CONFIG.BROWSER_USE_IMAGE_EXECUTOR
+			max_workers = self.max_workers or CONFIG.BROWSER_USE_IMAGE_EXECUTOR_WORKERS or min(4, os.cpu_count() or 1)
+			if kind == 'process':
+				self._executor = ProcessPoolExecutor(max_workers=max_workers)
+			else:
+				self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='browser_use_image')
+			logger.debug(f'🖼️ Started image executor: {max_workers} {kind} workers')
+		return self._executor
+
+	async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+		"""Run `fn(*args, **kwargs)` on a worker and return its result."""
+		submitted_at = time.time()
+		self.stats.submitted += 1
+		self.stats.queue_depth += 1
+		self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queue_depth)
+		try:
+			started_at, run_seconds, result = await asyncio.get_running_loop().run_in_executor(
+				self._get_executor(), _timed_call, functools.partial(fn, *args, **kwargs)
+			)
+		except Exception:
+			self.stats.failed += 1
+			raise
+		finally:
+			self.stats.queue_depth -= 1
+
+		wait_ms = max(started_at - submitted_at, 0.0) * 1000
+		run_ms = run_seconds * 1000
+		self.stats.completed += 1
+		self.stats.total_wait_ms += wait_ms
+		self.stats.max_wait_ms = max(self.stats.max_wait_ms, wait_ms)
+		self.stats.total_run_ms += run_ms
+		self.stats.max_run_ms = max(self.stats.max_run_ms, run_ms)
+		if wait_ms > SLOW_WAIT_WARNING_MS:
+			logger.debug(
+				f'🖼️ {getattr(fn, "__name__", fn)} waited {wait_ms:.0f}ms for an image worker '
+				f'(queue depth {self.stats.queue_depth}), consider raising BROWSER_USE_IMAGE_EXECUTOR_WORKERS'
+			)
+		return result
+
+	def shutdown(self, wait: bool = True) -> None:
+		"""Stop the workers; the pool is recreated lazily on the next `run()`."""
+		if self._executor is not None:
+			self._executor.shutdown(wait=wait)
+			self._executor = None
+
+
+# Shared process-wide executor used by all image call sites
+image_executor = ImageExecutor()
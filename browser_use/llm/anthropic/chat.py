@@ -21,6 +21,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.client_pool import llm_client_pool
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.schema import SchemaOptimizer
@@ -68,7 +69,6 @@ class ChatAnthropic(BaseChatModel):
 			'max_retries': self.max_retries,
 			'default_headers': self.default_headers,
 			'default_query': self.default_query,
-			'http_client': self.http_client,
 		}
 
 		# Create client_params dict with non-None values and non-NotGiven values
@@ -100,13 +100,20 @@ class ChatAnthropic(BaseChatModel):
 
 	def get_client(self) -> AsyncAnthropic:
 		"""
-		Returns an AsyncAnthropic client.
+		Returns an AsyncAnthropic client from the shared LLM client pool.
 
 		Returns:
 			AsyncAnthropic: An instance of the AsyncAnthropic client.
 		"""
 		client_params = self._get_client_params()
-		return AsyncAnthropic(**client_params)
+		return llm_client_pool.get_client(
+			self.provider,
+			client_params,
+			lambda http_client: AsyncAnthropic(**client_params, http_client=http_client),
+			base_url=self.base_url,
+			credentials=(self.api_key, self.auth_token),
+			http_client=self.http_client,
+		)
 
 	@property
 	def name(self) -> str:
@@ -175,11 +182,10 @@ class ChatAnthropic(BaseChatModel):
 				# Use tool calling for structured output
 				# Create a tool that represents the output format
 				tool_name = output_format.__name__
-				schema = SchemaOptimizer.create_optimized_json_schema(output_format)
-
 				# Remove title from schema if present (Anthropic doesn't like it in parameters)
-				if 'title' in schema:
-					del schema['title']
+				schema = SchemaOptimizer.get_cached_schema(
+					output_format, dialect='anthropic', postprocess=SchemaOptimizer.strip_title
+				).schema
 
 				tool = ToolParam(
 					name=tool_name,
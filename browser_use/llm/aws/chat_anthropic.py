@@ -17,6 +17,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
 from browser_use.llm.aws.chat_bedrock import ChatAWSBedrock
+from browser_use.llm.client_pool import llm_client_pool
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
@@ -119,13 +120,19 @@ class ChatAnthropicBedrock(ChatAWSBedrock):
 
 	def get_client(self) -> AsyncAnthropicBedrock:
 		"""
-		Returns an AsyncAnthropicBedrock client.
+		Returns an AsyncAnthropicBedrock client from the shared LLM client pool.
 
 		Returns:
 			AsyncAnthropicBedrock: An instance of the AsyncAnthropicBedrock client.
 		"""
 		client_params = self._get_client_params()
-		return AsyncAnthropicBedrock(**client_params)
+		return llm_client_pool.get_client(
+			self.provider,
+			client_params,
+			lambda http_client: AsyncAnthropicBedrock(**client_params, http_client=http_client),
+			base_url=client_params.get('aws_region'),
+			credentials=(client_params.get('aws_access_key'), client_params.get('aws_session_token')),
+		)
 
 	@property
 	def name(self) -> str:
@@ -2,10 +2,10 @@ import os
 from dataclasses import dataclass
 from typing import Any
 
-import httpx
 from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
 from openai.types.shared import ChatModel
 
+from browser_use.llm.client_pool import llm_client_pool
 from browser_use.llm.openai.like import ChatOpenAILike
 
 
@@ -55,7 +55,6 @@ class ChatAzureOpenAI(ChatOpenAILike):
 			'base_url': self.base_url,
 			'azure_ad_token': self.azure_ad_token,
 			'azure_ad_token_provider': self.azure_ad_token_provider,
-			'http_client': self.http_client,
 		}
 		if self.default_headers is not None:
 			_client_params['default_headers'] = self.default_headers
@@ -70,6 +69,8 @@ class ChatAzureOpenAI(ChatOpenAILike):
 		"""
 		Returns an asynchronous OpenAI client.
 
+		An explicitly provided `client` is returned as-is, otherwise the client comes from the shared LLM client pool.
+
 		Returns:
 			AsyncAzureOpenAIClient: An instance of the asynchronous OpenAI client.
 		"""
@@ -78,14 +79,11 @@ class ChatAzureOpenAI(ChatOpenAILike):
 
 		_client_params: dict[str, Any] = self._get_client_params()
 
-		if self.http_client:
-			_client_params['http_client'] = self.http_client
-		else:
-			# Create a new async HTTP client with custom limits
-			_client_params['http_client'] = httpx.AsyncClient(
-				limits=httpx.Limits(max_connections=20, max_keepalive_connections=6)
-			)
-
-		self.client = AsyncAzureOpenAIClient(**_client_params)
-
-		return self.client
+		return llm_client_pool.get_client(
+			self.provider,
+			_client_params,
+			lambda http_client: AsyncAzureOpenAIClient(**_client_params, http_client=http_client),
+			base_url=self.azure_endpoint or self.base_url,
+			credentials=(self.api_key, self.azure_ad_token),
+			http_client=self.http_client,
+		)
@@ -13,6 +13,7 @@ import httpx
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.client_pool import llm_client_pool
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.views import ChatInvokeCompletion
 from browser_use.observability import observe
@@ -120,77 +121,78 @@ class ChatBrowserUse(BaseChatModel):
 		if output_format is not None:
 			payload['output_format'] = output_format.model_json_schema()
 
-		# Make API request
-		async with httpx.AsyncClient(timeout=self.timeout) as client:
+		# Make API request over a pooled keep-alive connection
+		client = llm_client_pool.get_http_client(self.provider, self.base_url, self.api_key)
+		try:
+			response = await client.post(
+				f'{self.base_url}/v1/chat/completions',
+				json=payload,
+				timeout=self.timeout,
+				headers={
+					'Authorization': f'Bearer {self.api_key}',
+					'Content-Type': 'application/json',
+				},
+			)
+			response.raise_for_status()
+			result = response.json()
+
+		except httpx.HTTPStatusError as e:
+			error_detail = ''
 			try:
-				response = await client.post(
-					f'{self.base_url}/v1/chat/completions',
-					json=payload,
-					headers={
-						'Authorization': f'Bearer {self.api_key}',
-						'Content-Type': 'application/json',
-					},
-				)
-				response.raise_for_status()
-				result = response.json()
-
-			except httpx.HTTPStatusError as e:
-				error_detail = ''
-				try:
-					error_data = e.response.json()
-					error_detail = error_data.get('detail', str(e))
-				except Exception:
-					error_detail = str(e)
-
-				error_msg = ''
-				if e.response.status_code == 401:
-					error_msg = f'Invalid API key. {error_detail}'
-				elif e.response.status_code == 402:
-					error_msg = f'Insufficient credits. {error_detail}'
-				else:
-					error_msg = f'API request failed: {error_detail}'
-
-				raise ValueError(error_msg)
-
-			except httpx.TimeoutException:
-				error_msg = f'Request timed out after {self.timeout}s'
-				raise ValueError(error_msg)
-
-			except Exception as e:
-				error_msg = f'Failed to connect to browser-use API: {e}'
-				raise ValueError(error_msg)
-
-			# Parse response - server returns structured data as dict
-			if output_format is not None:
-				# Server returns structured data as a dict, validate it
-				completion_data = result['completion']
-				logger.debug(
-					f'📥 Got structured data from service: {list(completion_data.keys()) if isinstance(completion_data, dict) else type(completion_data)}'
-				)
-
-				# Convert action dicts to ActionModel instances if needed
-				# llm-use returns dicts to avoid validation with empty ActionModel
-				if isinstance(completion_data, dict) and 'action' in completion_data:
-					actions = completion_data['action']
-					if actions and isinstance(actions[0], dict):
-						from typing import get_args
-
-						# Get ActionModel type from output_format
-						action_model_type = get_args(output_format.model_fields['action'].annotation)[0]
-
-						# Convert dicts to ActionModel instances
-						completion_data['action'] = [action_model_type.model_validate(action_dict) for action_dict in actions]
-
-				completion = output_format.model_validate(completion_data)
+				error_data = e.response.json()
+				error_detail = error_data.get('detail', str(e))
+			except Exception:
+				error_detail = str(e)
+
+			error_msg = ''
+			if e.response.status_code == 401:
+				error_msg = f'Invalid API key. {error_detail}'
+			elif e.response.status_code == 402:
+				error_msg = f'Insufficient credits. {error_detail}'
 			else:
-				completion = result['completion']
+				error_msg = f'API request failed: {error_detail}'
+
+			raise ValueError(error_msg)
+
+		except httpx.TimeoutException:
+			error_msg = f'Request timed out after {self.timeout}s'
+			raise ValueError(error_msg)
+
+		except Exception as e:
+			error_msg = f'Failed to connect to browser-use API: {e}'
+			raise ValueError(error_msg)
+
+		# Parse response - server returns structured data as dict
+		if output_format is not None:
+			# Server returns structured data as a dict, validate it
+			completion_data = result['completion']
+			logger.debug(
+				f'📥 Got structured data from service: {list(completion_data.keys()) if isinstance(completion_data, dict) else type(completion_data)}'
+			)
+
+			# Convert action dicts to ActionModel instances if needed
+			# llm-use returns dicts to avoid validation with empty ActionModel
+			if isinstance(completion_data, dict) and 'action' in completion_data:
+				actions = completion_data['action']
+				if actions and isinstance(actions[0], dict):
+					from typing import get_args
+
+					# Get ActionModel type from output_format
+					action_model_type = get_args(output_format.model_fields['action'].annotation)[0]
+
+					# Convert dicts to ActionModel instances
+					completion_data['action'] = [action_model_type.model_validate(action_dict) for action_dict in actions]
+
+			completion = output_format.model_validate(completion_data)
+		else:
+			completion = result['completion']
 
-			# Parse usage info
-			usage = None
-			if 'usage' in result:
-				from browser_use.llm.views import ChatInvokeUsage
+		# Parse usage info
+		usage = None
+		if 'usage' in result:
+			from browser_use.llm.views import ChatInvokeUsage
 
-				usage = ChatInvokeUsage(**result['usage'])
+			usage = ChatInvokeUsage(**result['usage'])
 
 		return ChatInvokeCompletion(
 			completion=completion,
@@ -17,6 +17,7 @@ from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.cerebras.serializer import CerebrasMessageSerializer
+from browser_use.llm.client_pool import llm_client_pool
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
@@ -47,11 +48,20 @@ class ChatCerebras(BaseChatModel):
 		return 'cerebras'
 
 	def _client(self) -> AsyncOpenAI:
-		return AsyncOpenAI(
-			api_key=self.api_key,
-			base_url=self.base_url,
-			timeout=self.timeout,
+		client_params: dict[str, Any] = {
+			'api_key': self.api_key,
+			'base_url': self.base_url,
+			'timeout': self.timeout,
 			**(self.client_params or {}),
+		}
+		http_client = client_params.pop('http_client', None)
+		return llm_client_pool.get_client(
+			self.provider,
+			client_params,
+			lambda pooled_http_client: AsyncOpenAI(**client_params, http_client=pooled_http_client),
+			base_url=self.base_url,
+			credentials=self.api_key,
+			http_client=http_client,
 		)
 
 	@property
@@ -0,0 +1,189 @@
+"""
+Shared, lifecycle-managed HTTP client pool for LLM providers.
+
+Provider SDK clients (AsyncOpenAI, AsyncAnthropic, AsyncGroq, ...) each own an httpx connection pool.
+Creating a new SDK client per request means a new TCP/TLS handshake and DNS lookup on every agent step,
+so providers fetch their clients from this pool instead. Clients are keyed by provider, base_url and a
+fingerprint of the credentials, and are bound to the event loop that created them.
+
+Agents hold a lease on the pool for their lifetime (see `Agent.close()`); once the last lease is released
+all pooled clients are closed and will be recreated lazily on next use.
+
+Each pooled httpx client is shared by every agent in the process that talks to the same provider and base_url,
+so its connection limits cap the number of concurrent requests they can make together. The defaults match the
+limits the OpenAI/Anthropic SDKs use for their own clients (1000 connections, 100 kept alive); tune them with
+BROWSER_USE_LLM_MAX_CONNECTIONS and BROWSER_USE_LLM_MAX_KEEPALIVE_CONNECTIONS.
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import httpx
+
+from browser_use.config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def _fingerprint(*parts: Any) -> str:
+	"""Stable, non-reversible fingerprint of client parameters (credentials never appear in pool keys)."""
+	return hashlib.sha256(repr(parts).encode()).hexdigest()[:16]
+
+
+def _current_loop() -> asyncio.AbstractEventLoop | None:
+	try:
+		return asyncio.get_running_loop()
+	except RuntimeError:
+		return None
+
+
+@dataclass
+class _PooledHttpClient:
+	client: httpx.AsyncClient
+	loop: asyncio.AbstractEventLoop | None
+
+
+@dataclass
+class LLMClientPoolStats:
+	http_clients_created: int = 0
+	http_client_hits: int = 0
+	sdk_clients_created: int = 0
+	sdk_client_hits: int = 0
+	closes: int = 0
+
+
+@dataclass
+class LLMClientPool:
+	"""Process-wide pool of keep-alive httpx clients and provider SDK clients built on top of them."""
+
+	max_connections: int | None = None
+	max_keepalive_connections: int | None = None
+	keepalive_expiry: float = 30.0
+	http2: bool | None = None
+
+	stats: LLMClientPoolStats = field(default_factory=LLMClientPoolStats)
+	_http_clients: dict[tuple, _PooledHttpClient] = field(default_factory=dict)
+	_sdk_clients: dict[tuple, tuple[Any, httpx.AsyncClient]] = field(default_factory=dict)
+	_leases: int = 0
+
+	def _limits(self) -> httpx.Limits:
+		return httpx.Limits(
+			max_connections=self.max_connections if self.max_connections is not None else CONFIG.BROWSER_USE_LLM_MAX_CONNECTIONS,
+			max_keepalive_connections=self.max_keepalive_connections
+			if self.max_keepalive_connections is not None
+			else CONFIG.BROWSER_USE_LLM_MAX_KEEPALIVE_CONNECTIONS,
+			keepalive_expiry=self.keepalive_expiry,
+		)
+
+	def _use_http2(self) -> bool:
+		wanted = self.http2 if self.http2 is not None else CONFIG.BROWSER_USE_LLM_HTTP2
+		# httpx only supports HTTP/2 when the optional `h2` package is installed
+		return wanted and importlib.util.find_spec('h2') is not None
+
+	def _prune_closed_loops(self) -> None:
+		"""Drop clients whose event loop has been closed (e.g. after repeated asyncio.run() calls)."""
+		stale = [key for key, entry in self._http_clients.items() if entry.loop is not None and entry.loop.is_closed()]
+		for key in stale:
+			del self._http_clients[key]
+		if stale:
+			# Their connections belong to the closed loop and can no longer be closed gracefully
+			logger.debug(f'Dropped {len(stale)} pooled LLM HTTP client(s) bound to a closed event loop without closing them')
+			stale_loops = {key[-1] for key in stale}
+			for key in [k for k in self._sdk_clients if k[-1] in stale_loops]:
+				del self._sdk_clients[key]
+
+	def get_http_client(
+		self, provider: str, base_url: str | httpx.URL | None = None, credentials: Any = None
+	) -> httpx.AsyncClient:
+		"""Return a shared keep-alive httpx client for (provider, base_url, credentials) on the running event loop."""
+		self._prune_closed_loops()
+		loop = _current_loop()
+		key = (provider, str(base_url or ''), _fingerprint(credentials), id(loop))
+
+		entry = self._http_clients.get(key)
+		if entry is not None and not entry.client.is_closed:
+			self.stats.http_client_hits += 1
+			return entry.client
+
+		# follow_redirects matches the default clients the provider SDKs create for themselves
+		client = httpx.AsyncClient(limits=self._limits(), http2=self._use_http2(), follow_redirects=True)
+		self._http_clients[key] = _PooledHttpClient(client=client, loop=loop)
+		self.stats.http_clients_created += 1
+		logger.debug(f'🔌 Created pooled HTTP client for {provider} ({base_url or "default endpoint"})')
+		return client
+
+	def get_client(
+		self,
+		provider: str,
+		client_params: dict[str, Any],
+		factory: Callable[[httpx.AsyncClient], T],
+		*,
+		base_url: str | httpx.URL | None = None,
+		credentials: Any = None,
+		http_client: httpx.AsyncClient | None = None,
+	) -> T:
+		"""
+		Return a cached provider SDK client for these exact client params, creating it with `factory` on a miss.
+
+		`factory` receives the pooled httpx client to pass to the SDK, or the caller-provided `http_client`
+		if one was given (caller-provided clients are never closed by the pool).
+		"""
+		self._prune_closed_loops()
+		loop_id = id(_current_loop())
+		key = (provider, _fingerprint(sorted(client_params.items(), key=lambda kv: kv[0])), id(http_client), loop_id)
+
+		cached = self._sdk_clients.get(key)
+		if cached is not None and not cached[1].is_closed:
+			self.stats.sdk_client_hits += 1
+			return cached[0]
+
+		transport = http_client if http_client is not None else self.get_http_client(provider, base_url, credentials)
+		sdk_client = factory(transport)
+		self._sdk_clients[key] = (sdk_client, transport)
+		self.stats.sdk_clients_created += 1
+		return sdk_client
+
+	def acquire(self) -> None:
+		"""Register a long-lived user of the pool (e.g. an Agent). Pair with `release()`."""
+		self._leases += 1
+
+	async def release(self) -> None:
+		"""Release a lease; closes all pooled clients once no users remain."""
+		self._leases = max(0, self._leases - 1)
+		if self._leases == 0:
+			await self.aclose()
+
+	async def aclose(self) -> None:
+		"""Close every pooled httpx client. SDK clients built on them are dropped and recreated on next use."""
+		entries = list(self._http_clients.values())
+		self._http_clients.clear()
+		self._sdk_clients.clear()
+
+		current_loop = _current_loop()
+		for entry in entries:
+			if entry.client.is_closed:
+				continue
+			# Clients bound to a different loop cannot be awaited from here: close them on their own loop if it still runs
+			if entry.loop is not None and entry.loop is not current_loop:
+				if entry.loop.is_running():
+					asyncio.run_coroutine_threadsafe(entry.client.aclose(), entry.loop)
+					self.stats.closes += 1
+				else:
+					logger.debug('Skipped closing a pooled LLM HTTP client bound to an event loop that is no longer running')
+				continue
+			try:
+				await entry.client.aclose()
+				self.stats.closes += 1
+			except Exception as e:
+				logger.debug(f'Error closing pooled LLM HTTP client: {type(e).__name__}: {e}')
+
+
+# Shared process-wide pool used by all providers
+llm_client_pool = LLMClientPool()
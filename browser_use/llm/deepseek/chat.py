@@ -16,6 +16,7 @@ from openai import (
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.client_pool import llm_client_pool
 from browser_use.llm.deepseek.serializer import DeepSeekMessageSerializer
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
@@ -48,11 +49,20 @@ class ChatDeepSeek(BaseChatModel):
 		return 'deepseek'
 
 	def _client(self) -> AsyncOpenAI:
-		return AsyncOpenAI(
-			api_key=self.api_key,
-			base_url=self.base_url,
-			timeout=self.timeout,
+		client_params: dict[str, Any] = {
+			'api_key': self.api_key,
+			'base_url': self.base_url,
+			'timeout': self.timeout,
 			**(self.client_params or {}),
+		}
+		http_client = client_params.pop('http_client', None)
+		return llm_client_pool.get_client(
+			self.provider,
+			client_params,
+			lambda pooled_http_client: AsyncOpenAI(**client_params, http_client=pooled_http_client),
+			base_url=self.base_url,
+			credentials=self.api_key,
+			http_client=http_client,
 		)
 
 	@property
@@ -138,8 +148,9 @@ class ChatDeepSeek(BaseChatModel):
 				tool_choice = None
 				if output_format is not None and hasattr(output_format, 'model_json_schema'):
 					tool_name = output_format.__name__
-					schema = SchemaOptimizer.create_optimized_json_schema(output_format)
-					schema.pop('title', None)
+					schema = SchemaOptimizer.get_cached_schema(
+						output_format, dialect='deepseek', postprocess=SchemaOptimizer.strip_title
+					).schema
 					call_tools = [
 						{
 							'type': 'function',
@@ -271,9 +271,9 @@ class ChatGoogle(BaseChatModel):
 						self.logger.debug(f'🔧 Requesting structured output for {output_format.__name__}')
 						config['response_mime_type'] = 'application/json'
 						# Convert Pydantic model to Gemini-compatible schema
-						optimized_schema = SchemaOptimizer.create_gemini_optimized_schema(output_format)
-
-						gemini_schema = self._fix_gemini_schema(optimized_schema)
+						gemini_schema = SchemaOptimizer.get_cached_schema(
+							output_format, dialect='gemini', postprocess=self._fix_gemini_schema
+						).schema
 						config['response_schema'] = gemini_schema
 
 						response = await self.get_client().aio.models.generate_content(
@@ -347,7 +347,7 @@ class ChatGoogle(BaseChatModel):
 
 						# Add JSON instruction to the last message
 						if modified_messages and isinstance(modified_messages[-1].content, str):
-							json_instruction = f'\n\nPlease respond with a valid JSON object that matches this schema: {SchemaOptimizer.create_optimized_json_schema(output_format)}'
+							json_instruction = f'\n\nPlease respond with a valid JSON object that matches this schema: {SchemaOptimizer.get_cached_schema(output_format).json}'
 							modified_messages[-1].content += json_instruction
 
 						# Re-serialize with modified messages
@@ -20,6 +20,7 @@ from httpx import URL
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel, ChatInvokeCompletion
+from browser_use.llm.client_pool import llm_client_pool
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.groq.parser import try_parse_groq_failed_generation
 from browser_use.llm.groq.serializer import GroqMessageSerializer
@@ -74,7 +75,19 @@ class ChatGroq(BaseChatModel):
 	max_retries: int = 10  # Increase default retries for automation reliability
 
 	def get_client(self) -> AsyncGroq:
-		return AsyncGroq(api_key=self.api_key, base_url=self.base_url, timeout=self.timeout, max_retries=self.max_retries)
+		client_params = {
+			'api_key': self.api_key,
+			'base_url': self.base_url,
+			'timeout': self.timeout,
+			'max_retries': self.max_retries,
+		}
+		return llm_client_pool.get_client(
+			self.provider,
+			client_params,
+			lambda http_client: AsyncGroq(**client_params, http_client=http_client),
+			base_url=self.base_url,
+			credentials=self.api_key,
+		)
 
 	@property
 	def provider(self) -> str:
@@ -164,7 +177,7 @@ class ChatGroq(BaseChatModel):
 
 	async def _invoke_structured_output(self, groq_messages, output_format: type[T]) -> ChatInvokeCompletion[T]:
 		"""Handle structured output using either tool calling or JSON schema."""
-		schema = SchemaOptimizer.create_optimized_json_schema(output_format)
+		schema = SchemaOptimizer.get_cached_schema(output_format).schema
 
 		if self.model in ToolCallingModels:
 			response = await self._invoke_with_tool_calling(groq_messages, output_format, schema)
@@ -353,12 +353,12 @@ class ChatOCIRaw(BaseChatModel):
 				)
 			else:
 				# For structured output, add JSON schema instructions
-				optimized_schema = SchemaOptimizer.create_optimized_json_schema(output_format)
+				schema_json = SchemaOptimizer.get_cached_schema(output_format).json
 
 				# Add JSON schema instruction to messages
 				system_instruction = f"""
 You must respond with ONLY a valid JSON object that matches this exact schema:
-{json.dumps(optimized_schema, indent=2)}
+{schema_json}
 
 IMPORTANT: 
 - Your response must be ONLY the JSON object, no additional text
@@ -14,6 +14,7 @@ from openai.types.shared_params.response_format_json_schema import JSONSchema, R
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.client_pool import llm_client_pool
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openai.serializer import OpenAIMessageSerializer
@@ -116,21 +117,27 @@ class ChatOpenAI(BaseChatModel):
 		# Create client_params dict with non-None values
 		client_params = {k: v for k, v in base_params.items() if v is not None}
 
-		# Add http_client if provided
-		if self.http_client is not None:
-			client_params['http_client'] = self.http_client
-
 		return client_params
 
 	def get_client(self) -> AsyncOpenAI:
 		"""
-		Returns an AsyncOpenAI client.
+		Returns an AsyncOpenAI client from the shared LLM client pool.
+
+		The client (and its keep-alive connections) is reused across calls with the same parameters.
+		If `http_client` is set it is used as-is instead of a pooled one.
 
 		Returns:
 			AsyncOpenAI: An instance of the AsyncOpenAI client.
 		"""
 		client_params = self._get_client_params()
-		return AsyncOpenAI(**client_params)
+		return llm_client_pool.get_client(
+			self.provider,
+			client_params,
+			lambda http_client: AsyncOpenAI(**client_params, http_client=http_client),
+			base_url=client_params.get('base_url'),
+			credentials=(self.api_key, self.organization, self.project),
+			http_client=self.http_client,
+		)
 
 	@property
 	def name(self) -> str:
@@ -229,11 +236,11 @@ class ChatOpenAI(BaseChatModel):
 				response_format: JSONSchema = {
 					'name': 'agent_output',
 					'strict': True,
-					'schema': SchemaOptimizer.create_optimized_json_schema(
+					'schema': SchemaOptimizer.get_cached_schema(
 						output_format,
 						remove_min_items=self.remove_min_items_from_schema,
 						remove_defaults=self.remove_defaults_from_schema,
-					),
+					).schema,
 				}
 
 				# Add JSON schema to system prompt if requested
@@ -12,6 +12,7 @@ from openai.types.shared_params.response_format_json_schema import (
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
+from browser_use.llm.client_pool import llm_client_pool
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.openrouter.serializer import OpenRouterMessageSerializer
@@ -73,23 +74,24 @@ class ChatOpenRouter(BaseChatModel):
 		# Create client_params dict with non-None values
 		client_params = {k: v for k, v in base_params.items() if v is not None}
 
-		# Add http_client if provided
-		if self.http_client is not None:
-			client_params['http_client'] = self.http_client
-
 		return client_params
 
 	def get_client(self) -> AsyncOpenAI:
 		"""
-		Returns an AsyncOpenAI client configured for OpenRouter.
+		Returns an AsyncOpenAI client configured for OpenRouter, from the shared LLM client pool.
 
 		Returns:
 		    AsyncOpenAI: An instance of the AsyncOpenAI client with OpenRouter base URL.
 		"""
-		if not hasattr(self, '_client'):
-			client_params = self._get_client_params()
-			self._client = AsyncOpenAI(**client_params)
-		return self._client
+		client_params = self._get_client_params()
+		return llm_client_pool.get_client(
+			self.provider,
+			client_params,
+			lambda http_client: AsyncOpenAI(**client_params, http_client=http_client),
+			base_url=self.base_url,
+			credentials=self.api_key,
+			http_client=self.http_client,
+		)
 
 	@property
 	def name(self) -> str:
@@ -160,7 +162,7 @@ class ChatOpenRouter(BaseChatModel):
 
 			else:
 				# Create a JSON schema for structured output
-				schema = SchemaOptimizer.create_optimized_json_schema(output_format)
+				schema = SchemaOptimizer.get_cached_schema(output_format).schema
 
 				response_format_schema: JSONSchema = {
 					'name': 'agent_output',
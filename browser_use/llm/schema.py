@@ -2,12 +2,125 @@
 Utilities for creating optimized Pydantic schemas for LLM usage.
 """
 
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from pydantic import BaseModel
 
+# Max number of (model, flags, dialect) entries kept by SchemaOptimizer.get_cached_schema
+SCHEMA_CACHE_MAX_SIZE = 128
+
+
+@dataclass(frozen=True)
+class OptimizedSchema:
+	"""
+	A cached, pre-serialized JSON schema for a structured output model.
+
+	The cache entry only holds the serialized `json`, so it is shared between callers without any of them being
+	able to change it. Embed `json` where the schema goes into a prompt as text; `schema` returns a fresh dict
+	for SDKs that take the schema as an object.
+	"""
+
+	json: str
+
+	@property
+	def schema(self) -> dict[str, Any]:
+		"""A new copy of the schema on every access, so callers and SDKs may mutate it."""
+		return json.loads(self.json)
+
+
+@dataclass
+class SchemaCacheInfo:
+	hits: int
+	misses: int
+	size: int
+	max_size: int
+
 
 class SchemaOptimizer:
+	_cache: 'OrderedDict[tuple[Any, ...], OptimizedSchema]' = OrderedDict()
+	_cache_lock = threading.Lock()
+	_cache_hits = 0
+	_cache_misses = 0
+
+	@staticmethod
+	def get_cached_schema(
+		model: type[BaseModel],
+		*,
+		remove_min_items: bool = False,
+		remove_defaults: bool = False,
+		dialect: str = 'openai',
+		postprocess: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+	) -> OptimizedSchema:
+		"""
+		Memoized version of `create_optimized_json_schema`.
+
+		The agent's output model only changes when its action models are swapped, so the (expensive) schema
+		for it is computed once per (model class, flags, provider dialect) and reused on every request.
+
+		Args:
+			model: The Pydantic model to optimize
+			remove_min_items: If True, remove minItems from the schema
+			remove_defaults: If True, remove default values from the schema
+			dialect: Provider dialect name, part of the cache key so provider-specific variants don't collide
+			postprocess: Provider-specific transform applied once on a cache miss (must be consistent per dialect)
+
+		Returns:
+			A frozen OptimizedSchema shared by all callers
+		"""
+		key = (model, remove_min_items, remove_defaults, dialect)
+		with SchemaOptimizer._cache_lock:
+			cached = SchemaOptimizer._cache.get(key)
+			if cached is not None:
+				SchemaOptimizer._cache.move_to_end(key)
+				SchemaOptimizer._cache_hits += 1
+				return cached
+
+		schema = SchemaOptimizer.create_optimized_json_schema(
+			model,
+			remove_min_items=remove_min_items,
+			remove_defaults=remove_defaults,
+		)
+		if postprocess is not None:
+			schema = postprocess(schema)
+		optimized = OptimizedSchema(json=json.dumps(schema))
+
+		with SchemaOptimizer._cache_lock:
+			SchemaOptimizer._cache_misses += 1
+			SchemaOptimizer._cache[key] = optimized
+			while len(SchemaOptimizer._cache) > SCHEMA_CACHE_MAX_SIZE:
+				SchemaOptimizer._cache.popitem(last=False)
+		return optimized
+
+	@staticmethod
+	def cache_info() -> SchemaCacheInfo:
+		"""Hit/miss counters and current size of the schema cache."""
+		with SchemaOptimizer._cache_lock:
+			return SchemaCacheInfo(
+				hits=SchemaOptimizer._cache_hits,
+				misses=SchemaOptimizer._cache_misses,
+				size=len(SchemaOptimizer._cache),
+				max_size=SCHEMA_CACHE_MAX_SIZE,
+			)
+
+	@staticmethod
+	def clear_cache() -> None:
+		"""Drop all cached schemas and reset the counters."""
+		with SchemaOptimizer._cache_lock:
+			SchemaOptimizer._cache.clear()
+			SchemaOptimizer._cache_hits = 0
+			SchemaOptimizer._cache_misses = 0
+
+	@staticmethod
+	def strip_title(schema: dict[str, Any]) -> dict[str, Any]:
+		"""Remove the root `title`, for providers that reject it in tool parameters."""
+		schema.pop('title', None)
+		return schema
+
 	@staticmethod
 	def create_optimized_json_schema(
 		model: type[BaseModel],
@@ -6,6 +6,11 @@ This server provides tools for:
 - Content extraction from web pages
 - File system operations
 
+Each MCP client connection gets its own browser session, tools, LLM and file system, so concurrent clients don't share
+one browser and focused tab. Tool calls of one client run one at a time, calls of different clients run concurrently.
+At most BROWSER_USE_MCP_MAX_BROWSERS browsers (default 4, agent tasks included) run at once, further sessions wait for
+one to close. Idle sessions are closed after the session timeout.
+
 Usage:
     uvx browser-use --mcp
 
@@ -35,7 +40,9 @@ os.environ['BROWSER_USE_SETUP_LOGGING'] = 'false'
 import asyncio
 import json
 import logging
+import re
 import time
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Any
 
@@ -92,13 +99,19 @@ logging.disable(logging.CRITICAL)
 # Import browser_use modules
 from browser_use import ActionModel, Agent
 from browser_use.browser import BrowserProfile, BrowserSession
-from browser_use.config import get_default_llm, get_default_profile, load_browser_use_config
+from browser_use.config import CONFIG, get_default_llm, get_default_profile, load_browser_use_config
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.openai.chat import ChatOpenAI
 from browser_use.tools.service import Tools
 
 logger = logging.getLogger(__name__)
 
+# Client id of tool calls made outside of an MCP request (e.g. calling the server methods directly)
+DEFAULT_CLIENT_ID = 'default'
+
+# MCP client connection the current tool call came from, set per request by the call_tool handler
+_current_client_id: ContextVar[str] = ContextVar('mcp_client_id', default=DEFAULT_CLIENT_ID)
+
 
 def _ensure_all_loggers_use_stderr():
 	"""Ensure ALL loggers only output to stderr, not stdout."""
@@ -187,28 +200,70 @@ def get_parent_process_cmdline() -> str | None:
 class BrowserUseServer:
 	"""MCP Server for browser-use capabilities."""
 
-	def __init__(self, session_timeout_minutes: int = 10):
+	def __init__(self, session_timeout_minutes: int = 10, max_browsers: int | None = None):
 		# Ensure all logging goes to stderr (in case new loggers were created)
 		_ensure_all_loggers_use_stderr()
 
 		self.server = Server('browser-use')
 		self.config = load_browser_use_config()
 		self.agent: Agent | None = None
-		self.browser_session: BrowserSession | None = None
-		self.tools: Tools | None = None
-		self.llm: ChatOpenAI | None = None
-		self.file_system: FileSystem | None = None
 		self._telemetry = ProductTelemetry()
 		self._start_time = time.time()
 
-		# Session management
+		# Session management, one browser session (with its tools, LLM and file system) per MCP client
 		self.active_sessions: dict[str, dict[str, Any]] = {}  # session_id -> session info
+		self.client_sessions: dict[str, str] = {}  # MCP client id -> session_id of its browser session
 		self.session_timeout_minutes = session_timeout_minutes
+		self.max_browsers = CONFIG.BROWSER_USE_MCP_MAX_BROWSERS if max_browsers is None else max_browsers
+		self._browser_slots = asyncio.Semaphore(self.max_browsers)
+		self._client_locks: dict[str, asyncio.Lock] = {}
 		self._cleanup_task: Any = None
 
 		# Setup handlers
 		self._setup_handlers()
 
+	def _current_session_data(self) -> dict[str, Any] | None:
+		session_id = self.client_sessions.get(_current_client_id.get())
+		return self.active_sessions.get(session_id) if session_id else None
+
+	@property
+	def browser_session(self) -> BrowserSession | None:
+		"""Browser session of the MCP client making the current tool call."""
+		session_data = self._current_session_data()
+		return session_data['session'] if session_data else None
+
+	@property
+	def tools(self) -> Tools | None:
+		session_data = self._current_session_data()
+		return session_data.get('tools') if session_data else None
+
+	@property
+	def llm(self) -> ChatOpenAI | None:
+		session_data = self._current_session_data()
+		return session_data.get('llm') if session_data else None
+
+	@property
+	def file_system(self) -> FileSystem | None:
+		session_data = self._current_session_data()
+		return session_data.get('file_system') if session_data else None
+
+	def _get_client_id(self) -> str:
+		"""Id of the MCP client connection the current request came from."""
+		try:
+			request_context = self.server.request_context
+		except LookupError:
+			return DEFAULT_CLIENT_ID
+		# Streamable HTTP clients send their session id with every request, other transports have one session per connection
+		headers = getattr(getattr(request_context, 'request', None), 'headers', None)
+		if headers is not None and (mcp_session_id := headers.get('mcp-session-id')):
+			return mcp_session_id
+		return f'connection-{id(request_context.session)}'
+
+	def _get_client_lock(self, client_id: str) -> asyncio.Lock:
+		if client_id not in self._client_locks:
+			self._client_locks[client_id] = asyncio.Lock()
+		return self._client_locks[client_id]
+
 	def _setup_handlers(self):
 		"""Setup MCP server handlers."""
 
@@ -382,12 +437,12 @@ class BrowserUseServer:
 				# Browser session management tools
 				types.Tool(
 					name='browser_list_sessions',
-					description='List all active browser sessions with their details and last activity time',
+					description='List the active browser sessions of this client with their details and last activity time',
 					inputSchema={'type': 'object', 'properties': {}},
 				),
 				types.Tool(
 					name='browser_close_session',
-					description='Close a specific browser session by its ID',
+					description='Close a specific browser session of this client by its ID',
 					inputSchema={
 						'type': 'object',
 						'properties': {
@@ -401,7 +456,7 @@ class BrowserUseServer:
 				),
 				types.Tool(
 					name='browser_close_all',
-					description='Close all active browser sessions and clean up resources',
+					description='Close all browser sessions of this client and clean up resources',
 					inputSchema={'type': 'object', 'properties': {}},
 				),
 			]
@@ -421,6 +476,7 @@ class BrowserUseServer:
 			"""Handle tool execution."""
 			start_time = time.time()
 			error_msg = None
+			client_token = _current_client_id.set(self._get_client_id())
 			try:
 				result = await self._execute_tool(name, arguments or {})
 				return [types.TextContent(type='text', text=result)]
@@ -429,6 +485,7 @@ class BrowserUseServer:
 				logger.error(f'Tool execution failed: {e}', exc_info=True)
 				return [types.TextContent(type='text', text=f'Error: {str(e)}')]
 			finally:
+				_current_client_id.reset(client_token)
 				# Capture telemetry for tool calls
 				duration = time.time() - start_time
 				self._telemetry.capture(
@@ -466,49 +523,60 @@ class BrowserUseServer:
 
 		# Direct browser control tools (require active session)
 		elif tool_name.startswith('browser_'):
-			# Ensure browser session exists
-			if not self.browser_session:
-				await self._init_browser_session()
+			# Calls of one client run one at a time on its browser, calls of different clients run concurrently
+			async with self._get_client_lock(_current_client_id.get()):
+				return await self._execute_browser_tool(tool_name, arguments)
 
-			if tool_name == 'browser_navigate':
-				return await self._navigate(arguments['url'], arguments.get('new_tab', False))
+		return f'Unknown tool: {tool_name}'
 
-			elif tool_name == 'browser_click':
-				return await self._click(arguments['index'], arguments.get('new_tab', False))
+	async def _execute_browser_tool(self, tool_name: str, arguments: dict[str, Any]) -> str:
+		"""Execute a direct browser control tool on the current client's browser session."""
+		# Ensure browser session exists
+		if not self.browser_session:
+			await self._init_browser_session()
+		if self.browser_session:
+			self._update_session_activity(self.browser_session.id)
+
+		if tool_name == 'browser_navigate':
+			return await self._navigate(arguments['url'], arguments.get('new_tab', False))
 
-			elif tool_name == 'browser_type':
-				return await self._type_text(arguments['index'], arguments['text'])
+		elif tool_name == 'browser_click':
+			return await self._click(arguments['index'], arguments.get('new_tab', False))
 
-			elif tool_name == 'browser_get_state':
-				return await self._get_browser_state(arguments.get('include_screenshot', False))
+		elif tool_name == 'browser_type':
+			return await self._type_text(arguments['index'], arguments['text'])
 
-			elif tool_name == 'browser_extract_content':
-				return await self._extract_content(arguments['query'], arguments.get('extract_links', False))
+		elif tool_name == 'browser_get_state':
+			return await self._get_browser_state(arguments.get('include_screenshot', False))
 
-			elif tool_name == 'browser_scroll':
-				return await self._scroll(arguments.get('direction', 'down'))
+		elif tool_name == 'browser_extract_content':
+			return await self._extract_content(arguments['query'], arguments.get('extract_links', False))
 
-			elif tool_name == 'browser_go_back':
-				return await self._go_back()
+		elif tool_name == 'browser_scroll':
+			return await self._scroll(arguments.get('direction', 'down'))
 
-			elif tool_name == 'browser_close':
-				return await self._close_browser()
+		elif tool_name == 'browser_go_back':
+			return await self._go_back()
 
-			elif tool_name == 'browser_list_tabs':
-				return await self._list_tabs()
+		elif tool_name == 'browser_close':
+			return await self._close_browser()
 
-			elif tool_name == 'browser_switch_tab':
-				return await self._switch_tab(arguments['tab_id'])
+		elif tool_name == 'browser_list_tabs':
+			return await self._list_tabs()
 
-			elif tool_name == 'browser_close_tab':
-				return await self._close_tab(arguments['tab_id'])
+		elif tool_name == 'browser_switch_tab':
+			return await self._switch_tab(arguments['tab_id'])
+
+		elif tool_name == 'browser_close_tab':
+			return await self._close_tab(arguments['tab_id'])
 
 		return f'Unknown tool: {tool_name}'
 
 	async def _init_browser_session(self, allowed_domains: list[str] | None = None, **kwargs):
-		"""Initialize browser session using config"""
+		"""Initialize the current MCP client's browser session using config"""
 		if self.browser_session:
 			return
+		client_id = _current_client_id.get()
 
 		# Ensure all logging goes to stderr before browser initialization
 		_ensure_all_loggers_use_stderr()
@@ -538,34 +606,67 @@ class BrowserUseServer:
 		for key, value in kwargs.items():
 			profile_data[key] = value
 
+		await self._acquire_browser_slot()
+
+		# Chrome can't run two browsers on one user data dir, so further concurrent clients get a temporary profile
+		if profile_data.get('user_data_dir') and self._is_path_in_use('user_data_dir', profile_data['user_data_dir']):
+			profile_data['user_data_dir'] = None
+
 		# Create browser profile
 		profile = BrowserProfile(**profile_data)
 
-		# Create browser session
-		self.browser_session = BrowserSession(browser_profile=profile)
-		await self.browser_session.start()
+		# Create browser session, tracked right away so concurrent clients see its user data dir and file system
+		browser_session = BrowserSession(browser_profile=profile)
+		self._track_session(browser_session, client_id=client_id, holds_browser_slot=True)
 
-		# Track the session for management
-		self._track_session(self.browser_session)
+		try:
+			await browser_session.start()
+		except BaseException:
+			self._forget_session(browser_session.id)
+			raise
 
 		# Create tools for direct actions
-		self.tools = Tools()
+		session_data = self.active_sessions[browser_session.id]
+		session_data['tools'] = Tools()
 
 		# Initialize LLM from config
 		llm_config = get_default_llm(self.config)
 		if api_key := llm_config.get('api_key'):
-			self.llm = ChatOpenAI(
+			session_data['llm'] = ChatOpenAI(
 				model=llm_config.get('model', 'gpt-4o-mini'),
 				api_key=api_key,
 				temperature=llm_config.get('temperature', 0.7),
 				# max_tokens=llm_config.get('max_tokens'),
 			)
 
-		# Initialize FileSystem for extraction actions
-		file_system_path = profile_config.get('file_system_path', '~/.browser-use-mcp')
-		self.file_system = FileSystem(base_dir=Path(file_system_path).expanduser())
-
-		logger.debug('Browser session initialized')
+		# Initialize FileSystem for extraction actions, in a subdirectory per client when the directory is taken
+		file_system_path = Path(profile_config.get('file_system_path', '~/.browser-use-mcp')).expanduser()
+		if self._is_path_in_use('file_system_path', file_system_path):
+			file_system_path = file_system_path / 'clients' / re.sub(r'[^A-Za-z0-9_-]', '_', client_id)
+		session_data['file_system_path'] = file_system_path
+		session_data['file_system'] = FileSystem(base_dir=file_system_path)
+
+		logger.debug(f'Browser session initialized for MCP client {client_id}')
+
+	def _is_path_in_use(self, key: str, path: str | Path) -> bool:
+		"""Whether another tracked session already uses this user_data_dir / file_system_path."""
+		resolved = Path(path).expanduser().resolve()
+		for session_data in self.active_sessions.values():
+			if key == 'user_data_dir':
+				used = session_data['session'].browser_profile.user_data_dir
+			else:
+				used = session_data.get(key)
+			if used and Path(used).expanduser().resolve() == resolved:
+				return True
+		return False
+
+	async def _acquire_browser_slot(self) -> None:
+		"""Wait until fewer than max_browsers browsers are running (queueing behind other sessions)."""
+		if self._browser_slots.locked():
+			await self._cleanup_expired_sessions()
+		if self._browser_slots.locked():
+			logger.info(f'All {self.max_browsers} browsers are in use, waiting for a session to close...')
+		await self._browser_slots.acquire()
 
 	async def _retry_with_browser_use_agent(
 		self,
@@ -622,6 +723,14 @@ class BrowserUseServer:
 		# Create browser profile using config
 		profile = BrowserProfile(**profile_config)
 
+		# The agent runs its own browser, which counts towards max_browsers
+		await self._acquire_browser_slot()
+		try:
+			return await self._run_agent(task, llm, profile, max_steps, use_vision)
+		finally:
+			self._browser_slots.release()
+
+	async def _run_agent(self, task: str, llm: Any, profile: BrowserProfile, max_steps: int, use_vision: bool) -> str:
 		# Create and run agent
 		agent = Agent(
 			task=task,
@@ -885,13 +994,12 @@ class BrowserUseServer:
 
 	async def _close_browser(self) -> str:
 		"""Close the browser session."""
-		if self.browser_session:
+		if browser_session := self.browser_session:
 			from browser_use.browser.events import BrowserStopEvent
 
-			event = self.browser_session.event_bus.dispatch(BrowserStopEvent())
+			event = browser_session.event_bus.dispatch(BrowserStopEvent())
 			await event
-			self.browser_session = None
-			self.tools = None
+			self._forget_session(browser_session.id)
 			return 'Browser closed'
 		return 'No browser session to close'
 
@@ -932,27 +1040,54 @@ class BrowserUseServer:
 		current_url = await self.browser_session.get_current_page_url()
 		return f'Closed tab # {tab_id}, now on {current_url}'
 
-	def _track_session(self, session: BrowserSession) -> None:
-		"""Track a browser session for management."""
+	def _track_session(self, session: BrowserSession, client_id: str | None = None, holds_browser_slot: bool = False) -> None:
+		"""Track a browser session for management, as the browser session of an MCP client if given."""
 		self.active_sessions[session.id] = {
 			'session': session,
+			'client_id': client_id,
+			'holds_browser_slot': holds_browser_slot,
 			'created_at': time.time(),
 			'last_activity': time.time(),
 			'url': getattr(session, 'current_url', None),
 		}
+		if client_id is not None:
+			self.client_sessions[client_id] = session.id
+
+	def _forget_session(self, session_id: str) -> None:
+		"""Stop tracking a closed session, detaching it from its client and freeing its browser slot."""
+		session_data = self.active_sessions.pop(session_id, None)
+		if session_data is None:
+			return
+		client_id = session_data.get('client_id')
+		if client_id is not None and self.client_sessions.get(client_id) == session_id:
+			del self.client_sessions[client_id]
+			lock = self._client_locks.get(client_id)
+			if lock is not None and not lock.locked():
+				del self._client_locks[client_id]
+		if session_data.get('holds_browser_slot'):
+			self._browser_slots.release()
 
 	def _update_session_activity(self, session_id: str) -> None:
 		"""Update the last activity time for a session."""
 		if session_id in self.active_sessions:
 			self.active_sessions[session_id]['last_activity'] = time.time()
 
+	def _own_session_ids(self) -> list[str]:
+		"""Sessions of the MCP client making the current tool call, the only ones it may list or close."""
+		client_id = _current_client_id.get()
+		return [
+			session_id for session_id, session_data in self.active_sessions.items() if session_data.get('client_id') == client_id
+		]
+
 	async def _list_sessions(self) -> str:
-		"""List all active browser sessions."""
-		if not self.active_sessions:
+		"""List the active browser sessions of the current client."""
+		session_ids = self._own_session_ids()
+		if not session_ids:
 			return 'No active browser sessions'
 
 		sessions_info = []
-		for session_id, session_data in self.active_sessions.items():
+		for session_id in session_ids:
+			session_data = self.active_sessions[session_id]
 			session = session_data['session']
 			created_at = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(session_data['created_at']))
 			last_activity = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(session_data['last_activity']))
@@ -974,43 +1109,23 @@ class BrowserUseServer:
 		return json.dumps(sessions_info, indent=2)
 
 	async def _close_session(self, session_id: str) -> str:
-		"""Close a specific browser session."""
-		if session_id not in self.active_sessions:
+		"""Close a specific browser session of the current client."""
+		if session_id not in self._own_session_ids():
 			return f'Session {session_id} not found'
-
-		session_data = self.active_sessions[session_id]
-		session = session_data['session']
-
-		try:
-			# Close the session
-			if hasattr(session, 'kill'):
-				await session.kill()
-			elif hasattr(session, 'close'):
-				await session.close()
-
-			# Remove from tracking
-			del self.active_sessions[session_id]
-
-			# If this was the current session, clear it
-			if self.browser_session and self.browser_session.id == session_id:
-				self.browser_session = None
-				self.tools = None
-
-			return f'Successfully closed session {session_id}'
-		except Exception as e:
-			return f'Error closing session {session_id}: {str(e)}'
+		return await self._kill_session(session_id)
 
 	async def _close_all_sessions(self) -> str:
-		"""Close all active browser sessions."""
-		if not self.active_sessions:
+		"""Close all browser sessions of the current client."""
+		session_ids = self._own_session_ids()
+		if not session_ids:
 			return 'No active sessions to close'
 
 		closed_count = 0
 		errors = []
 
-		for session_id in list(self.active_sessions.keys()):
+		for session_id in session_ids:
 			try:
-				result = await self._close_session(session_id)
+				result = await self._kill_session(session_id)
 				if 'Successfully closed' in result:
 					closed_count += 1
 				else:
@@ -1018,16 +1133,47 @@ class BrowserUseServer:
 			except Exception as e:
 				errors.append(f'{session_id}: {str(e)}')
 
-		# Clear current session references
-		self.browser_session = None
-		self.tools = None
-
 		result = f'Closed {closed_count} sessions'
 		if errors:
 			result += f'. Errors: {"; ".join(errors)}'
 
 		return result
 
+	async def _kill_session(self, session_id: str, idle_seconds: float | None = None) -> str:
+		"""Close a browser session once the tool call its client has in flight finished.
+
+		With idle_seconds, the session is only closed if it was still idle that long after waiting for its client.
+		"""
+		session_data = self.active_sessions.get(session_id)
+		if session_data is None:
+			return f'Session {session_id} not found'
+		client_id = session_data.get('client_id')
+		lock = self._get_client_lock(client_id) if client_id is not None else asyncio.Lock()
+
+		async with lock:
+			if self.active_sessions.get(session_id) is not session_data:
+				return f'Session {session_id} not found'  # closed while waiting for the client
+			if idle_seconds is not None and time.time() - session_data['last_activity'] <= idle_seconds:
+				return f'Session {session_id} is in use'
+
+			session = session_data['session']
+			try:
+				# Close the session
+				if hasattr(session, 'kill'):
+					await session.kill()
+				elif hasattr(session, 'close'):
+					await session.close()
+
+				# Remove from tracking (and from its client, so the client's next call starts a new session)
+				self._forget_session(session_id)
+			except Exception as e:
+				return f'Error closing session {session_id}: {str(e)}'
+
+		# _forget_session keeps the lock of the client while it is held, drop it now unless another call took it
+		if client_id is not None and client_id not in self.client_sessions and not lock.locked():
+			self._client_locks.pop(client_id, None)
+		return f'Successfully closed session {session_id}'
+
 	async def _cleanup_expired_sessions(self) -> None:
 		"""Background task to clean up expired sessions."""
 		current_time = time.time()
@@ -1036,13 +1182,15 @@ class BrowserUseServer:
 		expired_sessions = []
 		for session_id, session_data in self.active_sessions.items():
 			last_activity = session_data['last_activity']
-			if current_time - last_activity > timeout_seconds:
+			lock = self._client_locks.get(session_data.get('client_id') or '')
+			if current_time - last_activity > timeout_seconds and not (lock and lock.locked()):
 				expired_sessions.append(session_id)
 
 		for session_id in expired_sessions:
 			try:
-				await self._close_session(session_id)
-				logger.info(f'Auto-closed expired session {session_id}')
+				result = await self._kill_session(session_id, idle_seconds=timeout_seconds)
+				if 'Successfully closed' in result:
+					logger.info(f'Auto-closed expired session {session_id}')
 			except Exception as e:
 				logger.error(f'Error auto-closing session {session_id}: {e}')
 
@@ -1081,12 +1229,12 @@ class BrowserUseServer:
 			)
 
 
-async def main(session_timeout_minutes: int = 10):
+async def main(session_timeout_minutes: int = 10, max_browsers: int | None = None):
 	if not MCP_AVAILABLE:
 		print('MCP SDK is required. Install with: pip install mcp', file=sys.stderr)
 		sys.exit(1)
 
-	server = BrowserUseServer(session_timeout_minutes=session_timeout_minutes)
+	server = BrowserUseServer(session_timeout_minutes=session_timeout_minutes, max_browsers=max_browsers)
 	server._telemetry.capture(
 		MCPServerTelemetryEvent(
 			version=get_browser_use_version(),
@@ -8,6 +8,7 @@ from pathlib import Path
 import anyio
 
 from browser_use.observability import observe_debug
+from browser_use.utils import get_image_media_type
 
 
 class ScreenshotService:
@@ -24,7 +25,8 @@ class ScreenshotService:
 	@observe_debug(ignore_input=True, ignore_output=True, name='store_screenshot')
 	async def store_screenshot(self, screenshot_b64: str, step_number: int) -> str:
 		"""Store screenshot to disk and return the full path as string"""
-		screenshot_filename = f'step_{step_number}.png'
+		extension = get_image_media_type(screenshot_b64).removeprefix('image/').replace('jpeg', 'jpg')
+		screenshot_filename = f'step_{step_number}.{extension}'
 		screenshot_path = self.screenshots_dir / screenshot_filename
 
 		# Decode base64 and save to disk
@@ -12,6 +12,7 @@ import pyotp
 from pydantic import BaseModel, Field, RootModel, create_model
 
 from browser_use.browser import BrowserSession
+from browser_use.domain_matcher import get_domain_pattern_matcher
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.base import BaseChatModel
 from browser_use.observability import observe_debug
@@ -22,7 +23,7 @@ from browser_use.tools.registry.views import (
 	RegisteredAction,
 	SpecialActionParameters,
 )
-from browser_use.utils import is_new_tab_page, match_url_with_domain_pattern, time_execution_async
+from browser_use.utils import is_new_tab_page, time_execution_async
 
 Context = TypeVar('Context')
 
@@ -36,6 +37,8 @@ class Registry(Generic[Context]):
 		self.registry = ActionRegistry()
 		self.telemetry = ProductTelemetry()
 		self.exclude_actions = exclude_actions if exclude_actions is not None else []
+		# frozenset of action names -> (RegisteredAction objects it was built from, ActionModel class)
+		self._action_model_cache: dict[frozenset[str], tuple[tuple[tuple[str, RegisteredAction], ...], type[ActionModel]]] = {}
 
 	def _get_special_param_types(self) -> dict[str, type | UnionType | None]:
 		"""Get the expected types for special parameters from SpecialActionParameters"""
@@ -418,14 +421,19 @@ class Registry(Generic[Context]):
 		# Process sensitive data based on format and current URL
 		applicable_secrets = {}
 
+		# Domain patterns of the new format that match the current URL, using our custom allowed_domains
+		# scheme://*.example.com glob matching (compiled once per set of patterns)
+		matching_domains: frozenset[str] = frozenset()
+		if current_url and not is_new_tab_page(current_url):
+			domain_patterns = [key for key, content in sensitive_data.items() if isinstance(content, dict)]
+			matching_domains = get_domain_pattern_matcher(domain_patterns).matching_patterns(current_url)
+
 		for domain_or_key, content in sensitive_data.items():
 			if isinstance(content, dict):
 				# New format: {domain_pattern: {key: value}}
 				# Only include secrets for domains that match the current URL
-				if current_url and not is_new_tab_page(current_url):
-					# it's a real url, check it using our custom allowed_domains scheme://*.example.com glob matching
-					if match_url_with_domain_pattern(current_url, domain_or_key):
-						applicable_secrets.update(content)
+				if domain_or_key in matching_domains:
+					applicable_secrets.update(content)
 			else:
 				# Old format: {key: value}, expose to all domains (only allowed for legacy reasons)
 				applicable_secrets[domain_or_key] = content
@@ -479,8 +487,11 @@ class Registry(Generic[Context]):
 
 		Each action model contains only the specific action being used,
 		rather than all actions with most set to None.
+
+		Models are cached per set of available actions (after domain filtering), so repeated calls
+		for pages with the same available actions return the same class and don't rebuild the
+		pydantic models or their core schemas.
 		"""
-		from typing import Union
 
 		# Filter actions based on page_url if provided:
 		#   if page_url is None, only include actions with no filters
@@ -504,6 +515,23 @@ class Registry(Generic[Context]):
 			if domain_is_allowed:
 				available_actions[name] = action
 
+		# Reuse the cached model if it was built from the exact same RegisteredAction objects
+		# (actions can be re-registered under the same name, e.g. `done` with a structured output model)
+		cache_key = frozenset(available_actions)
+		cached = self._action_model_cache.get(cache_key)
+		if cached is not None:
+			cached_actions, cached_model = cached
+			if all(available_actions.get(name) is action for name, action in cached_actions):
+				return cached_model
+
+		result_model = self._build_action_model(available_actions)
+		self._action_model_cache[cache_key] = (tuple(available_actions.items()), result_model)
+		return result_model
+
+	def _build_action_model(self, available_actions: dict[str, RegisteredAction]) -> type[ActionModel]:
+		"""Build the (uncached) Union ActionModel for the given actions"""
+		from typing import Union
+
 		# Create individual action models for each action
 		individual_action_models: list[type[BaseModel]] = []
 
@@ -101,6 +101,168 @@ def handle_browser_error(e: BrowserError) -> ActionResult:
 	raise e
 
 
+EXTRACTION_SYSTEM_PROMPT = """
+You are an expert at extracting data from the markdown of a webpage.
+
+<input>
+You will be given a query and the markdown of a webpage that has been filtered to remove noise and advertising content.
+</input>
+
+<instructions>
+- You are tasked to extract information from the webpage that is relevant to the query.
+- You should ONLY use the information available in the webpage to answer the query. Do not make up information or provide guess from your own knowledge.
+- If the information relevant to the query is not available in the page, your response should mention that.
+- If the query asks for all items, products, etc., make sure to directly list all of them.
+- If the content was truncated and you need more information, note that the user can use start_from_char parameter to continue from where truncation occurred.
+</instructions>
+
+<output>
+- Your output should present ALL the information relevant to the query in a concise way.
+- Do not answer in conversational format - directly output the relevant information or that the information is unavailable.
+</output>
+""".strip()
+
+# Answer of a chunk without anything relevant to the query, dropped before the reduce pass
+NO_RELEVANT_CONTENT = 'NO_RELEVANT_CONTENT'
+
+EXTRACTION_MAP_SYSTEM_PROMPT = f"""
+You are an expert at extracting data from the markdown of a webpage.
+
+<input>
+You will be given a query and ONE PART of the markdown of a long webpage that has been split into parts. The other parts are processed separately.
+</input>
+
+<instructions>
+- Extract the information from this part that is relevant to the query.
+- You should ONLY use the information available in this part. Do not make up information or provide guess from your own knowledge.
+- If the query asks for all items, products, etc., list every one of them that appears in this part, in page order.
+- If this part contains nothing relevant to the query, output exactly {NO_RELEVANT_CONTENT} and nothing else.
+</instructions>
+
+<output>
+- Directly output the relevant information in a concise way, not in conversational format.
+</output>
+""".strip()
+
+EXTRACTION_REDUCE_SYSTEM_PROMPT = """
+You are an expert at merging data extracted from a webpage.
+
+<input>
+You will be given a query and the partial results extracted from consecutive parts of one long webpage, in page order.
+</input>
+
+<instructions>
+- Merge the partial results into a single answer to the query.
+- Keep ALL the relevant information and the page order. Remove duplicates caused by items spanning two parts.
+- Do not add information that is not in the partial results.
+</instructions>
+
+<output>
+- Your output should present ALL the information relevant to the query in a concise way.
+- Do not answer in conversational format - directly output the merged information.
+</output>
+""".strip()
+
+# Limits of the full page (map-reduce) extraction
+EXTRACTION_MAX_CHUNKS = 20
+EXTRACTION_MAX_CONCURRENCY = 5
+EXTRACTION_LLM_TIMEOUT = 120.0
+
+
+async def _extraction_result(query: str, result: str, browser_session: BrowserSession, file_system: FileSystem) -> ActionResult:
+	"""Wrap an extraction answer in an ActionResult, saving long answers to the file system."""
+	current_url = await browser_session.get_current_page_url()
+	extracted_content = f'<url>\n{current_url}\n</url>\n<query>\n{query}\n</query>\n<result>\n{result}\n</result>'
+
+	# Simple memory handling
+	MAX_MEMORY_LENGTH = 1000
+	if len(extracted_content) < MAX_MEMORY_LENGTH:
+		memory = extracted_content
+		include_extracted_content_only_once = False
+	else:
+		file_name = await file_system.save_extracted_content(extracted_content)
+		memory = f'Query: {query}\nContent in {file_name} and once in <read_state>.'
+		include_extracted_content_only_once = True
+
+	logger.info(f'📄 {memory}')
+	return ActionResult(
+		extracted_content=extracted_content,
+		include_extracted_content_only_once=include_extracted_content_only_once,
+		long_term_memory=memory,
+	)
+
+
+async def _extract_full_page(
+	query: str,
+	content: str,
+	content_stats: dict,
+	max_chunk_chars: int,
+	browser_session: BrowserSession,
+	page_extraction_llm: BaseChatModel,
+	file_system: FileSystem,
+) -> ActionResult:
+	"""Extract from the whole page in one action: query the chunks concurrently (map), then merge the answers (reduce)."""
+	from browser_use.dom.markdown_extractor import split_markdown_into_chunks
+
+	content = sanitize_surrogates(content)
+	query = sanitize_surrogates(query)
+	start_from_char = content_stats.get('started_from_char', 0)
+
+	chunks = split_markdown_into_chunks(content, max_chunk_chars)
+	truncation_note = ''
+	if len(chunks) > EXTRACTION_MAX_CHUNKS:
+		# Locate where the last processed chunk ends in the content, so the caller can continue from there
+		end = 0
+		for chunk in chunks[:EXTRACTION_MAX_CHUNKS]:
+			end = content.find(chunk, end) + len(chunk)
+		chunks = chunks[:EXTRACTION_MAX_CHUNKS]
+		next_start = start_from_char + end
+		content_stats['next_start_char'] = next_start
+		truncation_note = f'\n\nOnly the first {end:,} chars were processed, use start_from_char={next_start} to continue.'
+
+	semaphore = asyncio.Semaphore(EXTRACTION_MAX_CONCURRENCY)
+
+	async def extract_chunk(i: int, chunk: str) -> str:
+		prompt = f'<query>\n{query}\n</query>\n\n<part>\nPart {i + 1} of {len(chunks)}\n</part>\n\n<webpage_content>\n{chunk}\n</webpage_content>'
+		async with semaphore:
+			response = await asyncio.wait_for(
+				page_extraction_llm.ainvoke([SystemMessage(content=EXTRACTION_MAP_SYSTEM_PROMPT), UserMessage(content=prompt)]),
+				timeout=EXTRACTION_LLM_TIMEOUT,
+			)
+		return response.completion.strip()
+
+	try:
+		# Map: one concurrent query per chunk, bounded by the semaphore
+		partial_results = await asyncio.gather(*(extract_chunk(i, chunk) for i, chunk in enumerate(chunks)))
+		relevant_results = [result for result in partial_results if result and result != NO_RELEVANT_CONTENT]
+		logger.debug(
+			f'📄 Extracted {len(chunks)} chunks of {len(content):,} chars, {len(relevant_results)} with relevant content'
+		)
+
+		# Reduce: merge the partial answers, no LLM call needed when at most one chunk had anything
+		if not relevant_results:
+			result = 'The information relevant to the query is not available on the page.'
+		elif len(relevant_results) == 1:
+			result = relevant_results[0]
+		else:
+			parts = '\n\n'.join(
+				f'<partial_result index="{i + 1}">\n{partial}\n</partial_result>' for i, partial in enumerate(relevant_results)
+			)
+			prompt = f'<query>\n{query}\n</query>\n\n{parts}'
+			response = await asyncio.wait_for(
+				page_extraction_llm.ainvoke(
+					[SystemMessage(content=EXTRACTION_REDUCE_SYSTEM_PROMPT), UserMessage(content=prompt)]
+				),
+				timeout=EXTRACTION_LLM_TIMEOUT,
+			)
+			result = response.completion
+
+		return await _extraction_result(query, result + truncation_note, browser_session, file_system)
+	except Exception as e:
+		logger.debug(f'Error extracting content: {e}')
+		raise RuntimeError(str(e))
+
+
 class Tools(Generic[Context]):
 	def __init__(
 		self,
@@ -236,8 +398,10 @@ class Tools(Generic[Context]):
 		# Helper function for coordinate conversion
 		def _convert_llm_coordinates_to_viewport(llm_x: int, llm_y: int, browser_session: BrowserSession) -> tuple[int, int]:
 			"""Convert coordinates from LLM screenshot size to original viewport size."""
-			if browser_session.llm_screenshot_size and browser_session._original_viewport_size:
-				original_width, original_height = browser_session._original_viewport_size
+			# A browser-downscaled LLM screenshot may show a slightly cropped viewport, starting at its top left corner
+			viewport_area = browser_session._llm_screenshot_area or browser_session._original_viewport_size
+			if browser_session.llm_screenshot_size and viewport_area:
+				original_width, original_height = viewport_area
 				llm_width, llm_height = browser_session.llm_screenshot_size
 
 				# Convert coordinates using fractions
@@ -650,7 +814,7 @@ class Tools(Generic[Context]):
 				)
 
 		@self.registry.action(
-			"""LLM extracts structured data from page markdown. Use when: on right page, know what to extract, haven't called before on same page+query. Can't get interactive elements. Set extract_links=True for URLs. Use start_from_char if previous extraction was truncated to extract data further down the page.""",
+			"""LLM extracts structured data from page markdown. Use when: on right page, know what to extract, haven't called before on same page+query. Can't get interactive elements. Set extract_links=True for URLs. Use start_from_char if previous extraction was truncated to extract data further down the page. Set full_page=True on long pages to extract from the whole page at once.""",
 			param_model=ExtractAction,
 		)
 		async def extract(
@@ -664,6 +828,7 @@ class Tools(Generic[Context]):
 			query = params['query'] if isinstance(params, dict) else params.query
 			extract_links = params['extract_links'] if isinstance(params, dict) else params.extract_links
 			start_from_char = params['start_from_char'] if isinstance(params, dict) else params.start_from_char
+			full_page = params.get('full_page', False) if isinstance(params, dict) else params.full_page
 
 			# Extract clean markdown using the unified method
 			try:
@@ -686,6 +851,11 @@ class Tools(Generic[Context]):
 				content = content[start_from_char:]
 				content_stats['started_from_char'] = start_from_char
 
+			if full_page:
+				return await _extract_full_page(
+					query, content, content_stats, MAX_CHAR_LIMIT, browser_session, page_extraction_llm, file_system
+				)
+
 			# Smart truncation with context preservation
 			truncated = False
 			if len(content) > MAX_CHAR_LIMIT:
@@ -709,11 +879,10 @@ class Tools(Generic[Context]):
 				content_stats['next_start_char'] = next_start
 
 			# Add content statistics to the result
-			original_html_length = content_stats['original_html_chars']
 			initial_markdown_length = content_stats['initial_markdown_chars']
 			chars_filtered = content_stats['filtered_chars_removed']
 
-			stats_summary = f"""Content processed: {original_html_length:,} HTML chars → {initial_markdown_length:,} initial markdown → {final_filtered_length:,} filtered markdown"""
+			stats_summary = f"""Content processed: {initial_markdown_length:,} initial markdown → {final_filtered_length:,} filtered markdown"""
 			if start_from_char > 0:
 				stats_summary += f' (started from char {start_from_char:,})'
 			if truncated:
@@ -721,27 +890,6 @@ class Tools(Generic[Context]):
 			elif chars_filtered > 0:
 				stats_summary += f' (filtered {chars_filtered:,} chars of noise)'
 
-			system_prompt = """
-You are an expert at extracting data from the markdown of a webpage.
-
-<input>
-You will be given a query and the markdown of a webpage that has been filtered to remove noise and advertising content.
-</input>
-
-<instructions>
-- You are tasked to extract information from the webpage that is relevant to the query.
-- You should ONLY use the information available in the webpage to answer the query. Do not make up information or provide guess from your own knowledge.
-- If the information relevant to the query is not available in the page, your response should mention that.
-- If the query asks for all items, products, etc., make sure to directly list all of them.
-- If the content was truncated and you need more information, note that the user can use start_from_char parameter to continue from where truncation occurred.
-</instructions>
-
-<output>
-- Your output should present ALL the information relevant to the query in a concise way.
-- Do not answer in conversational format - directly output the relevant information or that the information is unavailable.
-</output>
-""".strip()
-
 			# Sanitize surrogates from content to prevent UTF-8 encoding errors
 			content = sanitize_surrogates(content)
 			query = sanitize_surrogates(query)
@@ -750,31 +898,11 @@ You will be given a query and the markdown of a webpage that has been filtered t
 
 			try:
 				response = await asyncio.wait_for(
-					page_extraction_llm.ainvoke([SystemMessage(content=system_prompt), UserMessage(content=prompt)]),
-					timeout=120.0,
-				)
-
-				current_url = await browser_session.get_current_page_url()
-				extracted_content = (
-					f'<url>\n{current_url}\n</url>\n<query>\n{query}\n</query>\n<result>\n{response.completion}\n</result>'
+					page_extraction_llm.ainvoke([SystemMessage(content=EXTRACTION_SYSTEM_PROMPT), UserMessage(content=prompt)]),
+					timeout=EXTRACTION_LLM_TIMEOUT,
 				)
 
-				# Simple memory handling
-				MAX_MEMORY_LENGTH = 1000
-				if len(extracted_content) < MAX_MEMORY_LENGTH:
-					memory = extracted_content
-					include_extracted_content_only_once = False
-				else:
-					file_name = await file_system.save_extracted_content(extracted_content)
-					memory = f'Query: {query}\nContent in {file_name} and once in <read_state>.'
-					include_extracted_content_only_once = True
-
-				logger.info(f'📄 {memory}')
-				return ActionResult(
-					extracted_content=extracted_content,
-					include_extracted_content_only_once=include_extracted_content_only_once,
-					long_term_memory=memory,
-				)
+				return await _extraction_result(query, response.completion, browser_session, file_system)
 			except Exception as e:
 				logger.debug(f'Error extracting content: {e}')
 				raise RuntimeError(str(e))
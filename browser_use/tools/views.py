@@ -12,6 +12,10 @@ class ExtractAction(BaseModel):
 	start_from_char: int = Field(
 		default=0, description='Use this for long markdowns to start from a specific character (not index in browser_state)'
 	)
+	full_page: bool = Field(
+		default=False,
+		description='Set True for long pages (e.g. listings) to extract from the whole page in one call instead of 30k char pages',
+	)
 
 
 class SearchAction(BaseModel):
@@ -10,7 +10,7 @@ from fnmatch import fnmatch
 from functools import cache, wraps
 from pathlib import Path
 from sys import stderr
-from typing import Any, ParamSpec, TypeVar
+from typing import Any, Literal, ParamSpec, TypeVar
 from urllib.parse import urlparse
 
 import httpx
@@ -432,6 +432,23 @@ def is_new_tab_page(url: str) -> bool:
 	return url in ('about:blank', 'chrome://new-tab-page/', 'chrome://new-tab-page', 'chrome://newtab/', 'chrome://newtab')
 
 
+def get_image_media_type(image_b64: str) -> Literal['image/png', 'image/jpeg', 'image/webp']:
+	"""
+	Detect the media type of a base64-encoded PNG, JPEG or WebP image from its leading magic bytes, without decoding it.
+
+	Args:
+		image_b64: The base64-encoded image
+
+	Returns:
+		The image media type, 'image/png' if the format is not recognized
+	"""
+	if image_b64.startswith('/9j/'):
+		return 'image/jpeg'
+	if image_b64.startswith('UklGR'):
+		return 'image/webp'
+	return 'image/png'
+
+
 def match_url_with_domain_pattern(url: str, domain_pattern: str, log_warnings: bool = False) -> bool:
 	"""
 	Check if a URL matches a domain pattern. SECURITY CRITICAL.
@@ -13,6 +13,11 @@ Useful for:
 Note: Initial actions (like opening URLs from tasks) are now automatically
 saved to history and will be replayed during rerun, so you don't need to
 worry about manually specifying URLs when rerunning.
+
+For recorded flows that are replayed often, pass fast=True: instead of sleeping
+delay_between_actions after every step, the replay waits until the page settles
+(and at most delay_between_actions), and skips element highlighting. Per-step
+timings end up in rerun_agent.replay_metrics.
 """
 
 import asyncio
@@ -34,7 +39,9 @@ async def main():
 
 	rerun_agent = Agent(task='', llm=llm)
 
-	await rerun_agent.load_and_rerun(history_file)
+	await rerun_agent.load_and_rerun(history_file, fast=True)
+	for metrics in rerun_agent.replay_metrics:
+		print(f'Step {metrics.step_number}: {metrics.step_ms:.0f}ms')
 
 
 if __name__ == '__main__':
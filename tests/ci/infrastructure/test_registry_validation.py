@@ -351,6 +351,47 @@ class TestParameterOrdering:
 		assert action.description == 'Extract content from page'
 
 
+class TestActionModelCache:
+	"""Test that create_action_model reuses models for identical sets of available actions"""
+
+	def test_same_available_actions_return_same_model(self):
+		registry = Registry()
+
+		@registry.action('Click')
+		async def click(index: int):
+			return ActionResult()
+
+		@registry.action('Search google', domains=['*.google.com'])
+		async def search(query: str):
+			return ActionResult()
+
+		google_a = registry.create_action_model(page_url='https://www.google.com/search?q=a')
+		google_b = registry.create_action_model(page_url='https://maps.google.com/')
+		other = registry.create_action_model(page_url='https://example.com')
+
+		# Same set of available actions after domain filtering -> same class
+		assert google_a is google_b
+		assert other is not google_a
+		assert registry.create_action_model(page_url='https://example.org') is other
+
+	def test_reregistered_action_invalidates_cached_model(self):
+		registry = Registry()
+
+		@registry.action('Done')
+		async def done(text: str):
+			return ActionResult()
+
+		first = registry.create_action_model()
+
+		@registry.action('Done with structured data')
+		async def done(data: int):  # noqa: F811
+			return ActionResult()
+
+		second = registry.create_action_model()
+		assert second is not first
+		assert 'data' in second.model_fields['done'].annotation.model_fields
+
+
 class TestParamsModelArgsAndKwargs:
 	async def test_browser_session_double_kwarg(self):
 		"""Run the test to diagnose browser_session parameter issue
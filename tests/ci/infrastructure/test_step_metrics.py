@@ -0,0 +1,152 @@
+"""
+Tests for the per-step latency metrics (StepMetrics) and their JSONL / Prometheus / OpenTelemetry sinks.
+
+Usage:
+	uv run pytest tests/ci/infrastructure/test_step_metrics.py -v -s
+"""
+
+import json
+import threading
+
+from browser_use.agent.metrics import JSONLMetricsSink, OpenTelemetryMetricsSink, PrometheusTextFileSink, StepMetricsSink
+from browser_use.agent.service import Agent
+from browser_use.agent.views import StepMetadata, StepMetrics
+from tests.ci.conftest import create_mock_llm
+
+BROWSER_TIMING = {
+	'get_dom_tree_total_ms': 120.0,
+	'cdp_parallel_calls_ms': 80.0,
+	'serialize_accessible_elements_total_ms': 30.0,
+	'screenshot_ms': 45.0,
+}
+
+
+def _metrics(step_number: int = 1, llm_ms: float = 1500.0) -> StepMetrics:
+	return StepMetrics.from_timings(
+		step_number=step_number,
+		step_ms=2000.0,
+		step_timing={'browser_state_ms': 210.0, 'llm_ms': llm_ms, 'actions_ms': 250.0},
+		browser_timing=BROWSER_TIMING,
+	)
+
+
+def test_step_metrics_from_timings():
+	metrics = _metrics()
+
+	assert metrics.dom_capture_ms == 120.0
+	assert metrics.dom_serialization_ms == 30.0
+	assert metrics.screenshot_ms == 45.0
+	assert metrics.dom_timing['cdp_parallel_calls_ms'] == 80.0
+	assert 'screenshot_ms' not in metrics.dom_timing
+	assert metrics.phase_durations_ms() == {
+		'step': 2000.0,
+		'browser_state': 210.0,
+		'dom_capture': 120.0,
+		'dom_serialization': 30.0,
+		'screenshot': 45.0,
+		'llm': 1500.0,
+		'actions': 250.0,
+	}
+
+	# A step that failed before the LLM call only reports the phases that ran
+	partial = StepMetrics.from_timings(step_number=2, step_ms=300.0, step_timing={'browser_state_ms': 290.0})
+	assert partial.phase_durations_ms() == {'step': 300.0, 'browser_state': 290.0}
+
+
+def test_step_metadata_round_trips_metrics():
+	metadata = StepMetadata(step_start_time=1.0, step_end_time=3.0, step_number=1, metrics=_metrics())
+	restored = StepMetadata.model_validate_json(metadata.model_dump_json())
+	assert restored.metrics == metadata.metrics
+
+	# Histories saved before metrics existed still load
+	assert StepMetadata.model_validate({'step_start_time': 1.0, 'step_end_time': 3.0, 'step_number': 1}).metrics is None
+
+
+def test_jsonl_sink_appends_one_line_per_step(tmp_path):
+	sink = JSONLMetricsSink(tmp_path / 'metrics' / 'steps.jsonl')
+	sink.record_step('task-1', _metrics(step_number=1))
+	sink.record_step('task-1', _metrics(step_number=2))
+
+	rows = [json.loads(line) for line in (tmp_path / 'metrics' / 'steps.jsonl').read_text().splitlines()]
+	assert [row['step_number'] for row in rows] == [1, 2]
+	assert rows[0]['task_id'] == 'task-1'
+	assert rows[0]['llm_ms'] == 1500.0
+
+
+def test_jsonl_sink_keeps_its_file_open_until_closed(tmp_path):
+	sink = JSONLMetricsSink(tmp_path / 'steps.jsonl')
+	sink.record_step('task-1', _metrics(step_number=1))
+	handle = sink._file
+	sink.record_step('task-1', _metrics(step_number=2))
+	assert sink._file is handle and handle is not None
+
+	sink.close()
+	assert handle.closed and sink._file is None
+
+	# Recording after close reopens the file in append mode
+	sink.record_step('task-1', _metrics(step_number=3))
+	sink.close()
+	rows = [json.loads(line) for line in (tmp_path / 'steps.jsonl').read_text().splitlines()]
+	assert [row['step_number'] for row in rows] == [1, 2, 3]
+
+
+def test_prometheus_sink_writes_cumulative_histograms(tmp_path):
+	path = tmp_path / 'browser_use.prom'
+	sink = PrometheusTextFileSink(path, buckets=(1.0, 5.0), labels={'worker': 'a"b'})
+	sink.record_step('task-1', _metrics(llm_ms=500.0))
+	sink.record_step('task-1', _metrics(llm_ms=3000.0))
+	sink.record_step('task-1', _metrics(llm_ms=9000.0))
+
+	lines = path.read_text().splitlines()
+	assert '# TYPE browser_use_step_phase_duration_seconds histogram' in lines
+	llm = [line for line in lines if 'phase="llm"' in line]
+	assert llm == [
+		'browser_use_step_phase_duration_seconds_bucket{worker="a\\"b",phase="llm",le="1.0"} 1',
+		'browser_use_step_phase_duration_seconds_bucket{worker="a\\"b",phase="llm",le="5.0"} 2',
+		'browser_use_step_phase_duration_seconds_bucket{worker="a\\"b",phase="llm",le="+Inf"} 3',
+		'browser_use_step_phase_duration_seconds_sum{worker="a\\"b",phase="llm"} 12.5',
+		'browser_use_step_phase_duration_seconds_count{worker="a\\"b",phase="llm"} 3',
+	]
+	assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_opentelemetry_sink_records_each_phase():
+	recorded: list[tuple[float, dict[str, str]]] = []
+
+	class Histogram:
+		def record(self, amount, attributes=None):
+			recorded.append((amount, attributes))
+
+	class Meter:
+		def create_histogram(self, name, unit='', description=''):
+			assert unit == 'ms'
+			return Histogram()
+
+	sink = OpenTelemetryMetricsSink(meter=Meter(), attributes={'service': 'crawler'})
+	sink.record_step('task-1', _metrics())
+
+	assert (1500.0, {'service': 'crawler', 'phase': 'llm'}) in recorded
+	assert len(recorded) == 7
+
+
+async def test_agent_records_blocking_sinks_off_the_event_loop(tmp_path):
+	class ThreadRecordingSink(StepMetricsSink):
+		def __init__(self, blocking: bool):
+			self.blocking = blocking
+			self.threads: list[threading.Thread] = []
+
+		def record_step(self, task_id: str, metrics: StepMetrics) -> None:
+			self.threads.append(threading.current_thread())
+
+		def close(self) -> None:
+			self.threads.append(threading.current_thread())
+
+	file_sink, memory_sink = ThreadRecordingSink(blocking=True), ThreadRecordingSink(blocking=False)
+	agent = Agent(task='Metrics', llm=create_mock_llm(), metrics_sinks=[file_sink, memory_sink])
+
+	await agent._record_step_metrics(_metrics())
+	await agent.close()
+
+	assert len(file_sink.threads) == 2
+	assert all(thread is not threading.main_thread() for thread in file_sink.threads)
+	assert memory_sink.threads == [threading.main_thread()] * 2
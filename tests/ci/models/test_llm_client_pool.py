@@ -0,0 +1,134 @@
+"""
+Tests for the shared LLM client pool used by all providers.
+"""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from browser_use.llm.anthropic.chat import ChatAnthropic
+from browser_use.llm.client_pool import LLMClientPool, llm_client_pool
+from browser_use.llm.openai.chat import ChatOpenAI
+
+
+async def test_provider_reuses_pooled_client_across_calls():
+	"""Repeated get_client() calls must not build a new SDK client (and connection pool) per request."""
+	llm = ChatOpenAI(model='gpt-4.1-mini', api_key='sk-test-a', base_url='http://localhost:4000')
+
+	first = llm.get_client()
+	second = llm.get_client()
+	assert first is second
+
+	# A second instance with identical settings shares the same client
+	assert ChatOpenAI(model='gpt-4.1-mini', api_key='sk-test-a', base_url='http://localhost:4000').get_client() is first
+
+	# Different credentials never share a client
+	other = ChatOpenAI(model='gpt-4.1-mini', api_key='sk-test-b', base_url='http://localhost:4000').get_client()
+	assert other is not first
+
+	await llm_client_pool.aclose()
+
+
+async def test_http_client_shared_per_provider_and_base_url():
+	pool = LLMClientPool(max_connections=5, max_keepalive_connections=2)
+
+	a = pool.get_http_client('openai', 'http://gateway:4000/v1', 'key')
+	b = pool.get_http_client('openai', 'http://gateway:4000/v1', 'key')
+	c = pool.get_http_client('anthropic', 'http://gateway:4000/v1', 'key')
+
+	assert a is b
+	assert a is not c
+	assert pool.stats.http_clients_created == 2
+	assert pool.stats.http_client_hits == 1
+
+	await pool.aclose()
+	assert a.is_closed and c.is_closed
+
+
+async def test_release_closes_clients_only_after_last_lease():
+	pool = LLMClientPool()
+	pool.acquire()
+	pool.acquire()
+	client = pool.get_http_client('openai', None, 'key')
+
+	await pool.release()
+	assert not client.is_closed
+
+	await pool.release()
+	assert client.is_closed
+
+	# Clients are recreated lazily after the pool was closed
+	assert pool.get_http_client('openai', None, 'key') is not client
+	await pool.aclose()
+
+
+async def test_user_provided_http_client_is_never_closed_by_pool():
+	user_client = httpx.AsyncClient()
+	llm = ChatAnthropic(model='claude-sonnet-4-0', api_key='sk-ant-test', http_client=user_client)
+
+	sdk_client = llm.get_client()
+	assert sdk_client is llm.get_client()
+
+	await llm_client_pool.aclose()
+	assert not user_client.is_closed
+	await user_client.aclose()
+
+
+async def test_pooled_http_client_follows_redirects():
+	pool = LLMClientPool()
+	assert pool.get_http_client('openai', None, 'key').follow_redirects
+	await pool.aclose()
+
+
+def test_aclose_closes_clients_of_other_running_loops(caplog):
+	pool = LLMClientPool()
+	other_loop = asyncio.new_event_loop()
+	thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+	thread.start()
+
+	async def create_client():
+		return pool.get_http_client('openai', None, 'key')
+
+	other_client = asyncio.run_coroutine_threadsafe(create_client(), other_loop).result(timeout=5)
+	stopped_loop = asyncio.new_event_loop()
+	stopped_client = stopped_loop.run_until_complete(create_client())
+
+	with caplog.at_level('DEBUG', logger='browser_use.llm.client_pool'):
+		asyncio.run(pool.aclose())
+
+	asyncio.run_coroutine_threadsafe(asyncio.sleep(0.1), other_loop).result(timeout=5)
+	assert other_client.is_closed
+	assert not stopped_client.is_closed
+	assert 'Skipped closing a pooled LLM HTTP client' in caplog.text
+
+	other_loop.call_soon_threadsafe(other_loop.stop)
+	thread.join(timeout=5)
+	other_loop.close()
+	stopped_loop.run_until_complete(stopped_client.aclose())
+	stopped_loop.close()
+
+
+async def test_default_limits_match_the_sdk_clients(monkeypatch):
+	import openai
+
+	monkeypatch.delenv('BROWSER_USE_LLM_MAX_CONNECTIONS', raising=False)
+	monkeypatch.delenv('BROWSER_USE_LLM_MAX_KEEPALIVE_CONNECTIONS', raising=False)
+	limits = LLMClientPool()._limits()
+	sdk_limits = openai.DEFAULT_CONNECTION_LIMITS
+	assert limits.max_connections is not None and sdk_limits.max_connections is not None
+	assert limits.max_keepalive_connections is not None and sdk_limits.max_keepalive_connections is not None
+	assert limits.max_connections >= sdk_limits.max_connections
+	assert limits.max_keepalive_connections >= sdk_limits.max_keepalive_connections
+
+	monkeypatch.setenv('BROWSER_USE_LLM_MAX_CONNECTIONS', '7')
+	assert LLMClientPool()._limits().max_connections == 7
+
+
+@pytest.mark.parametrize('value, expected', [('', False), ('0', False), ('false', False), ('true', True), ('1', True)])
+def test_http2_env_var_is_parsed_as_a_boolean(monkeypatch, value, expected):
+	from browser_use.config import CONFIG
+
+	monkeypatch.setenv('BROWSER_USE_LLM_HTTP2', value)
+	assert CONFIG.BROWSER_USE_LLM_HTTP2 is expected
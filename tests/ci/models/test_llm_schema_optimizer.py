@@ -3,6 +3,8 @@ Tests for the SchemaOptimizer to ensure it correctly processes and
 optimizes the schemas for agent actions without losing information.
 """
 
+import json
+
 from pydantic import BaseModel
 
 from browser_use.agent.views import AgentOutput
@@ -74,3 +76,44 @@ def test_gemini_schema_retains_required_fields():
 
 	required_fields = set(schema['required'])
 	assert {'price', 'title'}.issubset(required_fields), 'Mandatory fields must stay required for Gemini.'
+
+
+def test_cached_schema_is_memoized_per_model_flags_and_dialect():
+	"""get_cached_schema should compute each (model, flags, dialect) schema once and reuse it."""
+	SchemaOptimizer.clear_cache()
+
+	first = SchemaOptimizer.get_cached_schema(ProductInfo)
+	second = SchemaOptimizer.get_cached_schema(ProductInfo)
+	assert first is second
+	assert first.schema == SchemaOptimizer.create_optimized_json_schema(ProductInfo)
+	assert json.loads(first.json) == first.schema
+
+	# Callers get their own copy, so mutating it never changes the cached schema
+	first.schema['properties'].clear()
+	assert first.schema['properties']
+	assert first.schema is not first.schema
+
+	# Different flags or dialects are cached separately
+	no_defaults = SchemaOptimizer.get_cached_schema(ProductInfo, remove_defaults=True)
+	tool_schema = SchemaOptimizer.get_cached_schema(ProductInfo, dialect='anthropic', postprocess=SchemaOptimizer.strip_title)
+	assert no_defaults is not first
+	assert 'title' not in tool_schema.schema
+
+	info = SchemaOptimizer.cache_info()
+	assert info.hits == 1
+	assert info.misses == 3
+	assert info.size == 3
+
+
+def test_cached_schema_follows_action_model_swaps():
+	"""A new AgentOutput type (e.g. after action models change) must get its own schema."""
+	SchemaOptimizer.clear_cache()
+	tools = Tools()
+
+	output_a = AgentOutput.type_with_custom_actions(tools.registry.create_action_model())
+	output_b = AgentOutput.type_with_custom_actions(tools.registry.create_action_model(include_actions=['done']))
+
+	schema_a = SchemaOptimizer.get_cached_schema(output_a)
+	schema_b = SchemaOptimizer.get_cached_schema(output_b)
+	assert schema_a is not schema_b
+	assert SchemaOptimizer.get_cached_schema(output_a) is schema_a
@@ -0,0 +1,226 @@
+"""
+Tests for the warm browser pool that hands pre-launched browsers to BrowserSession.start().
+
+The pooled "browser" is a small script that only announces and serves the CDP /json/version endpoint, so the pool's launch,
+hand-out, recycle and replenish logic is exercised without Chrome.
+
+Usage:
+	uv run pytest tests/ci/test_browser_pool.py -v -s
+"""
+
+import asyncio
+import stat
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from browser_use.browser.browser_pool import BrowserPool
+from browser_use.browser.events import BrowserKillEvent, BrowserLaunchEvent, NavigationCompleteEvent
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs.local_browser_watchdog import LocalBrowserWatchdog
+
+FAKE_BROWSER = """#!{python}
+import json, sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+port = int(next(arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('--remote-debugging-port=')))
+
+class Handler(BaseHTTPRequestHandler):
+	def do_GET(self):
+		body = json.dumps({{'webSocketDebuggerUrl': f'ws://127.0.0.1:{{port}}/devtools/browser/fake'}}).encode()
+		self.send_response(200)
+		self.end_headers()
+		self.wfile.write(body)
+
+	def log_message(self, *args):
+		pass
+
+server = HTTPServer(('127.0.0.1', port), Handler)
+print(f'DevTools listening on ws://127.0.0.1:{{port}}/devtools/browser/fake', file=sys.stderr, flush=True)
+server.serve_forever()
+"""
+
+
+@pytest.fixture
+def fake_browser(tmp_path: Path) -> str:
+	path = tmp_path / 'fake-chrome'
+	path.write_text(FAKE_BROWSER.format(python=sys.executable))
+	path.chmod(path.stat().st_mode | stat.S_IEXEC)
+	return str(path)
+
+
+def _profile(executable_path: str, **kwargs) -> BrowserProfile:
+	kwargs.setdefault('headless', True)
+	return BrowserProfile(executable_path=executable_path, enable_default_extensions=False, **kwargs)
+
+
+@pytest.fixture
+async def pool(fake_browser: str):
+	pool = BrowserPool(size=2, browser_profile=_profile(fake_browser))
+	yield pool
+	await pool.close()
+
+
+async def _settle(pool: BrowserPool) -> None:
+	await asyncio.gather(*pool._launch_tasks, *pool._background_tasks, return_exceptions=True)
+
+
+async def test_prelaunched_browsers_are_handed_out_and_replenished(pool: BrowserPool, fake_browser: str):
+	await pool.start()
+	assert pool.idle_count == 2
+	assert pool.stats.launched == 2
+
+	browser = await pool.acquire(_profile(fake_browser))
+
+	assert browser is not None
+	assert browser.process.is_running()
+	assert browser.cdp_url.startswith('http://localhost:')
+	assert pool.stats.hits == 1
+	await _settle(pool)
+	assert pool.idle_count == 2  # a replacement was launched in the background
+
+	pool.release(browser)
+	await _settle(pool)
+
+
+async def test_incompatible_profiles_start_cold(pool: BrowserPool, fake_browser: str, tmp_path: Path):
+	await pool.start()
+
+	assert await pool.acquire(_profile(fake_browser, user_data_dir=tmp_path / 'my-profile')) is None
+	assert await pool.acquire(_profile(fake_browser, headless=False)) is None
+	assert pool.stats.cold_starts == 2
+	assert pool.stats.hits == 0
+	assert pool.idle_count == 2
+
+
+async def test_released_browsers_are_reset_and_reused(pool: BrowserPool, fake_browser: str, monkeypatch):
+	reset_calls = []
+
+	async def fake_reset(browser, visited_origins):
+		reset_calls.append(visited_origins)
+
+	monkeypatch.setattr(BrowserPool, '_reset', staticmethod(fake_reset))
+	await pool.start()
+	browser = await pool.acquire(_profile(fake_browser))
+	assert browser is not None
+
+	pool.release(browser, {'https://example.com'})  # before its replacement finished launching
+	await _settle(pool)
+
+	assert reset_calls == [{'https://example.com'}]
+	assert pool.stats.recycled == 1
+	assert browser in pool._idle
+	assert pool.idle_count == 2  # the pending replacement launch was cancelled instead
+	assert pool.stats.launched == 2
+
+
+class FakeCDPClient:
+	"""Stands in for the pool's CDP connection: collects the registered Target event handlers."""
+
+	def __init__(self):
+		self.handlers = []
+		self.stopped = False
+		self.register = SimpleNamespace(
+			Target=SimpleNamespace(targetCreated=self.handlers.append, targetInfoChanged=self.handlers.append)
+		)
+		self.send = SimpleNamespace(Target=SimpleNamespace(setDiscoverTargets=self._set_discover_targets))
+
+	async def _set_discover_targets(self, params):
+		pass
+
+	async def stop(self):
+		self.stopped = True
+
+	def emit(self, target_type: str, url: str):
+		for handler in self.handlers:
+			handler({'targetInfo': {'type': target_type, 'url': url}})
+
+
+async def test_origins_of_frames_and_workers_are_cleared(pool: BrowserPool, fake_browser: str, monkeypatch):
+	cdp_client = FakeCDPClient()
+	reset_calls = []
+
+	async def fake_connect(browser):
+		return cdp_client
+
+	async def fake_reset(browser, visited_origins):
+		reset_calls.append(visited_origins | browser.recorded_origins)
+
+	monkeypatch.setattr(BrowserPool, '_connect', staticmethod(fake_connect))
+	monkeypatch.setattr(BrowserPool, '_reset', staticmethod(fake_reset))
+	await pool.start()
+	browser = await pool.acquire(_profile(fake_browser))
+	assert browser is not None
+	await asyncio.sleep(0.05)
+
+	cdp_client.emit('page', 'https://example.com/page')
+	cdp_client.emit('iframe', 'https://ads.example.net/frame?id=1')
+	cdp_client.emit('service_worker', 'https://cdn.example.org/sw.js')
+	cdp_client.emit('page', 'about:blank')
+	pool.release(browser, {'https://example.com'})
+	await _settle(pool)
+
+	assert reset_calls == [{'https://example.com', 'https://ads.example.net', 'https://cdn.example.org'}]
+	assert cdp_client.stopped
+	assert browser.recorder is None
+
+
+async def test_browsers_that_fail_to_reset_are_replaced(pool: BrowserPool, fake_browser: str):
+	await pool.start()
+	browser = await pool.acquire(_profile(fake_browser))
+	assert browser is not None
+
+	pool.release(browser)  # the fake browser has no CDP websocket, so the reset fails
+	await _settle(pool)
+
+	assert pool.stats.retired == 1
+	assert not browser.process.is_running()
+	assert not browser.user_data_dir.exists()
+	assert pool.idle_count == 2
+
+
+async def test_local_browser_watchdog_uses_the_pool(pool: BrowserPool, fake_browser: str, monkeypatch):
+	monkeypatch.setattr('browser_use.browser.watchdogs.local_browser_watchdog.browser_pool', pool)
+	await pool.start()
+	session = BrowserSession(browser_profile=_profile(fake_browser))
+	original_user_data_dir = str(session.browser_profile.user_data_dir)
+	watchdog = LocalBrowserWatchdog(event_bus=session.event_bus, browser_session=session)
+
+	result = await watchdog.on_BrowserLaunchEvent(BrowserLaunchEvent())
+	await watchdog.on_NavigationCompleteEvent(NavigationCompleteEvent(target_id='t' * 32, url='https://example.com/page'))
+	pooled = watchdog._pooled_browser
+
+	assert pooled is not None
+	assert result.cdp_url == pooled.cdp_url
+	assert watchdog.browser_pid == pooled.process.pid
+	assert str(session.browser_profile.user_data_dir) == str(pooled.user_data_dir)
+	assert watchdog._visited_origins == {'https://example.com'}
+
+	await watchdog.on_BrowserKillEvent(BrowserKillEvent())
+
+	assert str(session.browser_profile.user_data_dir) == original_user_data_dir
+	assert watchdog._pooled_browser is None
+	await _settle(pool)
+	assert pool.stats.hits == 1
+	assert pool.idle_count == 2
+
+
+async def test_local_browser_watchdog_restores_a_missing_user_data_dir(pool: BrowserPool, fake_browser: str, monkeypatch):
+	monkeypatch.setattr('browser_use.browser.watchdogs.local_browser_watchdog.browser_pool', pool)
+	await pool.start()
+	session = BrowserSession(browser_profile=_profile(fake_browser))
+	watchdog = LocalBrowserWatchdog(event_bus=session.event_bus, browser_session=session)
+
+	await watchdog.on_BrowserLaunchEvent(BrowserLaunchEvent())
+	pooled = watchdog._pooled_browser
+	assert pooled is not None
+	watchdog._original_user_data_dir = None  # the session had no user_data_dir of its own
+	await watchdog.on_BrowserKillEvent(BrowserKillEvent())
+
+	user_data_dir = str(session.browser_profile.user_data_dir)
+	assert user_data_dir != str(pooled.user_data_dir)
+	assert 'browser-use-user-data-dir-' in user_data_dir
+	await _settle(pool)
@@ -0,0 +1,115 @@
+"""
+Tests for the event-driven waits on browser startup and target attach: the CDP URL is ready the moment Chrome prints
+"DevTools listening on" to stderr, and sessions are handed to waiters as soon as SessionManager handles the attach event.
+
+Usage:
+	uv run pytest tests/ci/test_cdp_waits.py -v -s
+"""
+
+import asyncio
+import sys
+import time
+
+import pytest
+from cdp_use import CDPClient
+
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.session_manager import SessionManager
+from browser_use.browser.watchdogs.local_browser_watchdog import LocalBrowserWatchdog
+
+TARGET_ID = 'A' * 32
+
+
+async def _spawn(script: str) -> asyncio.subprocess.Process:
+	return await asyncio.create_subprocess_exec(
+		sys.executable, '-c', script, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+	)
+
+
+async def test_cdp_url_is_ready_when_devtools_listening_is_printed():
+	process = await _spawn(
+		'import sys, time\n'
+		'print("[1:2:INFO] starting up", file=sys.stderr, flush=True)\n'
+		'time.sleep(0.3)\n'
+		'print("DevTools listening on ws://127.0.0.1:9222/devtools/browser/x", file=sys.stderr, flush=True)\n'
+		'print("x" * 200000, file=sys.stderr, flush=True)\n'  # more output than a pipe buffer holds
+		'time.sleep(5)\n'
+	)
+	try:
+		start = time.perf_counter()
+		cdp_url = await LocalBrowserWatchdog._wait_for_cdp_url(9222, timeout=5, stderr=process.stderr)
+		elapsed = time.perf_counter() - start
+
+		assert cdp_url == 'http://localhost:9222/'
+		assert 0.25 < elapsed < 2
+		await asyncio.sleep(0.3)
+		assert process.returncode is None  # stderr keeps being drained, the browser is not blocked writing to it
+	finally:
+		process.kill()
+		await process.wait()
+
+
+async def test_browser_exiting_before_devtools_is_ready_fails_fast_with_its_output():
+	process = await _spawn(
+		'import sys; print("Failed to create a ProcessSingleton: SingletonLock", file=sys.stderr); sys.exit(1)'
+	)
+
+	start = time.perf_counter()
+	with pytest.raises(RuntimeError, match='SingletonLock'):
+		await LocalBrowserWatchdog._wait_for_cdp_url(9222, timeout=5, stderr=process.stderr)
+	assert time.perf_counter() - start < 2
+	await process.wait()
+
+
+@pytest.fixture
+def session_manager():
+	browser_session = BrowserSession(is_local=True)
+	# Never started: CDP commands issued while handling the attach fail fast and are ignored by SessionManager
+	browser_session._cdp_client_root = CDPClient('ws://127.0.0.1:9/devtools/browser/unused')
+	return SessionManager(browser_session)
+
+
+def _attached_event(target_type: str) -> dict:
+	return {
+		'sessionId': 'S' * 32,
+		'targetInfo': {'targetId': TARGET_ID, 'type': target_type, 'url': 'about:blank', 'title': ''},
+		'waitingForDebugger': False,
+	}
+
+
+async def test_wait_for_session_resolves_when_the_target_attaches(session_manager: SessionManager):
+	async def attach_later():
+		await asyncio.sleep(0.05)
+		await session_manager._handle_target_attached(_attached_event('iframe'))  # type: ignore[arg-type]
+
+	start = time.perf_counter()
+	session, _ = await asyncio.gather(session_manager.wait_for_session(TARGET_ID, timeout=2.0), attach_later())
+
+	assert session is not None
+	assert session.target_id == TARGET_ID
+	assert time.perf_counter() - start < 0.09  # resolved by the attach itself, not the next poll
+	assert not session_manager._attach_waiters
+	# Already attached: returns immediately
+	assert await session_manager.wait_for_session(TARGET_ID, timeout=0.01) is session
+
+
+async def test_wait_for_session_times_out_and_clear_releases_waiters(session_manager: SessionManager):
+	assert await session_manager.wait_for_session(TARGET_ID, timeout=0.05) is None
+	assert not session_manager._attach_waiters
+
+	waiter = asyncio.create_task(session_manager.wait_for_session(TARGET_ID, timeout=5.0, ready=True))
+	await asyncio.sleep(0)
+	await session_manager.clear()
+
+	assert await waiter is None
+
+
+async def test_ready_waiters_resolve_after_page_monitoring_setup(session_manager: SessionManager):
+	waiter = asyncio.create_task(session_manager.wait_for_session(TARGET_ID, timeout=2.0, ready=True))
+	await asyncio.sleep(0)
+
+	await session_manager._handle_target_attached(_attached_event('page'))  # type: ignore[arg-type]
+
+	session = await waiter
+	assert session is not None
+	assert not session_manager._ready_waiters
@@ -0,0 +1,182 @@
+"""
+Tests for incremental DOM mode: DOMMutationTracker keeping the DOM.getDocument tree live from CDP mutation events.
+
+A CDPClient subclass answers commands locally and dispatches events through cdp_use's real event registry,
+in the same order Chrome sends them (events caused by a command before its response).
+
+Usage:
+	uv run pytest tests/ci/test_dom_mutation_tracker.py -v -s
+"""
+
+import logging
+from types import SimpleNamespace
+from typing import Any
+
+from cdp_use import CDPClient
+
+from browser_use.dom.service import DomService
+
+TARGET_ID = 'target-1'
+SESSION_ID = 'session-1'
+
+
+def _node(node_id: int, name: str, children: list | None = None, node_type: int = 1, **extra) -> dict[str, Any]:
+	node: dict[str, Any] = {
+		'nodeId': node_id,
+		'backendNodeId': node_id + 1000,
+		'nodeType': node_type,
+		'nodeName': name,
+		'localName': name.lower(),
+		'nodeValue': '',
+		**extra,
+	}
+	if children is not None:
+		node['children'] = children
+		node['childNodeCount'] = len(children)
+	return node
+
+
+def _text(node_id: int, value: str) -> dict[str, Any]:
+	return _node(node_id, '#text', node_type=3, nodeValue=value)
+
+
+def _document() -> dict[str, Any]:
+	button = _node(4, 'BUTTON', [_text(5, 'Go')], attributes=['id', 'go'])
+	body = _node(3, 'BODY', [button, _node(6, 'DIV', [])])
+	return {'root': _node(1, '#document', [_node(2, 'HTML', [body])], node_type=9)}
+
+
+class FakeChrome(CDPClient):
+	"""CDP client answering DOM commands locally instead of over a websocket."""
+
+	def __init__(self):
+		super().__init__('ws://127.0.0.1:0')
+		self.get_document_calls = 0
+		self.ids_rebound = False
+		self.child_nodes: dict[int, list[dict[str, Any]]] = {}  # answers for DOM.requestChildNodes
+
+	async def send_raw(self, method: str, params: Any = None, session_id: str | None = None) -> dict[str, Any]:
+		if method == 'DOM.getDocument':
+			self.get_document_calls += 1
+			self.ids_rebound = False
+			return _document()
+		if method == 'DOM.describeNode':
+			if self.ids_rebound:
+				raise RuntimeError('Could not find node with given id')
+			return {'node': {}}
+		if method == 'DOM.requestChildNodes':
+			await self.emit_event(
+				'DOM.setChildNodes', {'parentId': params['nodeId'], 'nodes': self.child_nodes[params['nodeId']]}, session_id
+			)
+			return {}
+		raise AssertionError(f'unexpected CDP command {method}')
+
+	async def dom_event(self, method: str, **params) -> None:
+		await self.emit_event(f'DOM.{method}', params, SESSION_ID)
+
+
+def _make_service() -> tuple[DomService, FakeChrome, SimpleNamespace]:
+	chrome = FakeChrome()
+	browser_session = SimpleNamespace(agent_focus_target_id=TARGET_ID, logger=logging.getLogger('test'))
+	service = DomService(browser_session, incremental_dom=True)  # type: ignore[arg-type]
+	cdp_session = SimpleNamespace(cdp_client=chrome, session_id=SESSION_ID, target_id=TARGET_ID)
+	return service, chrome, cdp_session
+
+
+def _find(node: dict[str, Any], node_id: int) -> dict[str, Any] | None:
+	if node['nodeId'] == node_id:
+		return node
+	for child in node.get('children', ()):
+		if found := _find(child, node_id):
+			return found
+	return None
+
+
+async def test_incremental_dom_reuses_document_patched_with_mutations():
+	service, chrome, cdp_session = _make_service()
+	await service._get_dom_document(TARGET_ID, cdp_session)  # type: ignore[arg-type]
+
+	await chrome.dom_event('attributeModified', nodeId=4, name='aria-label', value='Submit')
+	await chrome.dom_event('attributeModified', nodeId=4, name='id', value='submit')
+	await chrome.dom_event('characterDataModified', nodeId=5, characterData='Submit form')
+	await chrome.dom_event(
+		'childNodeInserted', parentNodeId=3, previousNodeId=4, node=_node(7, 'INPUT', attributes=['type', 'text'])
+	)
+	await chrome.dom_event('childNodeRemoved', parentNodeId=3, nodeId=6)
+
+	document = await service._get_dom_document(TARGET_ID, cdp_session)  # type: ignore[arg-type]
+	assert chrome.get_document_calls == 1
+
+	body = _find(document['root'], 3)
+	assert body is not None
+	assert [child['nodeName'] for child in body['children']] == ['BUTTON', 'INPUT']
+	assert body['children'][1]['parentId'] == 3
+	button = body['children'][0]
+	assert button['attributes'] == ['id', 'submit', 'aria-label', 'Submit']
+	assert button['children'][0]['nodeValue'] == 'Submit form'
+
+
+async def test_inserted_subtree_is_completed_with_request_child_nodes():
+	service, chrome, cdp_session = _make_service()
+	await service._get_dom_document(TARGET_ID, cdp_session)  # type: ignore[arg-type]
+
+	# Chrome reports inserted elements without their children
+	await chrome.dom_event('childNodeInserted', parentNodeId=6, previousNodeId=0, node={**_node(8, 'UL'), 'childNodeCount': 1})
+	chrome.child_nodes[8] = [_node(9, 'LI', [_text(10, 'item')])]
+
+	document = await service._get_dom_document(TARGET_ID, cdp_session)  # type: ignore[arg-type]
+	assert chrome.get_document_calls == 1
+	item = _find(document['root'], 10)
+	assert item is not None and item['nodeValue'] == 'item'
+
+
+async def test_incremental_dom_falls_back_to_full_fetch():
+	service, chrome, cdp_session = _make_service()
+	await service._get_dom_document(TARGET_ID, cdp_session)  # type: ignore[arg-type]
+
+	# Navigation replaces the document
+	await chrome.dom_event('documentUpdated')
+	await service._get_dom_document(TARGET_ID, cdp_session)  # type: ignore[arg-type]
+	assert chrome.get_document_calls == 2
+
+	# Mutation on a node we never saw
+	await chrome.dom_event('attributeModified', nodeId=999, name='class', value='x')
+	await service._get_dom_document(TARGET_ID, cdp_session)  # type: ignore[arg-type]
+	assert chrome.get_document_calls == 3
+
+	# Another caller ran DOM.getDocument and rebound all node ids
+	chrome.ids_rebound = True
+	await service._get_dom_document(TARGET_ID, cdp_session)  # type: ignore[arg-type]
+	assert chrome.get_document_calls == 4
+
+	# Nothing changed: no fetch at all
+	await service._get_dom_document(TARGET_ID, cdp_session)  # type: ignore[arg-type]
+	assert chrome.get_document_calls == 4
+
+
+async def test_mutation_during_full_fetch_forces_next_full_fetch():
+	service, chrome, cdp_session = _make_service()
+	original_send_raw = chrome.send_raw
+
+	async def send_raw_with_concurrent_mutation(method, params=None, session_id=None):
+		result = await original_send_raw(method, params, session_id)
+		if method == 'DOM.getDocument':
+			await chrome.dom_event('attributeModified', nodeId=4, name='class', value='late')
+		return result
+
+	chrome.send_raw = send_raw_with_concurrent_mutation  # type: ignore[method-assign]
+	document = await service._get_dom_document(TARGET_ID, cdp_session)  # type: ignore[arg-type]
+	assert document['root']['nodeId'] == 1
+
+	chrome.send_raw = original_send_raw  # type: ignore[method-assign]
+	await service._get_dom_document(TARGET_ID, cdp_session)  # type: ignore[arg-type]
+	assert chrome.get_document_calls == 2
+
+
+async def test_non_incremental_service_always_fetches():
+	service, chrome, cdp_session = _make_service()
+	service.incremental_dom = False
+	for _ in range(3):
+		await service._get_dom_document(TARGET_ID, cdp_session)  # type: ignore[arg-type]
+	assert chrome.get_document_calls == 3
+	assert service._mutation_tracker is None
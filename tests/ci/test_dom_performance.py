@@ -0,0 +1,531 @@
+"""
+Scaling benchmarks for the DOM serialization pipeline on large synthetic trees.
+
+These run without a browser: the enhanced DOM tree is built directly, shaped like a long feed or
+a big table (scrollable containers holding thousands of interactive rows).
+
+Usage:
+	uv run pytest tests/ci/test_dom_performance.py -v -s
+"""
+
+import dataclasses
+import gc
+import json
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from cdp_use.cdp.domsnapshot.commands import CaptureSnapshotReturns
+
+from browser_use.dom.enhanced_snapshot import build_snapshot_lookup
+from browser_use.dom.serializer.paint_order import Rect, RectUnionIndexed, RectUnionPure
+from browser_use.dom.serializer.serializer import DOMTreeSerializer
+from browser_use.dom.service import DomService
+from browser_use.dom.views import (
+	DOMRect,
+	EnhancedDOMTreeNode,
+	EnhancedSnapshotNode,
+	NodeType,
+	SerializedDOMState,
+	TargetAllTrees,
+)
+
+
+class SyntheticTreeBuilder:
+	"""Builds an EnhancedDOMTreeNode tree: document > html > body > sections > rows > (button + text)."""
+
+	def __init__(self, opaque: bool = False):
+		self._next_id = 1
+		# Opaque nodes have a background color, so they occlude what is painted below them
+		self._styles = {'display': 'block', 'visibility': 'visible', 'opacity': '1'}
+		if opaque:
+			self._styles['background-color'] = 'rgb(255, 255, 255)'
+
+	def _node(
+		self,
+		node_type: NodeType,
+		node_name: str,
+		parent: EnhancedDOMTreeNode | None,
+		*,
+		node_value: str = '',
+		attributes: dict[str, str] | None = None,
+		bounds: DOMRect | None = None,
+		is_scrollable: bool | None = None,
+		paint_order: int | None = None,
+	) -> EnhancedDOMTreeNode:
+		node_id = self._next_id
+		self._next_id += 1
+		snapshot = None
+		if bounds is not None:
+			snapshot = EnhancedSnapshotNode(
+				is_clickable=None,
+				cursor_style=None,
+				bounds=bounds,
+				clientRects=bounds,
+				scrollRects=None,
+				computed_styles=self._styles,
+				paint_order=paint_order if paint_order is not None else node_id,
+				stacking_contexts=None,
+			)
+		node = EnhancedDOMTreeNode(
+			node_id=node_id,
+			backend_node_id=node_id,
+			node_type=node_type,
+			node_name=node_name,
+			node_value=node_value,
+			attributes=attributes or {},
+			is_scrollable=is_scrollable,
+			is_visible=bounds is not None,
+			absolute_position=bounds,
+			target_id='synthetic-target',
+			frame_id=None,
+			session_id=None,
+			content_document=None,
+			shadow_root_type=None,
+			shadow_roots=None,
+			parent_node=parent,
+			children_nodes=[],
+			ax_node=None,
+			snapshot_node=snapshot,
+		)
+		if parent is not None:
+			assert parent.children_nodes is not None
+			parent.children_nodes.append(node)
+		return node
+
+	def build(self, total_nodes: int, rows_per_section: int = 100) -> EnhancedDOMTreeNode:
+		"""Build a tree with roughly `total_nodes` nodes (each row = row div + button + text)."""
+		document = self._node(NodeType.DOCUMENT_NODE, '#document', None)
+		html = self._node(NodeType.ELEMENT_NODE, 'HTML', document, bounds=DOMRect(0, 0, 1280, 100_000))
+		body = self._node(NodeType.ELEMENT_NODE, 'BODY', html, bounds=DOMRect(0, 0, 1280, 100_000), is_scrollable=True)
+
+		rows = max(1, (total_nodes - 3) // 3)
+		section: EnhancedDOMTreeNode | None = None
+		y = 0.0
+		for row_index in range(rows):
+			if row_index % rows_per_section == 0:
+				section = self._node(
+					NodeType.ELEMENT_NODE,
+					'DIV',
+					body,
+					attributes={'class': 'feed-section'},
+					bounds=DOMRect(0, y, 1280, 30.0 * rows_per_section),
+					is_scrollable=True,
+				)
+			row = self._node(NodeType.ELEMENT_NODE, 'DIV', section, bounds=DOMRect(0, y, 1280, 30))
+			button = self._node(
+				NodeType.ELEMENT_NODE,
+				'BUTTON',
+				row,
+				attributes={'type': 'button', 'aria-label': f'Row {row_index}'},
+				bounds=DOMRect(10, y + 5, 200, 20),
+			)
+			self._node(
+				NodeType.TEXT_NODE, '#text', button, node_value=f'Open row {row_index}', bounds=DOMRect(12, y + 6, 100, 16)
+			)
+			y += 30
+		return document
+
+
+def _serialize(root: EnhancedDOMTreeNode, previous_state: SerializedDOMState | None = None) -> tuple[SerializedDOMState, float]:
+	start = time.perf_counter()
+	state, _ = DOMTreeSerializer(root, previous_state, paint_order_filtering=False).serialize_accessible_elements()
+	return state, time.perf_counter() - start
+
+
+def _best_of(runs: int, fn) -> float:
+	return min(fn() for _ in range(runs))
+
+
+def test_serializer_new_node_marking_scales_linearly():
+	"""Serialization with a previous selector map must stay ~linear in the number of interactive nodes."""
+	small_root = SyntheticTreeBuilder().build(5_000)
+	large_root = SyntheticTreeBuilder().build(20_000)
+
+	# Previous state from the same page, so every interactive node is checked against the previous IDs
+	small_previous, _ = _serialize(small_root)
+	large_previous, _ = _serialize(large_root)
+	assert len(large_previous.selector_map) > 6_000
+
+	small_time = _best_of(3, lambda: _serialize(small_root, small_previous)[1])
+	large_time = _best_of(3, lambda: _serialize(large_root, large_previous)[1])
+
+	print(f'\nserialize 5k nodes: {small_time * 1000:.1f}ms, 20k nodes: {large_time * 1000:.1f}ms')
+	# 4x the nodes should cost ~4x the time; quadratic behaviour would be ~16x
+	assert large_time < small_time * 8, f'Serialization scaled super-linearly: {small_time:.3f}s -> {large_time:.3f}s'
+
+
+def test_serializer_marks_only_unseen_nodes_as_new():
+	root = SyntheticTreeBuilder().build(600)
+	previous_state, _ = _serialize(root)
+
+	# Nothing is new when re-serializing the same page
+	state, _ = _serialize(root, previous_state)
+	assert state.selector_map.keys() == previous_state.selector_map.keys()
+
+	# Drop half of the previous selector map: exactly those nodes become new
+	dropped = set(list(previous_state.selector_map)[::2])
+	partial_previous = SerializedDOMState(
+		_root=previous_state._root,
+		selector_map={k: v for k, v in previous_state.selector_map.items() if k not in dropped},
+	)
+	state, _ = _serialize(root, partial_previous)
+
+	new_ids = set()
+
+	def collect_new(node):
+		if node.is_new:
+			new_ids.add(node.original_node.backend_node_id)
+		for child in node.children:
+			collect_new(child)
+
+	assert state._root is not None
+	collect_new(state._root)
+	assert new_ids == dropped
+
+
+# --- Paint order rectangle union ---------------------------------------------------------------
+
+
+def _layered_page(kind: str, seed: int = 0) -> list[list[Rect]]:
+	"""Paint-order groups (top-most first, as PaintOrderRemover visits them) for a heavily layered page."""
+	rng = random.Random(seed)
+	groups: list[list[Rect]] = []
+
+	def rect(x: float, y: float, w: float, h: float) -> Rect:
+		return Rect(x, y, x + w, y + h)
+
+	if kind == 'card_grid':
+		# Sticky header + modal on top, then a grid of cards with nested content
+		groups.append([rect(0, 0, 1280, 64)])
+		groups.append([rect(340, 200, 600, 400)])
+		for row in range(25):
+			for col in range(6):
+				x, y = 20 + col * 210, 80 + row * 260
+				groups.append([rect(x + 10, y + 10, 180, 120), rect(x + 10, y + 140, 180, 20), rect(x + 10, y + 170, 90, 30)])
+				groups.append([rect(x, y, 200, 250)])
+	elif kind == 'dashboard':
+		# Many overlapping widgets of random size
+		for _ in range(600):
+			w, h = rng.uniform(40, 400), rng.uniform(20, 300)
+			groups.append([rect(rng.uniform(0, 1280 - w), rng.uniform(0, 2000), w, h) for _ in range(rng.randint(1, 3))])
+	elif kind == 'map':
+		# Markers on top of a tile layer
+		for _ in range(500):
+			groups.append([rect(rng.uniform(0, 1260), rng.uniform(0, 1000), 20, 20)])
+		for tx in range(0, 1280, 128):
+			for ty in range(0, 1024, 128):
+				groups.append([rect(tx, ty, 128, 128)])
+	else:
+		raise ValueError(kind)
+	return groups
+
+
+def _replay(union, groups: list[list[Rect]]) -> list[bool]:
+	"""Replay PaintOrderRemover's contains-then-batch-insert loop, returning every contains() answer."""
+	covered = []
+	for group in groups:
+		covered.extend(union.contains(r) for r in group)
+		union.add_many(group)
+	return covered
+
+
+def test_indexed_rect_union_matches_pure():
+	for kind in ('card_grid', 'dashboard', 'map'):
+		for seed in range(3):
+			groups = _layered_page(kind, seed)
+			assert _replay(RectUnionIndexed(), groups) == _replay(RectUnionPure(), groups), kind
+
+
+def test_indexed_rect_union_matches_pure_on_random_rects():
+	rng = random.Random(42)
+	for _ in range(20):
+		pure, indexed = RectUnionPure(), RectUnionIndexed()
+		for _ in range(150):
+			x, y = rng.uniform(-300, 1500), rng.uniform(-300, 1500)
+			# Mix of tiny, normal, huge and degenerate rectangles
+			w, h = rng.choice([0, 1, 50, 300, 2000, 100_000]), rng.choice([0, 1, 50, 300, 2000])
+			r = Rect(x, y, x + w, y + h)
+			assert indexed.contains(r) == pure.contains(r)
+			assert indexed.add(r) == pure.add(r)
+		assert sum(r.area() for r in indexed._rects) == pytest.approx(sum(r.area() for r in pure._rects))
+
+
+def test_paint_order_remover_same_result_for_both_unions():
+	builder = SyntheticTreeBuilder(opaque=True)
+	root = builder.build(3_000)
+	# Overlay covering the top half of the page, painted above everything else
+	body = root.children_nodes[0].children_nodes[0]  # type: ignore[index]
+	builder._node(NodeType.ELEMENT_NODE, 'DIV', body, bounds=DOMRect(0, 0, 1280, 15_000), paint_order=10**9)
+
+	results = {}
+	for impl in ('pure', 'indexed'):
+		state, _ = DOMTreeSerializer(root, paint_order_union=impl).serialize_accessible_elements()
+		results[impl] = sorted(node.backend_node_id for node in state.selector_map.values())
+	assert results['pure'] == results['indexed']
+	assert 0 < len(results['indexed']) < 1_000
+
+
+def test_indexed_rect_union_benchmark():
+	for kind in ('card_grid', 'dashboard', 'map'):
+		groups = _layered_page(kind)
+		pure_time = _best_of(1, lambda: _timed(lambda: _replay(RectUnionPure(), groups)))
+		indexed_time = _best_of(2, lambda: _timed(lambda: _replay(RectUnionIndexed(), groups)))
+		print(f'\n{kind}: pure {pure_time * 1000:.1f}ms, indexed {indexed_time * 1000:.1f}ms')
+		assert indexed_time < pure_time, kind
+
+
+def _timed(fn) -> float:
+	start = time.perf_counter()
+	fn()
+	return time.perf_counter() - start
+
+
+# --- Snapshot lookup -------------------------------------------------------------------------
+
+
+def _snapshot(node_count: int, device_pixel_ratio: float = 1.0) -> CaptureSnapshotReturns:
+	"""CDP DOMSnapshot with a layout object for every other node and two distinct style combinations."""
+	strings = ['block', 'visible', '1', 'auto', 'pointer', 'static', 'rgba(0, 0, 0, 0)']
+	laid_out = range(0, node_count, 2)
+	return {
+		'strings': strings,
+		'documents': [
+			{
+				'nodes': {
+					'backendNodeId': list(range(1, node_count + 1)),
+					'isClickable': {'index': list(range(0, node_count, 7))},
+				},
+				'layout': {
+					'nodeIndex': list(laid_out),
+					'bounds': [[i * device_pixel_ratio, 2 * i * device_pixel_ratio, 10, 20] for i in laid_out],
+					'styles': [[0, 1, 2, 3, 3, 3, 4 if i % 4 == 0 else 3, 3, 5, 6] for i in laid_out],
+					'paintOrders': [i // 2 for i in laid_out],
+					'clientRects': [[] for _ in laid_out],
+					'scrollRects': [[0, 0, 10, 20] if i == 0 else [] for i in laid_out],
+					'stackingContexts': {'index': [0]},
+				},
+				'text': {'index': [], 'value': []},
+			}  # type: ignore[typeddict-item]
+		],
+	}
+
+
+def test_snapshot_lookup_values_and_laziness():
+	lookup = build_snapshot_lookup(_snapshot(1_000, device_pixel_ratio=2.0), device_pixel_ratio=2.0)
+	assert len(lookup) == 1_000 and 1 in lookup and 1_001 not in lookup
+	assert lookup.materialized_count == 0
+
+	first = lookup[1]  # snapshot index 0: laid out, clickable, pointer cursor
+	assert first.is_clickable is True
+	assert first.bounds is not None and (first.bounds.x, first.bounds.y, first.bounds.width) == (0, 0, 5)
+	assert first.cursor_style == 'pointer' and first.paint_order == 0
+	assert first.scrollRects is not None and first.scrollRects.height == 20
+	assert first.computed_styles is not None and first.computed_styles['display'] == 'block'
+
+	no_layout = lookup[2]  # snapshot index 1 has no layout object
+	assert no_layout.bounds is None and no_layout.computed_styles is None and no_layout.is_clickable is False
+
+	laid_out = lookup[3]
+	assert laid_out.bounds is not None and laid_out.bounds.y == 2 * 2
+	assert laid_out.cursor_style == 'auto'
+
+	assert lookup.get(1_001) is None
+	assert lookup[1] is first  # views are cached
+	assert lookup.materialized_count == 3
+	# nodes with identical style indices share one styles dict
+	assert lookup[5].computed_styles is first.computed_styles
+
+
+def test_snapshot_lookup_benchmark():
+	snapshot = _snapshot(50_000)
+	build_time = _best_of(3, lambda: _timed(lambda: build_snapshot_lookup(snapshot)))
+	lookup = build_snapshot_lookup(snapshot)
+	materialize_time = _timed(lambda: [lookup.get(backend_node_id) for backend_node_id in range(1, 50_001)])
+	print(f'\nsnapshot lookup 50k nodes: build {build_time * 1000:.1f}ms, materialize all {materialize_time * 1000:.1f}ms')
+	assert build_time < 0.5
+	assert materialize_time < 3.0
+
+
+# --- Enhanced DOM tree memory ---------------------------------------------------------------
+
+
+def _cdp_trees(rows: int) -> TargetAllTrees:
+	"""Raw CDP payloads (DOM.getDocument, DOMSnapshot, AX tree) for a page of `rows` list items with links."""
+	next_id = iter(range(1, 10**9))
+	layout_nodes: list[int] = []
+
+	def node(name: str, children: list | None = None, node_type: int = 1, value: str = '', attributes: list | None = None):
+		node_id = next(next_id)
+		data: dict[str, Any] = {
+			'nodeId': node_id,
+			'backendNodeId': node_id,
+			'nodeType': node_type,
+			'nodeName': name,
+			'localName': name.lower(),
+			'nodeValue': value,
+			'attributes': attributes or [],
+		}
+		if children is not None:
+			data['children'] = children
+			data['childNodeCount'] = len(children)
+			for child in children:
+				child['parentId'] = node_id
+		layout_nodes.append(node_id)
+		return data
+
+	items = [
+		node(
+			'LI',
+			[
+				node(
+					'A', [node('#text', node_type=3, value=f'Item {i}')], attributes=['href', f'/item/{i}', 'class', 'item-link']
+				),
+				node('SPAN', [node('#text', node_type=3, value='details')], attributes=['class', 'meta']),
+			],
+			attributes=['class', 'row'],
+		)
+		for i in range(rows)
+	]
+	body = node('BODY', [node('UL', items)])
+	root = node('#document', [node('HTML', [body], attributes=['lang', 'en'])], node_type=9)
+
+	strings = ['block', 'visible', '1', 'auto', 'pointer', 'static', 'rgba(0, 0, 0, 0)']
+	backend_ids = sorted(layout_nodes)
+	snapshot = {
+		'strings': strings,
+		'documents': [
+			{
+				'nodes': {'backendNodeId': backend_ids, 'isClickable': {'index': []}},
+				'layout': {
+					'nodeIndex': list(range(len(backend_ids))),
+					'bounds': [[0, 20 * i, 800, 20] for i in range(len(backend_ids))],
+					'styles': [[0, 1, 2, 3, 3, 3, 3, 3, 5, 6] for _ in backend_ids],
+					'paintOrders': list(range(len(backend_ids))),
+					'clientRects': [[] for _ in backend_ids],
+					'scrollRects': [[] for _ in backend_ids],
+					'stackingContexts': {'index': [0]},
+				},
+			}
+		],
+	}
+	return TargetAllTrees(
+		snapshot=snapshot,  # type: ignore[arg-type]
+		dom_tree={'root': root},  # type: ignore[typeddict-item]
+		ax_tree={'nodes': []},
+		device_pixel_ratio=1.0,
+		cdp_timing={},
+	)
+
+
+async def test_enhanced_dom_tree_memory_per_node():
+	"""Bytes retained per EnhancedDOMTreeNode once the raw CDP payloads are gone (like after a real step)."""
+	# Decode from JSON inside the measured window so strings are fresh objects, as with real CDP messages
+	payload = json.dumps(dataclasses.asdict(_cdp_trees(rows=4_000)))
+	cdp_session = SimpleNamespace(session_id='session-1')
+
+	async def get_or_create_cdp_session(target_id, focus=False):
+		return cdp_session
+
+	browser_session = SimpleNamespace(logger=logging.getLogger('test'), get_or_create_cdp_session=get_or_create_cdp_session)
+	service = DomService(browser_session)  # type: ignore[arg-type]
+
+	gc.collect()
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+
+	pending = [TargetAllTrees(**json.loads(payload))]
+	node_count = len(pending[0].snapshot['documents'][0]['nodes']['backendNodeId'])
+
+	async def get_all_trees(target_id):
+		return pending.pop()  # hand over the only reference, so the payload is freed after the build
+
+	service._get_all_trees = get_all_trees  # type: ignore[method-assign]
+	root, _ = await service.get_dom_tree(target_id='target-1')
+	gc.collect()
+	retained = tracemalloc.get_traced_memory()[0] - before
+	tracemalloc.stop()
+
+	bytes_per_node = retained / node_count
+	print(f'\nenhanced DOM tree: {node_count} nodes, {bytes_per_node:.0f} bytes/node retained')
+	assert root.node_type == NodeType.DOCUMENT_NODE
+	# ~1100 bytes/node before interning names and lazily allocating uuid/compound children, ~900 after
+	assert bytes_per_node < 1_000
+
+
+# --- Child iteration -----------------------------------------------------------------------------
+
+
+def _attach_shadow_root(builder: SyntheticTreeBuilder, host: EnhancedDOMTreeNode) -> EnhancedDOMTreeNode:
+	shadow_root = builder._node(NodeType.DOCUMENT_FRAGMENT_NODE, '#document-fragment', None)
+	shadow_root.parent_node = host
+	host.shadow_roots = (host.shadow_roots or []) + [shadow_root]
+	builder._node(NodeType.ELEMENT_NODE, 'SLOT', shadow_root, bounds=DOMRect(0, 0, 10, 10))
+	return shadow_root
+
+
+def test_iter_children_and_shadow_roots_matches_property():
+	builder = SyntheticTreeBuilder()
+	document = builder.build(30)
+	body = document.children[0].children[0]
+	row = body.children[0].children[0]
+	leaf = row.children[0].children[0]
+	shadow_only = builder._node(NodeType.ELEMENT_NODE, 'DIV', body)
+	shadow_root = _attach_shadow_root(builder, shadow_only)
+	_attach_shadow_root(builder, row)
+
+	for node in (document, body, row, leaf, shadow_only, shadow_root):
+		assert list(node.iter_children_and_shadow_roots()) == node.children_and_shadow_roots
+	# Without shadow roots nothing is allocated: it's the children list itself
+	assert body.iter_children_and_shadow_roots() is body.children_nodes
+	assert shadow_only.iter_children_and_shadow_roots() is shadow_only.shadow_roots
+	assert list(leaf.iter_children_and_shadow_roots()) == []
+
+
+def _bytes_allocated_by_children_of(root: EnhancedDOMTreeNode, node_count: int, children_of) -> int:
+	"""Walks the tree keeping whatever children_of returned alive, so the garbage it would leave is measured."""
+	kept: list[Any] = [None] * node_count
+	stack = [root]
+	gc.collect()
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	stack_size = sys.getsizeof(stack)
+	visited = 0
+	while stack:
+		node = stack.pop()
+		children = children_of(node)
+		kept[visited] = children
+		visited += 1
+		stack.extend(children)
+	allocated = tracemalloc.get_traced_memory()[0] - before - (sys.getsizeof(stack) - stack_size)
+	tracemalloc.stop()
+	assert visited == node_count
+	return allocated
+
+
+def test_child_iteration_allocation_benchmark(monkeypatch):
+	builder = SyntheticTreeBuilder()
+	root = builder.build(50_000)
+	body = root.children[0].children[0]
+	for section in body.children[::10]:
+		_attach_shadow_root(builder, section.children[0])
+	node_count = builder._next_id - 1
+
+	copied = _bytes_allocated_by_children_of(root, node_count, lambda node: node.children_and_shadow_roots)
+	iterated = _bytes_allocated_by_children_of(root, node_count, lambda node: node.iter_children_and_shadow_roots())
+
+	serialize_time = _best_of(3, lambda: _serialize(root)[1])
+	monkeypatch.setattr(EnhancedDOMTreeNode, 'iter_children_and_shadow_roots', lambda node: node.children_and_shadow_roots)
+	copying_serialize_time = _best_of(3, lambda: _serialize(root)[1])
+
+	print(
+		f'\n{node_count} nodes, garbage per traversal: list copies {copied / 1024:.0f}KB, '
+		f'iteration {iterated / 1024:.1f}KB; serialize with copies {copying_serialize_time * 1000:.0f}ms, '
+		f'without {serialize_time * 1000:.0f}ms'
+	)
+	assert iterated * 50 < copied
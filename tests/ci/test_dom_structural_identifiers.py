@@ -0,0 +1,226 @@
+"""
+Tests for the xpaths, element hashes and parent branch hashes of EnhancedDOMTreeNode.
+
+They are memoized per node and derived from the parent's memoized value plus the node's own segment, instead of every
+access walking up to the root (and rescanning siblings). Random trees with shadow roots and iframe documents, accessed
+in different orders, are checked against the per-node computation used before (`_reference_*` below), and both are
+benchmarked on a deep tree.
+
+Usage:
+	uv run pytest tests/ci/test_dom_structural_identifiers.py -v -s
+"""
+
+import hashlib
+import random
+import time
+
+import pytest
+
+from browser_use.dom.views import STATIC_ATTRIBUTES, EnhancedDOMTreeNode, NodeType, _fast_hash
+
+
+def _reference_branch_path(node: EnhancedDOMTreeNode) -> str:
+	tags = []
+	current = node
+	while current is not None:
+		if current.node_type == NodeType.ELEMENT_NODE:
+			tags.append(current.tag_name)
+		current = current.parent_node
+	return '/'.join(reversed(tags))
+
+
+def _sha256_hash(data: str) -> int:
+	return int(hashlib.sha256(data.encode()).hexdigest()[:16], 16)
+
+
+def _reference_element_hash(node: EnhancedDOMTreeNode, hash_function=_sha256_hash) -> int:
+	"""What hash(node) (and so element_hash) returned: hash() folds __hash__ values that don't fit in Py_ssize_t."""
+	attributes = ''.join(f'{k}={v}' for k, v in sorted((k, v) for k, v in node.attributes.items() if k in STATIC_ATTRIBUTES))
+	value = hash_function(f'{_reference_branch_path(node)}|{attributes}')
+	return value if value < 2**63 else hash(value)
+
+
+def _reference_parent_branch_hash(node: EnhancedDOMTreeNode, hash_function=_sha256_hash) -> int:
+	return hash_function(_reference_branch_path(node))
+
+
+def _reference_position(element: EnhancedDOMTreeNode) -> int:
+	if not element.parent_node or not element.parent_node.children_nodes:
+		return 0
+	same_tag_siblings = [
+		child
+		for child in element.parent_node.children_nodes
+		if child.node_type == NodeType.ELEMENT_NODE and child.node_name.lower() == element.node_name.lower()
+	]
+	if len(same_tag_siblings) <= 1:
+		return 0
+	try:
+		return same_tag_siblings.index(element) + 1
+	except ValueError:
+		return 0
+
+
+def _reference_xpath(node: EnhancedDOMTreeNode) -> str:
+	segments = []
+	current = node
+	while current and current.node_type in (NodeType.ELEMENT_NODE, NodeType.DOCUMENT_FRAGMENT_NODE):
+		if current.node_type == NodeType.DOCUMENT_FRAGMENT_NODE:
+			current = current.parent_node
+			continue
+		if current.parent_node and current.parent_node.node_name.lower() == 'iframe':
+			break
+		position = _reference_position(current)
+		segments.insert(0, f'{current.node_name.lower()}{f"[{position}]" if position > 0 else ""}')
+		current = current.parent_node
+	return '/'.join(segments)
+
+
+def _node(node_type: NodeType, node_name: str, parent: EnhancedDOMTreeNode | None, **attributes: str) -> EnhancedDOMTreeNode:
+	node = EnhancedDOMTreeNode(
+		node_id=0,
+		backend_node_id=0,
+		node_type=node_type,
+		node_name=node_name,
+		node_value='',
+		attributes=attributes,
+		is_scrollable=None,
+		is_visible=True,
+		absolute_position=None,
+		target_id='test-target',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=parent,
+		children_nodes=[],
+		ax_node=None,
+		snapshot_node=None,
+	)
+	if parent is not None and parent.children_nodes is not None and node_type != NodeType.DOCUMENT_FRAGMENT_NODE:
+		parent.children_nodes.append(node)
+	return node
+
+
+_TAGS = ['DIV', 'SPAN', 'A', 'LI', 'BUTTON', 'INPUT', 'IFRAME', 'svg', 'linearGradient', 'lineargradient']
+_ATTRIBUTES = [{}, {'id': 'main'}, {'class': 'btn primary', 'style': 'color: red'}, {'name': 'q', 'data-x': '1'}]
+
+
+def _random_tree(rng: random.Random, max_depth: int = 7) -> EnhancedDOMTreeNode:
+	document = _node(NodeType.DOCUMENT_NODE, '#document', None)
+	html = _node(NodeType.ELEMENT_NODE, 'HTML', document)
+
+	def fill(parent: EnhancedDOMTreeNode, depth: int) -> None:
+		for _ in range(rng.randint(0, 4 if depth < max_depth else 0)):
+			kind = rng.random()
+			if kind < 0.2:
+				_node(NodeType.TEXT_NODE, '#text', parent)
+			elif kind < 0.25:
+				_node(NodeType.COMMENT_NODE, '#comment', parent)
+			elif kind < 0.3 and parent.node_type == NodeType.ELEMENT_NODE:
+				shadow_root = _node(NodeType.DOCUMENT_FRAGMENT_NODE, '#document-fragment', parent)
+				parent.shadow_roots = (parent.shadow_roots or []) + [shadow_root]
+				fill(shadow_root, depth + 1)
+			else:
+				element = _node(NodeType.ELEMENT_NODE, rng.choice(_TAGS), parent, **rng.choice(_ATTRIBUTES))
+				if element.tag_name == 'iframe' and rng.random() < 0.7:
+					content_document = _node(NodeType.DOCUMENT_NODE, '#document', element)
+					element.content_document = content_document
+					fill(_node(NodeType.ELEMENT_NODE, 'HTML', content_document), depth + 1)
+				fill(element, depth + 1)
+
+	fill(html, 0)
+	return document
+
+
+def _all_nodes(root: EnhancedDOMTreeNode) -> list[EnhancedDOMTreeNode]:
+	nodes, stack = [], [root]
+	while stack:
+		node = stack.pop()
+		nodes.append(node)
+		stack.extend(node.children_and_shadow_roots)
+		if node.content_document is not None:
+			stack.append(node.content_document)
+	return nodes
+
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('order', ['top_down', 'bottom_up', 'random'])
+def test_identifiers_match_per_node_computation(seed: int, order: str):
+	rng = random.Random(seed)
+	nodes = _all_nodes(_random_tree(rng))
+	if order == 'bottom_up':
+		nodes.reverse()
+	elif order == 'random':
+		rng.shuffle(nodes)
+
+	for node in nodes:
+		assert node.xpath == _reference_xpath(node)
+		assert node.element_hash == hash(node) == _reference_element_hash(node)
+		assert node.parent_branch_hash() == _reference_parent_branch_hash(node)
+
+
+def test_identifiers_are_memoized_from_the_parent():
+	root = _random_tree(random.Random(0))
+	deepest = max(_all_nodes(root), key=lambda node: len(_reference_branch_path(node)))
+	deepest.xpath, deepest.element_hash, deepest.parent_branch_hash()
+
+	ancestor = deepest.parent_node
+	while ancestor is not None:
+		assert ancestor._xpath == _reference_xpath(ancestor)
+		assert ancestor._branch_path == _reference_branch_path(ancestor)
+		assert ancestor._element_hash is None  # hashed only when asked for
+		ancestor = ancestor.parent_node
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_fast_hash_option(seed: int, monkeypatch):
+	monkeypatch.setenv('BROWSER_USE_DOM_HASH', 'fast')
+	nodes = _all_nodes(_random_tree(random.Random(seed)))
+
+	for node in nodes:
+		assert node.element_hash == _reference_element_hash(node, _fast_hash)
+		assert node.parent_branch_hash() == _reference_parent_branch_hash(node, _fast_hash)
+
+	elements = [node for node in nodes if node.node_type == NodeType.ELEMENT_NODE]
+	distinct_identities = {(_reference_branch_path(node), node._static_attributes_string()) for node in elements}
+	assert len({node.element_hash for node in elements}) == len(distinct_identities)
+
+
+def test_unknown_hash_algorithm_is_rejected(monkeypatch):
+	monkeypatch.setenv('BROWSER_USE_DOM_HASH', 'md5')
+	with pytest.raises(ValueError, match='Unknown BROWSER_USE_DOM_HASH'):
+		hash(_random_tree(random.Random(0)))
+
+
+def test_deep_tree_benchmark(monkeypatch):
+	document = _node(NodeType.DOCUMENT_NODE, '#document', None)
+	parent = _node(NodeType.ELEMENT_NODE, 'HTML', document)
+	for _ in range(300):
+		for i in range(10):
+			sibling = _node(NodeType.ELEMENT_NODE, 'DIV', parent, **{'class': f'row-{i}'})
+			_node(NodeType.TEXT_NODE, '#text', sibling)
+		parent = sibling
+	nodes = _all_nodes(document)
+
+	start = time.perf_counter()
+	expected = [(_reference_xpath(node), _reference_element_hash(node), _reference_parent_branch_hash(node)) for node in nodes]
+	reference_time = time.perf_counter() - start
+
+	timings = {}
+	for algorithm in ['sha256', 'fast']:
+		monkeypatch.setenv('BROWSER_USE_DOM_HASH', algorithm)
+		for node in nodes:
+			node._xpath = node._branch_path = node._element_hash = node._parent_branch_hash = None
+		start = time.perf_counter()
+		actual = [(node.xpath, node.element_hash, node.parent_branch_hash()) for node in reversed(nodes)]
+		timings[algorithm] = time.perf_counter() - start
+		if algorithm == 'sha256':
+			assert actual[::-1] == expected
+
+	print(
+		f'\n{len(nodes)} nodes, depth 300: per node {reference_time * 1000:.0f}ms, '
+		f'memoized {timings["sha256"] * 1000:.0f}ms with sha256 ({reference_time / timings["sha256"]:.0f}x faster), '
+		f'{timings["fast"] * 1000:.0f}ms with the fast hash'
+	)
+	assert timings['sha256'] < reference_time
@@ -0,0 +1,173 @@
+"""
+Tests for the deadline budget and task cleanup of DOMWatchdog.on_BrowserStateRequestEvent.
+
+The browser session is replaced with a fake whose queries can be made to hang, so no browser is needed.
+
+Usage:
+	uv run pytest tests/ci/test_dom_watchdog_state_capture.py -v -s
+"""
+
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from browser_use.browser.events import BrowserStateRequestEvent
+from browser_use.browser.views import PageInfo, TabInfo
+from browser_use.browser.watchdogs.dom_watchdog import DOMWatchdog
+from browser_use.dom.views import SerializedDOMState
+
+PAGE_INFO = PageInfo(
+	viewport_width=800,
+	viewport_height=600,
+	page_width=800,
+	page_height=600,
+	scroll_x=0,
+	scroll_y=0,
+	pixels_above=0,
+	pixels_below=0,
+	pixels_left=0,
+	pixels_right=0,
+)
+
+
+class FakeQueries:
+	"""The browser queries of a state request; the ones listed in `hanging` never return until cancelled."""
+
+	def __init__(self, *hanging: str):
+		self.hanging = set(hanging)
+		self.cancelled: set[str] = set()
+
+	async def run(self, name: str, result):
+		if name in self.hanging:
+			try:
+				await asyncio.Event().wait()
+			except asyncio.CancelledError:
+				self.cancelled.add(name)
+				raise
+		return result
+
+
+@pytest.fixture
+def queries(monkeypatch) -> FakeQueries:
+	queries = FakeQueries()
+
+	async def get_pending_network_requests(self):
+		return await queries.run('pending_requests', [])
+
+	async def build_dom_tree(self, previous_state=None):
+		return await queries.run('dom', SerializedDOMState(_root=None, selector_map={}))
+
+	async def capture_screenshot(self):
+		return await queries.run('screenshot', 'c2NyZWVuc2hvdA==')
+
+	async def get_page_info(self):
+		return await queries.run('page_info', PAGE_INFO)
+
+	monkeypatch.setattr(DOMWatchdog, '_get_pending_network_requests', get_pending_network_requests)
+	monkeypatch.setattr(DOMWatchdog, '_build_dom_tree_without_highlights', build_dom_tree)
+	monkeypatch.setattr(DOMWatchdog, '_capture_clean_screenshot', capture_screenshot)
+	monkeypatch.setattr(DOMWatchdog, '_get_page_info', get_page_info)
+	return queries
+
+
+@pytest.fixture
+def watchdog(queries: FakeQueries) -> DOMWatchdog:
+	async def get_current_page_url():
+		return 'https://example.com'
+
+	async def get_tabs():
+		return await queries.run('tabs', [TabInfo(url='https://example.com', title='Example', target_id='0' * 32)])
+
+	async def get_current_page_title():
+		return await queries.run('title', 'Example')
+
+	session = SimpleNamespace(
+		logger=logging.getLogger('test'),
+		agent_focus_target_id=None,
+		get_current_page_url=get_current_page_url,
+		get_tabs=get_tabs,
+		get_current_page_title=get_current_page_title,
+		_cached_browser_state_summary=None,
+		_closed_popup_messages=[],
+		browser_profile=SimpleNamespace(dom_highlight_elements=False, viewport={'width': 1280, 'height': 720}),
+		llm_screenshot_size=None,
+	)
+	return DOMWatchdog.model_construct(browser_session=session, event_bus=None)  # type: ignore[arg-type]
+
+
+async def test_state_is_captured_when_nothing_hangs(watchdog: DOMWatchdog, queries: FakeQueries):
+	state = await watchdog.on_BrowserStateRequestEvent(BrowserStateRequestEvent())
+
+	assert state.title == 'Example'
+	assert [tab.url for tab in state.tabs] == ['https://example.com']
+	assert state.screenshot == 'c2NyZWVuc2hvdA=='
+	assert state.page_info == PAGE_INFO
+	assert queries.cancelled == set()
+
+
+@pytest.mark.parametrize(
+	'hanging, title, tab_count, has_screenshot',
+	[
+		(('dom',), 'Example', 1, True),
+		(('screenshot', 'title', 'page_info'), 'Page', 1, False),
+		# Hanging before the DOM build uses up the whole budget: the later queries get no time (None: not checked)
+		(('tabs',), None, 0, None),
+		(('pending_requests',), None, None, None),
+	],
+)
+async def test_whole_capture_shares_one_deadline(
+	watchdog: DOMWatchdog,
+	queries: FakeQueries,
+	hanging: tuple[str, ...],
+	title: str | None,
+	tab_count: int | None,
+	has_screenshot: bool | None,
+):
+	queries.hanging.update(hanging)
+	event = BrowserStateRequestEvent(event_timeout=2.0)  # too short for the margin, so the capture gets half: 1s
+
+	start = time.perf_counter()
+	state = await watchdog.on_BrowserStateRequestEvent(event)
+	elapsed = time.perf_counter() - start
+
+	assert 0.9 < elapsed < 1.5
+	assert title is None or state.title == title
+	assert tab_count is None or len(state.tabs) == tab_count
+	assert has_screenshot is None or (state.screenshot is not None) == has_screenshot
+	assert state.dom_state.selector_map == {}
+	# Queries still pending at the deadline are cancelled (those started after it may be cancelled before they ran)
+	assert hanging[0] in queries.cancelled and queries.cancelled <= set(hanging)
+
+
+async def test_cancelled_handler_cancels_its_queries(watchdog: DOMWatchdog, queries: FakeQueries):
+	queries.hanging.update({'tabs', 'pending_requests'})
+
+	handler = asyncio.create_task(watchdog.on_BrowserStateRequestEvent(BrowserStateRequestEvent()))
+	await asyncio.sleep(0.1)
+	handler.cancel()
+	with pytest.raises(asyncio.CancelledError):
+		await handler
+
+	assert queries.cancelled == {'tabs', 'pending_requests'}
+
+
+async def test_llm_screenshot_is_a_separate_capture(watchdog: DOMWatchdog, queries: FakeQueries, monkeypatch):
+	sizes = []
+
+	async def capture_llm_screenshot(self, size):
+		sizes.append(size)
+		return await queries.run('llm_screenshot', 'bGxtLXNjcmVlbnNob3Q=')
+
+	monkeypatch.setattr(DOMWatchdog, '_capture_llm_screenshot', capture_llm_screenshot)
+
+	state = await watchdog.on_BrowserStateRequestEvent(BrowserStateRequestEvent())
+	assert state.llm_screenshot is None
+	assert sizes == []
+
+	state = await watchdog.on_BrowserStateRequestEvent(BrowserStateRequestEvent(llm_screenshot_size=(640, 360)))
+	assert state.screenshot == 'c2NyZWVuc2hvdA=='  # the shared screenshot stays at full resolution
+	assert state.llm_screenshot == 'bGxtLXNjcmVlbnNob3Q='
+	assert sizes == [(640, 360)]
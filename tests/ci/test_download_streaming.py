@@ -0,0 +1,136 @@
+"""
+Tests for DownloadsWatchdog streaming in-page downloads to disk through CDP IO.read instead of a JSON int array.
+
+A CDPClient subclass answers the Runtime / IO commands locally, serving the "fetched" body as base64 chunks.
+
+Usage:
+	uv run pytest tests/ci/test_download_streaming.py -v -s
+"""
+
+import asyncio
+import base64
+import logging
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from bubus import EventBus
+from cdp_use import CDPClient
+
+from browser_use.browser.events import FileDownloadProgressEvent
+from browser_use.browser.watchdogs.downloads_watchdog import DownloadsWatchdog
+
+BODY = bytes(range(256)) * 40  # 10240 bytes of binary data
+
+
+class FakeChrome(CDPClient):
+	"""CDP client serving one in-page fetch result as a Blob readable through IO.read."""
+
+	def __init__(self, body: bytes, fail_after_reads: int | None = None, stall_after_reads: int | None = None):
+		super().__init__('ws://127.0.0.1:0')
+		self.body = body
+		self.fail_after_reads = fail_after_reads
+		self.stall_after_reads = stall_after_reads
+		self.position = 0
+		self.read_sizes: list[int] = []
+		self.commands: list[str] = []
+
+	async def send_raw(self, method: str, params: Any = None, session_id: str | None = None) -> dict[str, Any]:
+		self.commands.append(method)
+		if method == 'Runtime.evaluate':
+			assert 'Array.from' not in params['expression']
+			return {'result': {'type': 'object', 'objectId': 'response-1'}}
+		if method == 'Runtime.callFunctionOn':
+			if params.get('returnByValue'):
+				value = {'size': len(self.body), 'contentType': 'application/pdf', 'fromCache': True}
+				return {'result': {'type': 'object', 'value': value}}
+			return {'result': {'type': 'object', 'subtype': 'blob', 'objectId': 'blob-1'}}
+		if method == 'IO.resolveBlob':
+			assert params['objectId'] == 'blob-1'
+			return {'uuid': 'uuid-1'}
+		if method == 'IO.read':
+			assert params['handle'] == 'blob:uuid-1'
+			if self.fail_after_reads is not None and len(self.read_sizes) >= self.fail_after_reads:
+				raise RuntimeError('Target closed')
+			if self.stall_after_reads is not None and len(self.read_sizes) >= self.stall_after_reads:
+				await asyncio.Event().wait()  # the stream stops sending data
+			self.read_sizes.append(params['size'])
+			chunk = self.body[self.position : self.position + params['size']]
+			self.position += len(chunk)
+			return {'base64Encoded': True, 'data': base64.b64encode(chunk).decode(), 'eof': self.position >= len(self.body)}
+		if method in ('IO.close', 'Runtime.releaseObjectGroup'):
+			return {}
+		raise AssertionError(f'unexpected CDP command {method}')
+
+
+def _make_watchdog(chunk_size: int) -> tuple[DownloadsWatchdog, EventBus]:
+	event_bus = EventBus()
+	browser_session = SimpleNamespace(
+		browser_profile=SimpleNamespace(download_chunk_size=chunk_size), logger=logging.getLogger('test')
+	)
+	watchdog = DownloadsWatchdog.model_construct(event_bus=event_bus, browser_session=browser_session)
+	return watchdog, event_bus
+
+
+async def test_download_is_streamed_to_disk_in_chunks(tmp_path):
+	watchdog, event_bus = _make_watchdog(chunk_size=4096)
+	chrome = FakeChrome(BODY)
+	progress: list[FileDownloadProgressEvent] = []
+
+	def on_progress(event: FileDownloadProgressEvent) -> None:
+		progress.append(event)
+
+	event_bus.on(FileDownloadProgressEvent, on_progress)
+
+	path = tmp_path / 'report.pdf'
+	result = await watchdog._stream_url_to_file(
+		SimpleNamespace(cdp_client=chrome, session_id='session-1'),  # type: ignore[arg-type]
+		'https://example.com/report.pdf',
+		path,
+		force_cache=True,
+	)
+	await event_bus.wait_until_idle()
+
+	assert path.read_bytes() == BODY
+	assert result == {'size': len(BODY), 'contentType': 'application/pdf', 'fromCache': True}
+	assert chrome.read_sizes == [4096, 4096, 4096]
+	assert [event.bytes_written for event in progress] == [4096, 8192, len(BODY)]
+	assert all(event.total_bytes == len(BODY) for event in progress)
+	assert chrome.commands[-2:] == ['IO.close', 'Runtime.releaseObjectGroup']
+	await event_bus.stop()
+
+
+async def test_failed_stream_removes_partial_file(tmp_path):
+	watchdog, event_bus = _make_watchdog(chunk_size=1024)
+	chrome = FakeChrome(BODY, fail_after_reads=2)
+
+	path = tmp_path / 'export.csv'
+	with pytest.raises(RuntimeError, match='Target closed'):
+		await watchdog._stream_url_to_file(
+			SimpleNamespace(cdp_client=chrome, session_id='session-1'),  # type: ignore[arg-type]
+			'https://example.com/export.csv',
+			path,
+		)
+
+	assert not path.exists()
+	assert 'IO.close' in chrome.commands and chrome.commands[-1] == 'Runtime.releaseObjectGroup'
+	await event_bus.stop()
+
+
+async def test_timeout_bounds_the_whole_transfer(tmp_path):
+	watchdog, event_bus = _make_watchdog(chunk_size=1024)
+	chrome = FakeChrome(BODY, stall_after_reads=3)
+
+	path = tmp_path / 'stalled.pdf'
+	with pytest.raises(TimeoutError):
+		await watchdog._stream_url_to_file(
+			SimpleNamespace(cdp_client=chrome, session_id='session-1'),  # type: ignore[arg-type]
+			'https://example.com/stalled.pdf',
+			path,
+			timeout=0.3,
+		)
+
+	assert len(chrome.read_sizes) == 3  # the fetch finished, then the reads stalled
+	assert not path.exists()
+	assert chrome.commands[-2:] == ['IO.close', 'Runtime.releaseObjectGroup']
+	await event_bus.stop()
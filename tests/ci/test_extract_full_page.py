@@ -0,0 +1,90 @@
+"""
+Tests for the full page (map-reduce) mode of the extract action: structural chunking of the page markdown,
+concurrent chunk queries and the merge pass.
+
+Usage:
+	uv run pytest tests/ci/test_extract_full_page.py -v -s
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from browser_use.dom.markdown_extractor import split_markdown_into_chunks
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.messages import SystemMessage
+from browser_use.tools.service import EXTRACTION_MAP_SYSTEM_PROMPT, NO_RELEVANT_CONTENT, _extract_full_page
+
+
+def test_chunks_break_before_headings():
+	content = '# Shoes\n- Sneaker\n- Boot\n# Hats\n- Cap\n# Bags\n- Tote'
+
+	chunks = split_markdown_into_chunks(content, 30)
+
+	assert chunks == ['# Shoes\n- Sneaker\n- Boot', '# Hats\n- Cap\n# Bags\n- Tote']
+
+
+def test_oversized_sections_and_lines_are_split():
+	content = '# Intro\nhello\n# Listing\n' + '- item\n' * 10 + 'x' * 45
+
+	chunks = split_markdown_into_chunks(content, 20)
+
+	assert all(len(chunk) <= 20 for chunk in chunks)
+	assert chunks[0] == '# Intro\nhello'
+	assert chunks[1].startswith('# Listing')
+	assert ''.join(chunk.replace('\n', '') for chunk in chunks) == content.replace('\n', '')
+	assert split_markdown_into_chunks('short', 20) == ['short']
+	assert split_markdown_into_chunks('', 20) == []
+
+
+class ChunkedPageLLM:
+	"""Fake extraction LLM: lists the items of a chunk, merges partial results in the reduce pass."""
+
+	def __init__(self):
+		self.map_calls = 0
+		self.reduce_calls = 0
+		self.running = 0
+		self.max_running = 0
+
+	async def ainvoke(self, messages):
+		system, user = messages
+		assert isinstance(system, SystemMessage)
+		if system.content == EXTRACTION_MAP_SYSTEM_PROMPT:
+			self.map_calls += 1
+			self.running += 1
+			self.max_running = max(self.max_running, self.running)
+			await asyncio.sleep(0.05)
+			self.running -= 1
+			items = [line[2:] for line in user.content.split('\n') if line.startswith('- item')]
+			completion = ', '.join(items) if items else NO_RELEVANT_CONTENT
+		else:
+			self.reduce_calls += 1
+			completion = f'MERGED {user.content.count("<partial_result")}'
+		return SimpleNamespace(completion=completion)
+
+
+async def _get_current_page_url():
+	return 'https://example.com/listing'
+
+
+async def test_full_page_extraction_maps_chunks_concurrently_and_merges(tmp_path):
+	sections = [f'# Section {i}\n' + '\n'.join(f'- item {i}.{j}' for j in range(3)) for i in range(6)]
+	content = '\n'.join(['# Header\nNothing to see here'] + sections)
+	llm = ChunkedPageLLM()
+	browser_session = SimpleNamespace(get_current_page_url=_get_current_page_url)
+
+	result = await _extract_full_page(
+		'list all items',
+		content,
+		{},
+		60,
+		browser_session,  # type: ignore[arg-type]
+		llm,  # type: ignore[arg-type]
+		FileSystem(tmp_path),
+	)
+
+	assert llm.map_calls == len(split_markdown_into_chunks(content, 60))
+	assert llm.max_running > 1  # chunks were queried concurrently
+	assert llm.reduce_calls == 1
+	assert result.extracted_content is not None
+	assert 'MERGED 6' in result.extracted_content  # the chunk without items was dropped before the merge
+	assert 'https://example.com/listing' in result.extracted_content
@@ -0,0 +1,199 @@
+"""
+Tests for replaying saved histories with Agent.rerun_history().
+
+Covered here:
+- recorded elements are found again through an element hash index;
+- fast mode skips highlights and waits for the page to settle instead of sleeping;
+- per-step replay timings are recorded;
+- BrowserSession.wait_for_page_settle() works on a real page.
+
+The replay tests replace the browser state and action execution with fakes, so only the page settle test needs a browser.
+
+Usage:
+	uv run pytest tests/ci/test_history_replay.py -v -s
+"""
+
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from browser_use.agent.service import Agent
+from browser_use.agent.views import ActionResult, AgentHistory, AgentHistoryList, StepMetadata
+from browser_use.browser import BrowserSession
+from browser_use.browser.events import NavigateToUrlEvent
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.views import BrowserStateHistory, BrowserStateSummary
+from browser_use.dom.views import DOMInteractedElement, EnhancedDOMTreeNode, NodeType, SerializedDOMState
+from tests.ci.conftest import create_mock_llm
+
+
+def _node(node_type: NodeType, node_name: str, parent: EnhancedDOMTreeNode | None, **attributes: str) -> EnhancedDOMTreeNode:
+	node = EnhancedDOMTreeNode(
+		node_id=0,
+		backend_node_id=0,
+		node_type=node_type,
+		node_name=node_name,
+		node_value='',
+		attributes=attributes,
+		is_scrollable=None,
+		is_visible=True,
+		absolute_position=None,
+		target_id='test-target',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=parent,
+		children_nodes=[],
+		ax_node=None,
+		snapshot_node=None,
+	)
+	if parent is not None and parent.children_nodes is not None:
+		parent.children_nodes.append(node)
+	return node
+
+
+def _page(*element_ids: str) -> dict[int, EnhancedDOMTreeNode]:
+	"""Selector map of a page with one button per id, indexed from 1 in order"""
+	body = _node(NodeType.ELEMENT_NODE, 'BODY', _node(NodeType.ELEMENT_NODE, 'HTML', None))
+	return {index: _node(NodeType.ELEMENT_NODE, 'BUTTON', body, id=element_id) for index, element_id in enumerate(element_ids, 1)}
+
+
+class FakeBrowser:
+	"""Serves a fixed selector map as the browser state and records what the replay asked the browser for."""
+
+	def __init__(self, selector_map: dict[int, EnhancedDOMTreeNode]):
+		self.selector_map = selector_map
+		self.state_requests: list[dict[str, bool]] = []
+		self.settle_timeouts: list[float] = []
+		self.acted: list[list[dict]] = []
+
+
+@pytest.fixture
+def fake_browser(monkeypatch) -> FakeBrowser:
+	fake = FakeBrowser(_page('menu', 'search', 'submit'))
+
+	async def get_browser_state_summary(self, include_screenshot=True, cached=False, include_recent_events=False, **kwargs):
+		fake.state_requests.append({'include_screenshot': include_screenshot, **kwargs})
+		return BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=None, selector_map=fake.selector_map),
+			url='https://example.com',
+			title='Example',
+			tabs=[],
+			timing={'get_dom_tree_total_ms': 12.0},
+		)
+
+	async def wait_for_page_settle(self, quiet_period=0.3, timeout=5.0):
+		fake.settle_timeouts.append(timeout)
+		return True
+
+	async def noop(self):
+		pass
+
+	async def multi_act(self, actions):
+		fake.acted.append([action.model_dump(exclude_unset=True) for action in actions])
+		return [ActionResult(extracted_content='done') for _ in actions]
+
+	monkeypatch.setattr(BrowserSession, 'start', noop)
+	monkeypatch.setattr(BrowserSession, 'get_browser_state_summary', get_browser_state_summary)
+	monkeypatch.setattr(BrowserSession, 'wait_for_page_settle', wait_for_page_settle)
+	monkeypatch.setattr(Agent, 'multi_act', multi_act)
+	monkeypatch.setattr(Agent, 'close', noop)
+	return fake
+
+
+@pytest.fixture
+def agent(fake_browser) -> Agent:
+	return Agent(task='Replay', llm=create_mock_llm(), browser_session=BrowserSession(browser_profile=BrowserProfile()))
+
+
+def _history(agent: Agent, recorded_page: dict[int, EnhancedDOMTreeNode], clicked_indices: list[int]) -> AgentHistoryList:
+	"""One step per clicked index, recorded on recorded_page"""
+	history = AgentHistoryList(history=[], usage=None)
+	for step_number, index in enumerate(clicked_indices, 1):
+		model_output = agent.AgentOutput(
+			evaluation_previous_goal='',
+			memory='',
+			next_goal=f'Click {index}',
+			action=[agent.ActionModel(**{'click': {'index': index}})],
+		)
+		state = BrowserStateHistory(
+			url='https://example.com',
+			title='Example',
+			tabs=[],
+			interacted_element=[DOMInteractedElement.load_from_enhanced_dom_tree(recorded_page[index])],
+		)
+		metadata = StepMetadata(step_start_time=0, step_end_time=0, step_number=step_number)
+		history.add_item(AgentHistory(model_output=model_output, result=[], state=state, metadata=metadata))
+	return history
+
+
+async def test_fast_replay_finds_moved_elements_and_waits_for_settle(agent: Agent, fake_browser: FakeBrowser):
+	# Recorded when the page had more buttons: search was #5 and submit #6, now they are #2 and #3
+	history = _history(agent, _page('ad', 'banner', 'cookie', 'menu', 'search', 'submit'), [5, 6])
+
+	start = time.perf_counter()
+	results = await agent.rerun_history(history, delay_between_actions=5.0, fast=True)
+	elapsed = time.perf_counter() - start
+
+	assert [result.extracted_content for result in results] == ['done', 'done']
+	assert fake_browser.acted == [[{'click': {'index': 2}}], [{'click': {'index': 3}}]]
+	assert fake_browser.state_requests == [{'include_screenshot': False, 'include_highlights': False}] * 2
+	assert fake_browser.settle_timeouts == [5.0, 5.0]
+	assert elapsed < 1
+
+	assert [metrics.step_number for metrics in agent.replay_metrics] == [1, 2]
+	for metrics in agent.replay_metrics:
+		assert metrics.dom_capture_ms == 12.0
+		assert metrics.settle_ms is not None and metrics.actions_ms is not None and metrics.browser_state_ms is not None
+		assert metrics.step_ms >= metrics.settle_ms + metrics.actions_ms
+
+
+async def test_default_replay_sleeps_between_steps(agent: Agent, fake_browser: FakeBrowser):
+	history = _history(agent, fake_browser.selector_map, [1, 2])
+
+	start = time.perf_counter()
+	await agent.rerun_history(history, delay_between_actions=0.2)
+	elapsed = time.perf_counter() - start
+
+	assert fake_browser.acted == [[{'click': {'index': 1}}], [{'click': {'index': 2}}]]
+	assert fake_browser.state_requests == [{'include_screenshot': False, 'include_highlights': True}] * 2
+	assert fake_browser.settle_timeouts == []
+	assert elapsed >= 0.4
+	assert all(metrics.settle_ms is not None and metrics.settle_ms >= 200 for metrics in agent.replay_metrics)
+
+
+async def test_step_with_a_missing_element_is_retried_then_skipped(agent: Agent, fake_browser: FakeBrowser):
+	history = _history(agent, _page('gone', 'search'), [1, 2])
+
+	await agent.rerun_history(history, max_retries=2, delay_between_actions=5.0, fast=True)
+
+	assert fake_browser.acted == [[{'click': {'index': 2}}]]  # only the second step found its element
+	assert fake_browser.settle_timeouts == [5.0, 5.0]  # one retry of the first step, then after the second step
+	assert [metrics.step_number for metrics in agent.replay_metrics] == [2]
+
+
+async def test_wait_for_page_settle(browser_session: BrowserSession, httpserver: HTTPServer):
+	def page(mutate_for_ms: int) -> str:
+		return f"""<html><body><div id="box"></div><script>
+			const started = Date.now();
+			const timer = setInterval(() => {{
+				document.getElementById('box').textContent = Date.now();
+				if ({mutate_for_ms} >= 0 && Date.now() - started > {mutate_for_ms}) clearInterval(timer);
+			}}, 20);
+		</script></body></html>"""
+
+	httpserver.expect_request('/settles').respond_with_data(page(600), content_type='text/html')
+	httpserver.expect_request('/never-settles').respond_with_data(page(-1), content_type='text/html')
+
+	await browser_session.event_bus.dispatch(NavigateToUrlEvent(url=httpserver.url_for('/settles')))
+	start = time.perf_counter()
+	assert await browser_session.wait_for_page_settle(quiet_period=0.2, timeout=5)
+	assert 0.2 <= time.perf_counter() - start < 3
+
+	await browser_session.event_bus.dispatch(NavigateToUrlEvent(url=httpserver.url_for('/never-settles')))
+	start = time.perf_counter()
+	assert not await browser_session.wait_for_page_settle(quiet_period=0.2, timeout=1)
+	assert time.perf_counter() - start < 2
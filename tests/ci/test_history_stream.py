@@ -0,0 +1,164 @@
+"""
+Tests for append-only history files (browser_use.agent.history_stream).
+
+Covered here:
+- streamed steps read back lazily, and compact into exactly what AgentHistoryList.save_to_file() writes;
+- sensitive data is filtered from streamed steps;
+- a final line cut off by a crash is skipped, a corrupt line elsewhere is an error;
+- the fsync policies;
+- the agent appends each history item to its history_writer;
+- a benchmark of saving a 300 step history after every step vs streaming it.
+
+Usage:
+	uv run pytest tests/ci/test_history_stream.py -v -s
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from browser_use.agent.history_stream import HistoryStreamWriter, compact_history_file, iter_history_file
+from browser_use.agent.service import Agent
+from browser_use.agent.views import ActionResult, AgentHistory, AgentHistoryList, StepMetadata
+from browser_use.browser.views import BrowserStateHistory
+from tests.ci.conftest import create_mock_llm
+
+SENSITIVE_DATA: dict[str, str | dict[str, str]] = {'password': 'hunter2'}
+
+
+@pytest.fixture
+def agent() -> Agent:
+	return Agent(task='Stream history', llm=create_mock_llm(), sensitive_data=SENSITIVE_DATA)
+
+
+def _history(agent: Agent, steps: int, extracted_content: str = 'page text') -> AgentHistoryList:
+	history = AgentHistoryList(history=[], usage=None)
+	for step_number in range(1, steps + 1):
+		model_output = agent.AgentOutput(
+			evaluation_previous_goal='Success',
+			memory=f'Step {step_number}',
+			next_goal='Log in',
+			action=[agent.ActionModel(**{'input': {'index': step_number, 'text': 'hunter2'}})],
+		)
+		state = BrowserStateHistory(url=f'https://example.com/{step_number}', title='Example', tabs=[], interacted_element=[None])
+		metadata = StepMetadata(step_start_time=step_number, step_end_time=step_number + 0.5, step_number=step_number)
+		result = [ActionResult(extracted_content=extracted_content, long_term_memory=f'Typed into {step_number}')]
+		history.add_item(AgentHistory(model_output=model_output, result=result, state=state, metadata=metadata))
+	return history
+
+
+def _stream(history: AgentHistoryList, path: Path, **kwargs) -> None:
+	with HistoryStreamWriter(path, **kwargs) as writer:
+		for item in history.history:
+			writer.append(item, sensitive_data=SENSITIVE_DATA)
+
+
+@pytest.mark.parametrize('steps', [0, 1, 5])
+def test_stream_reads_back_and_compacts_to_the_legacy_format(agent: Agent, tmp_path: Path, steps: int):
+	history = _history(agent, steps)
+	_stream(history, tmp_path / 'history.jsonl')
+	history.save_to_file(tmp_path / 'legacy.json', sensitive_data=SENSITIVE_DATA)
+
+	assert compact_history_file(tmp_path / 'history.jsonl', tmp_path / 'compacted.json') == steps
+	assert (tmp_path / 'compacted.json').read_text() == (tmp_path / 'legacy.json').read_text()
+	assert not list(tmp_path.glob('.*.tmp'))
+
+	legacy = AgentHistoryList.load_from_file(tmp_path / 'legacy.json', agent.AgentOutput)
+	streamed = AgentHistoryList.load_from_file(tmp_path / 'history.jsonl', agent.AgentOutput)
+	assert streamed.model_dump() == legacy.model_dump()
+	assert [item.model_dump() for item in iter_history_file(tmp_path / 'history.jsonl', agent.AgentOutput)] == [
+		item.model_dump() for item in legacy.history
+	]
+
+
+def test_streamed_steps_filter_sensitive_data(agent: Agent, tmp_path: Path):
+	_stream(_history(agent, 2), tmp_path / 'history.jsonl')
+
+	text = (tmp_path / 'history.jsonl').read_text()
+	assert 'hunter2' not in text
+	assert [json.loads(line)['model_output']['action'] for line in text.splitlines()] == [
+		[{'input': {'index': 1, 'text': '<secret>password</secret>', 'clear': True}}],
+		[{'input': {'index': 2, 'text': '<secret>password</secret>', 'clear': True}}],
+	]
+
+
+def test_incomplete_last_line_is_skipped_and_corrupt_lines_are_errors(agent: Agent, tmp_path: Path):
+	path = tmp_path / 'history.jsonl'
+	_stream(_history(agent, 3), path)
+	lines = path.read_text().splitlines(keepends=True)
+
+	path.write_text(''.join(lines[:2]) + lines[2][:40])  # crashed while writing the third step
+	assert [item.metadata.step_number for item in iter_history_file(path, agent.AgentOutput) if item.metadata] == [1, 2]
+	assert compact_history_file(path, tmp_path / 'compacted.json') == 2
+
+	path.write_text(lines[0] + lines[1][:40] + '\n' + lines[2])
+	with pytest.raises(ValueError, match='line 2'):
+		list(iter_history_file(path, agent.AgentOutput))
+	with pytest.raises(ValueError, match='line 2'):
+		compact_history_file(path, tmp_path / 'broken.json')
+	assert not (tmp_path / 'broken.json').exists()
+
+
+@pytest.mark.parametrize('fsync, expected_syncs', [('never', 0), ('close', 1), ('step', 4)])
+def test_fsync_policy(agent: Agent, tmp_path: Path, monkeypatch, fsync: str, expected_syncs: int):
+	syncs = []
+	monkeypatch.setattr(os, 'fsync', syncs.append)
+
+	writer = HistoryStreamWriter(tmp_path / 'history.jsonl', fsync=fsync)  # type: ignore[arg-type]
+	for item in _history(agent, 3).history:
+		writer.append(item)
+		assert len((tmp_path / 'history.jsonl').read_text().splitlines()) == writer.steps_written  # flushed every step
+	writer.close()
+	writer.close()
+
+	assert len(syncs) == expected_syncs
+	with pytest.raises(ValueError, match='closed'):
+		writer.append(_history(agent, 1).history[0])
+
+
+def test_invalid_fsync_policy(tmp_path: Path):
+	with pytest.raises(ValueError, match='Invalid fsync policy'):
+		HistoryStreamWriter(tmp_path / 'history.jsonl', fsync='always')  # type: ignore[arg-type]
+
+
+async def test_agent_streams_history_items(tmp_path: Path):
+	writer = HistoryStreamWriter(tmp_path / 'run' / 'history.jsonl')
+	agent = Agent(task='Stream history', llm=create_mock_llm(), sensitive_data=SENSITIVE_DATA, history_writer=writer)
+
+	for item in _history(agent, 2).history:
+		await agent._add_history_item(item)
+	writer.close()
+	await agent._add_history_item(_history(agent, 1).history[0])  # a failing stream doesn't fail the step
+
+	assert len(agent.history.history) == 3
+	streamed = AgentHistoryList.load_from_file(writer.path, agent.AgentOutput)
+	assert streamed.model_dump() == {'history': [item.model_dump(SENSITIVE_DATA) for item in agent.history.history[:2]]}
+
+
+def test_save_every_step_benchmark(agent: Agent, tmp_path: Path):
+	history = _history(agent, 300, extracted_content='x' * 5_000)
+
+	start = time.perf_counter()
+	partial = AgentHistoryList(history=[], usage=None)
+	for item in history.history:
+		partial.add_item(item)
+		partial.save_to_file(tmp_path / 'history.json', sensitive_data=SENSITIVE_DATA)
+	rewrite_time = time.perf_counter() - start
+
+	start = time.perf_counter()
+	_stream(history, tmp_path / 'history.jsonl')
+	stream_time = time.perf_counter() - start
+
+	start = time.perf_counter()
+	compact_history_file(tmp_path / 'history.jsonl', tmp_path / 'compacted.json')
+	compact_time = time.perf_counter() - start
+
+	print(
+		f'\n300 steps of 5KB, saved after every step: save_to_file {rewrite_time * 1000:.0f}ms, '
+		f'stream {stream_time * 1000:.0f}ms ({rewrite_time / stream_time:.0f}x faster), compaction {compact_time * 1000:.0f}ms'
+	)
+	assert (tmp_path / 'compacted.json').read_text() == (tmp_path / 'history.json').read_text()
+	assert stream_time < rewrite_time
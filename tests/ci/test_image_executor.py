@@ -0,0 +1,178 @@
+"""
+Tests for the shared image executor that keeps CPU-bound image work (screenshot resizing, highlight overlays,
+GIF frames) off the event loop.
+
+Usage:
+	uv run pytest tests/ci/test_image_executor.py -v -s
+"""
+
+import asyncio
+import base64
+import threading
+import time
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from browser_use.agent.service import Agent
+from browser_use.browser.python_highlights import create_highlighted_screenshot
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.views import BrowserStateSummary
+from browser_use.dom.views import SerializedDOMState
+from browser_use.image_executor import ImageExecutor, image_executor
+from tests.ci.conftest import create_mock_llm
+
+
+def _busy(seconds: float) -> str:
+	time.sleep(seconds)
+	return threading.current_thread().name
+
+
+def _fail() -> None:
+	raise ValueError('corrupt image')
+
+
+async def test_jobs_run_off_the_event_loop_and_are_measured():
+	executor = ImageExecutor(kind='thread', max_workers=1)
+	ticks = 0
+
+	async def ticker():
+		nonlocal ticks
+		while True:
+			ticks += 1
+			await asyncio.sleep(0.01)
+
+	ticker_task = asyncio.create_task(ticker())
+	try:
+		results = await asyncio.gather(*(executor.run(_busy, 0.1) for _ in range(3)))
+	finally:
+		ticker_task.cancel()
+		executor.shutdown()
+
+	assert all(name.startswith('browser_use_image') for name in results)
+	assert ticks >= 15  # the loop kept running while the worker was busy for ~300ms
+	assert executor.stats.completed == 3
+	assert executor.stats.queue_depth == 0
+	assert executor.stats.max_queue_depth == 3
+	# With a single worker the last job waited for the two before it
+	assert executor.stats.max_wait_ms >= 150
+	assert executor.stats.avg_run_ms >= 90
+
+
+async def test_failures_propagate_and_are_counted():
+	executor = ImageExecutor(kind='thread', max_workers=1)
+	with pytest.raises(ValueError, match='corrupt image'):
+		await executor.run(_fail)
+	executor.shutdown()
+
+	assert executor.stats.failed == 1
+	assert executor.stats.completed == 0
+	assert executor.stats.queue_depth == 0
+
+
+async def test_process_pool():
+	executor = ImageExecutor(kind='process', max_workers=1)
+	try:
+		assert await executor.run(sum, [1, 2, 3], start=4) == 10
+	finally:
+		executor.shutdown()
+	assert executor.stats.completed == 1
+
+
+async def test_highlights_are_drawn_on_the_image_executor():
+	buffer = BytesIO()
+	Image.new('RGB', (200, 100), 'white').save(buffer, format='PNG')
+	button = SimpleNamespace(
+		absolute_position=SimpleNamespace(x=20, y=20, width=100, height=40),
+		tag_name='button',
+		attributes={},
+		backend_node_id=7,
+	)
+	completed_before = image_executor.stats.completed
+
+	highlighted = await create_highlighted_screenshot(
+		base64.b64encode(buffer.getvalue()).decode(),
+		{1: button},  # type: ignore[dict-item]
+		filter_highlight_ids=False,
+	)
+
+	assert image_executor.stats.completed == completed_before + 1
+	image = Image.open(BytesIO(base64.b64decode(highlighted))).convert('RGB')
+	drawn = [(x, y) for x in range(200) for y in range(100) if image.getpixel((x, y)) != (255, 255, 255)]
+	assert drawn  # the box and its index label were drawn
+	assert all(10 <= x <= 130 and 10 <= y <= 70 for x, y in drawn)
+
+
+@pytest.mark.parametrize('use_vision, llm_size', [(True, (100, 100)), (False, (200, 100))])
+async def test_only_the_llm_sees_the_resized_screenshot(monkeypatch, use_vision: bool, llm_size: tuple[int, int]):
+	buffer = BytesIO()
+	Image.new('RGB', (200, 100), 'white').save(buffer, format='PNG')
+	screenshot = base64.b64encode(buffer.getvalue()).decode()
+	summary = BrowserStateSummary(
+		dom_state=SerializedDOMState(_root=None, selector_map={}),
+		url='https://example.com',
+		title='Example',
+		tabs=[],
+		screenshot=screenshot,
+	)
+
+	async def get_browser_state_summary(self, **kwargs):
+		return summary
+
+	monkeypatch.setattr(BrowserSession, 'get_browser_state_summary', get_browser_state_summary)
+	agent = Agent(task='Resize', llm=create_mock_llm(), use_vision=use_vision)
+	agent.browser_session.llm_screenshot_size = (100, 100)  # type: ignore[union-attr]
+	llm_summaries = []
+	monkeypatch.setattr(agent._message_manager, 'create_state_messages', lambda **kwargs: llm_summaries.append(kwargs))
+	completed_before = image_executor.stats.completed
+
+	assert await agent._prepare_context() is summary
+
+	# The session's cached summary (which history, GIFs and cloud events use) keeps the full-size screenshot
+	assert summary.screenshot == screenshot
+	llm_screenshot = llm_summaries[0]['browser_state_summary'].screenshot
+	assert Image.open(BytesIO(base64.b64decode(llm_screenshot))).size == llm_size
+	assert image_executor.stats.completed == completed_before + use_vision
+
+
+@pytest.mark.parametrize(
+	'use_vision, downscale_in_browser, requested_size',
+	[(True, True, (100, 50)), (False, True, None), (True, False, None)],
+)
+async def test_browser_downscaled_screenshot_is_only_requested_for_the_llm(
+	monkeypatch, use_vision: bool, downscale_in_browser: bool, requested_size: tuple[int, int] | None
+):
+	def image(size: tuple[int, int]) -> str:
+		buffer = BytesIO()
+		Image.new('RGB', size, 'white').save(buffer, format='PNG')
+		return base64.b64encode(buffer.getvalue()).decode()
+
+	screenshot = image((200, 100))
+	requests = []
+
+	async def get_browser_state_summary(self, llm_screenshot_size=None, **kwargs):
+		requests.append(llm_screenshot_size)
+		return BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=None, selector_map={}),
+			url='https://example.com',
+			title='Example',
+			tabs=[],
+			screenshot=screenshot,
+			llm_screenshot=image(llm_screenshot_size) if llm_screenshot_size else None,
+		)
+
+	monkeypatch.setattr(BrowserSession, 'get_browser_state_summary', get_browser_state_summary)
+	agent = Agent(task='Resize', llm=create_mock_llm(), use_vision=use_vision)
+	agent.browser_session.llm_screenshot_size = (100, 50)  # type: ignore[union-attr]
+	agent.browser_session.browser_profile.downscale_llm_screenshot_in_browser = downscale_in_browser  # type: ignore[union-attr]
+	llm_summaries = []
+	monkeypatch.setattr(agent._message_manager, 'create_state_messages', lambda **kwargs: llm_summaries.append(kwargs))
+
+	summary = await agent._prepare_context()
+
+	assert requests == [requested_size]
+	assert summary.screenshot == screenshot
+	if requested_size:
+		assert llm_summaries[0]['browser_state_summary'].screenshot == summary.llm_screenshot  # passed through as-is
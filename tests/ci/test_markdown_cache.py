@@ -0,0 +1,81 @@
+"""
+Tests for the clean markdown cache used by repeated extract calls on an unchanged page.
+
+Usage:
+	uv run pytest tests/ci/test_markdown_cache.py -v -s
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from browser_use.dom import markdown_extractor
+from browser_use.dom.markdown_extractor import MarkdownCache, extract_clean_markdown, markdown_cache
+
+PAGE_MARKDOWN = '# Products\n\n- First product\n- Second product'
+
+
+@pytest.fixture
+def serialize_calls(monkeypatch):
+	calls = []
+
+	def serialize(self, node):
+		calls.append(node)
+		return PAGE_MARKDOWN
+
+	monkeypatch.setattr(markdown_extractor.MarkdownSerializer, 'serialize', serialize)
+	markdown_cache.clear()
+	yield calls
+	markdown_cache.clear()
+
+
+def _fake_browser_session(dom_version: int = 1):
+	async def get_current_page_url():
+		return 'https://example.com/products'
+
+	return SimpleNamespace(
+		id='session-1',
+		agent_focus_target_id='target-1',
+		_dom_watchdog=SimpleNamespace(enhanced_dom_tree=object(), dom_version=dom_version),
+		get_current_page_url=get_current_page_url,
+	)
+
+
+def test_lru_eviction_and_counters():
+	cache = MarkdownCache(max_size=2)
+	cache.put(('a',), 'A', {})
+	cache.put(('b',), 'B', {})
+	assert cache.get(('a',)) == ('A', {})  # 'a' is now the most recently used
+	cache.put(('c',), 'C', {})
+
+	assert cache.get(('b',)) is None
+	assert cache.get(('c',)) == ('C', {})
+	info = cache.info()
+	assert (info.hits, info.misses, info.size) == (2, 1, 2)
+	assert info.hit_rate == pytest.approx(2 / 3)
+
+
+async def test_unchanged_page_is_converted_once(serialize_calls):
+	browser_session = _fake_browser_session()
+
+	content, stats = await extract_clean_markdown(browser_session=browser_session)  # type: ignore[arg-type]
+	stats['started_from_char'] = 10  # callers extend the stats, this must not leak into the cache
+	cached_content, cached_stats = await extract_clean_markdown(browser_session=browser_session)  # type: ignore[arg-type]
+
+	assert len(serialize_calls) == 1
+	assert cached_content == content
+	assert 'Second product' in content
+	assert stats['markdown_cache_hit'] is False
+	assert cached_stats['markdown_cache_hit'] is True
+	assert cached_stats['markdown_cache_hit_rate'] == pytest.approx(0.5)
+	assert 'started_from_char' not in cached_stats
+	assert cached_stats['url'] == 'https://example.com/products'
+
+
+async def test_new_dom_version_or_links_flag_is_converted_again(serialize_calls):
+	await extract_clean_markdown(browser_session=_fake_browser_session(dom_version=1))  # type: ignore[arg-type]
+	await extract_clean_markdown(browser_session=_fake_browser_session(dom_version=1), extract_links=True)  # type: ignore[arg-type]
+	_, stats = await extract_clean_markdown(browser_session=_fake_browser_session(dom_version=2))  # type: ignore[arg-type]
+
+	assert len(serialize_calls) == 3
+	assert stats['markdown_cache_hit'] is False
@@ -0,0 +1,264 @@
+"""
+Tests for the direct DOM-to-markdown converter used by extract_clean_markdown.
+
+The converter replaced serializing the enhanced DOM tree to HTML and converting that with markdownify. The
+golden files in tests/ci/markdown_golden/ hold what that pipeline produced for each page; when markdownify is
+installed, randomly generated pages are also checked against it directly and both are benchmarked.
+
+Regenerate the golden files (requires markdownify) with:
+	UPDATE_MARKDOWN_GOLDEN=1 uv run pytest tests/ci/test_markdown_serializer.py -k golden
+
+Usage:
+	uv run pytest tests/ci/test_markdown_serializer.py -v -s
+"""
+
+import os
+import random
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+
+import pytest
+
+from browser_use.dom.serializer.html_serializer import HTMLSerializer
+from browser_use.dom.serializer.markdown_serializer import MarkdownSerializer
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
+
+GOLDEN_DIR = Path(__file__).parent / 'markdown_golden'
+GOLDEN_PAGES = sorted(path.stem for path in GOLDEN_DIR.glob('*.html'))
+
+# The markdownify call extract_clean_markdown made before the direct converter
+MARKDOWNIFY_OPTIONS = dict(
+	heading_style='ATX',
+	strip=['script', 'style'],
+	bullets='-',
+	code_language='',
+	escape_asterisks=False,
+	escape_underscores=False,
+	escape_misc=False,
+	autolinks=False,
+	default_title=False,
+	keep_inline_images_in=[],
+)
+
+_VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'}
+
+
+class DOMTreeParser(HTMLParser):
+	"""Parses an HTML page into an EnhancedDOMTreeNode tree shaped like the one built from CDP.
+
+	Declarative shadow DOM (<template shadowrootmode>) becomes a shadow root of its parent and <iframe srcdoc>
+	becomes the iframe's content document.
+	"""
+
+	def __init__(self):
+		super().__init__(convert_charrefs=True)
+		self._next_id = 1
+		self.document = self._node(NodeType.DOCUMENT_NODE, '#document', None)
+		self._stack = [self.document]
+
+	def _node(
+		self,
+		node_type: NodeType,
+		node_name: str,
+		parent: EnhancedDOMTreeNode | None,
+		*,
+		node_value: str = '',
+		attributes: dict[str, str] | None = None,
+		shadow_root_type: str | None = None,
+	) -> EnhancedDOMTreeNode:
+		node_id = self._next_id
+		self._next_id += 1
+		node = EnhancedDOMTreeNode(
+			node_id=node_id,
+			backend_node_id=node_id,
+			node_type=node_type,
+			node_name=node_name,
+			node_value=node_value,
+			attributes=attributes or {},
+			is_scrollable=None,
+			is_visible=True,
+			absolute_position=None,
+			target_id='test-target',
+			frame_id=None,
+			session_id=None,
+			content_document=None,
+			shadow_root_type=shadow_root_type,  # type: ignore[arg-type]
+			shadow_roots=None,
+			parent_node=parent,
+			children_nodes=[],
+			ax_node=None,
+			snapshot_node=None,
+		)
+		if parent is not None and shadow_root_type is None:
+			assert parent.children_nodes is not None
+			parent.children_nodes.append(node)
+		return node
+
+	@classmethod
+	def parse(cls, html: str) -> EnhancedDOMTreeNode:
+		parser = cls()
+		parser.feed(html)
+		parser.close()
+		return parser.document
+
+	def handle_starttag(self, tag, attrs):
+		parent = self._stack[-1]
+		attributes = {key: value or '' for key, value in attrs}
+		if tag == 'template' and 'shadowrootmode' in attributes:
+			shadow_root = self._node(
+				NodeType.DOCUMENT_FRAGMENT_NODE, '#document-fragment', parent, shadow_root_type=attributes['shadowrootmode']
+			)
+			parent.shadow_roots = (parent.shadow_roots or []) + [shadow_root]
+			self._stack.append(shadow_root)
+			return
+		element = self._node(NodeType.ELEMENT_NODE, tag.upper(), parent, attributes=attributes)
+		if tag == 'iframe' and 'srcdoc' in attributes:
+			element.content_document = DOMTreeParser.parse(attributes['srcdoc'])
+		if tag not in _VOID_ELEMENTS:
+			self._stack.append(element)
+
+	def handle_startendtag(self, tag, attrs):
+		self.handle_starttag(tag, attrs)
+		if tag not in _VOID_ELEMENTS:
+			self._stack.pop()
+
+	def handle_endtag(self, tag):
+		for i in range(len(self._stack) - 1, 0, -1):
+			node = self._stack[i]
+			name = 'template' if node.node_type == NodeType.DOCUMENT_FRAGMENT_NODE else node.tag_name
+			if name == tag:
+				del self._stack[i:]
+				return
+
+	def handle_data(self, data):
+		parent = self._stack[-1]
+		assert parent.children_nodes is not None
+		if parent.children_nodes and parent.children_nodes[-1].node_type == NodeType.TEXT_NODE:
+			parent.children_nodes[-1].node_value += data
+		else:
+			self._node(NodeType.TEXT_NODE, '#text', parent, node_value=data)
+
+	def handle_comment(self, data):
+		self._node(NodeType.COMMENT_NODE, '#comment', self._stack[-1], node_value=data)
+
+	def handle_decl(self, decl):
+		self._node(NodeType.DOCUMENT_TYPE_NODE, 'html', self._stack[-1])
+
+
+def _markdownify(root: EnhancedDOMTreeNode, extract_links: bool) -> str:
+	from markdownify import markdownify
+
+	return markdownify(HTMLSerializer(extract_links=extract_links).serialize(root), **MARKDOWNIFY_OPTIONS)
+
+
+@pytest.mark.parametrize('extract_links', [False, True], ids=['no_links', 'links'])
+@pytest.mark.parametrize('page', GOLDEN_PAGES)
+def test_golden_pages(page: str, extract_links: bool):
+	root = DOMTreeParser.parse((GOLDEN_DIR / f'{page}.html').read_text())
+	golden_path = GOLDEN_DIR / f'{page}{".links" if extract_links else ""}.md'
+	if os.getenv('UPDATE_MARKDOWN_GOLDEN'):
+		golden_path.write_text(_markdownify(root, extract_links))
+
+	assert MarkdownSerializer(extract_links=extract_links).serialize(root) == golden_path.read_text()
+
+
+# --- Random pages, checked against markdownify directly ----------------------------------------
+
+_RANDOM_TAGS = [
+	'div', 'span', 'p', 'a', 'b', 'strong', 'em', 'i', 'code', 'pre', 'ul', 'ol', 'li', 'h1', 'h2', 'h3', 'h6',
+	'table', 'thead', 'tbody', 'tr', 'td', 'th', 'blockquote', 'section', 'article', 'dl', 'dt', 'dd', 'q', 'sub',
+	'del', 'kbd', 'label', 'button', 'nav', 'figure', 'figcaption', 'caption', 'video', 'template', 'iframe',
+]  # fmt: skip
+_RANDOM_VOID_TAGS = ['br', 'hr', 'img', 'input', 'source']
+_RANDOM_TEXTS = [
+	'Hello',
+	' world ',
+	'\n\t',
+	'  ',
+	'a  b\n c',
+	'1. item',
+	'# not heading',
+	'`tick`',
+	'- dash',
+	'*star*',
+	'&',
+	'<x>',
+]
+
+
+def _random_html(rng: random.Random, depth: int = 0) -> str:
+	parts = []
+	for _ in range(rng.randint(0, 5 if depth < 4 else 1)):
+		choice = rng.random()
+		if choice < 0.35 or depth >= 6:
+			parts.append(
+				''.join(rng.choice(_RANDOM_TEXTS) for _ in range(rng.randint(1, 3))).replace('&', '&amp;').replace('<', '&lt;')
+			)
+		elif choice < 0.45:
+			tag = rng.choice(_RANDOM_VOID_TAGS)
+			attrs = rng.choice(['', ' src="/a.png" alt="Alt"', ' src="/b.png"', ' alt="only alt" title="T"'])
+			parts.append(f'<{tag}{attrs}>')
+		elif choice < 0.5:
+			parts.append(rng.choice(['<!-- comment -->', '<script>var x = 1;</script>', '<style>p {}</style>']))
+		else:
+			tag = rng.choice(_RANDOM_TAGS)
+			attrs = rng.choice(['', ' href="/link" title="Title"', ' colspan="2"', ' start="4"', ' data-x="1"', ' href=""'])
+			if tag == 'template':
+				attrs = ' shadowrootmode="open"'
+			if tag == 'iframe':
+				inner = _random_html(rng, depth + 2).replace('"', '&quot;')
+				parts.append(f'<iframe srcdoc="{inner}"></iframe>')
+				continue
+			parts.append(f'<{tag}{attrs}>{_random_html(rng, depth + 1)}</{tag}>')
+	return ''.join(parts)
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_random_pages_match_markdownify(seed: int):
+	pytest.importorskip('markdownify')
+	rng = random.Random(seed)
+	html = f'<html><body>{_random_html(rng)}</body></html>'
+	root = DOMTreeParser.parse(html)
+
+	for extract_links in (False, True):
+		assert MarkdownSerializer(extract_links=extract_links).serialize(root) == _markdownify(root, extract_links), html
+
+
+# --- Benchmark on a large page -----------------------------------------------------------------
+
+
+def _large_page(copies: int) -> str:
+	"""One big page made of many copies of the golden pages' bodies (a long listing or feed)."""
+	bodies = []
+	for page in GOLDEN_PAGES:
+		html = (GOLDEN_DIR / f'{page}.html').read_text()
+		bodies.append(html[html.index('<body>') + len('<body>') : html.index('</body>')])
+	return (
+		'<html><body>'
+		+ ''.join(f'<section id="s{i}">{bodies[i % len(bodies)]}</section>' for i in range(copies))
+		+ '</body></html>'
+	)
+
+
+def test_large_page_benchmark():
+	root = DOMTreeParser.parse(_large_page(1500))
+	html_size = len(HTMLSerializer(extract_links=True).serialize(root))
+
+	start = time.perf_counter()
+	markdown = MarkdownSerializer(extract_links=True).serialize(root)
+	direct_time = time.perf_counter() - start
+	print(f'\n{html_size / 1e6:.1f} MB page: direct converter {direct_time * 1000:.0f}ms')
+	assert markdown
+
+	try:
+		import markdownify  # noqa: F401
+	except ImportError:
+		return
+
+	start = time.perf_counter()
+	expected = _markdownify(root, extract_links=True)
+	round_trip_time = time.perf_counter() - start
+	print(f'HTML + markdownify {round_trip_time * 1000:.0f}ms ({round_trip_time / direct_time:.1f}x slower)')
+	assert markdown == expected
+	assert direct_time < round_trip_time
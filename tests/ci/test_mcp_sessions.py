@@ -0,0 +1,162 @@
+"""
+Tests for per-client browser sessions in the MCP server: isolation between clients (including the session management
+tools), per-client serialization, the max_browsers limit with queueing and eviction of expired sessions.
+
+Browser sessions are replaced by a fake that records how many tool calls run on it at once, so no browser is launched.
+
+Usage:
+	uv run pytest tests/ci/test_mcp_sessions.py -v -s
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from browser_use.mcp import server as mcp_server
+from browser_use.mcp.server import BrowserUseServer, _current_client_id
+
+
+class FakeBrowserSession:
+	"""Stands in for BrowserSession: browser_list_tabs calls take a while and track their concurrency."""
+
+	running = 0
+	max_running = 0
+
+	def __init__(self, browser_profile):
+		self.id = f'session-{id(self)}'
+		self.browser_profile = browser_profile
+		self.killed = False
+		self.calls = 0
+
+	async def start(self):
+		pass
+
+	async def kill(self):
+		self.killed = True
+
+	async def get_tabs(self):
+		self.calls += 1
+		FakeBrowserSession.running += 1
+		FakeBrowserSession.max_running = max(FakeBrowserSession.max_running, FakeBrowserSession.running)
+		await asyncio.sleep(0.05)
+		FakeBrowserSession.running -= 1
+		return []
+
+
+@pytest.fixture
+def server(tmp_path: Path, monkeypatch) -> BrowserUseServer:
+	FakeBrowserSession.running = FakeBrowserSession.max_running = 0
+	profile = {'user_data_dir': str(tmp_path / 'profile'), 'file_system_path': str(tmp_path / 'files'), 'headless': True}
+	monkeypatch.setattr(mcp_server, 'BrowserSession', FakeBrowserSession)
+	monkeypatch.setattr(mcp_server, 'get_default_profile', lambda config: dict(profile))
+	monkeypatch.setattr(mcp_server, 'get_default_llm', lambda config: {})
+	return BrowserUseServer(max_browsers=2)
+
+
+async def _call(server: BrowserUseServer, client_id: str, tool_name: str = 'browser_list_tabs', **arguments) -> str:
+	token = _current_client_id.set(client_id)
+	try:
+		return await server._execute_tool(tool_name, arguments)
+	finally:
+		_current_client_id.reset(token)
+
+
+def _session_of(server: BrowserUseServer, client_id: str) -> FakeBrowserSession:
+	return server.active_sessions[server.client_sessions[client_id]]['session']
+
+
+async def test_clients_get_isolated_sessions(server: BrowserUseServer, tmp_path: Path):
+	await asyncio.gather(_call(server, 'alice'), _call(server, 'bob'))
+
+	alice, bob = _session_of(server, 'alice'), _session_of(server, 'bob')
+	assert alice is not bob
+	assert len(server.active_sessions) == 2
+	# Only one browser can use the configured profile and file system directory, the other client gets its own
+	user_data_dirs = {str(alice.browser_profile.user_data_dir), str(bob.browser_profile.user_data_dir)}
+	assert str(tmp_path / 'profile') in user_data_dirs
+	assert len(user_data_dirs) == 2
+	file_system_paths = {data['file_system_path'] for data in server.active_sessions.values()}
+	assert tmp_path / 'files' in file_system_paths
+	assert len(file_system_paths) == 2
+
+	await _call(server, 'alice')
+	assert alice.calls == 2
+	assert bob.calls == 1
+
+
+async def test_clients_only_see_and_close_their_own_sessions(server: BrowserUseServer):
+	await asyncio.gather(_call(server, 'alice'), _call(server, 'bob'))
+	alice, bob = _session_of(server, 'alice'), _session_of(server, 'bob')
+
+	listing = json.loads(await _call(server, 'alice', 'browser_list_sessions'))
+	assert [session['session_id'] for session in listing] == [alice.id]
+	assert 'client_id' not in listing[0]
+
+	assert await _call(server, 'alice', 'browser_close_session', session_id=bob.id) == f'Session {bob.id} not found'
+	assert await _call(server, 'alice', 'browser_close_all') == 'Closed 1 sessions'
+	assert alice.killed
+	assert not bob.killed
+	assert set(server.client_sessions) == {'bob'}
+	assert await _call(server, 'carol', 'browser_list_sessions') == 'No active browser sessions'
+
+
+async def test_closing_a_session_waits_for_its_in_flight_call(server: BrowserUseServer):
+	await _call(server, 'alice')
+	alice = _session_of(server, 'alice')
+
+	call = asyncio.create_task(_call(server, 'alice'))
+	await asyncio.sleep(0.01)
+	close = asyncio.create_task(_call(server, 'alice', 'browser_close_session', session_id=alice.id))
+	await asyncio.sleep(0.01)
+	assert not alice.killed  # the browser_list_tabs call is still running on it
+
+	await call
+	assert await close == f'Successfully closed session {alice.id}'
+	assert alice.killed
+	assert alice.calls == 2
+	assert server._client_locks == {}
+
+
+async def test_calls_of_one_client_are_serialized_and_clients_run_concurrently(server: BrowserUseServer):
+	await asyncio.gather(*[_call(server, 'alice') for _ in range(3)])
+	assert FakeBrowserSession.max_running == 1
+	assert len(server.active_sessions) == 1
+
+	await asyncio.gather(_call(server, 'alice'), _call(server, 'bob'))
+	assert FakeBrowserSession.max_running == 2
+
+
+async def test_sessions_beyond_max_browsers_wait_for_a_free_browser(server: BrowserUseServer):
+	await asyncio.gather(_call(server, 'alice'), _call(server, 'bob'))
+
+	carol = asyncio.create_task(_call(server, 'carol'))
+	await asyncio.sleep(0.1)
+	assert not carol.done()  # queued behind the two running browsers
+
+	bob = _session_of(server, 'bob')
+	assert await _call(server, 'bob', 'browser_close_session', session_id=bob.id) == f'Successfully closed session {bob.id}'
+	await asyncio.wait_for(carol, timeout=1)
+
+	assert bob.killed
+	assert set(server.client_sessions) == {'alice', 'carol'}
+
+
+async def test_expired_sessions_are_evicted_unless_busy(server: BrowserUseServer):
+	await asyncio.gather(_call(server, 'alice'), _call(server, 'bob'))
+	alice, bob = _session_of(server, 'alice'), _session_of(server, 'bob')
+	for session_data in server.active_sessions.values():
+		session_data['last_activity'] = time.time() - server.session_timeout_minutes * 60 - 1
+
+	async with server._get_client_lock('bob'):  # bob has a tool call in flight
+		await server._cleanup_expired_sessions()
+
+	assert alice.killed
+	assert not bob.killed
+	assert set(server.client_sessions) == {'bob'}
+
+	# The freed browser slot is immediately available to a new client
+	await asyncio.wait_for(_call(server, 'carol'), timeout=1)
+	assert set(server.client_sessions) == {'bob', 'carol'}
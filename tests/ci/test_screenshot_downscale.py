@@ -0,0 +1,181 @@
+"""
+Tests for ScreenshotWatchdog asking Chrome for screenshots at the LLM screenshot size in compressed formats,
+so AgentMessagePrompt no longer decodes and resizes them in Python, and for mapping the LLM's coordinates back
+through the clipped part of the viewport those screenshots show.
+
+A CDPClient subclass answers Page.getLayoutMetrics and records the Page.captureScreenshot parameters.
+
+Usage:
+	uv run pytest tests/ci/test_screenshot_downscale.py -v -s
+"""
+
+import base64
+import logging
+from io import BytesIO
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from bubus import EventBus
+from cdp_use import CDPClient
+from PIL import Image
+
+from browser_use.agent.prompts import AgentMessagePrompt
+from browser_use.browser.events import ScreenshotEvent
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.views import BrowserStateSummary
+from browser_use.browser.watchdogs.screenshot_watchdog import ScreenshotWatchdog
+from browser_use.dom.views import SerializedDOMState
+from browser_use.tools.service import Tools
+from browser_use.utils import get_image_media_type
+
+
+def _image_b64(size: tuple[int, int], format: str) -> str:
+	buffer = BytesIO()
+	Image.new('RGB', size, 'white').save(buffer, format=format)
+	return base64.b64encode(buffer.getvalue()).decode()
+
+
+class FakeChrome(CDPClient):
+	"""CDP client with a 1280x720 CSS pixel viewport at the given device pixel ratio, scrolled to y=300."""
+
+	def __init__(self, device_pixel_ratio: float = 1.0):
+		super().__init__('ws://127.0.0.1:0')
+		self.device_pixel_ratio = device_pixel_ratio
+		self.capture_params: dict[str, Any] = {}
+
+	async def send_raw(self, method: str, params: Any = None, session_id: str | None = None) -> dict[str, Any]:
+		if method == 'Page.getLayoutMetrics':
+			return {
+				'visualViewport': {'clientWidth': 1280 * self.device_pixel_ratio, 'clientHeight': 720 * self.device_pixel_ratio},
+				'cssVisualViewport': {'pageX': 0, 'pageY': 300, 'clientWidth': 1280, 'clientHeight': 720},
+			}
+		if method == 'Page.captureScreenshot':
+			self.capture_params = params
+			return {'data': _image_b64((640, 360), 'JPEG')}
+		raise AssertionError(f'unexpected CDP command {method}')
+
+
+def _make_watchdog(chrome: FakeChrome) -> ScreenshotWatchdog:
+	cdp_session = SimpleNamespace(cdp_client=chrome, session_id='session-1')
+
+	async def get_or_create_cdp_session(*args, **kwargs):
+		return cdp_session
+
+	async def remove_highlights():
+		pass
+
+	browser_session = SimpleNamespace(
+		get_or_create_cdp_session=get_or_create_cdp_session,
+		remove_highlights=remove_highlights,
+		logger=logging.getLogger('test'),
+		_llm_screenshot_area=None,
+	)
+	return ScreenshotWatchdog.model_construct(event_bus=EventBus(), browser_session=browser_session)
+
+
+async def test_chrome_renders_screenshot_at_llm_size():
+	chrome = FakeChrome(device_pixel_ratio=2.0)
+	watchdog = _make_watchdog(chrome)
+
+	screenshot = await watchdog.on_ScreenshotEvent(ScreenshotEvent(format='jpeg', quality=70, size=(640, 360)))
+
+	assert get_image_media_type(screenshot) == 'image/jpeg'
+	assert chrome.capture_params['format'] == 'jpeg'
+	assert chrome.capture_params['quality'] == 70
+	# 1280x720 CSS pixels at 2x device pixels scaled by 0.25 -> 640x360
+	assert chrome.capture_params['clip'] == {'x': 0, 'y': 300, 'width': 1280, 'height': 720, 'scale': 0.25}
+	assert watchdog.browser_session._llm_screenshot_area == (1280, 720)
+
+
+async def test_mismatched_aspect_ratio_is_captured_at_full_resolution():
+	chrome = FakeChrome()
+	watchdog = _make_watchdog(chrome)
+
+	await watchdog.on_ScreenshotEvent(ScreenshotEvent(size=(800, 800)))
+	assert 'clip' not in chrome.capture_params
+	assert 'quality' not in chrome.capture_params
+	assert watchdog.browser_session._llm_screenshot_area is None
+
+	# A few pixels of difference are cropped instead
+	await watchdog.on_ScreenshotEvent(ScreenshotEvent(size=(1280, 716)))
+	assert chrome.capture_params['clip']['scale'] == 1.0
+	assert chrome.capture_params['clip']['height'] == 716
+	assert watchdog.browser_session._llm_screenshot_area == (1280, 716)
+
+	# Screenshots without a size (the shared browser state screenshot) leave the LLM's area alone
+	await watchdog.on_ScreenshotEvent(ScreenshotEvent())
+	assert 'clip' not in chrome.capture_params
+	assert watchdog.browser_session._llm_screenshot_area == (1280, 716)
+
+
+def test_prompt_passes_browser_sized_screenshot_through(monkeypatch):
+	screenshot = _image_b64((640, 360), 'WEBP')
+	prompt = AgentMessagePrompt(
+		browser_state_summary=BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=None, selector_map={}), url='https://example.com', title='Example', tabs=[]
+		),
+		file_system=None,
+		screenshots=[screenshot],
+		llm_screenshot_size=(640, 360),
+	)
+
+	def fail_resize(*args, **kwargs):
+		raise AssertionError('screenshot should not be resized')
+
+	monkeypatch.setattr(Image.Image, 'resize', fail_resize)
+	image_part = prompt.get_user_message(use_vision=True).content[-1]
+
+	assert image_part.image_url.media_type == 'image/webp'  # type: ignore[union-attr]
+	assert image_part.image_url.url == f'data:image/webp;base64,{screenshot}'  # type: ignore[union-attr]
+
+
+def test_prompt_resize_keeps_screenshot_format():
+	prompt = AgentMessagePrompt(
+		browser_state_summary=BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=None, selector_map={}), url='https://example.com', title='Example', tabs=[]
+		),
+		file_system=None,
+		llm_screenshot_size=(640, 360),
+	)
+	resized = prompt._resize_screenshot(_image_b64((1280, 720), 'JPEG'))
+
+	assert get_image_media_type(resized) == 'image/jpeg'
+	assert Image.open(BytesIO(base64.b64decode(resized))).size == (640, 360)
+
+
+@pytest.mark.parametrize(
+	'llm_screenshot_area, expected_click',
+	[
+		((1400.0, 850.0), (700, 425)),  # browser-downscaled screenshot of the viewport cropped to the LLM's aspect ratio
+		(None, (720, 425)),  # the whole viewport resized
+	],
+)
+async def test_llm_coordinates_map_through_the_area_the_screenshot_shows(
+	monkeypatch, llm_screenshot_area: tuple[float, float] | None, expected_click: tuple[int, int]
+):
+	clicks = []
+
+	async def click(x: int, y: int):
+		clicks.append((x, y))
+
+	async def get_mouse():
+		return SimpleNamespace(click=click)
+
+	async def get_current_page(self):
+		return SimpleNamespace(mouse=get_mouse())
+
+	async def highlight_coordinate_click(self, x: int, y: int):
+		pass
+
+	monkeypatch.setattr(BrowserSession, 'get_current_page', get_current_page)
+	monkeypatch.setattr(BrowserSession, 'highlight_coordinate_click', highlight_coordinate_click)
+	session = BrowserSession(headless=True)
+	session.llm_screenshot_size = (1400, 850)
+	session._original_viewport_size = (1440, 850)
+	session._llm_screenshot_area = llm_screenshot_area
+	action = Tools().registry.registry.actions['click']
+
+	await action.function(params=action.param_model(coordinate_x=700, coordinate_y=425), browser_session=session)
+
+	assert clicks == [expected_click]
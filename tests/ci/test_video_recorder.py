@@ -0,0 +1,155 @@
+"""
+Tests for the session video recorder: one long-lived ffmpeg process fed from a bounded frame queue.
+
+Requires the optional video dependencies (pip install "browser-use[video]"), skipped otherwise.
+
+Usage:
+	uv run pytest tests/ci/test_video_recorder.py -v -s
+"""
+
+import asyncio
+import base64
+import io
+import logging
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from browser_use.browser import video_recorder
+from browser_use.browser.profile import ViewportSize
+from browser_use.browser.video_recorder import VideoRecorderService
+
+imageio_ffmpeg = pytest.importorskip('imageio_ffmpeg')
+
+
+def _png_frame(width: int, height: int, shade: int) -> str:
+	buffer = io.BytesIO()
+	Image.new('RGB', (width, height), (shade, 255 - shade, 128)).save(buffer, format='PNG')
+	return base64.b64encode(buffer.getvalue()).decode()
+
+
+def _probe(path: Path) -> tuple[int, str]:
+	"""Decode the video and return (frame count, WIDTHxHEIGHT)."""
+	result = subprocess.run(
+		[imageio_ffmpeg.get_ffmpeg_exe(), '-nostdin', '-i', str(path), '-f', 'null', '-'],
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+	frames = re.findall(r'frame=\s*(\d+)', result.stderr)
+	dimensions = re.search(r'Video: h264.*?(\d{2,5}x\d{2,5})', result.stderr)
+	assert frames and dimensions, result.stderr
+	return int(frames[-1]), dimensions.group(1)
+
+
+async def test_frames_are_encoded_by_a_single_ffmpeg_process(tmp_path: Path, monkeypatch):
+	spawned = []
+	create_subprocess_exec = asyncio.create_subprocess_exec
+
+	async def counting_create_subprocess_exec(*args, **kwargs):
+		spawned.append(args)
+		return await create_subprocess_exec(*args, **kwargs)
+
+	monkeypatch.setattr(asyncio, 'create_subprocess_exec', counting_create_subprocess_exec)
+	output_path = tmp_path / 'videos' / 'session.mp4'
+	recorder = VideoRecorderService(output_path, ViewportSize(width=100, height=75), framerate=30)
+
+	await recorder.start()
+	for i in range(20):
+		recorder.add_frame(_png_frame(200, 150, i * 10))  # larger than the video, scaled down
+		await asyncio.sleep(0)
+	await recorder.stop_and_save()
+
+	assert len(spawned) == 1
+	assert recorder.frames_written == 20
+	assert recorder.frames_dropped == 0
+	assert _probe(output_path) == (20, '112x80')  # padded to the 16px macro-block size
+
+
+async def test_add_frame_never_blocks_and_drops_oldest_frames_under_backpressure(tmp_path: Path):
+	output_path = tmp_path / 'session.mp4'
+	recorder = VideoRecorderService(output_path, ViewportSize(width=64, height=48), framerate=30, max_queued_frames=5)
+	frames = [_png_frame(64, 48, i) for i in range(50)]
+
+	await recorder.start()
+	start = time.perf_counter()
+	for frame in frames:  # the encoder gets no chance to run in between
+		recorder.add_frame(frame)
+	elapsed = time.perf_counter() - start
+	await recorder.stop_and_save()
+
+	assert elapsed < 0.05
+	assert recorder.frames_dropped == 45
+	assert recorder.frames_written == 5
+	assert _probe(output_path)[0] == 5
+
+
+async def test_stop_without_frames_and_add_after_stop_are_harmless(tmp_path: Path):
+	recorder = VideoRecorderService(tmp_path / 'empty.mp4', ViewportSize(width=64, height=48), framerate=30)
+
+	await recorder.start()
+	await recorder.stop_and_save()
+	recorder.add_frame(_png_frame(64, 48, 0))
+	await recorder.stop_and_save()
+
+	assert recorder.frames_written == 0
+	assert not recorder._is_active
+	assert not (tmp_path / 'empty.mp4').exists()
+
+
+# Stand-in encoders: a chatty one that only reads its input after writing 1MB of errors, and one that never reads it
+CHATTY_ENCODER = """
+import sys
+for _ in range(16_384):
+	sys.stderr.write('w' * 63 + chr(10))
+sys.stderr.flush()
+data = sys.stdin.buffer.read()
+sys.stderr.write(f'read {len(data)} bytes')
+sys.exit(3)
+"""
+STUCK_ENCODER = 'import time; time.sleep(60)'
+
+
+def _use_encoder(monkeypatch, script: str) -> None:
+	monkeypatch.setattr(VideoRecorderService, '_get_ffmpeg_command', lambda self: [sys.executable, '-c', script])
+
+
+async def test_encoder_errors_are_drained_while_recording(tmp_path: Path, monkeypatch, caplog):
+	_use_encoder(monkeypatch, CHATTY_ENCODER)
+	recorder = VideoRecorderService(tmp_path / 'session.mp4', ViewportSize(width=64, height=48), framerate=30)
+	frame = base64.b64encode(b'x' * 100_000).decode()  # more than the pipe buffer holds, so writing needs the encoder
+
+	await recorder.start()
+	for _ in range(5):
+		recorder.add_frame(frame)
+	with caplog.at_level(logging.ERROR):
+		await asyncio.wait_for(recorder.stop_and_save(), timeout=10)
+
+	assert recorder.frames_written == 5
+	# The error ends with the last output of the encoder, which it wrote after its first megabyte of errors
+	assert 'ffmpeg exited with code 3:' in caplog.text
+	assert caplog.text.count('w' * 63) < 100
+	assert 'read 500000 bytes' in caplog.text
+
+
+async def test_stop_gives_up_on_an_encoder_that_stopped_reading(tmp_path: Path, monkeypatch):
+	_use_encoder(monkeypatch, STUCK_ENCODER)
+	monkeypatch.setattr(video_recorder, 'VIDEO_FINALIZE_TIMEOUT', 0.5)
+	recorder = VideoRecorderService(tmp_path / 'session.mp4', ViewportSize(width=64, height=48), framerate=30)
+
+	await recorder.start()
+	process = recorder._process
+	assert process is not None
+	for _ in range(20):
+		recorder.add_frame(base64.b64encode(b'x' * 100_000).decode())  # far more than the pipe buffer holds
+	start = time.perf_counter()
+	await recorder.stop_and_save()
+
+	assert time.perf_counter() - start < 2
+	assert process.returncode is not None  # killed
+	assert recorder._writer_task is None